@@ -0,0 +1,76 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool, text
+
+from app.config import DATABASE_URL
+from app.db.database import Base
+from app.db import models  # noqa: F401 - 모델을 메타데이터에 등록
+
+# Alembic 설정 객체 (alembic.ini)
+config = context.config
+config.set_main_option("sqlalchemy.url", DATABASE_URL.replace("%", "%%"))
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# autogenerate 비교 대상 메타데이터
+target_metadata = Base.metadata
+
+# 모든 테이블이 stockdashx 스키마에 있으므로 버전 테이블도 같은 스키마에 둠
+SCHEMA = "stockdashx"
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """stockdashx 스키마 외의 객체는 autogenerate 대상에서 제외"""
+    if type_ == "table":
+        return object.schema == SCHEMA
+    return True
+
+
+def run_migrations_offline():
+    """DB 연결 없이 SQL 스크립트만 생성 (alembic upgrade head --sql)"""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        version_table_schema=SCHEMA,
+        include_schemas=True,
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """DB에 연결하여 마이그레이션 실행"""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        # 버전 테이블을 만들기 전에 스키마가 있어야 함
+        connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+        connection.commit()
+
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            version_table_schema=SCHEMA,
+            include_schemas=True,
+            include_object=include_object,
+            compare_type=True,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
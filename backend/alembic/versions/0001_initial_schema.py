@@ -0,0 +1,110 @@
+"""initial schema (database/init.sql + database/migrations/simulation_tables.sql)
+
+기존에 docker-entrypoint의 init.sql 또는 Base.metadata.create_all로 만들어진
+DB에도 그대로 적용할 수 있도록 모든 구문을 IF NOT EXISTS로 작성했습니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-03-16 00:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE SCHEMA IF NOT EXISTS stockdashx")
+
+    # 사용자 테이블
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS stockdashx.users (
+            id SERIAL PRIMARY KEY,
+            email VARCHAR(255) NOT NULL UNIQUE,
+            username VARCHAR(50) NOT NULL UNIQUE,
+            hashed_password VARCHAR(255) NOT NULL,
+            is_active BOOLEAN NOT NULL DEFAULT TRUE,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # 주식 테이블
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS stockdashx.stocks (
+            id SERIAL PRIMARY KEY,
+            symbol VARCHAR(20) NOT NULL UNIQUE,
+            name VARCHAR(255) NOT NULL,
+            last_price DECIMAL(10, 2),
+            change_percent DECIMAL(5, 2),
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # 포트폴리오 테이블
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS stockdashx.portfolios (
+            id SERIAL PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES stockdashx.users(id) ON DELETE CASCADE,
+            name VARCHAR(100) NOT NULL,
+            description TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(user_id, name)
+        )
+    """)
+
+    # 거래 내역 테이블
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS stockdashx.transactions (
+            id SERIAL PRIMARY KEY,
+            portfolio_id INTEGER NOT NULL REFERENCES stockdashx.portfolios(id) ON DELETE CASCADE,
+            stock_id INTEGER NOT NULL REFERENCES stockdashx.stocks(id),
+            transaction_type VARCHAR(10) NOT NULL,
+            quantity INTEGER NOT NULL,
+            price DECIMAL(10, 2) NOT NULL,
+            transaction_date TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # 모의 투자 계좌 테이블
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS stockdashx.simulation_accounts (
+            id SERIAL PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES stockdashx.users(id) ON DELETE CASCADE,
+            name VARCHAR(100) NOT NULL,
+            initial_balance DECIMAL(12, 2) NOT NULL DEFAULT 100000.00,
+            current_balance DECIMAL(12, 2) NOT NULL DEFAULT 100000.00,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # 모의 투자 거래 내역 테이블
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS stockdashx.simulation_transactions (
+            id SERIAL PRIMARY KEY,
+            account_id INTEGER NOT NULL REFERENCES stockdashx.simulation_accounts(id) ON DELETE CASCADE,
+            stock_id INTEGER NOT NULL REFERENCES stockdashx.stocks(id),
+            transaction_type VARCHAR(10) NOT NULL,
+            quantity INTEGER NOT NULL,
+            price DECIMAL(10, 2) NOT NULL,
+            total_amount DECIMAL(12, 2) NOT NULL,
+            transaction_date TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    op.execute("CREATE INDEX IF NOT EXISTS idx_simulation_accounts_user_id ON stockdashx.simulation_accounts(user_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_simulation_transactions_account_id ON stockdashx.simulation_transactions(account_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_simulation_transactions_stock_id ON stockdashx.simulation_transactions(stock_id)")
+
+
+def downgrade():
+    op.execute("DROP TABLE IF EXISTS stockdashx.simulation_transactions")
+    op.execute("DROP TABLE IF EXISTS stockdashx.simulation_accounts")
+    op.execute("DROP TABLE IF EXISTS stockdashx.transactions")
+    op.execute("DROP TABLE IF EXISTS stockdashx.portfolios")
+    op.execute("DROP TABLE IF EXISTS stockdashx.stocks")
+    op.execute("DROP TABLE IF EXISTS stockdashx.users")
@@ -0,0 +1,68 @@
+"""performance indexes for hot transaction queries, align simulation amount precision
+
+- transactions(portfolio_id, stock_id) INCLUDE (transaction_type, quantity)
+  : 매도 가능 수량 확인 쿼리를 index-only scan으로 처리
+- transactions(portfolio_id, transaction_date DESC, id DESC)
+  : 거래 내역 키셋 페이지네이션 및 내보내기
+- simulation_transactions에도 같은 두 인덱스 (account_id 기준)
+- simulation_accounts/simulation_transactions 금액 컬럼을 DECIMAL(12, 2)로 통일
+  (create_all로 만든 DB는 ORM 정의에 따라 NUMERIC(10, 2)였음)
+
+인덱스는 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY로 생성합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-03-20 00:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    (
+        "ix_transactions_portfolio_stock",
+        "stockdashx.transactions (portfolio_id, stock_id) INCLUDE (transaction_type, quantity)",
+    ),
+    (
+        "ix_transactions_portfolio_date",
+        "stockdashx.transactions (portfolio_id, transaction_date DESC, id DESC)",
+    ),
+    (
+        "ix_simulation_transactions_account_stock",
+        "stockdashx.simulation_transactions (account_id, stock_id) INCLUDE (transaction_type, quantity, total_amount)",
+    ),
+    (
+        "ix_simulation_transactions_account_date",
+        "stockdashx.simulation_transactions (account_id, transaction_date DESC, id DESC)",
+    ),
+]
+
+
+def upgrade():
+    op.execute("ALTER TABLE stockdashx.simulation_accounts ALTER COLUMN initial_balance TYPE DECIMAL(12, 2)")
+    op.execute("ALTER TABLE stockdashx.simulation_accounts ALTER COLUMN current_balance TYPE DECIMAL(12, 2)")
+    op.execute("ALTER TABLE stockdashx.simulation_transactions ALTER COLUMN total_amount TYPE DECIMAL(12, 2)")
+
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+
+        # (account_id, ...) 복합 인덱스가 선두 컬럼을 포함하므로 단일 컬럼 인덱스는 불필요
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS stockdashx.idx_simulation_transactions_account_id")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_simulation_transactions_account_id "
+            "ON stockdashx.simulation_transactions (account_id)"
+        )
+        for name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS stockdashx.{name}")
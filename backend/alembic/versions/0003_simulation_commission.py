@@ -0,0 +1,30 @@
+"""simulation transaction commission column
+
+시장가 주문 체결 엔진의 수수료 모델 결과를 거래 내역에 기록합니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-03-24 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "simulation_transactions",
+        sa.Column("commission", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        schema="stockdashx"
+    )
+
+
+def downgrade():
+    op.drop_column("simulation_transactions", "commission", schema="stockdashx")
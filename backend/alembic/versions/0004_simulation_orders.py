@@ -0,0 +1,50 @@
+"""simulation resting orders (LIMIT / STOP / STOP_LIMIT)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-03-28 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "simulation_orders",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("account_id", sa.Integer, sa.ForeignKey("stockdashx.simulation_accounts.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("stock_id", sa.Integer, sa.ForeignKey("stockdashx.stocks.id"), nullable=False),
+        sa.Column("order_type", sa.String(20), nullable=False),
+        sa.Column("transaction_type", sa.String(10), nullable=False),
+        sa.Column("quantity", sa.Integer, nullable=False),
+        sa.Column("limit_price", sa.Numeric(10, 2)),
+        sa.Column("stop_price", sa.Numeric(10, 2)),
+        sa.Column("status", sa.String(20), nullable=False, server_default="OPEN"),
+        sa.Column("reject_reason", sa.Text),
+        sa.Column("transaction_id", sa.Integer, sa.ForeignKey("stockdashx.simulation_transactions.id", ondelete="SET NULL")),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        schema="stockdashx"
+    )
+    op.create_index(
+        "ix_simulation_orders_open", "simulation_orders", ["stock_id"],
+        schema="stockdashx", postgresql_where=sa.text("status IN ('OPEN', 'TRIGGERED')")
+    )
+    op.create_index(
+        "ix_simulation_orders_account", "simulation_orders", ["account_id", sa.text("created_at DESC")],
+        schema="stockdashx"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_simulation_orders_account", table_name="simulation_orders", schema="stockdashx")
+    op.drop_index("ix_simulation_orders_open", table_name="simulation_orders", schema="stockdashx")
+    op.drop_table("simulation_orders", schema="stockdashx")
@@ -0,0 +1,36 @@
+"""daily OHLCV price history
+
+(stock_id, price_date) 기본키가 종목별 날짜 범위 조회 인덱스 역할을 합니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-04-02 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "stock_prices",
+        sa.Column("stock_id", sa.Integer, sa.ForeignKey("stockdashx.stocks.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("price_date", sa.Date, primary_key=True),
+        sa.Column("open", sa.Numeric(12, 4), nullable=False),
+        sa.Column("high", sa.Numeric(12, 4), nullable=False),
+        sa.Column("low", sa.Numeric(12, 4), nullable=False),
+        sa.Column("close", sa.Numeric(12, 4), nullable=False),
+        sa.Column("volume", sa.BigInteger, nullable=False, server_default="0"),
+        schema="stockdashx"
+    )
+
+
+def downgrade():
+    op.drop_table("stock_prices", schema="stockdashx")
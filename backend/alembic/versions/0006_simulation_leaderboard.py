@@ -0,0 +1,34 @@
+"""simulation leaderboard checkpoint
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-04-05 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "simulation_leaderboard",
+        sa.Column("account_id", sa.Integer, sa.ForeignKey("stockdashx.simulation_accounts.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("rank", sa.Integer, nullable=False),
+        sa.Column("return_percent", sa.Numeric(12, 4), nullable=False),
+        sa.Column("total_value", sa.Numeric(14, 2), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        schema="stockdashx"
+    )
+    op.create_index("ix_simulation_leaderboard_rank", "simulation_leaderboard", ["rank"], schema="stockdashx")
+
+
+def downgrade():
+    op.drop_index("ix_simulation_leaderboard_rank", table_name="simulation_leaderboard", schema="stockdashx")
+    op.drop_table("simulation_leaderboard", schema="stockdashx")
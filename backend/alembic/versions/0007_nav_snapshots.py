@@ -0,0 +1,41 @@
+"""daily NAV snapshots for simulation accounts and portfolios
+
+(owner_type, owner_id, snapshot_date) 유니크 제약의 인덱스가 기간 조회와
+스냅샷 upsert 충돌 대상을 함께 처리합니다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-04-08 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "nav_snapshots",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("owner_type", sa.String, nullable=False),
+        sa.Column("owner_id", sa.Integer, nullable=False),
+        sa.Column("snapshot_date", sa.Date, nullable=False),
+        sa.Column("cash", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("invested", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("market_value", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("nav", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("pnl", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("owner_type", "owner_id", "snapshot_date", name="uq_nav_snapshots_owner_date"),
+        schema="stockdashx"
+    )
+
+
+def downgrade():
+    op.drop_table("nav_snapshots", schema="stockdashx")
@@ -0,0 +1,30 @@
+"""historical replay mode for simulation accounts
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-04-11 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "simulation_accounts",
+        sa.Column("mode", sa.String(10), nullable=False, server_default="LIVE"),
+        schema="stockdashx"
+    )
+    op.add_column("simulation_accounts", sa.Column("replay_date", sa.Date), schema="stockdashx")
+
+
+def downgrade():
+    op.drop_column("simulation_accounts", "replay_date", schema="stockdashx")
+    op.drop_column("simulation_accounts", "mode", schema="stockdashx")
@@ -0,0 +1,60 @@
+"""local news article store
+
+기사는 URL 해시 유니크 제약으로 한 번만 저장하고, 피드(시장 뉴스 또는 종목)
+소속은 news_article_feeds에 (feed, published_at, article_id) 인덱스와 함께
+저장해 피드별 키셋 페이지네이션을 인덱스 범위 스캔으로 처리합니다.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-04-14 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "news_articles",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("url_hash", sa.String(64), nullable=False, unique=True),
+        sa.Column("url", sa.Text, nullable=False),
+        sa.Column("title", sa.Text, nullable=False, server_default=""),
+        sa.Column("description", sa.Text),
+        sa.Column("url_to_image", sa.Text),
+        sa.Column("source", sa.String),
+        sa.Column("content", sa.Text),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        schema="stockdashx"
+    )
+    op.create_table(
+        "news_article_feeds",
+        sa.Column("feed", sa.String, primary_key=True),
+        sa.Column(
+            "article_id", sa.Integer,
+            sa.ForeignKey("stockdashx.news_articles.id", ondelete="CASCADE"),
+            primary_key=True
+        ),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=False),
+        schema="stockdashx"
+    )
+    op.create_index(
+        "ix_news_article_feeds_feed_published",
+        "news_article_feeds",
+        ["feed", sa.text("published_at DESC"), sa.text("article_id DESC")],
+        schema="stockdashx"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_news_article_feeds_feed_published", table_name="news_article_feeds", schema="stockdashx")
+    op.drop_table("news_article_feeds", schema="stockdashx")
+    op.drop_table("news_articles", schema="stockdashx")
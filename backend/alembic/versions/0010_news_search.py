@@ -0,0 +1,39 @@
+"""full-text search over stored news articles
+
+news_articles에 제목/요약/본문 가중치 tsvector 생성 컬럼(STORED)과 GIN 인덱스를
+추가합니다. 기사가 저장될 때 DB가 벡터를 계산하므로 수집과 함께 색인이
+갱신됩니다.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2025-04-15 00:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE stockdashx.news_articles "
+        f"ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED"
+    )
+    op.execute("CREATE INDEX ix_news_articles_search ON stockdashx.news_articles USING gin (search_vector)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS stockdashx.ix_news_articles_search")
+    op.drop_column("news_articles", "search_vector", schema="stockdashx")
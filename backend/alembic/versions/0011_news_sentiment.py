@@ -0,0 +1,40 @@
+"""news sentiment scores and per-symbol daily aggregates
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2025-04-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("news_articles", sa.Column("sentiment", sa.Float), schema="stockdashx")
+    op.create_index(
+        "ix_news_articles_unscored", "news_articles", ["id"],
+        schema="stockdashx", postgresql_where=sa.text("sentiment IS NULL")
+    )
+    op.create_table(
+        "news_sentiment_daily",
+        sa.Column("symbol", sa.String, primary_key=True),
+        sa.Column("day", sa.Date, primary_key=True),
+        sa.Column("article_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("sentiment_sum", sa.Float, nullable=False, server_default="0"),
+        sa.Column("positive_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("negative_count", sa.Integer, nullable=False, server_default="0"),
+        schema="stockdashx"
+    )
+
+
+def downgrade():
+    op.drop_table("news_sentiment_daily", schema="stockdashx")
+    op.drop_index("ix_news_articles_unscored", table_name="news_articles", schema="stockdashx")
+    op.drop_column("news_articles", "sentiment", schema="stockdashx")
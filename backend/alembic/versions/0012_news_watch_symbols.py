@@ -0,0 +1,32 @@
+"""news watch list shared by all workers
+
+뉴스 화면에서 조회된 종목을 워커 메모리가 아닌 DB에 기록해, 수집 작업을
+실행하는 리더 워커가 다른 워커에서 조회된 종목도 수집하도록 합니다.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2025-04-17 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "news_watch_symbols",
+        sa.Column("symbol", sa.String, primary_key=True),
+        sa.Column("last_requested_at", sa.DateTime(timezone=True), nullable=False),
+        schema="stockdashx"
+    )
+
+
+def downgrade():
+    op.drop_table("news_watch_symbols", schema="stockdashx")
@@ -0,0 +1,41 @@
+"""simulation account change log for cross-worker leaderboard sync
+
+거래, 계좌 생성/삭제가 커밋될 때 같은 트랜잭션에서 계좌 ID를 기록합니다.
+각 워커는 이 기록에서 새로 바뀐 계좌만 읽어 메모리 순위표를 갱신합니다.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2025-04-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "simulation_account_changes",
+        sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+        # 삭제된 계좌도 기록하므로 외래 키를 두지 않음
+        sa.Column("account_id", sa.Integer, nullable=False),
+        sa.Column("changed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema="stockdashx"
+    )
+    op.create_index(
+        "ix_simulation_account_changes_changed_at",
+        "simulation_account_changes",
+        ["changed_at"],
+        schema="stockdashx"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_simulation_account_changes_changed_at", table_name="simulation_account_changes", schema="stockdashx")
+    op.drop_table("simulation_account_changes", schema="stockdashx")
@@ -0,0 +1,32 @@
+"""on-demand news fetch cap shared by all workers
+
+저장된 기사가 없는 피드를 요청 시 바로 수집하는 횟수를 워커별 메모리가 아닌
+DB에서 세어, 워커 수와 관계없이 수집 주기당 외부 API 호출 한도를 지킵니다.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2025-04-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "news_fetch_slots",
+        sa.Column("window_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("count", sa.Integer, nullable=False),
+        schema="stockdashx"
+    )
+
+
+def downgrade():
+    op.drop_table("news_fetch_slots", schema="stockdashx")
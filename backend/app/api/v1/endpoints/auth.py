@@ -1,15 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import timedelta
-from jose import JWTError, jwt
+from typing import Optional
 
 # 필요한 모듈과 클래스 임포트
 from app.db.database import get_db  # 데이터베이스 세션 가져오는 함수
 from app.db.models import User as UserModel  # SQLAlchemy 모델 (DB 쿼리용)
 from app.schemas.users import User as UserSchema  # Pydantic 모델 (응답 모델용)
 from app.schemas.users import UserCreate  # Pydantic 모델 (요청 모델용)
-from app.core.security import create_access_token, verify_password, get_password_hash, ALGORITHM
+from app.core.security import create_access_token, hash_password_async, verify_password_async, ALGORITHM
+from app.core.user_cache import USER_CACHE, UserSnapshot
 from app.config import SECRET_KEY
 
 # API 라우터 생성
@@ -18,20 +20,18 @@ router = APIRouter()
 # OAuth2 인증 스키마 설정 (토큰 URL 지정)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/token")
 
-def create_user(db: Session, user: UserCreate):
+def create_user(db: Session, user: UserCreate, hashed_password: str):
     """
     새 사용자 생성 함수
     
     Args:
         db (Session): 데이터베이스 세션
         user (UserCreate): 생성할 사용자 정보 (Pydantic 모델)
+        hashed_password (str): 해시된 비밀번호 (평문 저장 방지)
         
     Returns:
         UserModel: 생성된 사용자 객체 (SQLAlchemy 모델)
     """
-    # 비밀번호 해싱 (평문 저장 방지)
-    hashed_password = get_password_hash(user.password)
-    
     # SQLAlchemy 모델 인스턴스 생성
     db_user = UserModel(
         email=user.email,
@@ -48,10 +48,37 @@ def create_user(db: Session, user: UserCreate):
     
     return db_user
 
-def authenticate_user(db: Session, username: str, password: str):
+def get_user_by_username(db: Session, username: str) -> Optional[UserModel]:
+    """사용자 이름으로 사용자 조회 (없으면 None)"""
+    return db.query(UserModel).filter(UserModel.username == username).first()
+
+def find_registration_conflict(db: Session, user: UserCreate) -> Optional[str]:
+    """
+    가입 요청의 이메일/사용자 이름 중복 확인
+    
+    Returns:
+        Optional[str]: 이미 사용 중이면 오류 메시지, 아니면 None
+    """
+    if db.query(UserModel).filter(UserModel.email == user.email).first():
+        return "이미 사용 중인 이메일입니다"
+    if db.query(UserModel).filter(UserModel.username == user.username).first():
+        return "이미 사용 중인 사용자 이름입니다"
+    return None
+
+def update_password_hash(db: Session, user: UserModel, hashed_password: str):
+    """다시 해시한 비밀번호 저장 (커밋 후 만료된 속성을 다시 읽어 둠)"""
+    user.hashed_password = hashed_password
+    db.commit()
+    db.refresh(user)
+
+async def authenticate_user(db: Session, username: str, password: str):
     """
     사용자 인증 함수
     
+    비밀번호 검증은 전용 프로세스 풀에서 실행되며, 저장된 해시의 비용이 현재
+    BCRYPT_ROUNDS와 다르면 새 비용으로 다시 해시해 저장합니다.
+    동기 DB 조회/커밋은 이벤트 루프를 막지 않도록 스레드풀에서 실행합니다.
+    
     Args:
         db (Session): 데이터베이스 세션
         username (str): 로그인 시도하는 사용자 이름
@@ -59,26 +86,37 @@ def authenticate_user(db: Session, username: str, password: str):
         
     Returns:
         UserModel 또는 False: 인증 성공 시 사용자 객체, 실패 시 False
+        
+    Raises:
+        HTTPException: 해시 작업 대기열이 가득 찬 경우 (503)
     """
     # 사용자 이름으로 사용자 검색
-    user = db.query(UserModel).filter(UserModel.username == username).first()
+    user = await run_in_threadpool(get_user_by_username, db, username)
     
     # 사용자가 존재하지 않으면 인증 실패
     if not user:
         return False
     
     # 비밀번호 검증 (해시된 비밀번호와 입력된 비밀번호 비교)
-    if not verify_password(password, user.hashed_password):
+    verified, new_hash = await verify_password_async(password, user.hashed_password)
+    if not verified:
         return False
     
+    # 해시 비용이 바뀐 경우 투명하게 다시 해시
+    if new_hash:
+        await run_in_threadpool(update_password_hash, db, user, new_hash)
+    
     # 인증 성공
     return user
 
 @router.post("/register", response_model=UserSchema)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: Session = Depends(get_db)):
     """
     새 사용자 등록 API 엔드포인트
     
+    중복 확인과 사용자 저장(동기 DB 작업)은 스레드풀에서, 비밀번호 해싱은
+    전용 프로세스 풀에서 실행합니다.
+    
     Args:
         user (UserCreate): 등록할 사용자 정보 (요청 본문)
         db (Session, optional): 데이터베이스 세션 (의존성 주입)
@@ -87,29 +125,22 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         UserSchema: 생성된 사용자 정보 (응답 모델)
         
     Raises:
-        HTTPException: 이메일이나 사용자 이름이 이미 사용 중인 경우
+        HTTPException: 이메일이나 사용자 이름이 이미 사용 중인 경우, 해시 작업 대기열이 가득 찬 경우 (503)
     """
-    # 이메일 중복 확인 - SQLAlchemy 모델 사용
-    db_user = db.query(UserModel).filter(UserModel.email == user.email).first()
-    if db_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 사용 중인 이메일입니다"
-        )
-    
-    # 사용자 이름 중복 확인 - SQLAlchemy 모델 사용
-    db_user = db.query(UserModel).filter(UserModel.username == user.username).first()
-    if db_user:
+    # 이메일/사용자 이름 중복 확인
+    conflict = await run_in_threadpool(find_registration_conflict, db, user)
+    if conflict:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 사용 중인 사용자 이름입니다"
+            detail=conflict
         )
     
-    # 사용자 생성 및 반환
-    return create_user(db=db, user=user)
+    # 비밀번호 해싱 (전용 프로세스 풀) 후 사용자 생성 및 반환
+    hashed_password = await hash_password_async(user.password)
+    return await run_in_threadpool(create_user, db, user, hashed_password)
 
 @router.post("/token")
-def login_for_access_token(
+async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
@@ -124,11 +155,10 @@ def login_for_access_token(
         dict: 액세스 토큰과 토큰 타입
         
     Raises:
-        HTTPException: 인증 실패 시
+        HTTPException: 인증 실패 시, 해시 작업 대기열이 가득 찬 경우 (503)
     """
     # 사용자 인증 시도
-    user = authenticate_user(db, form_data.username, form_data.password)
-    print(user)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -153,12 +183,15 @@ async def get_current_user(
     """
     현재 인증된 사용자 가져오기 (보호된 엔드포인트를 위한 의존성 함수)
     
+    토큰 서명/만료는 매 요청 검증하고, 사용자 조회 결과는 USER_CACHE에 짧게
+    캐시하므로 대부분의 요청은 인증을 위해 DB를 조회하지 않습니다.
+    
     Args:
         token (str, optional): JWT 토큰 (의존성 주입)
         db (Session, optional): 데이터베이스 세션 (의존성 주입)
         
     Returns:
-        UserModel: 인증된 사용자 정보
+        UserSnapshot: 인증된 사용자 정보 (id, username, email, is_active)
         
     Raises:
         HTTPException: 인증 정보가 유효하지 않은 경우
@@ -170,6 +203,9 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    # jose는 서버 시작 시간을 줄이기 위해 처음 사용할 때 임포트
+    from jose import JWTError, jwt
+    
     try:
         # JWT 토큰 디코딩
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -182,11 +218,18 @@ async def get_current_user(
         # 토큰 디코딩 실패 시 인증 실패
         raise credentials_exception
     
-    # 데이터베이스에서 사용자 조회
-    user = db.query(UserModel).filter(UserModel.username == username).first()
+    # 캐시 확인
+    user = USER_CACHE.get(username)
+    if user is not None:
+        return user
+    
+    # 데이터베이스에서 사용자 조회 (캐시 미스일 때만, 스레드풀에서 실행)
+    db_user = await run_in_threadpool(get_user_by_username, db, username)
     
-    # 사용자가 없으면 인증 실패
-    if user is None:
+    # 사용자가 없으면 인증 실패 (없는 사용자는 캐시하지 않음)
+    if db_user is None:
         raise credentials_exception
-        
-    return user
\ No newline at end of file
+    
+    user = UserSnapshot.from_model(db_user)
+    USER_CACHE.put(user)
+    return user
@@ -0,0 +1,143 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from app.db.database import get_db
+from app.db.models import SimulationAccount as SimulationAccountModel, User as UserModel
+from app.schemas.backtest import BacktestCreate, BacktestResult, BacktestSweepCreate, BacktestSweepResult
+from app.api.v1.endpoints.auth import get_current_user
+from app.services.price_history import ensure_daily_history, load_daily_bars
+from app.services.backtest import run_backtest, run_sweep, save_backtest_account, StrategySpecError
+
+router = APIRouter()
+
+# 지표 계산에 필요한 최소 일봉 수
+MIN_BARS = 2
+
+
+async def _load_bars(db: Session, request):
+    """요청 종목의 일별 시세를 준비하고 기간으로 잘라 배열로 반환"""
+    symbol = request.symbol.upper()
+    stock = await ensure_daily_history(db, symbol)
+    bars = await run_in_threadpool(load_daily_bars, db, stock.id, request.start_date, request.end_date)
+
+    if len(bars["close"]) < MIN_BARS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"백테스트에 사용할 {symbol}의 일별 시세가 부족합니다."
+        )
+    return stock, bars
+
+
+@router.post("/", response_model=BacktestResult)
+async def create_backtest(
+    request: BacktestCreate,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    백테스트 실행 API 엔드포인트
+
+    저장된 일별 시세(없으면 외부 API에서 전체 기간을 가져와 저장)로 전략을 실행합니다.
+
+    Args:
+        request (BacktestCreate): 종목, 전략, 파라미터, 기간 및 자금 조건
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+
+    Returns:
+        BacktestResult: 거래 내역, 자산 곡선, 요약 통계
+
+    Raises:
+        HTTPException: 전략 정의가 올바르지 않거나 시세가 부족한 경우, 계좌 이름이 중복된 경우
+    """
+    if request.save_as_account:
+        existing = db.query(SimulationAccountModel).filter(
+            SimulationAccountModel.user_id == current_user.id,
+            SimulationAccountModel.name == request.save_as_account
+        ).first()
+        if existing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 동일한 이름의 모의 투자 계좌가 있습니다."
+            )
+
+    stock, bars = await _load_bars(db, request)
+
+    try:
+        # 단일 실행은 밀리초 단위이므로 스레드풀에서 실행
+        result = await run_in_threadpool(
+            run_backtest,
+            bars,
+            stock.symbol,
+            request.strategy,
+            request.params,
+            spec=request.spec,
+            initial_cash=request.initial_cash,
+            commission_rate=request.commission_rate
+        )
+    except StrategySpecError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    account_id = None
+    if request.save_as_account:
+        account = save_backtest_account(
+            db, current_user.id, request.save_as_account, stock.id, result, request.initial_cash
+        )
+        account_id = account.id
+
+    return {
+        "symbol": stock.symbol,
+        "strategy": request.strategy,
+        "account_id": account_id,
+        **result
+    }
+
+
+@router.post("/sweep", response_model=BacktestSweepResult)
+async def create_backtest_sweep(
+    request: BacktestSweepCreate,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    백테스트 파라미터 탐색 API 엔드포인트
+
+    파라미터 격자의 모든 조합을 계산용 프로세스 풀에서 병렬로 실행하고
+    sort_by 기준 상위 결과를 반환합니다 (max_drawdown은 손실이 작은 순).
+
+    Args:
+        request (BacktestSweepCreate): 종목, 전략, 파라미터 격자, 정렬 기준
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+
+    Returns:
+        BacktestSweepResult: 정렬된 조합별 요약 통계
+
+    Raises:
+        HTTPException: 격자가 너무 크거나 전략 정의가 올바르지 않은 경우, 시세가 부족한 경우
+    """
+    stock, bars = await _load_bars(db, request)
+
+    try:
+        results = await run_sweep(
+            bars,
+            stock.symbol,
+            request.strategy,
+            request.grid,
+            spec=request.spec,
+            initial_cash=request.initial_cash,
+            commission_rate=request.commission_rate
+        )
+    except StrategySpecError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # max_drawdown은 음수이므로 모든 지표를 큰 값이 좋은 순으로 정렬
+    results.sort(key=lambda entry: entry["stats"][request.sort_by], reverse=True)
+
+    return {
+        "symbol": stock.symbol,
+        "strategy": request.strategy,
+        "combinations": len(results),
+        "sort_by": request.sort_by,
+        "results": results[:request.top_n]
+    }
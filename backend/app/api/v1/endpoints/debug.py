@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import FileResponse
+from typing import Optional
+from app.core.profiling import check_profile_token, profile_path
+
+router = APIRouter()
+
+@router.get("/profiles/{profile_id}")
+def download_profile(
+    profile_id: str,
+    x_profile_token: Optional[str] = Header(None)
+):
+    """
+    요청 프로파일 다운로드 API 엔드포인트
+
+    프로파일링된 응답의 X-Profile-Id 값으로 저장된 프로파일을 내려받습니다.
+    collapsed stack 형식이므로 flamegraph.pl이나 speedscope로 바로 열 수 있습니다.
+
+    Args:
+        profile_id (str): 프로파일 ID
+        x_profile_token (Optional[str]): PROFILE_TOKEN과 같은 값의 X-Profile-Token 헤더
+
+    Returns:
+        FileResponse: 프로파일 파일 (text/plain)
+
+    Raises:
+        HTTPException: 토큰이 없거나 일치하지 않는 경우 (403), 프로파일이 없는 경우 (404)
+    """
+    if not check_profile_token(x_profile_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="프로파일 다운로드 권한이 없습니다.")
+
+    path = profile_path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로파일을 찾을 수 없습니다.")
+
+    return FileResponse(path, media_type="text/plain", filename=f"{profile_id}.folded")
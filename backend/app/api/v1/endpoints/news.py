@@ -1,6 +1,11 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any
-from app.services.news_service import get_market_news, get_stock_news
+from app.db.database import get_db
+from app.db.pagination import InvalidCursorError, NEXT_CURSOR_HEADER
+from app.services.news_service import get_market_news, get_stock_news, search_articles
+from app.services.news_sentiment import get_sentiment_series
 from app.api.v1.endpoints.auth import get_current_user
 from app.db.models import User as UserModel
 
@@ -8,25 +13,36 @@ router = APIRouter()
 
 @router.get("/market")
 async def market_news(
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    response: Response,
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor가 없을 때만 사용)"),
     page_size: int = Query(10, ge=1, le=100, description="페이지 당 뉴스 항목 수"),
-    current_user: UserModel = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor (X-Next-Cursor 헤더) 값"),
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
     시장 전반에 관한 뉴스를 가져오는 API 엔드포인트
-    
+
+    뉴스는 수집 작업이 저장한 로컬 기사 저장소에서 (게시 시각, id) 기준 키셋
+    페이지네이션으로 조회합니다. 다음 페이지가 있으면 nextCursor와
+    X-Next-Cursor 응답 헤더로 커서를 전달합니다.
+
     Args:
+        response (Response): 커서 헤더를 설정할 응답 객체
         page (int): 페이지 번호 (기본값: 1)
         page_size (int): 페이지 당 뉴스 항목 수 (기본값: 10, 최대: 100)
+        cursor (Optional[str]): 다음 페이지 커서
         current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
-        
+        db (Session): 데이터베이스 세션 (의존성 주입)
+
     Returns:
-        dict: 뉴스 데이터 (articles, totalResults 포함)
+        dict: 뉴스 데이터 (articles, totalResults, nextCursor 포함)
     """
     try:
         # 뉴스 서비스를 통해 시장 뉴스 가져오기
-        news_data = await get_market_news(page, page_size)
-        return news_data
+        news_data = await get_market_news(db, page_size, cursor, page)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException as e:
         # 이미 HTTPException인 경우 그대로 전달
         raise e
@@ -34,33 +50,110 @@ async def market_news(
         # 기타 예외를 HTTPException으로 변환
         raise HTTPException(status_code=500, detail=f"뉴스 조회 중 오류가 발생했습니다: {str(e)}")
 
+    if news_data["nextCursor"]:
+        response.headers[NEXT_CURSOR_HEADER] = news_data["nextCursor"]
+    return news_data
+
 @router.get("/stock/{symbol}")
 async def stock_news(
     symbol: str,
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    response: Response,
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor가 없을 때만 사용)"),
     page_size: int = Query(10, ge=1, le=100, description="페이지 당 뉴스 항목 수"),
-    current_user: UserModel = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor (X-Next-Cursor 헤더) 값"),
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
     특정 주식에 관한 뉴스를 가져오는 API 엔드포인트
-    
+
+    로컬 기사 저장소에서 조회하며, 아직 수집한 적 없는 종목이면 한 번 수집한 뒤
+    다음 수집 주기부터 수집 대상에 포함합니다.
+
     Args:
         symbol (str): 주식 심볼 (예: AAPL, MSFT)
+        response (Response): 커서 헤더를 설정할 응답 객체
         page (int): 페이지 번호 (기본값: 1)
         page_size (int): 페이지 당 뉴스 항목 수 (기본값: 10, 최대: 100)
+        cursor (Optional[str]): 다음 페이지 커서
         current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
-        
+        db (Session): 데이터베이스 세션 (의존성 주입)
+
     Returns:
-        dict: 뉴스 데이터 (symbol, companyName, articles, totalResults 포함)
+        dict: 뉴스 데이터 (symbol, companyName, articles, totalResults, nextCursor 포함)
     """
     try:
         # 심볼을 대문자로 변환 (일관성을 위해)
         symbol = symbol.upper()
-        
+
         # 뉴스 서비스를 통해 주식 관련 뉴스 가져오기
-        news_data = await get_stock_news(symbol, page, page_size)
-        return news_data
+        news_data = await get_stock_news(db, symbol, page_size, cursor, page)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException as e:
         raise e
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"뉴스 조회 중 오류가 발생했습니다: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"뉴스 조회 중 오류가 발생했습니다: {str(e)}")
+
+    if news_data["nextCursor"]:
+        response.headers[NEXT_CURSOR_HEADER] = news_data["nextCursor"]
+    return news_data
+
+@router.get("/search")
+async def search_news(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (예: earnings guidance NVDA)"),
+    symbol: Optional[str] = Query(None, description="특정 종목 뉴스로 제한할 심볼"),
+    page: int = Query(1, ge=1, le=50, description="페이지 번호"),
+    page_size: int = Query(10, ge=1, le=50, description="페이지 당 뉴스 항목 수"),
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    수집된 뉴스 전문 검색 API 엔드포인트
+
+    외부 뉴스 API를 호출하지 않고 로컬 기사 저장소의 전문 검색 인덱스에서
+    제목/요약/본문을 검색해 관련도 순으로 반환합니다.
+
+    Args:
+        q (str): 검색어 (따옴표 구문 검색, OR, -제외어 지원)
+        symbol (Optional[str]): 종목 심볼 필터
+        page (int): 페이지 번호 (기본값: 1)
+        page_size (int): 페이지 당 뉴스 항목 수 (기본값: 10, 최대: 50)
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+
+    Returns:
+        dict: 검색 결과 (query, articles, page, hasMore 포함)
+    """
+    try:
+        return await run_in_threadpool(
+            search_articles, db, q, page_size, page, symbol.upper() if symbol else None
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"뉴스 검색 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/sentiment/{symbol}")
+def symbol_sentiment(
+    symbol: str,
+    days: int = Query(90, ge=1, le=730, description="조회 기간 (일)"),
+    window: int = Query(7, ge=1, le=90, description="이동 감성 지수 기간 (일)"),
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    종목별 뉴스 감성 시계열 API 엔드포인트
+
+    뉴스 수집 작업이 저장한 일별 감성 집계로 일별 평균 감성과 window일 이동
+    감성 지수(기사 수 가중 평균)를 반환합니다. 시장 전체는 symbol=MARKET입니다.
+
+    Args:
+        symbol (str): 주식 심볼 (예: AAPL) 또는 MARKET
+        days (int): 조회 기간 (기본값: 90일)
+        window (int): 이동 평균 기간 (기본값: 7일)
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+
+    Returns:
+        dict: 감성 데이터 (symbol, window, series 포함)
+    """
+    return get_sentiment_series(db, symbol.upper(), days, window)
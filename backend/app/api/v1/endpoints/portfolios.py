@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.db.database import get_db
 from app.db.models import Portfolio as PortfolioModel, Transaction as TransactionModel, Stock as StockModel, User as UserModel
-from app.schemas.portfolios import Portfolio as PortfolioSchema, PortfolioCreate, PortfolioUpdate, PortfolioDetail
+from app.schemas.portfolios import Portfolio as PortfolioSchema, PortfolioCreate, PortfolioUpdate, PortfolioDetail, PortfolioProjection
+from app.schemas.transactions import TransactionImportResult
 from app.api.v1.endpoints.auth import get_current_user
+from app.schemas.nav import NavSnapshot as NavSnapshotSchema, PeriodReturns
+from app.services.transaction_import import import_transactions_csv, ImportFormatError
+from app.services.projection import project_portfolio
+from app.services.holdings import compute_holdings, last_price, portfolio_cost
+from app.services.nav_snapshots import PORTFOLIO, get_nav_history, get_period_returns, delete_nav_snapshots
+from datetime import date
 
 router = APIRouter()
 
@@ -120,68 +127,10 @@ def get_portfolio(
     # 포트폴리오에 속한 모든 거래 내역 조회
     transactions = db.query(TransactionModel).filter(
         TransactionModel.portfolio_id == portfolio_id
-    ).all()
+    ).order_by(TransactionModel.transaction_date, TransactionModel.id).all()
     
     # 보유 주식 계산
-    holdings = {}
-    total_investment = 0
-    current_value = 0
-    
-    for transaction in transactions:
-        symbol = transaction.stock.symbol
-        
-        # 매수/매도에 따라 계산
-        if transaction.transaction_type == "BUY":
-            if symbol not in holdings:
-                holdings[symbol] = {
-                    "symbol": symbol,
-                    "name": transaction.stock.name,
-                    "quantity": 0,
-                    "avg_price": 0,
-                    "current_price": float(transaction.stock.last_price) if transaction.stock.last_price else 0,
-                    "total_cost": 0,
-                    "current_value": 0,
-                    "profit_loss": 0,
-                    "profit_loss_percent": 0
-                }
-            
-            # 평균 단가 계산
-            total_quantity = holdings[symbol]["quantity"] + transaction.quantity
-            total_cost = holdings[symbol]["total_cost"] + (transaction.quantity * float(transaction.price))
-            
-            holdings[symbol]["quantity"] = total_quantity
-            holdings[symbol]["total_cost"] = total_cost
-            
-            if total_quantity > 0:
-                holdings[symbol]["avg_price"] = total_cost / total_quantity
-        
-        elif transaction.transaction_type == "SELL":
-            if symbol in holdings:
-                # 매도 시 수량 감소
-                holdings[symbol]["quantity"] -= transaction.quantity
-                
-                # 매도 금액 계산 (FIFO 방식 단순화)
-                sell_value = transaction.quantity * float(transaction.price)
-                buy_value = transaction.quantity * holdings[symbol]["avg_price"]
-                
-                # 매도 이익/손실 반영
-                holdings[symbol]["total_cost"] -= buy_value
-    
-    # 현재 가치 및 수익/손실 계산
-    holdings_list = []
-    
-    for symbol, holding in holdings.items():
-        if holding["quantity"] > 0:
-            holding["current_value"] = holding["quantity"] * holding["current_price"]
-            holding["profit_loss"] = holding["current_value"] - holding["total_cost"]
-            
-            if holding["total_cost"] > 0:
-                holding["profit_loss_percent"] = (holding["profit_loss"] / holding["total_cost"]) * 100
-            
-            total_investment += holding["total_cost"]
-            current_value += holding["current_value"]
-            
-            holdings_list.append(holding)
+    holdings_list, total_investment, current_value = compute_holdings(transactions, portfolio_cost, last_price)
     
     # 포트폴리오 성과 계산
     portfolio_performance = {
@@ -304,5 +253,191 @@ def delete_portfolio(
         )
     
     # 포트폴리오 삭제 (관련 거래 내역도 cascade로 함께 삭제됨)
+    delete_nav_snapshots(db, PORTFOLIO, portfolio_id)
     db.delete(db_portfolio)
-    db.commit()
\ No newline at end of file
+    db.commit()
+
+@router.post("/{portfolio_id}/import", response_model=TransactionImportResult)
+def import_portfolio_transactions(
+    portfolio_id: int,
+    file: UploadFile = File(..., description="증권사 거래 내역 CSV 파일"),
+    dry_run: bool = Query(False, description="검증만 하고 저장하지 않음"),
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    CSV 거래 내역 일괄 등록 API 엔드포인트
+    
+    CSV 헤더는 symbol, transaction_type, quantity, price 컬럼이 필수이며
+    transaction_date 컬럼은 선택입니다. 행은 거래일 오름차순이어야 하며, 매도는
+    해당 거래일 기준 보유 수량으로 확인합니다. 유효한 행만 등록되고 나머지는
+    행 번호와 함께 오류 목록으로 반환됩니다.
+    
+    Args:
+        portfolio_id (int): 거래 내역을 등록할 포트폴리오 ID
+        file (UploadFile): 업로드된 CSV 파일
+        dry_run (bool): True이면 검증 결과만 반환
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        TransactionImportResult: 등록 결과 및 행별 오류 목록
+        
+    Raises:
+        HTTPException: 포트폴리오가 없거나 접근 권한이 없는 경우, 또는 CSV 형식이 잘못된 경우
+    """
+    # 포트폴리오 존재 및 접근 권한 확인
+    portfolio = db.query(PortfolioModel).filter(PortfolioModel.id == portfolio_id).first()
+    if not portfolio:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="포트폴리오를 찾을 수 없습니다."
+        )
+    
+    if portfolio.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 포트폴리오에 접근할 권한이 없습니다."
+        )
+    
+    try:
+        return import_transactions_csv(db, portfolio.id, file.file, dry_run=dry_run)
+    except ImportFormatError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"CSV 파일 형식이 올바르지 않습니다: {str(e)}"
+        )
+
+@router.get("/{portfolio_id}/nav", response_model=List[NavSnapshotSchema])
+def get_portfolio_nav_history(
+    portfolio_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    포트폴리오 일별 NAV 이력 조회 API 엔드포인트
+    
+    장 마감 후 저장된 스냅샷을 읽으므로 거래 내역을 다시 계산하지 않습니다.
+    
+    Args:
+        portfolio_id (int): 조회할 포트폴리오 ID
+        start_date (Optional[date]): 시작일 (포함)
+        end_date (Optional[date]): 종료일 (포함)
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        List[NavSnapshot]: 날짜 오름차순 NAV 스냅샷 목록
+        
+    Raises:
+        HTTPException: 포트폴리오가 없거나 접근 권한이 없는 경우
+    """
+    portfolio = db.query(PortfolioModel).filter(PortfolioModel.id == portfolio_id).first()
+    
+    if not portfolio:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="포트폴리오를 찾을 수 없습니다."
+        )
+    
+    if portfolio.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 포트폴리오에 접근할 권한이 없습니다."
+        )
+    
+    return get_nav_history(db, PORTFOLIO, portfolio_id, start_date, end_date)
+
+@router.get("/{portfolio_id}/returns", response_model=PeriodReturns)
+def get_portfolio_period_returns(
+    portfolio_id: int,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    포트폴리오 기간 수익률(1D/1W/1M/YTD) 조회 API 엔드포인트
+    
+    Args:
+        portfolio_id (int): 조회할 포트폴리오 ID
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        PeriodReturns: 최근 스냅샷 기준 기간 수익률
+        
+    Raises:
+        HTTPException: 포트폴리오가 없거나 접근 권한이 없는 경우, 아직 스냅샷이 없는 경우
+    """
+    portfolio = db.query(PortfolioModel).filter(PortfolioModel.id == portfolio_id).first()
+    
+    if not portfolio:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="포트폴리오를 찾을 수 없습니다."
+        )
+    
+    if portfolio.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 포트폴리오에 접근할 권한이 없습니다."
+        )
+    
+    returns = get_period_returns(db, PORTFOLIO, portfolio_id)
+    if returns is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="아직 저장된 NAV 스냅샷이 없습니다."
+        )
+    
+    return returns
+
+@router.get("/{portfolio_id}/projection", response_model=PortfolioProjection)
+async def get_portfolio_projection(
+    portfolio_id: int,
+    method: str = Query("gbm", pattern="^(gbm|bootstrap)$", description="시뮬레이션 방식 (gbm, bootstrap)"),
+    horizon_days: int = Query(252, ge=1, le=1260, description="예측 기간 (거래일)"),
+    paths: int = Query(5000, ge=100, le=50000, description="시뮬레이션 경로 수"),
+    seed: Optional[int] = Query(None, ge=0, description="난수 시드 (생략 시 보유 종목으로 결정)"),
+    lookback_days: int = Query(756, ge=20, le=2520, description="수익률 추정에 사용할 과거 거래일 수"),
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    포트폴리오 가치 몬테카를로 예측 API 엔드포인트
+    
+    보유 종목의 과거 일간 수익률로 상관된 기하 브라운 운동(gbm) 또는
+    과거 거래일 복원 추출(bootstrap) 경로를 생성하고 백분위 밴드를 반환합니다.
+    
+    Args:
+        portfolio_id (int): 예측할 포트폴리오 ID
+        method (str): 시뮬레이션 방식
+        horizon_days (int): 예측 기간 (거래일)
+        paths (int): 시뮬레이션 경로 수
+        seed (Optional[int]): 난수 시드
+        lookback_days (int): 수익률 추정에 사용할 과거 거래일 수
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        PortfolioProjection: 기간별 가치 밴드와 만기 요약 통계
+        
+    Raises:
+        HTTPException: 포트폴리오가 없거나 접근 권한이 없는 경우, 보유 종목이나 과거 시세가 없는 경우
+    """
+    portfolio = db.query(PortfolioModel).filter(PortfolioModel.id == portfolio_id).first()
+    
+    if not portfolio:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="포트폴리오를 찾을 수 없습니다."
+        )
+    
+    if portfolio.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 포트폴리오에 접근할 권한이 없습니다."
+        )
+    
+    return await project_portfolio(db, portfolio_id, horizon_days, paths, method, seed, lookback_days)
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.db.database import get_db
 from app.db.models import (
     SimulationAccount as SimulationAccountModel,
     SimulationTransaction as SimulationTransactionModel,
+    SimulationOrder as SimulationOrderModel,
     Stock as StockModel,
     User as UserModel
 )
@@ -13,16 +16,49 @@ from app.schemas.simulation import (
     SimulationAccountCreate,
     SimulationAccountDetail,
     SimulationTransaction,
-    SimulationTransactionCreate
+    SimulationTransactionCreate,
+    BasketOrderCreate,
+    SimulationOrder,
+    SimulationOrderCreate,
+    LeaderboardEntry,
+    ReplayAdvance,
+    ReplayClockStart,
+    ReplayStatus,
+    SimulationTradeStats
 )
 from app.api.v1.endpoints.auth import get_current_user
-from app.services.stock_data import get_stock_quote
+from app.services.holdings import compute_holdings, last_price, simulation_cost
+from app.services.simulation_trading import (
+    execute_simulation_trade,
+    execute_basket,
+    notify_account_changed,
+    record_account_change
+)
+from app.services.leaderboard import LEADERBOARD
+from app.services.replay import (
+    BACKTEST,
+    LIVE,
+    REPLAY,
+    HISTORY_STORE,
+    REPLAY_CLOCKS,
+    preload_replay_history,
+    price_replay_order,
+    replay_timestamp,
+    advance_replay_date
+)
+from app.services.trade_stats import get_trade_stats
+from app.services.nav_snapshots import SIMULATION, get_nav_history, get_period_returns, delete_nav_snapshots
+from app.schemas.nav import NavSnapshot as NavSnapshotSchema, PeriodReturns
+from app.services.execution import price_market_order, get_market_price
+from app.services.order_book import ORDER_BOOK, RestingOrder, ACTIVE_STATUSES
+from app.db.pagination import keyset_page, stream_export, InvalidCursorError, NEXT_CURSOR_HEADER
 from decimal import Decimal
+from datetime import date
 
 router = APIRouter()
 
 @router.post("/accounts", response_model=SimulationAccount)
-def create_simulation_account(
+async def create_simulation_account(
     account: SimulationAccountCreate,
     current_user: UserModel = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -30,6 +66,9 @@ def create_simulation_account(
     """
     모의 투자 계좌 생성 API 엔드포인트
     
+    과거 재현 계좌는 replay_symbols의 일별 시세를 먼저 저장한 뒤 생성합니다
+    (이후 과거 재현 거래는 외부 API를 호출하지 않음).
+    
     Args:
         account (SimulationAccountCreate): 생성할 모의 투자 계좌 정보
         current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
@@ -39,8 +78,14 @@ def create_simulation_account(
         SimulationAccount: 생성된 모의 투자 계좌 정보
         
     Raises:
-        HTTPException: 동일한 이름의 계좌가 이미 있는 경우
+        HTTPException: 동일한 이름의 계좌가 이미 있는 경우, 과거 재현 종목의 시세를 가져오지 못한 경우
     """
+    if account.replay_start_date:
+        await preload_replay_history(db, account.replay_symbols)
+    
+    return await run_in_threadpool(_create_account, db, current_user, account)
+
+def _create_account(db: Session, current_user: UserModel, account: SimulationAccountCreate):
     # 동일 이름의 계좌가 이미 있는지 확인
     existing = db.query(SimulationAccountModel).filter(
         SimulationAccountModel.user_id == current_user.id,
@@ -58,13 +103,18 @@ def create_simulation_account(
         user_id=current_user.id,
         name=account.name,
         initial_balance=account.initial_balance,
-        current_balance=account.initial_balance
+        current_balance=account.initial_balance,
+        mode=REPLAY if account.replay_start_date else LIVE,
+        replay_date=account.replay_start_date
     )
     
     # 데이터베이스에 저장
     db.add(db_account)
+    db.flush()
+    record_account_change(db, db_account.id)
     db.commit()
     db.refresh(db_account)
+    notify_account_changed(db, db_account.id)
     
     return db_account
 
@@ -129,68 +179,17 @@ def get_simulation_account(
     # 계좌에 속한 모든 거래 내역 조회
     transactions = db.query(SimulationTransactionModel).filter(
         SimulationTransactionModel.account_id == account_id
-    ).all()
+    ).order_by(SimulationTransactionModel.transaction_date, SimulationTransactionModel.id).all()
+    
+    # 현재가: 과거 재현 계좌는 가상 날짜의 종가, 실시간 계좌는 DB의 최근 시세
+    def current_price(stock):
+        if account.mode == REPLAY:
+            bar = HISTORY_STORE.quote(db, stock.id, account.replay_date)
+            return bar["close"] if bar else 0
+        return last_price(stock)
     
     # 보유 주식 계산
-    holdings = {}
-    total_investment = 0
-    current_value = 0
-    
-    for transaction in transactions:
-        symbol = transaction.stock.symbol
-        
-        # 매수/매도에 따라 계산
-        if transaction.transaction_type == "BUY":
-            if symbol not in holdings:
-                holdings[symbol] = {
-                    "symbol": symbol,
-                    "name": transaction.stock.name,
-                    "quantity": 0,
-                    "avg_price": 0,
-                    "current_price": float(transaction.stock.last_price) if transaction.stock.last_price else 0,
-                    "total_cost": 0,
-                    "current_value": 0,
-                    "profit_loss": 0,
-                    "profit_loss_percent": 0
-                }
-            
-            # 평균 단가 계산
-            total_quantity = holdings[symbol]["quantity"] + transaction.quantity
-            total_cost = holdings[symbol]["total_cost"] + float(transaction.total_amount)
-            
-            holdings[symbol]["quantity"] = total_quantity
-            holdings[symbol]["total_cost"] = total_cost
-            
-            if total_quantity > 0:
-                holdings[symbol]["avg_price"] = total_cost / total_quantity
-        
-        elif transaction.transaction_type == "SELL":
-            if symbol in holdings:
-                # 매도 시 수량 감소
-                holdings[symbol]["quantity"] -= transaction.quantity
-                
-                # 매도 금액 계산 (FIFO 방식 단순화)
-                sell_value = float(transaction.total_amount)
-                buy_value = transaction.quantity * holdings[symbol]["avg_price"]
-                
-                # 매도 이익/손실 반영
-                holdings[symbol]["total_cost"] -= buy_value
-    
-    # 현재 가치 및 수익/손실 계산
-    holdings_list = []
-    
-    for symbol, holding in holdings.items():
-        if holding["quantity"] > 0:
-            holding["current_value"] = holding["quantity"] * holding["current_price"]
-            holding["profit_loss"] = holding["current_value"] - holding["total_cost"]
-            
-            if holding["total_cost"] > 0:
-                holding["profit_loss_percent"] = (holding["profit_loss"] / holding["total_cost"]) * 100
-            
-            total_investment += holding["total_cost"]
-            current_value += holding["current_value"]
-            
-            holdings_list.append(holding)
+    holdings_list, total_investment, current_value = compute_holdings(transactions, simulation_cost, current_price)
     
     # 성과 계산
     total_portfolio_value = float(account.current_balance) + current_value
@@ -214,6 +213,8 @@ def get_simulation_account(
         "name": account.name,
         "initial_balance": float(account.initial_balance),
         "current_balance": float(account.current_balance),
+        "mode": account.mode,
+        "replay_date": account.replay_date,
         "created_at": account.created_at,
         "holdings": holdings_list,
         "performance": performance
@@ -257,11 +258,17 @@ def delete_simulation_account(
         )
     
     # 계좌 삭제 (관련 거래 내역도 cascade로 함께 삭제됨)
+    delete_nav_snapshots(db, SIMULATION, account_id)
+    REPLAY_CLOCKS.stop(account_id)
     db.delete(account)
+    record_account_change(db, account_id)
     db.commit()
+    # 삭제된 계좌의 대기 주문을 이 워커의 매칭 엔진에서 제거 (다른 워커는 주기 동기화로 제거)
+    ORDER_BOOK.remove_account(account_id)
+    notify_account_changed(db, account_id)
 
 @router.post("/transactions", response_model=SimulationTransaction)
-async def create_simulation_transaction(
+def create_simulation_transaction(
     transaction: SimulationTransactionCreate,
     current_user: UserModel = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -278,7 +285,7 @@ async def create_simulation_transaction(
         SimulationTransaction: 생성된 모의 투자 거래 내역 정보
         
     Raises:
-        HTTPException: 계좌가 없거나 접근 권한이 없는 경우, 또는 잔액 부족 등의 오류 발생 시
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우, 등록되지 않은 심볼인 경우, 또는 잔액 부족 등의 오류 발생 시
     """
     # 계좌 존재 및 접근 권한 확인
     account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == transaction.account_id).first()
@@ -294,97 +301,136 @@ async def create_simulation_transaction(
             detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
         )
     
-    # 주식 존재 확인 및 필요시 생성
-    stock = db.query(StockModel).filter(StockModel.symbol == transaction.symbol).first()
+    # 백테스트 결과 계좌는 저장된 결과 조회 전용
+    if account.mode == BACKTEST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="백테스트 결과 계좌에서는 거래할 수 없습니다."
+        )
     
+    # 등록된 주식만 거래 가능 (주문 경로에서 외부 API를 호출하지 않음)
+    stock = db.query(StockModel).filter(StockModel.symbol == transaction.symbol).first()
     if not stock:
-        try:
-            # 외부 API를 통해 주식 정보 가져오기
-            stock_data = await get_stock_quote(transaction.symbol)
-            
-            # 주식 정보 생성
-            stock = StockModel(
-                symbol=transaction.symbol,
-                name=stock_data.get("name", transaction.symbol),
-                last_price=stock_data.get("price", 0),
-                change_percent=stock_data.get("change_percent", 0)
-            )
-            db.add(stock)
-            db.flush()  # ID 할당을 위해 flush
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"유효하지 않은 주식 심볼입니다: {str(e)}"
-            )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"등록되지 않은 주식 심볼입니다: {transaction.symbol}"
+        )
     
-    # 총 거래 금액 계산
-    total_amount = Decimal(str(transaction.quantity)) * Decimal(str(transaction.price))
+    # 시장가 체결: 캐시된 시세에 슬리피지/수수료 모델 적용 (외부 API 호출 없음)
+    # 과거 재현 계좌는 가상 날짜의 일봉 종가로 체결하고 거래 시각도 가상 날짜로 기록
+    transaction_date = None
+    if account.mode == REPLAY:
+        fill_price, commission = price_replay_order(db, account, stock, transaction.transaction_type, transaction.quantity)
+        transaction_date = replay_timestamp(account.replay_date)
+    else:
+        fill_price, commission = price_market_order(stock, transaction.transaction_type, transaction.quantity)
     
-    # 매수 거래인 경우 잔액 확인
-    if transaction.transaction_type == "BUY":
-        if account.current_balance < total_amount:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"잔액이 부족합니다. 현재 잔액: ${float(account.current_balance)}, 필요 금액: ${float(total_amount)}"
-            )
+    # 계좌 행 잠금 후 잔액/보유 수량 검증 및 저장
+    db_transaction = execute_simulation_trade(
+        db,
+        account.id,
+        stock.id,
+        transaction.transaction_type,
+        transaction.quantity,
+        fill_price,
+        commission,
+        transaction_date
+    )
+    
+    return db_transaction
+
+@router.post("/orders/basket", response_model=List[SimulationTransaction])
+async def create_basket_order(
+    basket: BasketOrderCreate,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    바스켓 시장가 주문 API 엔드포인트
+    
+    여러 종목의 시장가 주문을 하나의 DB 트랜잭션으로 입력 순서대로 체결합니다.
+    하나라도 실패하면 전체 주문이 취소됩니다.
+    
+    Args:
+        basket (BasketOrderCreate): 계좌 ID와 주문 목록
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
         
-        # 잔액 감소
-        account.current_balance -= total_amount
-    
-    # 매도 거래인 경우 보유 수량 확인
-    elif transaction.transaction_type == "SELL":
-        # 계좌의 모든 거래 내역 가져오기
-        all_transactions = db.query(SimulationTransactionModel).filter(
-            SimulationTransactionModel.account_id == account.id,
-            SimulationTransactionModel.stock_id == stock.id
-        ).all()
-        
-        # 현재 보유 수량 계산
-        current_quantity = 0
-        for t in all_transactions:
-            if t.transaction_type == "BUY":
-                current_quantity += t.quantity
-            elif t.transaction_type == "SELL":
-                current_quantity -= t.quantity
-        
-        # 판매하려는 수량이 보유 수량보다 많으면 에러
-        if transaction.quantity > current_quantity:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"보유한 수량({current_quantity}주)보다 많은 수량({transaction.quantity}주)을 판매할 수 없습니다."
-            )
+    Returns:
+        List[SimulationTransaction]: 체결된 거래 내역 목록
         
-        # 잔액 증가
-        account.current_balance += total_amount
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우, 등록되지 않은 심볼이 있는 경우,
+            또는 잔액/보유 수량 부족으로 주문이 실패한 경우
+    """
+    # 계좌 존재 및 접근 권한 확인
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == basket.account_id).first()
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모의 투자 계좌를 찾을 수 없습니다."
+        )
     
-    # 새 거래 내역 생성
-    db_transaction = SimulationTransactionModel(
-        account_id=account.id,
-        stock_id=stock.id,
-        transaction_type=transaction.transaction_type,
-        quantity=transaction.quantity,
-        price=transaction.price,
-        total_amount=total_amount
-    )
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
     
-    # 데이터베이스에 저장
-    db.add(db_transaction)
-    db.commit()
-    db.refresh(db_transaction)
+    # 백테스트 결과 계좌는 저장된 결과 조회 전용
+    if account.mode == BACKTEST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="백테스트 결과 계좌에서는 거래할 수 없습니다."
+        )
     
-    return db_transaction
+    # 모든 심볼을 한 번의 쿼리로 조회
+    symbols = {order.symbol.upper() for order in basket.orders}
+    stocks = {
+        stock.symbol: stock
+        for stock in db.query(StockModel).filter(StockModel.symbol.in_(symbols)).all()
+    }
+    
+    missing = sorted(symbols - stocks.keys())
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"등록되지 않은 주식 심볼입니다: {', '.join(missing)}"
+        )
+    
+    # 주문별 체결가 및 수수료 계산 (과거 재현 계좌는 가상 날짜의 일봉 종가)
+    legs = []
+    for order in basket.orders:
+        stock = stocks[order.symbol.upper()]
+        if account.mode == REPLAY:
+            fill_price, commission = price_replay_order(db, account, stock, order.transaction_type, order.quantity)
+        else:
+            fill_price, commission = price_market_order(stock, order.transaction_type, order.quantity)
+        legs.append((stock.id, order.transaction_type, order.quantity, fill_price, commission))
+    
+    transaction_date = replay_timestamp(account.replay_date) if account.mode == REPLAY else None
+    return await run_in_threadpool(execute_basket, db, account.id, legs, transaction_date)
 
 @router.get("/accounts/{account_id}/transactions", response_model=List[SimulationTransaction])
 def get_account_transactions(
     account_id: int,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000, description="페이지 당 거래 내역 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     current_user: UserModel = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     특정 모의 투자 계좌의 거래 내역 목록 조회 API 엔드포인트
     
+    (transaction_date, id) 기준 키셋 페이지네이션을 사용합니다. 다음 페이지가
+    있으면 X-Next-Cursor 응답 헤더로 커서를 전달합니다.
+    
     Args:
         account_id (int): 조회할 모의 투자 계좌 ID
+        response (Response): 커서 헤더를 설정할 응답 객체
+        limit (int): 페이지 당 거래 내역 수
+        cursor (Optional[str]): 다음 페이지 커서
         current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
         db (Session): 데이터베이스 세션 (의존성 주입)
         
@@ -392,7 +438,7 @@ def get_account_transactions(
         List[SimulationTransaction]: 거래 내역 목록
         
     Raises:
-        HTTPException: 계좌가 없거나 접근 권한이 없는 경우
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우, 또는 커서가 유효하지 않은 경우
     """
     # 계좌 존재 및 접근 권한 확인
     account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
@@ -409,8 +455,688 @@ def get_account_transactions(
         )
     
     # 거래 내역 조회 (최신순 정렬)
-    transactions = db.query(SimulationTransactionModel).filter(
-        SimulationTransactionModel.account_id == account_id
-    ).order_by(SimulationTransactionModel.transaction_date.desc()).all()
+    query = db.query(SimulationTransactionModel).filter(SimulationTransactionModel.account_id == account_id)
+    
+    try:
+        transactions, next_cursor = keyset_page(
+            query, SimulationTransactionModel.transaction_date, SimulationTransactionModel.id, limit, cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
+    return transactions
+
+@router.get("/accounts/{account_id}/transactions/export")
+def export_account_transactions(
+    account_id: int,
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="내보내기 형식 (csv, ndjson)"),
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    모의 투자 계좌 거래 내역 전체 내보내기 API 엔드포인트
+    
+    서버 측 DB 커서로 읽으면서 CSV 또는 NDJSON으로 스트리밍하므로
+    거래 내역 수와 관계없이 메모리 사용량이 일정합니다.
+    
+    Args:
+        account_id (int): 내보낼 모의 투자 계좌 ID
+        format (str): 내보내기 형식
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        StreamingResponse: 거래 내역 스트림
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우
+    """
+    # 계좌 존재 및 접근 권한 확인
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    columns = ["id", "transaction_date", "symbol", "transaction_type", "quantity", "price", "total_amount"]
+    
+    def build_query(session: Session):
+        return session.query(
+            SimulationTransactionModel.id,
+            SimulationTransactionModel.transaction_date,
+            StockModel.symbol,
+            SimulationTransactionModel.transaction_type,
+            SimulationTransactionModel.quantity,
+            SimulationTransactionModel.price,
+            SimulationTransactionModel.total_amount
+        ).join(StockModel, StockModel.id == SimulationTransactionModel.stock_id).filter(
+            SimulationTransactionModel.account_id == account_id
+        ).order_by(SimulationTransactionModel.transaction_date.desc(), SimulationTransactionModel.id.desc())
+    
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv"
+    return StreamingResponse(
+        stream_export(build_query, columns, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="simulation_account_{account_id}_transactions.{format}"'}
+    )
+
+@router.post("/orders", response_model=SimulationOrder)
+async def create_simulation_order(
+    order: SimulationOrderCreate,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    모의 투자 대기 주문 생성 API 엔드포인트
+    
+    주문을 저장하고 매칭 엔진에 등록합니다. 현재 시세로 바로 체결 가능한
+    주문은 응답 전에 체결됩니다.
+    
+    Args:
+        order (SimulationOrderCreate): 생성할 대기 주문 정보
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        SimulationOrder: 생성된 주문 정보
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우, 또는 등록되지 않은 심볼인 경우
+    """
+    # 계좌 존재 및 접근 권한 확인
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == order.account_id).first()
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모의 투자 계좌를 찾을 수 없습니다."
+        )
     
-    return transactions
\ No newline at end of file
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    # 백테스트 결과 계좌는 저장된 결과 조회 전용
+    if account.mode == BACKTEST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="백테스트 결과 계좌에서는 거래할 수 없습니다."
+        )
+    
+    # 대기 주문은 실시간 시세로 매칭되므로 과거 재현 계좌에서는 사용할 수 없음
+    if account.mode == REPLAY:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="과거 재현 계좌는 시장가 주문만 사용할 수 있습니다."
+        )
+    
+    symbol = order.symbol.upper()
+    stock = db.query(StockModel).filter(StockModel.symbol == symbol).first()
+    if not stock:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"등록되지 않은 주식 심볼입니다: {symbol}"
+        )
+    
+    # 주문 저장
+    db_order = SimulationOrderModel(
+        account_id=account.id,
+        stock_id=stock.id,
+        order_type=order.order_type,
+        transaction_type=order.transaction_type,
+        quantity=order.quantity,
+        limit_price=order.limit_price,
+        stop_price=order.stop_price,
+        status="OPEN"
+    )
+    db.add(db_order)
+    db.commit()
+    db.refresh(db_order)
+    
+    # 매칭 엔진 등록 후 현재 시세로 즉시 체결 가능한지 확인
+    ORDER_BOOK.add(RestingOrder.from_model(db_order, symbol))
+    try:
+        await ORDER_BOOK.process_tick(symbol, float(get_market_price(stock)))
+    except HTTPException:
+        # 시세 정보가 없으면 다음 틱까지 대기
+        pass
+    
+    db.refresh(db_order)
+    return db_order
+
+@router.get("/accounts/{account_id}/orders", response_model=List[SimulationOrder])
+def get_account_orders(
+    account_id: int,
+    status_filter: Optional[str] = Query(None, alias="status", description="주문 상태 (OPEN, TRIGGERED, FILLED, CANCELLED, REJECTED)"),
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    모의 투자 계좌의 대기 주문 목록 조회 API 엔드포인트
+    
+    Args:
+        account_id (int): 조회할 모의 투자 계좌 ID
+        status_filter (Optional[str]): 주문 상태 필터
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        List[SimulationOrder]: 주문 목록 (최신순)
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우
+    """
+    # 계좌 존재 및 접근 권한 확인
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    query = db.query(SimulationOrderModel).filter(SimulationOrderModel.account_id == account_id)
+    if status_filter:
+        query = query.filter(SimulationOrderModel.status == status_filter.upper())
+    
+    return query.order_by(SimulationOrderModel.created_at.desc()).all()
+
+@router.delete("/orders/{order_id}", response_model=SimulationOrder)
+def cancel_simulation_order(
+    order_id: int,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    모의 투자 대기 주문 취소 API 엔드포인트
+    
+    Args:
+        order_id (int): 취소할 주문 ID
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        SimulationOrder: 취소된 주문 정보
+        
+    Raises:
+        HTTPException: 주문이 없거나 접근 권한이 없는 경우, 또는 이미 종료된 주문인 경우
+    """
+    # 체결 처리와 겹치지 않도록 주문 행 잠금
+    db_order = db.query(SimulationOrderModel).filter(
+        SimulationOrderModel.id == order_id
+    ).with_for_update().first()
+    
+    if not db_order:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="주문을 찾을 수 없습니다."
+        )
+    
+    if db_order.account.user_id != current_user.id:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 주문에 접근할 권한이 없습니다."
+        )
+    
+    if db_order.status not in ACTIVE_STATUSES:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"이미 종료된 주문입니다 (상태: {db_order.status})."
+        )
+    
+    db_order.status = "CANCELLED"
+    db.commit()
+    db.refresh(db_order)
+    
+    ORDER_BOOK.remove(order_id)
+    
+    return db_order
+
+@router.get("/accounts/{account_id}/stats", response_model=SimulationTradeStats)
+def get_account_trade_stats(
+    account_id: int,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    모의 투자 계좌 거래 통계 조회 API 엔드포인트
+    
+    승률, 평균 보유 기간, 평균 이익/손실, 회전율, 최대 이익/손실 거래를
+    DB 윈도우 함수로 한 번에 계산하며, 결과는 계좌의 다음 거래 전까지 캐시됩니다.
+    
+    Args:
+        account_id (int): 조회할 모의 투자 계좌 ID
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        SimulationTradeStats: 거래 통계
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우
+    """
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    return get_trade_stats(db, account_id)
+
+@router.get("/leaderboard", response_model=List[LeaderboardEntry])
+def get_leaderboard(
+    limit: int = Query(10, ge=1, le=100),
+    current_user: UserModel = Depends(get_current_user)
+):
+    """
+    모의 투자 수익률 순위 조회 API 엔드포인트
+    
+    메모리 순위표에서 바로 읽으므로 계좌별 거래 내역을 다시 계산하지 않습니다.
+    
+    Args:
+        limit (int): 조회할 상위 계좌 수
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        
+    Returns:
+        List[LeaderboardEntry]: 수익률 상위 계좌 목록
+    """
+    return LEADERBOARD.top(limit)
+
+@router.get("/leaderboard/accounts/{account_id}", response_model=LeaderboardEntry)
+def get_account_rank(
+    account_id: int,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    모의 투자 계좌 순위 조회 API 엔드포인트
+    
+    Args:
+        account_id (int): 조회할 모의 투자 계좌 ID
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        LeaderboardEntry: 계좌의 현재 순위와 수익률
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우
+    """
+    entry = LEADERBOARD.get_rank(account_id)
+    
+    if entry is None:
+        # 순위표에 아직 반영되지 않은 계좌는 DB에서 한 번 읽어 등록
+        account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+        if not account:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="모의 투자 계좌를 찾을 수 없습니다."
+            )
+        if account.user_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+            )
+        LEADERBOARD.refresh_account(db, account_id)
+        entry = LEADERBOARD.get_rank(account_id)
+        if entry is None:
+            # 과거 재현 계좌는 순위 대상이 아님
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="순위표에 없는 모의 투자 계좌입니다."
+            )
+    
+    if entry["user_id"] != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    return entry
+
+@router.get("/accounts/{account_id}/nav", response_model=List[NavSnapshotSchema])
+def get_account_nav_history(
+    account_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    모의 투자 계좌 일별 NAV 이력 조회 API 엔드포인트
+    
+    장 마감 후 저장된 스냅샷을 읽으므로 거래 내역을 다시 계산하지 않습니다.
+    
+    Args:
+        account_id (int): 조회할 모의 투자 계좌 ID
+        start_date (Optional[date]): 시작일 (포함)
+        end_date (Optional[date]): 종료일 (포함)
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        List[NavSnapshot]: 날짜 오름차순 NAV 스냅샷 목록
+        
+    Raises:
+        HTTPException: 모의 투자 계좌가 없거나 접근 권한이 없는 경우
+    """
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    return get_nav_history(db, SIMULATION, account_id, start_date, end_date)
+
+@router.get("/accounts/{account_id}/returns", response_model=PeriodReturns)
+def get_account_period_returns(
+    account_id: int,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    모의 투자 계좌 기간 수익률(1D/1W/1M/YTD) 조회 API 엔드포인트
+    
+    Args:
+        account_id (int): 조회할 모의 투자 계좌 ID
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        PeriodReturns: 최근 스냅샷 기준 기간 수익률
+        
+    Raises:
+        HTTPException: 모의 투자 계좌가 없거나 접근 권한이 없는 경우, 아직 스냅샷이 없는 경우
+    """
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    returns = get_period_returns(db, SIMULATION, account_id)
+    if returns is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="아직 저장된 NAV 스냅샷이 없습니다."
+        )
+    
+    return returns
+
+@router.get("/accounts/{account_id}/replay/quote/{symbol}", response_model=dict)
+def get_replay_quote(
+    account_id: int,
+    symbol: str,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    과거 재현 계좌의 가상 날짜 기준 시세 조회 API 엔드포인트
+    
+    저장된 일별 시세에서 가상 날짜 이전(포함) 마지막 거래일의 일봉을 반환합니다.
+    외부 API는 호출하지 않습니다 (시세는 계좌 생성 시 replay_symbols로 저장).
+    
+    Args:
+        account_id (int): 과거 재현 모의 투자 계좌 ID
+        symbol (str): 주식 심볼
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        dict: symbol, date, open, high, low, close, volume
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우, 등록되지 않은 심볼이거나 가상 날짜 이전 시세가 없는 경우
+    """
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    
+    if not account or account.mode != REPLAY:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="과거 재현 모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    stock = db.query(StockModel).filter(StockModel.symbol == symbol.upper()).first()
+    if not stock:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"등록되지 않은 주식 심볼입니다: {symbol.upper()}"
+        )
+    
+    bar = HISTORY_STORE.quote(db, stock.id, account.replay_date)
+    if bar is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{account.replay_date} 이전의 {stock.symbol} 시세가 없습니다."
+        )
+    
+    return {"symbol": stock.symbol, **bar}
+
+@router.get("/accounts/{account_id}/replay", response_model=ReplayStatus)
+def get_replay_status(
+    account_id: int,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    과거 재현 계좌 상태 조회 API 엔드포인트
+    
+    Args:
+        account_id (int): 과거 재현 모의 투자 계좌 ID
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        ReplayStatus: 현재 가상 날짜와 가상 시계 실행 여부
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우
+    """
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    
+    if not account or account.mode != REPLAY:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="과거 재현 모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    return {
+        "account_id": account.id,
+        "replay_date": account.replay_date,
+        "running": REPLAY_CLOCKS.is_running(account.id)
+    }
+
+@router.post("/accounts/{account_id}/replay/advance", response_model=ReplayStatus)
+def advance_replay(
+    account_id: int,
+    advance: ReplayAdvance,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    과거 재현 가상 날짜 진행 API 엔드포인트
+    
+    가상 날짜를 영업일 기준으로 앞으로 이동합니다 (오늘 이후로는 이동하지 않음).
+    
+    Args:
+        account_id (int): 과거 재현 모의 투자 계좌 ID
+        advance (ReplayAdvance): 이동할 영업일 수
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        ReplayStatus: 이동 후 가상 날짜
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우
+    """
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    
+    if not account or account.mode != REPLAY:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="과거 재현 모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    replay_date = advance_replay_date(db, account.id, advance.days)
+    
+    return {
+        "account_id": account.id,
+        "replay_date": replay_date,
+        "running": REPLAY_CLOCKS.is_running(account.id)
+    }
+
+@router.post("/accounts/{account_id}/replay/start", response_model=ReplayStatus)
+async def start_replay_clock(
+    account_id: int,
+    clock: ReplayClockStart,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    과거 재현 가상 시계 자동 진행 시작 API 엔드포인트
+    
+    interval_seconds마다 가상 날짜를 하루(영업일)씩 진행합니다.
+    가상 시계는 요청을 처리한 서버 프로세스에서 실행됩니다.
+    
+    Args:
+        account_id (int): 과거 재현 모의 투자 계좌 ID
+        clock (ReplayClockStart): 진행 간격과 종료 날짜
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        ReplayStatus: 현재 가상 날짜와 실행 여부
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우, 종료 날짜가 가상 날짜 이전인 경우
+    """
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    
+    if not account or account.mode != REPLAY:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="과거 재현 모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    if clock.until is not None and clock.until <= account.replay_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="종료 날짜는 현재 가상 날짜 이후여야 합니다."
+        )
+    
+    REPLAY_CLOCKS.start(account.id, clock.interval_seconds, clock.until)
+    
+    return {
+        "account_id": account.id,
+        "replay_date": account.replay_date,
+        "running": True
+    }
+
+@router.post("/accounts/{account_id}/replay/stop", response_model=ReplayStatus)
+def stop_replay_clock(
+    account_id: int,
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    과거 재현 가상 시계 정지 API 엔드포인트
+    
+    Args:
+        account_id (int): 과거 재현 모의 투자 계좌 ID
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        ReplayStatus: 현재 가상 날짜
+        
+    Raises:
+        HTTPException: 계좌가 없거나 접근 권한이 없는 경우
+    """
+    account = db.query(SimulationAccountModel).filter(SimulationAccountModel.id == account_id).first()
+    
+    if not account or account.mode != REPLAY:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="과거 재현 모의 투자 계좌를 찾을 수 없습니다."
+        )
+    
+    if account.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 모의 투자 계좌에 접근할 권한이 없습니다."
+        )
+    
+    REPLAY_CLOCKS.stop(account.id)
+    
+    return {
+        "account_id": account.id,
+        "replay_date": account.replay_date,
+        "running": False
+    }
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.db.database import get_db
 from app.db.models import Transaction as TransactionModel, Portfolio as PortfolioModel, Stock as StockModel, User as UserModel
 from app.schemas.transactions import Transaction as TransactionSchema, TransactionCreate
 from app.api.v1.endpoints.auth import get_current_user
 from app.services.stock_data import get_stock_quote
+from app.db.pagination import keyset_page, stream_export, InvalidCursorError, NEXT_CURSOR_HEADER
 
 router = APIRouter()
 
@@ -108,14 +110,23 @@ async def create_transaction(
 @router.get("/portfolio/{portfolio_id}", response_model=List[TransactionSchema])
 def get_portfolio_transactions(
     portfolio_id: int,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000, description="페이지 당 거래 내역 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     current_user: UserModel = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     특정 포트폴리오의 거래 내역 목록 조회 API 엔드포인트
     
+    (transaction_date, id) 기준 키셋 페이지네이션을 사용합니다. 다음 페이지가
+    있으면 X-Next-Cursor 응답 헤더로 커서를 전달합니다.
+    
     Args:
         portfolio_id (int): 조회할 포트폴리오 ID
+        response (Response): 커서 헤더를 설정할 응답 객체
+        limit (int): 페이지 당 거래 내역 수
+        cursor (Optional[str]): 다음 페이지 커서
         current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
         db (Session): 데이터베이스 세션 (의존성 주입)
         
@@ -123,7 +134,7 @@ def get_portfolio_transactions(
         List[TransactionSchema]: 거래 내역 목록
         
     Raises:
-        HTTPException: 포트폴리오가 없거나 접근 권한이 없는 경우
+        HTTPException: 포트폴리오가 없거나 접근 권한이 없는 경우, 또는 커서가 유효하지 않은 경우
     """
     # 포트폴리오 존재 및 접근 권한 확인
     portfolio = db.query(PortfolioModel).filter(PortfolioModel.id == portfolio_id).first()
@@ -140,8 +151,76 @@ def get_portfolio_transactions(
         )
     
     # 거래 내역 조회 (최신순 정렬)
-    transactions = db.query(TransactionModel).filter(
-        TransactionModel.portfolio_id == portfolio_id
-    ).order_by(TransactionModel.transaction_date.desc()).all()
+    query = db.query(TransactionModel).filter(TransactionModel.portfolio_id == portfolio_id)
+    
+    try:
+        transactions, next_cursor = keyset_page(
+            query, TransactionModel.transaction_date, TransactionModel.id, limit, cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
+    return transactions
+
+@router.get("/portfolio/{portfolio_id}/export")
+def export_portfolio_transactions(
+    portfolio_id: int,
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="내보내기 형식 (csv, ndjson)"),
+    current_user: UserModel = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    포트폴리오 거래 내역 전체 내보내기 API 엔드포인트
+    
+    서버 측 DB 커서로 읽으면서 CSV 또는 NDJSON으로 스트리밍하므로
+    거래 내역 수와 관계없이 메모리 사용량이 일정합니다.
+    
+    Args:
+        portfolio_id (int): 내보낼 포트폴리오 ID
+        format (str): 내보내기 형식
+        current_user (UserModel): 현재 인증된 사용자 (의존성 주입)
+        db (Session): 데이터베이스 세션 (의존성 주입)
+        
+    Returns:
+        StreamingResponse: 거래 내역 스트림
+        
+    Raises:
+        HTTPException: 포트폴리오가 없거나 접근 권한이 없는 경우
+    """
+    # 포트폴리오 존재 및 접근 권한 확인
+    portfolio = db.query(PortfolioModel).filter(PortfolioModel.id == portfolio_id).first()
+    if not portfolio:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="포트폴리오를 찾을 수 없습니다."
+        )
+    
+    if portfolio.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 포트폴리오에 접근할 권한이 없습니다."
+        )
+    
+    columns = ["id", "transaction_date", "symbol", "transaction_type", "quantity", "price"]
+    
+    def build_query(session: Session):
+        return session.query(
+            TransactionModel.id,
+            TransactionModel.transaction_date,
+            StockModel.symbol,
+            TransactionModel.transaction_type,
+            TransactionModel.quantity,
+            TransactionModel.price
+        ).join(StockModel, StockModel.id == TransactionModel.stock_id).filter(
+            TransactionModel.portfolio_id == portfolio_id
+        ).order_by(TransactionModel.transaction_date.desc(), TransactionModel.id.desc())
     
-    return transactions
\ No newline at end of file
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv"
+    return StreamingResponse(
+        stream_export(build_query, columns, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="portfolio_{portfolio_id}_transactions.{format}"'}
+    )
\ No newline at end of file
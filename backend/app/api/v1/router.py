@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, stocks, portfolios, transactions, simulation, news
+from app.api.v1.endpoints import auth, stocks, portfolios, transactions, simulation, news, backtests, debug
 
 api_router = APIRouter()
 
@@ -19,4 +19,10 @@ api_router.include_router(transactions.router, prefix="/transactions", tags=["
 api_router.include_router(simulation.router, prefix="/simulation", tags=["모의 투자"])
 
 # 뉴스 엔드포인트 등록
-api_router.include_router(news.router, prefix="/news", tags=["뉴스"])
\ No newline at end of file
+api_router.include_router(news.router, prefix="/news", tags=["뉴스"])
+
+# 백테스트 엔드포인트 등록
+api_router.include_router(backtests.router, prefix="/backtests", tags=["백테스트"])
+
+# 디버그(요청 프로파일 다운로드) 엔드포인트 등록
+api_router.include_router(debug.router, prefix="/debug", tags=["디버그"], include_in_schema=False)
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -7,6 +8,8 @@ load_dotenv()
 # 기본 설정
 DEBUG = os.getenv("DEBUG", "False") == "True"
 ENVIRONMENT = os.getenv("ENVIRONMENT", "production")
+# 앱 로그 수준 (DEBUG, INFO, WARNING, ERROR) - 주기 작업/백그라운드 작업 실패는 ERROR로 기록
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 
 # 데이터베이스 설정
 DB_HOST = os.getenv("DB_HOST")
@@ -21,7 +24,84 @@ DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NA
 # 보안 설정
 SECRET_KEY = os.getenv("SECRET_KEY", "fallback_secret_key_change_in_production")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+# 비밀번호 해시 설정
+# bcrypt 비용(rounds) - 바꾸면 기존 사용자는 다음 로그인 때 새 비용으로 다시 해시됨
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# 해시/검증 전용 프로세스 풀 크기 (0이면 CPU 코어 수의 절반)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+# 실행 중 + 대기 중인 해시/검증 작업 상한 (넘으면 즉시 503)
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+# 인증된 사용자 정보 캐시 (get_current_user의 사용자 조회 생략) - 유효 시간(초)과 최대 항목 수
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
 
 # API 키
 STOCK_API_KEY = os.getenv("STOCK_API_KEY")
-NEWS_API_KEY = os.getenv("NEWS_API_KEY")
\ No newline at end of file
+NEWS_API_KEY = os.getenv("NEWS_API_KEY")
+# 외부 API 주소 (부하 테스트에서 로컬 대역 서버로 바꿔 사용 - benchmarks/fake_upstreams.py)
+ALPHA_VANTAGE_BASE_URL = os.getenv("ALPHA_VANTAGE_BASE_URL", "https://www.alphavantage.co/query")
+NEWS_API_BASE_URL = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org/v2")
+
+# 모의 투자 체결 설정
+# 시장가 주문은 메모리 캐시의 최근 시세로 체결하며, 캐시가 이보다 오래되면 DB의 last_price 사용
+MARKET_QUOTE_MAX_AGE = int(os.getenv("MARKET_QUOTE_MAX_AGE", "900"))
+# 슬리피지 모델: none, fixed_bps
+SIMULATION_SLIPPAGE_MODEL = os.getenv("SIMULATION_SLIPPAGE_MODEL", "none")
+SIMULATION_SLIPPAGE_BPS = float(os.getenv("SIMULATION_SLIPPAGE_BPS", "0"))
+# 수수료 모델: none, per_share, percent
+SIMULATION_COMMISSION_MODEL = os.getenv("SIMULATION_COMMISSION_MODEL", "none")
+SIMULATION_COMMISSION_RATE = float(os.getenv("SIMULATION_COMMISSION_RATE", "0"))
+SIMULATION_COMMISSION_MIN = float(os.getenv("SIMULATION_COMMISSION_MIN", "0"))
+
+# 워커별 대기 주문 매칭 엔진을 DB의 미체결 주문과 맞추는 주기 (초)
+# 다른 워커에서 접수/취소/체결된 주문이 이 워커의 엔진에 반영되기까지의 최대 지연
+ORDER_BOOK_SYNC_INTERVAL = int(os.getenv("ORDER_BOOK_SYNC_INTERVAL", "10"))
+
+# 계산 작업(백테스트 파라미터 탐색 등)용 프로세스 풀 크기 (0이면 CPU 코어 수)
+COMPUTE_WORKERS = int(os.getenv("COMPUTE_WORKERS", "0"))
+
+# 모의 투자 순위표를 simulation_leaderboard 테이블에 저장하는 주기 (초)
+LEADERBOARD_CHECKPOINT_INTERVAL = int(os.getenv("LEADERBOARD_CHECKPOINT_INTERVAL", "300"))
+# 워커별 메모리 순위표에 다른 워커에서 바뀐 계좌(simulation_account_changes)를 반영하는 주기 (초)
+LEADERBOARD_SYNC_INTERVAL = int(os.getenv("LEADERBOARD_SYNC_INTERVAL", "5"))
+# 계좌 변경 기록을 커밋 지연에 대비해 다시 확인하는 기간 (초) - 가장 긴 거래 트랜잭션보다 길어야 함
+# 기록은 이 기간의 두 배가 지나면 리더의 체크포인트 작업이 삭제
+LEADERBOARD_CHANGE_WINDOW = int(os.getenv("LEADERBOARD_CHANGE_WINDOW", "300"))
+
+# 일별 NAV 스냅샷 작업 실행 시각 (UTC, HH:MM) - 미국 장 마감 이후
+NAV_SNAPSHOT_TIME = os.getenv("NAV_SNAPSHOT_TIME", "21:30")
+
+# 뉴스 수집 작업 설정
+# 시장 뉴스와 관심 종목(보유 종목 + 최근 조회 종목) 뉴스를 주기마다 한 번씩 가져옴
+NEWS_INGEST_INTERVAL = int(os.getenv("NEWS_INGEST_INTERVAL", "900"))
+# 한 주기에 수집하는 최대 종목 수 (주기당 외부 API 호출 수 = 1 + 이 값 이하)
+NEWS_INGEST_MAX_SYMBOLS = int(os.getenv("NEWS_INGEST_MAX_SYMBOLS", "50"))
+# 조회된 미보유 종목을 수집 대상에 유지하는 시간 (초)
+NEWS_WATCH_TTL = int(os.getenv("NEWS_WATCH_TTL", "86400"))
+
+# 요청 프로파일링 (둘 다 설정하지 않으면 미들웨어를 등록하지 않음)
+# 무작위로 프로파일링할 요청 비율 (0 ~ 1)
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+# X-Profile-Token 헤더로 요청을 프로파일링하거나 결과를 내려받을 때 쓰는 토큰 (비어 있으면 헤더 요청/다운로드 비활성)
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+# 스택 샘플링 간격 (밀리초)
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+# 프로파일 저장 디렉터리와 보관 개수 (오래된 것부터 삭제)
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(tempfile.gettempdir(), "stockdashx-profiles"))
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "200"))
+
+# 서버 시작 시 DB 스키마 처리 방식
+# create: 모델 기준으로 없는 테이블 생성 (로컬 개발 기본값)
+# check: 테이블을 만들지 않고 시작 후 백그라운드에서 alembic 마이그레이션 버전만 확인 (빠른 시작, 운영 권장)
+# skip: 스키마를 건드리지 않음
+STARTUP_SCHEMA_MODE = os.getenv("STARTUP_SCHEMA_MODE", "create")
+
+# 주기 작업 리더 선출 (여러 uvicorn 워커 중 한 워커만 주기 작업 실행)
+# postgres: DB advisory lock (여러 호스트), file: 파일 잠금 (단일 호스트), none: 모든 워커가 실행 (워커 1개일 때)
+LEADER_ELECTION = os.getenv("LEADER_ELECTION", "postgres")
+# advisory lock 키 (같은 DB를 쓰는 다른 앱과 겹치지 않는 값)
+LEADER_LOCK_KEY = int(os.getenv("LEADER_LOCK_KEY", "7405001"))
+# file 방식의 잠금 파일 경로 (모든 워커가 같은 경로를 사용해야 함)
+LEADER_LOCK_FILE = os.getenv("LEADER_LOCK_FILE", os.path.join(tempfile.gettempdir(), "stockdashx-scheduler.lock"))
+# 리더가 아닌 워커가 리더 자리를 다시 시도하는 간격 (초) - 리더가 죽었을 때 넘겨받기까지의 최대 시간
+LEADER_RETRY_INTERVAL = int(os.getenv("LEADER_RETRY_INTERVAL", "15"))
@@ -0,0 +1,60 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from typing import Optional
+
+from app.config import COMPUTE_WORKERS, PASSWORD_HASH_WORKERS
+
+# CPU 집약적인 계산 작업용 프로세스 풀 (첫 사용 시 생성)
+_compute_pool: Optional[ProcessPoolExecutor] = None
+# 비밀번호 해시/검증(bcrypt) 전용 프로세스 풀 (첫 사용 시 생성)
+_password_pool: Optional[ProcessPoolExecutor] = None
+
+
+def compute_pool_size() -> int:
+    """계산 풀의 워커 프로세스 수"""
+    return COMPUTE_WORKERS or os.cpu_count() or 1
+
+
+def get_compute_pool() -> ProcessPoolExecutor:
+    """
+    백테스트 파라미터 탐색처럼 CPU를 오래 쓰는 작업을 실행할 프로세스 풀을 반환합니다.
+
+    요청 처리 스레드풀이나 이벤트 루프와 분리되어 GIL 경합 없이 병렬로 실행됩니다.
+
+    Returns:
+        ProcessPoolExecutor: 프로세스 전역 계산 풀
+    """
+    global _compute_pool
+    if _compute_pool is None:
+        # 워커가 공유 메모리(백테스트 일봉)를 열 때 부모와 같은 resource tracker에 등록하도록
+        # 풀을 만들기 전에 tracker를 띄움 (워커별 tracker가 종료 시 블록을 지우지 않도록)
+        resource_tracker.ensure_running()
+        _compute_pool = ProcessPoolExecutor(max_workers=compute_pool_size())
+    return _compute_pool
+
+
+def get_password_pool() -> ProcessPoolExecutor:
+    """
+    bcrypt 해시/검증을 실행할 프로세스 풀을 반환합니다.
+
+    로그인이 몰려도 요청 처리 스레드풀과 계산 풀을 점유하지 않도록 분리되어 있습니다.
+
+    Returns:
+        ProcessPoolExecutor: 프로세스 전역 비밀번호 해시 풀
+    """
+    global _password_pool
+    if _password_pool is None:
+        _password_pool = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS or max(1, (os.cpu_count() or 2) // 2))
+    return _password_pool
+
+
+def shutdown_executors():
+    """애플리케이션 종료 시 프로세스 풀 정리"""
+    global _compute_pool, _password_pool
+    if _compute_pool is not None:
+        _compute_pool.shutdown(wait=False, cancel_futures=True)
+        _compute_pool = None
+    if _password_pool is not None:
+        _password_pool.shutdown(wait=False, cancel_futures=True)
+        _password_pool = None
@@ -0,0 +1,179 @@
+import logging
+import os
+import threading
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import LEADER_ELECTION, LEADER_LOCK_FILE, LEADER_LOCK_KEY
+from app.core.metrics import SCHEDULER_LEADER
+from app.db.database import engine
+
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresAdvisoryLock:
+    """
+    DB 세션 수준 advisory lock으로 리더 선출 (여러 호스트의 워커)
+
+    잠금을 잡은 워커는 전용 연결을 계속 열어 두며, 프로세스가 죽어 연결이
+    끊기면 Postgres가 잠금을 풀어 다른 워커가 넘겨받습니다.
+    """
+
+    def __init__(self, key: int = LEADER_LOCK_KEY):
+        self.key = key
+        self._conn = None
+
+    def acquire(self) -> bool:
+        # 풀 연결을 트랜잭션 없이 붙잡아 두기 위해 autocommit으로 사용
+        conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}).scalar()
+        except SQLAlchemyError:
+            conn.close()
+            raise
+        if not acquired:
+            # 리더가 아닌 워커는 연결을 붙잡지 않음
+            conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    def alive(self) -> bool:
+        """잠금을 잡은 연결이 살아 있는지 확인 (연결이 살아 있으면 잠금도 유지됨)"""
+        try:
+            self._conn.execute(text("SELECT 1"))
+            return True
+        except SQLAlchemyError:
+            self._close()
+            return False
+
+    def release(self):
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+        except SQLAlchemyError:
+            pass
+        self._close()
+
+    def _close(self):
+        # 잠금을 잡았던 세션이 풀에 돌아가 재사용되지 않도록 연결 폐기
+        try:
+            self._conn.invalidate()
+            self._conn.close()
+        except SQLAlchemyError:
+            pass
+        self._conn = None
+
+
+class FileLock:
+    """
+    잠금 파일의 flock으로 리더 선출 (단일 호스트의 워커)
+
+    프로세스가 죽으면 운영체제가 잠금을 풀어 다른 워커가 넘겨받습니다.
+    """
+
+    def __init__(self, path: str = LEADER_LOCK_FILE):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> bool:
+        import fcntl
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        # 어느 워커가 리더인지 확인할 수 있도록 PID 기록
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._fd = fd
+        return True
+
+    def alive(self) -> bool:
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        import fcntl
+
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+class NoLock:
+    """리더 선출 없음 - 모든 워커가 리더 (워커가 1개인 경우)"""
+
+    def acquire(self) -> bool:
+        return True
+
+    def alive(self) -> bool:
+        return True
+
+    def release(self):
+        pass
+
+
+class LeaderElection:
+    """
+    주기 작업을 실행할 워커 하나를 고르는 리더 선출
+
+    리더가 아닌 워커는 LEADER_RETRY_INTERVAL마다 renew()로 잠금을 다시 시도해
+    리더가 죽으면 넘겨받고, 리더는 renew()로 잠금이 유지되는지 확인합니다.
+    리더 전용 작업은 실행 직전에도 renew()를 호출하므로 잠금을 잃은 워커가
+    작업을 실행하지 않습니다. renew()는 DB/파일 작업을 하므로 스레드풀에서 호출합니다.
+    """
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.is_leader = False
+        self._lock = threading.Lock()
+
+    def renew(self) -> bool:
+        """
+        리더이면 잠금이 유지되는지 확인하고, 아니면 잠금을 시도
+
+        Returns:
+            bool: 이 워커가 리더인지 여부
+        """
+        with self._lock:
+            was_leader = self.is_leader
+            try:
+                self.is_leader = self.lock.alive() if was_leader else self.lock.acquire()
+            except Exception:
+                self.is_leader = False
+                raise
+            finally:
+                SCHEDULER_LEADER.set(1 if self.is_leader else 0)
+                if self.is_leader != was_leader:
+                    logger.info("주기 작업 리더 %s (pid %d)", "선출" if self.is_leader else "해제", os.getpid())
+            return self.is_leader
+
+    def release(self):
+        """서버 종료 시 잠금을 풀어 다른 워커가 바로 넘겨받도록 함"""
+        with self._lock:
+            if self.is_leader:
+                self.lock.release()
+                self.is_leader = False
+                SCHEDULER_LEADER.set(0)
+
+
+def _create_lock():
+    if LEADER_ELECTION == "postgres":
+        return PostgresAdvisoryLock()
+    if LEADER_ELECTION == "file":
+        return FileLock()
+    if LEADER_ELECTION != "none":
+        logger.warning("알 수 없는 LEADER_ELECTION: %s (리더 선출 없이 실행)", LEADER_ELECTION)
+    return NoLock()
+
+
+# 프로세스 전역 리더 선출
+LEADER = LeaderElection(_create_lock())
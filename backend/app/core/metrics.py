@@ -0,0 +1,376 @@
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+# 요청 지연 시간 기본 버킷(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Prometheus 텍스트 형식 응답의 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 라우트와 매칭되지 않은 요청(404 등)과 요청 밖(주기 작업 등)의 라벨 값 - 라벨 종류가 무한히 늘지 않도록 고정
+UNMATCHED_ROUTE = "unmatched"
+BACKGROUND_ROUTE = "background"
+
+# 처리 중인 요청의 ASGI scope (DB 쿼리를 라우트별로 집계할 때 사용)
+CURRENT_SCOPE: ContextVar[Optional[dict]] = ContextVar("metrics_current_scope", default=None)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _CounterChild:
+    """라벨 값 조합 하나의 카운터 (labels()로 한 번 만들어 두고 재사용)"""
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    """라벨 값 조합 하나의 게이지 (현재 값으로 덮어쓰거나 증감)"""
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+
+class _HistogramChild:
+    """라벨 값 조합 하나의 히스토그램 (버킷별 개수는 미리 할당한 리스트에 누적)"""
+    __slots__ = ("upper_bounds", "counts", "sum", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        # 마지막 칸은 +Inf 버킷
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class _Metric:
+    """
+    라벨별 자식 지표를 가진 지표의 공통 부분
+
+    자식은 라벨 값 튜플로 한 번만 만들어 보관하고, 라벨 문자열은 수집(/metrics
+    응답) 시점에만 만듭니다. 호출 빈도가 높은 곳은 labels() 결과를 모듈 전역에
+    미리 받아 두고 inc()/observe()만 호출합니다.
+    """
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    if len(values) != len(self.labelnames):
+                        raise ValueError(f"{self.name}: 라벨 {self.labelnames}의 값이 필요합니다")
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self.samples())
+        return lines
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in list(self._children.items())
+        ]
+
+
+class Gauge(_Metric):
+    """임의로 오르내리는 현재 값 (리더 여부, 마지막 성공 시각 등)"""
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self.labels().dec(amount)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in list(self._children.items())
+        ]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (Prometheus histogram_quantile로 p50/p95/p99 계산)"""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def samples(self) -> List[str]:
+        lines = []
+        bounds = self.upper_bounds + (float("inf"),)
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """프로세스의 모든 지표 (워커 프로세스마다 따로 집계되므로 워커별로 수집)"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric):
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# HTTP 요청 (라벨의 route는 경로 템플릿 - /api/v1/stocks/{symbol})
+HTTP_REQUEST_DURATION = Histogram(
+    "stockdashx_http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+)
+HTTP_RESPONSES = Counter(
+    "stockdashx_http_responses_total", "HTTP 응답 수 (상태 코드별)", ("method", "route", "status")
+)
+
+# 메모리 캐시
+CACHE_HITS = Counter("stockdashx_cache_hits_total", "캐시 적중 수", ("cache",))
+CACHE_MISSES = Counter("stockdashx_cache_misses_total", "캐시 미스 수 (만료 포함)", ("cache",))
+CACHE_EVICTIONS = Counter("stockdashx_cache_evictions_total", "만료/크기 제한으로 제거된 캐시 항목 수", ("cache",))
+
+# 외부 API
+UPSTREAM_DURATION = Histogram(
+    "stockdashx_upstream_request_duration_seconds", "외부 API 요청 시간", ("provider", "function")
+)
+UPSTREAM_ERRORS = Counter(
+    "stockdashx_upstream_errors_total", "외부 API 요청 실패 수", ("provider", "function")
+)
+
+# DB 쿼리 (요청 밖에서 실행된 쿼리는 route="background")
+DB_QUERY_DURATION = Histogram(
+    "stockdashx_db_query_duration_seconds", "DB 쿼리 실행 시간", ("route",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+# 주기 작업 (result: success, failure, skipped - 리더가 아니라서 건너뜀)
+JOB_RUNS = Counter("stockdashx_job_runs_total", "주기 작업 실행 수", ("job", "result"))
+JOB_DURATION = Histogram(
+    "stockdashx_job_duration_seconds", "주기 작업 실행 시간", ("job",),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+)
+JOB_LAST_SUCCESS = Gauge(
+    "stockdashx_job_last_success_timestamp_seconds", "주기 작업 마지막 성공 시각 (유닉스 시간)", ("job",)
+)
+SCHEDULER_LEADER = Gauge("stockdashx_scheduler_leader", "이 워커가 주기 작업 리더이면 1")
+
+# 비밀번호 해시 프로세스 풀 (operation: hash, verify - 시간은 풀 대기 포함)
+PASSWORD_HASH_DURATION = Histogram(
+    "stockdashx_password_hash_duration_seconds", "비밀번호 해시/검증 시간 (풀 대기 포함)", ("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "stockdashx_password_hash_rejected_total", "대기열이 가득 차 503으로 거절한 해시 작업 수"
+)
+PASSWORD_HASH_PENDING = Gauge("stockdashx_password_hash_pending", "실행 중 + 대기 중인 해시 작업 수")
+
+
+class CacheMetrics:
+    """캐시 하나의 적중/미스/제거 카운터 (모듈 전역에서 한 번 만들어 사용)"""
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self, cache: str):
+        self.hits = CACHE_HITS.labels(cache)
+        self.misses = CACHE_MISSES.labels(cache)
+        self.evictions = CACHE_EVICTIONS.labels(cache)
+
+    def hit(self):
+        self.hits.inc()
+
+    def miss(self):
+        self.misses.inc()
+
+    def evict(self, count: int = 1):
+        self.evictions.inc(count)
+
+
+class UpstreamMetrics:
+    """외부 API 함수 하나의 지연 시간/실패 지표"""
+    __slots__ = ("duration", "errors")
+
+    def __init__(self, provider: str, function: str):
+        self.duration = UPSTREAM_DURATION.labels(provider, function)
+        self.errors = UPSTREAM_ERRORS.labels(provider, function)
+
+    @contextmanager
+    def track(self):
+        """블록 실행 시간을 기록하고, 예외가 발생하면 실패로 집계"""
+        start = perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.errors.inc()
+            raise
+        finally:
+            self.duration.observe(perf_counter() - start)
+
+
+def _route_label(scope: dict) -> str:
+    route = scope.get("route")
+    return route.path if route is not None else UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    요청 지연 시간과 상태 코드별 응답 수를 라우트 템플릿 기준으로 집계하는 ASGI 미들웨어
+
+    라우트는 응답 후 scope["route"](라우팅 시 FastAPI가 설정)로 판단하므로 경로
+    파라미터 값이 라벨에 들어가지 않습니다. 처리 중인 요청의 scope를
+    CURRENT_SCOPE에 두어 DB 쿼리 지표도 같은 라우트로 집계합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        token = CURRENT_SCOPE.set(scope)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            CURRENT_SCOPE.reset(token)
+            method = scope["method"]
+            route = _route_label(scope)
+            HTTP_REQUEST_DURATION.labels(method, route).observe(perf_counter() - start)
+            HTTP_RESPONSES.labels(method, route, status_code).inc()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_start = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_metrics_start", None)
+    if start is None:
+        return
+    scope = CURRENT_SCOPE.get()
+    route = _route_label(scope) if scope is not None else BACKGROUND_ROUTE
+    DB_QUERY_DURATION.labels(route).observe(perf_counter() - start)
+
+
+def instrument_engine(engine):
+    """SQLAlchemy 엔진의 쿼리 수/실행 시간을 라우트별로 집계 (쿼리 수는 _count)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def render_metrics() -> str:
+    """/metrics 응답 본문 (Prometheus 텍스트 형식)"""
+    return REGISTRY.render()
@@ -0,0 +1,210 @@
+import hmac
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import uuid
+from collections import Counter
+from time import perf_counter
+from typing import Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import PROFILE_DIR, PROFILE_INTERVAL_MS, PROFILE_MAX_FILES, PROFILE_SAMPLE_RATE, PROFILE_TOKEN
+
+logger = logging.getLogger(__name__)
+
+# 프로파일링을 요청하는 헤더 (값은 PROFILE_TOKEN)와 응답의 프로파일 ID 헤더
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+# 샘플 시점에 요청 코드가 실행 중이 아니었던 경우(외부 API/DB 응답 대기 등)의 스택 이름
+WAITING_FRAME = "(waiting)"
+
+PROFILE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+# 프로파일 다운로드 요청은 토큰 헤더가 있어도 프로파일링하지 않음 (오래된 프로파일이 밀려나지 않도록)
+DOWNLOAD_PATH_PREFIX = "/api/v1/debug/"
+
+# 스택 출력에서 제거할 경로 접두사 (프로젝트 루트, site-packages)
+_PATH_PREFIXES = sorted(
+    {os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) + os.sep}
+    | {path + os.sep for path in sys.path if path.endswith("site-packages")},
+    key=len, reverse=True
+)
+
+# 샘플링 스레드가 모든 스레드의 스택을 훑으므로 한 번에 한 요청만 프로파일링
+_profile_lock = threading.Lock()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix):
+            filename = filename[len(prefix):]
+            break
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """
+    요청 하나의 스택을 일정 간격으로 수집하는 샘플링 프로파일러
+
+    별도 스레드가 sys._current_frames()로 스레드별 현재 스택을 읽어 요청에
+    속한 스택만 집계합니다.
+    - 이벤트 루프 스레드: 요청을 처리하는 미들웨어 프레임이 스택에 있을 때
+      (async 엔드포인트, 의존성, 미들웨어)
+    - 스레드 풀 워커: 라우트의 엔드포인트 함수 프레임이 스택에 있을 때
+      (동기 엔드포인트 - 같은 엔드포인트의 동시 요청은 함께 집계될 수 있음)
+    어느 쪽에도 없으면 WAITING_FRAME으로 집계해 벽시계 시간 비중을 보존합니다.
+    """
+
+    def __init__(self, scope: dict, loop_thread_id: int, marker_frame, interval: float):
+        self.scope = scope
+        self.loop_thread_id = loop_thread_id
+        self.marker_frame = marker_frame
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    @staticmethod
+    def _stack_from(frame, marker_frame=None, marker_code=None) -> Optional[Tuple[str, ...]]:
+        """표시 프레임(marker)부터 최상단 프레임까지의 스택 (표시 프레임이 없으면 None)"""
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            if frame is marker_frame or frame.f_code is marker_code:
+                return tuple(_frame_label(item) for item in reversed(frames))
+            frame = frame.f_back
+        return None
+
+    def _sample(self):
+        endpoint = self.scope.get("endpoint")
+        endpoint_code = getattr(endpoint, "__code__", None)
+        sampled = False
+
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == self._thread.ident:
+                continue
+            if thread_id == self.loop_thread_id:
+                stack = self._stack_from(frame, marker_frame=self.marker_frame)
+            elif endpoint_code is not None:
+                stack = self._stack_from(frame, marker_code=endpoint_code)
+            else:
+                continue
+            if stack:
+                self.stacks[stack] += 1
+                sampled = True
+
+        if not sampled:
+            self.stacks[(WAITING_FRAME,)] += 1
+        self.samples += 1
+
+    def folded(self) -> str:
+        """collapsed stack 형식 (flamegraph.pl, speedscope에서 바로 열 수 있음)"""
+        lines = [";".join(stack) + f" {count}" for stack, count in self.stacks.most_common()]
+        return "\n".join(lines) + "\n"
+
+
+def profile_path(profile_id: str) -> Optional[str]:
+    """프로파일 ID의 저장 경로 (형식이 잘못되었거나 파일이 없으면 None)"""
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = os.path.join(PROFILE_DIR, f"{profile_id}.folded")
+    return path if os.path.exists(path) else None
+
+
+def check_profile_token(token: Optional[str]) -> bool:
+    """PROFILE_TOKEN이 설정되어 있고 요청 토큰과 일치하는지 확인"""
+    return bool(PROFILE_TOKEN) and token is not None and hmac.compare_digest(token, PROFILE_TOKEN)
+
+
+def _save_profile(profile_id: str, content: str):
+    """프로파일을 저장하고 PROFILE_MAX_FILES개를 넘는 오래된 프로파일 삭제"""
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    with open(os.path.join(PROFILE_DIR, f"{profile_id}.folded"), "w") as f:
+        f.write(content)
+
+    profiles = [entry for entry in os.scandir(PROFILE_DIR) if entry.name.endswith(".folded")]
+    if len(profiles) > PROFILE_MAX_FILES:
+        profiles.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in profiles[:len(profiles) - PROFILE_MAX_FILES]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+class ProfilingMiddleware:
+    """
+    선택된 요청만 샘플링 프로파일러로 프로파일링하는 ASGI 미들웨어
+
+    PROFILE_SAMPLE_RATE 비율의 무작위 요청과 X-Profile-Token 헤더가 PROFILE_TOKEN과
+    일치하는 요청을 프로파일링합니다. 결과는 PROFILE_DIR에 저장하고 응답의
+    X-Profile-Id 헤더로 ID를 알려 주며, GET /api/v1/debug/profiles/{id}로 내려받습니다.
+    두 설정이 모두 비어 있으면 main.py에서 미들웨어를 등록하지 않으므로
+    일반 요청에는 비용이 없습니다.
+    """
+
+    def __init__(self, app, sample_rate: float = PROFILE_SAMPLE_RATE, interval_ms: float = PROFILE_INTERVAL_MS):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.interval = interval_ms / 1000
+        self.token_header = PROFILE_TOKEN_HEADER.lower().encode()
+
+    def _requested(self, scope) -> bool:
+        if scope["path"].startswith(DOWNLOAD_PATH_PREFIX):
+            return False
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+        if PROFILE_TOKEN:
+            for name, value in scope["headers"]:
+                if name == self.token_header:
+                    return check_profile_token(value.decode("latin-1"))
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope) or not _profile_lock.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (PROFILE_ID_HEADER.lower().encode(), profile_id.encode())
+                ]
+            await send(message)
+
+        sampler = StackSampler(scope, threading.get_ident(), sys._getframe(), self.interval)
+        start = perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            _profile_lock.release()
+            elapsed = (perf_counter() - start) * 1000
+            try:
+                await run_in_threadpool(_save_profile, profile_id, sampler.folded())
+                logger.info("요청 프로파일 저장: %s %s %s %.1fms, 샘플 %d개",
+                            profile_id, scope["method"], scope["path"], elapsed, sampler.samples)
+            except OSError as e:
+                logger.warning("요청 프로파일 저장 실패 (%s): %s", profile_id, e)
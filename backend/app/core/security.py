@@ -1,11 +1,23 @@
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+import asyncio
+import threading
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Optional
-from app.config import SECRET_KEY, ACCESS_TOKEN_EXPIRE_MINUTES  # 환경 변수 사용
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+from app.config import SECRET_KEY, ACCESS_TOKEN_EXPIRE_MINUTES, BCRYPT_ROUNDS, PASSWORD_HASH_MAX_PENDING  # 환경 변수 사용
+from app.core.executors import get_password_pool
+from app.core.metrics import PASSWORD_HASH_DURATION, PASSWORD_HASH_PENDING, PASSWORD_HASH_REJECTED
 
-# 비밀번호 해싱 설정 (bcrypt 알고리즘 사용)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """
+    비밀번호 해싱 설정 (bcrypt 알고리즘 사용, 설정과 다른 비용의 해시는 verify_and_update에서 다시 해시)
+    
+    passlib과 bcrypt 백엔드는 서버 시작 시간을 줄이기 위해 처음 사용할 때 임포트합니다.
+    """
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 # JWT 설정
 ALGORITHM = "HS256"  # JWT 암호화 알고리즘
@@ -21,7 +33,7 @@ def verify_password(plain_password, hashed_password):
     Returns:
         bool: 비밀번호 일치 여부
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password):
     """
@@ -33,7 +45,55 @@ def get_password_hash(password):
     Returns:
         str: 해시된 비밀번호
     """
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+def verify_and_update_password(plain_password, hashed_password) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호를 검증하고, 해시 비용이 현재 설정과 다르면 새 해시를 함께 반환
+    
+    Returns:
+        tuple: (비밀번호 일치 여부, 새 해시 또는 None)
+    """
+    return get_pwd_context().verify_and_update(plain_password, hashed_password)
+
+# 실행 중 + 대기 중인 해시 작업 수 제한
+_password_slots = threading.BoundedSemaphore(PASSWORD_HASH_MAX_PENDING)
+
+async def _run_password_task(operation: str, func, *args):
+    """
+    비밀번호 해시 작업을 전용 프로세스 풀에서 실행
+    
+    대기열이 가득 차 있으면 기다리지 않고 바로 503을 반환해, 로그인 폭주가
+    다른 요청의 응답 시간으로 번지지 않도록 합니다. 처리 시간(풀 대기 포함),
+    대기 수, 거절 수는 /metrics의 stockdashx_password_hash_* 지표로 기록합니다.
+    
+    Raises:
+        HTTPException: 대기 중인 해시 작업이 PASSWORD_HASH_MAX_PENDING개를 넘은 경우 (503)
+    """
+    if not _password_slots.acquire(blocking=False):
+        PASSWORD_HASH_REJECTED.inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="로그인 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": "1"}
+        )
+    
+    PASSWORD_HASH_PENDING.inc()
+    started = time.perf_counter()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(get_password_pool(), func, *args)
+    finally:
+        PASSWORD_HASH_PENDING.dec()
+        PASSWORD_HASH_DURATION.labels(operation).observe(time.perf_counter() - started)
+        _password_slots.release()
+
+async def hash_password_async(password) -> str:
+    """get_password_hash를 전용 프로세스 풀에서 실행"""
+    return await _run_password_task("hash", get_password_hash, password)
+
+async def verify_password_async(plain_password, hashed_password) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password를 전용 프로세스 풀에서 실행"""
+    return await _run_password_task("verify", verify_and_update_password, plain_password, hashed_password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """
@@ -58,6 +118,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     # 만료 시간 추가
     to_encode.update({"exp": expire})
     
-    # JWT 토큰 인코딩
+    # JWT 토큰 인코딩 (jose는 처음 사용할 때 임포트)
+    from jose import jwt
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
\ No newline at end of file
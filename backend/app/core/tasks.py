@@ -0,0 +1,142 @@
+import asyncio
+import logging
+from datetime import datetime, time, timedelta, timezone
+from time import perf_counter
+from typing import Callable, Set
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.leader import LEADER
+from app.core.metrics import JOB_DURATION, JOB_LAST_SUCCESS, JOB_RUNS
+
+logger = logging.getLogger(__name__)
+
+# 실행 중인 주기 작업 (가비지 컬렉션 방지 및 종료 시 취소용)
+_periodic_tasks: Set[asyncio.Task] = set()
+
+
+async def _run_job(func: Callable):
+    """코루틴 함수는 이벤트 루프에서, 동기 함수는 스레드풀에서 실행"""
+    if asyncio.iscoroutinefunction(func):
+        await func()
+    else:
+        await run_in_threadpool(func)
+
+
+async def _run_scheduled_job(name: str, func: Callable, leader_only: bool):
+    """
+    주기 작업 한 번 실행 (실행 수/시간/마지막 성공 시각 기록)
+
+    leader_only 작업은 실행 직전에 리더 잠금을 확인해, 리더가 아닌 워커에서는
+    건너뜁니다 (skipped로 집계). 실패는 예외로 전파합니다.
+    """
+    if leader_only and not await run_in_threadpool(LEADER.renew):
+        JOB_RUNS.labels(name, "skipped").inc()
+        return
+
+    start = perf_counter()
+    try:
+        await _run_job(func)
+    except Exception:
+        JOB_RUNS.labels(name, "failure").inc()
+        raise
+    finally:
+        JOB_DURATION.labels(name).observe(perf_counter() - start)
+    JOB_RUNS.labels(name, "success").inc()
+    JOB_LAST_SUCCESS.labels(name).set(datetime.now(timezone.utc).timestamp())
+
+
+def start_periodic_task(
+    name: str,
+    interval: float,
+    func: Callable[[], None],
+    run_at_start: bool = False,
+    leader_only: bool = True
+):
+    """
+    함수를 interval초마다 실행하는 백그라운드 태스크를 시작합니다.
+    동기 함수는 스레드풀에서, 코루틴 함수(외부 API 호출 등)는 이벤트 루프에서 실행합니다.
+
+    작업이 실패해도 오류를 로그로 남기고 다음 주기에 다시 실행합니다.
+    기본적으로 리더 워커에서만 실행되며 (모든 워커가 타이머를 돌리고 실행 시점에
+    리더인지 확인), 리더가 바뀌면 다음 주기부터 새 리더가 실행합니다.
+
+    Args:
+        name (str): 작업 이름 (로그, 지표 라벨)
+        interval (float): 실행 간격 (초)
+        func: 인자가 없는 동기 함수 또는 코루틴 함수
+        run_at_start (bool): 첫 주기를 기다리지 않고 바로 한 번 실행할지 여부
+        leader_only (bool): 리더 워커에서만 실행할지 여부 (False면 모든 워커에서 실행)
+    """
+    async def runner():
+        delay = 0 if run_at_start else interval
+        while True:
+            await asyncio.sleep(delay)
+            delay = interval
+            try:
+                await _run_scheduled_job(name, func, leader_only)
+            except Exception:
+                logger.exception("주기 작업 실패 (%s)", name)
+
+    task = asyncio.get_running_loop().create_task(runner(), name=name)
+    _periodic_tasks.add(task)
+    task.add_done_callback(_periodic_tasks.discard)
+
+
+async def stop_periodic_tasks():
+    """실행 중인 주기 작업을 모두 취소하고 종료를 기다립니다."""
+    tasks = list(_periodic_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _seconds_until(at: time) -> float:
+    """다음 at 시각(UTC)까지 남은 초"""
+    now = datetime.now(timezone.utc)
+    target = now.replace(hour=at.hour, minute=at.minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+def start_daily_task(name: str, at: time, func: Callable[[], None], leader_only: bool = True):
+    """
+    함수를 매일 at 시각(UTC)에 실행하는 백그라운드 태스크를 시작합니다.
+
+    Args:
+        name (str): 작업 이름 (로그, 지표 라벨)
+        at (time): 실행 시각 (UTC)
+        func: 인자가 없는 동기 함수 또는 코루틴 함수
+        leader_only (bool): 리더 워커에서만 실행할지 여부
+    """
+    async def runner():
+        while True:
+            await asyncio.sleep(_seconds_until(at))
+            try:
+                await _run_scheduled_job(name, func, leader_only)
+            except Exception:
+                logger.exception("일별 작업 실패 (%s)", name)
+
+    task = asyncio.get_running_loop().create_task(runner(), name=name)
+    _periodic_tasks.add(task)
+    task.add_done_callback(_periodic_tasks.discard)
+
+
+def start_background_task(name: str, func: Callable[[], None]):
+    """
+    함수를 한 번만 실행하는 백그라운드 태스크를 시작합니다 (서버 시작을 기다리게 하지 않음).
+
+    Args:
+        name (str): 작업 이름 (로그용)
+        func: 인자가 없는 동기 함수 또는 코루틴 함수
+    """
+    async def runner():
+        try:
+            await _run_job(func)
+        except Exception:
+            logger.exception("백그라운드 작업 실패 (%s)", name)
+
+    task = asyncio.get_running_loop().create_task(runner(), name=name)
+    _periodic_tasks.add(task)
+    task.add_done_callback(_periodic_tasks.discard)
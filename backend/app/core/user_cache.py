@@ -0,0 +1,80 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.config import USER_CACHE_SIZE, USER_CACHE_TTL
+from app.core.metrics import CacheMetrics
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """
+    인증 의존성이 반환하는 사용자 정보 (세션에 묶이지 않는 읽기 전용 사본)
+
+    보호된 엔드포인트는 소유권 확인에 id만 사용하므로 비밀번호 해시나
+    관계(relationship)는 담지 않습니다.
+    """
+    id: int
+    username: str
+    email: str
+    is_active: bool
+
+    @classmethod
+    def from_model(cls, user) -> "UserSnapshot":
+        return cls(id=user.id, username=user.username, email=user.email, is_active=bool(user.is_active))
+
+
+class UserCache:
+    """
+    사용자 이름 -> UserSnapshot 캐시 (TTL + 크기 제한, 가장 오래 사용하지 않은 항목부터 제거)
+
+    사용자 정보가 바뀌면 app/db/crud/users.py에서 즉시 무효화하고, 다른 워커에서
+    바뀐 경우는 USER_CACHE_TTL 안에 반영됩니다.
+    """
+
+    def __init__(self, max_size: int = USER_CACHE_SIZE, ttl: int = USER_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = timedelta(seconds=ttl)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.metrics = CacheMetrics("user")
+
+    def get(self, username: str) -> Optional[UserSnapshot]:
+        now = datetime.now()
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None:
+                self.metrics.miss()
+                return None
+            cached_at, snapshot = entry
+            if now - cached_at >= self.ttl:
+                del self._entries[username]
+                self.metrics.miss()
+                self.metrics.evict()
+                return None
+            self._entries.move_to_end(username)
+            self.metrics.hit()
+            return snapshot
+
+    def put(self, snapshot: UserSnapshot):
+        with self._lock:
+            self._entries[snapshot.username] = (datetime.now(), snapshot)
+            self._entries.move_to_end(snapshot.username)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.metrics.evict()
+
+    def invalidate(self, *usernames: str):
+        with self._lock:
+            for username in usernames:
+                self._entries.pop(username, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 프로세스 전역 인증 사용자 캐시
+USER_CACHE = UserCache()
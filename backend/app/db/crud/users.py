@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from app.db.models import User
 from app.schemas.users import UserCreate, UserUpdate
 from app.core.security import get_password_hash, verify_password
+from app.core.user_cache import USER_CACHE
 
 def get_user(db: Session, user_id: int):
     """사용자 ID로 사용자 조회"""
@@ -39,6 +40,7 @@ def update_user(db: Session, user_id: int, user: UserUpdate):
         return None
     
     update_data = user.dict(exclude_unset=True)
+    previous_username = db_user.username
     
     if "password" in update_data:
         update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
@@ -48,6 +50,8 @@ def update_user(db: Session, user_id: int, user: UserUpdate):
     
     db.commit()
     db.refresh(db_user)
+    # 인증 캐시 무효화 (사용자 이름이 바뀐 경우 이전 이름 포함, is_active 변경도 여기서 반영)
+    USER_CACHE.invalidate(previous_username, db_user.username)
     return db_user
 
 def delete_user(db: Session, user_id: int):
@@ -57,6 +61,7 @@ def delete_user(db: Session, user_id: int):
         return None
     db.delete(db_user)
     db.commit()
+    USER_CACHE.invalidate(db_user.username)
     return db_user
 
 def authenticate_user(db: Session, username: str, password: str):
@@ -1,6 +1,7 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text, Numeric, DateTime
+from sqlalchemy import Boolean, Column, Computed, Float, ForeignKey, Integer, BigInteger, String, Text, Numeric, DateTime, Date, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from .database import Base
 
@@ -66,6 +67,19 @@ class Transaction(Base):
     stock = relationship("Stock", back_populates="transactions")
 
 
+# 일별 시세(OHLCV) 모델 - 백테스트/과거 데이터 조회용
+class StockPrice(Base):
+    __tablename__ = "stock_prices"
+    __table_args__ = {"schema": "stockdashx"}
+
+    stock_id = Column(Integer, ForeignKey("stockdashx.stocks.id", ondelete="CASCADE"), primary_key=True)
+    price_date = Column(Date, primary_key=True)
+    open = Column(Numeric(12, 4), nullable=False)
+    high = Column(Numeric(12, 4), nullable=False)
+    low = Column(Numeric(12, 4), nullable=False)
+    close = Column(Numeric(12, 4), nullable=False)
+    volume = Column(BigInteger, nullable=False, default=0)
+
 # 모의 투자 계좌 모델
 class SimulationAccount(Base):
     __tablename__ = "simulation_accounts"
@@ -74,13 +88,16 @@ class SimulationAccount(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("stockdashx.users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String, nullable=False)
-    initial_balance = Column(Numeric(10, 2), nullable=False, default=100000.00)  # 기본 초기 자금 $100,000
-    current_balance = Column(Numeric(10, 2), nullable=False, default=100000.00)  # 현재 현금 잔액
+    initial_balance = Column(Numeric(12, 2), nullable=False, default=100000.00)  # 기본 초기 자금 $100,000
+    current_balance = Column(Numeric(12, 2), nullable=False, default=100000.00)  # 현재 현금 잔액
+    mode = Column(String, nullable=False, default="LIVE", server_default="LIVE")  # "LIVE", "REPLAY" or "BACKTEST"
+    replay_date = Column(Date)  # REPLAY 계좌의 가상 현재 날짜
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # 관계 정의
     user = relationship("User", back_populates="simulation_accounts")
     simulation_transactions = relationship("SimulationTransaction", back_populates="account", cascade="all, delete-orphan")
+    orders = relationship("SimulationOrder", back_populates="account", cascade="all, delete-orphan")
 
 
 # 모의 투자 거래 내역 모델
@@ -94,7 +111,8 @@ class SimulationTransaction(Base):
     transaction_type = Column(String, nullable=False)  # "BUY" or "SELL"
     quantity = Column(Integer, nullable=False)
     price = Column(Numeric(10, 2), nullable=False)
-    total_amount = Column(Numeric(10, 2), nullable=False)  # 총 거래 금액 (수량 * 가격)
+    commission = Column(Numeric(12, 2), nullable=False, default=0, server_default="0")  # 거래 수수료
+    total_amount = Column(Numeric(12, 2), nullable=False)  # 현금 변동액 (수량 * 가격 ± 수수료)
     transaction_date = Column(DateTime(timezone=True), server_default=func.now())
 
     # 관계 정의
@@ -102,8 +120,182 @@ class SimulationTransaction(Base):
     stock = relationship("Stock", back_populates="simulation_transactions")
 
 
+
+# 모의 투자 대기 주문 모델 (지정가/손절/손절 지정가)
+class SimulationOrder(Base):
+    __tablename__ = "simulation_orders"
+    __table_args__ = {"schema": "stockdashx"}
+
+    id = Column(Integer, primary_key=True, index=True)
+    account_id = Column(Integer, ForeignKey("stockdashx.simulation_accounts.id", ondelete="CASCADE"), nullable=False)
+    stock_id = Column(Integer, ForeignKey("stockdashx.stocks.id"), nullable=False)
+    order_type = Column(String, nullable=False)  # "LIMIT", "STOP" or "STOP_LIMIT"
+    transaction_type = Column(String, nullable=False)  # "BUY" or "SELL"
+    quantity = Column(Integer, nullable=False)
+    limit_price = Column(Numeric(10, 2))  # LIMIT, STOP_LIMIT
+    stop_price = Column(Numeric(10, 2))  # STOP, STOP_LIMIT
+    status = Column(String, nullable=False, default="OPEN")  # OPEN, TRIGGERED, FILLED, CANCELLED, REJECTED
+    reject_reason = Column(Text)
+    transaction_id = Column(Integer, ForeignKey("stockdashx.simulation_transactions.id", ondelete="SET NULL"))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # 관계 정의
+    account = relationship("SimulationAccount", back_populates="orders")
+    stock = relationship("Stock")
+    transaction = relationship("SimulationTransaction")
+
+# 모의 투자 수익률 순위 체크포인트 (메모리 순위표의 주기적 스냅샷)
+class SimulationLeaderboard(Base):
+    __tablename__ = "simulation_leaderboard"
+    __table_args__ = {"schema": "stockdashx"}
+
+    account_id = Column(Integer, ForeignKey("stockdashx.simulation_accounts.id", ondelete="CASCADE"), primary_key=True)
+    rank = Column(Integer, nullable=False)
+    return_percent = Column(Numeric(12, 4), nullable=False)
+    total_value = Column(Numeric(14, 2), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# 모의 투자 계좌 변경 기록 (거래/계좌 생성/삭제와 같은 트랜잭션에서 기록, 워커별 순위표 동기화용)
+class SimulationAccountChange(Base):
+    __tablename__ = "simulation_account_changes"
+    __table_args__ = (
+        Index("ix_simulation_account_changes_changed_at", "changed_at"),
+        {"schema": "stockdashx"}
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    account_id = Column(Integer, nullable=False)  # 삭제된 계좌도 기록하므로 외래 키 없음
+    changed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+# 일별 순자산(NAV) 스냅샷 모델 - 모의 투자 계좌와 포트폴리오 공용
+class NavSnapshot(Base):
+    __tablename__ = "nav_snapshots"
+    __table_args__ = (
+        UniqueConstraint("owner_type", "owner_id", "snapshot_date", name="uq_nav_snapshots_owner_date"),
+        {"schema": "stockdashx"}
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    owner_type = Column(String, nullable=False)  # "SIMULATION" or "PORTFOLIO"
+    owner_id = Column(Integer, nullable=False)  # simulation_accounts.id 또는 portfolios.id
+    snapshot_date = Column(Date, nullable=False)
+    cash = Column(Numeric(14, 2), nullable=False, default=0)  # 계좌: 현금 잔고, 포트폴리오: 실현 손익 누적
+    invested = Column(Numeric(14, 2), nullable=False, default=0)  # 보유 수량 * 평균 매수 단가 (replay_holdings 기준)
+    market_value = Column(Numeric(14, 2), nullable=False, default=0)  # 보유 수량 * 종가
+    nav = Column(Numeric(14, 2), nullable=False, default=0)  # cash + market_value
+    pnl = Column(Numeric(14, 2), nullable=False, default=0)  # 계좌: nav - 초기 자금, 포트폴리오: market_value - invested + cash
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# 뉴스 전문 검색 벡터 식 (alembic/versions/0010_news_search.py와 동일하게 유지)
+NEWS_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+
+# 수집한 뉴스 기사 (URL 해시로 중복 제거)
+class NewsArticle(Base):
+    __tablename__ = "news_articles"
+    __table_args__ = {"schema": "stockdashx"}
+
+    id = Column(Integer, primary_key=True, index=True)
+    url_hash = Column(String(64), unique=True, nullable=False)  # sha256(url)
+    url = Column(Text, nullable=False)
+    title = Column(Text, nullable=False, default="")
+    description = Column(Text)
+    url_to_image = Column(Text)
+    source = Column(String)
+    content = Column(Text)
+    published_at = Column(DateTime(timezone=True), nullable=False)
+    fetched_at = Column(DateTime(timezone=True), server_default=func.now())
+    sentiment = Column(Float)  # 사전 기반 감성 점수 (-1 ~ 1, 점수 계산 전에는 NULL)
+    # 전문 검색용 tsvector (제목 A, 요약 B, 본문 C 가중치) - 기사 저장 시 DB가 계산, 조회 시 기본 로드 안 함
+    search_vector = deferred(Column(TSVECTOR, Computed(NEWS_SEARCH_VECTOR, persisted=True)))
+
+# 뉴스 피드 소속 - 시장 뉴스("MARKET") 또는 종목 심볼별 뉴스
+class NewsArticleFeed(Base):
+    __tablename__ = "news_article_feeds"
+    __table_args__ = {"schema": "stockdashx"}
+
+    feed = Column(String, primary_key=True)  # "MARKET" 또는 주식 심볼
+    article_id = Column(Integer, ForeignKey("stockdashx.news_articles.id", ondelete="CASCADE"), primary_key=True)
+    published_at = Column(DateTime(timezone=True), nullable=False)  # 키셋 페이지네이션용 (news_articles와 동일 값)
+
+    # 관계 정의
+    article = relationship("NewsArticle", lazy="joined")
+
+# 종목(피드)별 일별 뉴스 감성 집계
+class NewsSentimentDaily(Base):
+    __tablename__ = "news_sentiment_daily"
+    __table_args__ = {"schema": "stockdashx"}
+
+    symbol = Column(String, primary_key=True)  # 주식 심볼 또는 "MARKET"
+    day = Column(Date, primary_key=True)  # 게시일 (UTC)
+    article_count = Column(Integer, nullable=False, default=0)
+    sentiment_sum = Column(Float, nullable=False, default=0)
+    positive_count = Column(Integer, nullable=False, default=0)
+    negative_count = Column(Integer, nullable=False, default=0)
+
+# 뉴스 화면에서 조회된 종목 (모든 워커가 기록, 수집 작업이 NEWS_WATCH_TTL 동안 수집 대상에 포함)
+class NewsWatchSymbol(Base):
+    __tablename__ = "news_watch_symbols"
+    __table_args__ = {"schema": "stockdashx"}
+
+    symbol = Column(String, primary_key=True)
+    last_requested_at = Column(DateTime(timezone=True), nullable=False)
+
+# 요청 시 바로 수집한 횟수 (NEWS_INGEST_INTERVAL 구간별, 모든 워커가 공유하는 한도)
+class NewsFetchSlot(Base):
+    __tablename__ = "news_fetch_slots"
+    __table_args__ = {"schema": "stockdashx"}
+
+    window_start = Column(DateTime(timezone=True), primary_key=True)
+    count = Column(Integer, nullable=False)
+
 # 기존 User 모델에 관계 추가
 User.simulation_accounts = relationship("SimulationAccount", back_populates="user", cascade="all, delete-orphan")
 
 # 기존 Stock 모델에 관계 추가
-Stock.simulation_transactions = relationship("SimulationTransaction", back_populates="stock")
\ No newline at end of file
+Stock.simulation_transactions = relationship("SimulationTransaction", back_populates="stock")
+
+# 조회 성능을 위한 인덱스 (alembic/versions/0002_performance_indexes.py와 동일하게 유지)
+# 매도 가능 수량 확인: (portfolio_id, stock_id) 조회를 index-only scan으로 처리
+Index(
+    "ix_transactions_portfolio_stock",
+    Transaction.portfolio_id, Transaction.stock_id,
+    postgresql_include=["transaction_type", "quantity"]
+)
+# 거래 내역 키셋 페이지네이션: (transaction_date, id) 역순
+Index(
+    "ix_transactions_portfolio_date",
+    Transaction.portfolio_id, Transaction.transaction_date.desc(), Transaction.id.desc()
+)
+Index(
+    "ix_simulation_transactions_account_stock",
+    SimulationTransaction.account_id, SimulationTransaction.stock_id,
+    postgresql_include=["transaction_type", "quantity", "total_amount"]
+)
+Index(
+    "ix_simulation_transactions_account_date",
+    SimulationTransaction.account_id, SimulationTransaction.transaction_date.desc(), SimulationTransaction.id.desc()
+)
+Index("idx_simulation_accounts_user_id", SimulationAccount.user_id)
+Index("idx_simulation_transactions_stock_id", SimulationTransaction.stock_id)
+# 서버 시작 시 매칭 엔진 재구성: 미체결 주문만 읽음
+Index(
+    "ix_simulation_orders_open",
+    SimulationOrder.stock_id,
+    postgresql_where=SimulationOrder.status.in_(["OPEN", "TRIGGERED"])
+)
+Index("ix_simulation_orders_account", SimulationOrder.account_id, SimulationOrder.created_at.desc())
+Index("ix_simulation_leaderboard_rank", SimulationLeaderboard.rank)
+# 뉴스 피드 키셋 페이지네이션: (feed, published_at, article_id) 역순
+Index(
+    "ix_news_article_feeds_feed_published",
+    NewsArticleFeed.feed, NewsArticleFeed.published_at.desc(), NewsArticleFeed.article_id.desc()
+)
+# 뉴스 전문 검색
+Index("ix_news_articles_search", NewsArticle.search_vector, postgresql_using="gin")
+# 감성 점수 계산 대기 기사
+Index("ix_news_articles_unscored", NewsArticle.id, postgresql_where=NewsArticle.sentiment.is_(None))
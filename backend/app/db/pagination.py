@@ -0,0 +1,142 @@
+import base64
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from app.db.database import SessionLocal
+
+# 서버 측 커서에서 한 번에 가져올 행 수 (스트리밍 내보내기)
+EXPORT_FETCH_SIZE = 1000
+
+# 커서 다음 페이지 정보를 전달하는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없는 페이지네이션 커서"""
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """
+    (정렬 값, id) 쌍을 URL에 안전한 불투명 커서 문자열로 인코딩합니다.
+
+    Args:
+        sort_value (datetime): 마지막 행의 정렬 기준 값
+        row_id (int): 마지막 행의 ID
+
+    Returns:
+        str: base64url 인코딩된 커서
+    """
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    encode_cursor로 만든 커서를 (정렬 값, id) 쌍으로 복원합니다.
+
+    Raises:
+        InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError(f"유효하지 않은 커서입니다: {cursor}") from e
+
+
+def keyset_page(query: Query, date_column, id_column, limit: int, cursor: Optional[str] = None):
+    """
+    (date_column DESC, id_column DESC) 순서의 키셋 페이지네이션을 적용합니다.
+
+    OFFSET 없이 마지막으로 본 (날짜, id) 이후의 행만 조회하므로
+    페이지 깊이와 무관하게 인덱스 범위 스캔 한 번으로 처리됩니다.
+
+    Args:
+        query (Query): 필터가 적용된 기본 쿼리
+        date_column: 정렬 기준 날짜 컬럼
+        id_column: 동일 날짜 내 순서를 결정하는 ID 컬럼
+        limit (int): 페이지 크기
+        cursor (Optional[str]): 이전 페이지에서 받은 커서
+
+    Returns:
+        tuple: (행 목록, 다음 페이지 커서 또는 None)
+
+    Raises:
+        InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    if cursor:
+        last_date, last_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                date_column < last_date,
+                and_(date_column == last_date, id_column < last_id)
+            )
+        )
+
+    # 다음 페이지 존재 여부 확인을 위해 한 행을 더 조회
+    rows = query.order_by(date_column.desc(), id_column.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, date_column.key), getattr(last, id_column.key))
+
+    return rows, next_cursor
+
+
+def _serialize(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is None:
+        return ""
+    return value
+
+
+def stream_export(build_query: Callable, columns: List[str], export_format: str = "csv") -> Iterator[str]:
+    """
+    쿼리 결과를 CSV 또는 NDJSON으로 스트리밍합니다.
+
+    FastAPI의 yield 의존성 세션은 응답 전송 전에 닫히므로, 응답 스트림 전용
+    세션을 새로 열고 서버 측 커서(stream_results)로 EXPORT_FETCH_SIZE 행씩
+    가져옵니다. 행 수와 무관하게 메모리 사용량이 일정합니다.
+
+    Args:
+        build_query (Callable): 세션을 받아 내보낼 컬럼을 조회하는 Query를 반환하는 함수
+        columns (List[str]): 출력 컬럼명 (쿼리 컬럼 순서와 동일)
+        export_format (str): "csv" 또는 "ndjson"
+
+    Yields:
+        str: 출력 청크
+    """
+    db = SessionLocal()
+    try:
+        query = build_query(db).execution_options(stream_results=True, yield_per=EXPORT_FETCH_SIZE)
+
+        if export_format == "ndjson":
+            for row in query:
+                yield json.dumps({column: _serialize(value) for column, value in zip(columns, row)}, default=str) + "\n"
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+
+        for index, row in enumerate(query, start=1):
+            writer.writerow([_serialize(value) for value in row])
+            # 일정 행마다 버퍼를 비워 청크 단위로 전송
+            if index % EXPORT_FETCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+
+        yield buffer.getvalue()
+    finally:
+        db.close()
@@ -0,0 +1,69 @@
+import logging
+import os
+from typing import Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.db.database import Base, engine
+
+logger = logging.getLogger(__name__)
+
+# backend/alembic.ini (마이그레이션 스크립트 위치 설정)
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "alembic.ini")
+
+# alembic/env.py의 version_table_schema와 같은 스키마
+VERSION_TABLE = "stockdashx.alembic_version"
+
+# 마지막 스키마 확인 결과 (check 모드에서 시작 후 채워짐)
+SCHEMA_STATUS = {"checked": False, "ok": None, "current": None, "heads": None, "error": None}
+
+
+def create_tables():
+    """모델 기준으로 없는 테이블 생성 (create 모드 - 기존 테이블은 변경하지 않음)"""
+    from app.db import models  # noqa: F401 - 모델을 메타데이터에 등록
+    Base.metadata.create_all(bind=engine)
+
+
+def migration_heads() -> Set[str]:
+    """alembic 마이그레이션 스크립트의 head 리비전 (alembic은 확인할 때만 임포트)"""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "alembic"))
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def current_revisions() -> Set[str]:
+    """DB에 적용된 마이그레이션 리비전 (버전 테이블이 없으면 예외)"""
+    with engine.connect() as conn:
+        return {row[0] for row in conn.execute(text(f"SELECT version_num FROM {VERSION_TABLE}"))}
+
+
+def check_schema_version() -> Optional[bool]:
+    """
+    DB 스키마가 최신 마이그레이션(head)까지 적용되었는지 확인
+
+    결과는 SCHEMA_STATUS에 기록하고 불일치/오류는 로그로 남깁니다.
+    서버 시작을 막지 않도록 예외를 전파하지 않습니다.
+
+    Returns:
+        Optional[bool]: 최신이면 True, 아니면 False, 확인 실패 시 None
+    """
+    try:
+        heads = migration_heads()
+        current = current_revisions()
+    except (SQLAlchemyError, OSError, ImportError) as e:
+        SCHEMA_STATUS.update(checked=True, ok=None, error=str(e))
+        logger.warning("DB 스키마 버전 확인 실패: %s", e)
+        return None
+
+    ok = current == heads
+    SCHEMA_STATUS.update(checked=True, ok=ok, current=sorted(current), heads=sorted(heads), error=None)
+    if ok:
+        logger.info("DB 스키마 버전 확인: %s", ", ".join(sorted(current)))
+    else:
+        logger.warning("DB 스키마가 최신이 아닙니다 (현재 %s, 최신 %s) - `alembic upgrade head`를 실행하세요",
+                       sorted(current) or "없음", sorted(heads))
+    return ok
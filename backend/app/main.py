@@ -1,16 +1,54 @@
-from fastapi import FastAPI
+import logging
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
-from app.db.database import engine
-from app.db import models
+from app.db.database import engine, SessionLocal
+from app.db.pagination import NEXT_CURSOR_HEADER
+from app.db.schema import check_schema_version, create_tables
+from app.services.stock_data import register_quote_listener
+from app.services.order_book import ORDER_BOOK, sync_order_book
+from app.services.simulation_trading import register_account_listener
+from app.services.leaderboard import LEADERBOARD, checkpoint_leaderboard, rebuild_leaderboard, sync_leaderboard
+from app.core.executors import shutdown_executors
+from app.core.leader import LEADER
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, instrument_engine, render_metrics
+from app.core.profiling import PROFILE_ID_HEADER, ProfilingMiddleware
+from app.services.nav_snapshots import run_nav_snapshot_job
+from app.services.replay import REPLAY_CLOCKS
+from app.services.trade_stats import invalidate_trade_stats
+from app.services.news_service import run_news_ingestion
+from app.core.tasks import start_background_task, start_periodic_task, start_daily_task, stop_periodic_tasks
+from app.config import (
+    LEADERBOARD_CHECKPOINT_INTERVAL, LEADERBOARD_SYNC_INTERVAL, LEADER_RETRY_INTERVAL, LOG_LEVEL, NAV_SNAPSHOT_TIME,
+    NEWS_INGEST_INTERVAL, ORDER_BOOK_SYNC_INTERVAL, PROFILE_SAMPLE_RATE, PROFILE_TOKEN, STARTUP_SCHEMA_MODE
+)
+from contextlib import asynccontextmanager
+from datetime import time
+
+# 로그 출력 설정 (uvicorn 로거는 uvicorn이 따로 설정) - 외부 라이브러리는 WARNING 이상, app.* 로거는 LOG_LEVEL 이상
+logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s [%(name)s] %(message)s")
+logging.getLogger("app").setLevel(LOG_LEVEL)
+logger = logging.getLogger(__name__)
 
-# 데이터베이스 테이블 생성 (실제 운영에서는 Alembic 사용 권장)
-models.Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 작업을 순서대로 실행(스키마 처리를 가장 먼저)하고 종료 시 백그라운드 작업 정리"""
+    await prepare_schema()
+    await start_leader_election()
+    await start_order_book()
+    await start_leaderboard()
+    register_trade_stats_cache()
+    start_nav_snapshots()
+    start_news_ingestion()
+    yield
+    await stop_background_work()
 
 app = FastAPI(
     title="StockDashX API",
     description="API for stock data monitoring and portfolio management",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -20,15 +58,109 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, PROFILE_ID_HEADER],  # 키셋 페이지네이션 커서, 요청 프로파일 ID
 )
 
+# 요청/DB 쿼리 지표 수집 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+instrument_engine(engine)
+
+# 요청 프로파일링 (설정한 경우에만 등록 - 일반 요청에는 비용 없음)
+if PROFILE_SAMPLE_RATE > 0 or PROFILE_TOKEN:
+    app.add_middleware(ProfilingMiddleware)
+
 # API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
+async def run_startup_db_task(name: str, func):
+    """
+    서버 시작 시 DB 작업 실행
+    
+    create 모드는 어차피 시작 전에 테이블을 만들며 DB를 기다리므로 완료까지 기다리고,
+    check/skip 모드는 DB 응답을 기다리지 않고 바로 요청을 받도록 백그라운드에서 실행합니다.
+    """
+    if STARTUP_SCHEMA_MODE == "create":
+        await run_in_threadpool(func)
+    else:
+        start_background_task(name, func)
+
+async def prepare_schema():
+    """
+    STARTUP_SCHEMA_MODE에 따라 DB 스키마 처리 (운영 DB 스키마는 backend/alembic 마이그레이션으로 관리: `alembic upgrade head`)
+    
+    - create: 없는 테이블 생성 (모듈 임포트가 아닌 서버 시작 시점에 실행)
+    - check: 시작을 기다리게 하지 않고 백그라운드에서 마이그레이션 버전만 확인
+    - skip: 아무것도 하지 않음
+    """
+    if STARTUP_SCHEMA_MODE == "create":
+        await run_in_threadpool(create_tables)
+    elif STARTUP_SCHEMA_MODE == "check":
+        start_background_task("schema_check", check_schema_version)
+    elif STARTUP_SCHEMA_MODE != "skip":
+        logger.warning("알 수 없는 STARTUP_SCHEMA_MODE: %s (스키마 처리 생략)", STARTUP_SCHEMA_MODE)
+
+async def start_leader_election():
+    """
+    주기 작업 리더 선출 시작 (여러 워커 중 리더 한 곳에서만 주기 작업 실행)
+    
+    첫 선출은 시작 시 한 번 시도하고(run_startup_db_task), 이후 모든 워커가
+    LEADER_RETRY_INTERVAL마다 잠금을 확인/시도해 리더가 죽으면 넘겨받습니다.
+    리더 전용 작업은 실행 직전에 다시 잠금을 확인하므로 첫 선출이 끝나기 전에
+    시작된 작업도 리더에서만 실행됩니다.
+    """
+    def elect():
+        try:
+            LEADER.renew()
+        except Exception:
+            logger.exception("주기 작업 리더 선출 실패")
+    
+    await run_startup_db_task("leader_election_start", elect)
+    start_periodic_task("leader_election", LEADER_RETRY_INTERVAL, LEADER.renew, leader_only=False)
+
+async def start_order_book():
+    """미체결 대기 주문으로 매칭 엔진을 구성하고 시세 리스너 및 동기화 주기 작업(모든 워커) 시작"""
+    register_quote_listener(ORDER_BOOK.on_quote)
+    await run_startup_db_task("order_book_sync_start", sync_order_book)
+    start_periodic_task("order_book_sync", ORDER_BOOK_SYNC_INTERVAL, sync_order_book, leader_only=False)
+
+async def start_leaderboard():
+    """모의 투자 순위표 구성, 거래/시세 리스너 등록 및 변경 동기화(모든 워커)/체크포인트(리더) 주기 작업 시작"""
+    await run_startup_db_task("leaderboard_rebuild_start", rebuild_leaderboard)
+    register_account_listener(LEADERBOARD.refresh_account)
+    register_quote_listener(LEADERBOARD.on_quote)
+    start_periodic_task("leaderboard_sync", LEADERBOARD_SYNC_INTERVAL, sync_leaderboard, leader_only=False)
+    start_periodic_task("leaderboard_checkpoint", LEADERBOARD_CHECKPOINT_INTERVAL, checkpoint_leaderboard)
+
+def register_trade_stats_cache():
+    """거래가 커밋되면 해당 계좌의 거래 통계 캐시 무효화"""
+    register_account_listener(invalidate_trade_stats)
+
+def start_nav_snapshots():
+    """장 마감 후 일별 NAV 스냅샷 작업 시작"""
+    start_daily_task("nav_snapshot", time.fromisoformat(NAV_SNAPSHOT_TIME), run_nav_snapshot_job)
+
+def start_news_ingestion():
+    """시장/관심 종목 뉴스 수집 주기 작업 시작 (서버 시작 직후 한 번 실행)"""
+    start_periodic_task("news_ingestion", NEWS_INGEST_INTERVAL, run_news_ingestion, run_at_start=True)
+
+async def stop_background_work():
+    """주기 작업과 과거 재현 가상 시계 취소, 순위표 마지막 체크포인트 저장(리더만), 리더 잠금 해제 및 계산용 프로세스 풀 종료"""
+    await stop_periodic_tasks()
+    await REPLAY_CLOCKS.stop_all()
+    if LEADER.is_leader:
+        checkpoint_leaderboard()
+    LEADER.release()
+    shutdown_executors()
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to StockDashX API"}
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 텍스트 형식 지표 (요청 지연/상태 코드, 캐시, 외부 API, DB 쿼리) - 워커 프로세스별 값"""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8080, reload=True)
\ No newline at end of file
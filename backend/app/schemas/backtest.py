@@ -0,0 +1,146 @@
+from pydantic import BaseModel, validator
+from typing import Optional, List, Dict, Any
+from datetime import date
+
+# 백테스트 전략 기본 모델
+class BacktestBase(BaseModel):
+    """
+    백테스트 공통 요청 스키마
+
+    종목, 전략, 기간, 자금 조건 등 단일 실행과 파라미터 탐색에 공통인 필드를 정의합니다.
+    strategy는 "ma_crossover", "momentum", "mean_reversion" 또는 "custom"이며,
+    custom 전략은 spec에 진입/청산 조건을 선언합니다.
+    """
+    symbol: str
+    strategy: str
+    spec: Optional[Dict[str, Any]] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    initial_cash: float = 100000.00
+    commission_rate: float = 0.0  # 거래 금액 대비 비율 (0.001 = 0.1%)
+
+    @validator('strategy')
+    def check_strategy(cls, v):
+        if v not in ["ma_crossover", "momentum", "mean_reversion", "custom"]:
+            raise ValueError('전략은 "ma_crossover", "momentum", "mean_reversion" 또는 "custom"이어야 합니다.')
+        return v
+
+    @validator('initial_cash')
+    def check_initial_cash(cls, v):
+        if v <= 0:
+            raise ValueError('초기 자금은 0보다 커야 합니다.')
+        return v
+
+    @validator('commission_rate')
+    def check_commission_rate(cls, v):
+        if v < 0 or v >= 1:
+            raise ValueError('수수료율은 0 이상 1 미만이어야 합니다.')
+        return v
+
+# 백테스트 단일 실행 요청 모델
+class BacktestCreate(BacktestBase):
+    """
+    백테스트 실행 요청 스키마
+
+    save_as_account에 계좌 이름을 지정하면 결과 거래 내역이 모의 투자 계좌로 저장됩니다.
+    """
+    params: Dict[str, float] = {}
+    save_as_account: Optional[str] = None
+
+# 파라미터 탐색 요청 모델
+class BacktestSweepCreate(BacktestBase):
+    """
+    백테스트 파라미터 탐색 요청 스키마
+
+    grid의 모든 조합을 실행하고 sort_by 지표 기준 상위 top_n개 결과를 반환합니다.
+    """
+    grid: Dict[str, List[float]]
+    sort_by: str = "sharpe"
+    top_n: int = 20
+
+    @validator('grid')
+    def check_grid(cls, v):
+        if not v or any(not values for values in v.values()):
+            raise ValueError('파라미터마다 후보 값이 하나 이상 있어야 합니다.')
+        return v
+
+    @validator('sort_by')
+    def check_sort_by(cls, v):
+        if v not in ["total_return", "cagr", "sharpe", "max_drawdown", "win_rate"]:
+            raise ValueError('정렬 기준은 "total_return", "cagr", "sharpe", "max_drawdown" 또는 "win_rate"이어야 합니다.')
+        return v
+
+    @validator('top_n')
+    def check_top_n(cls, v):
+        if v <= 0:
+            raise ValueError('top_n은 0보다 커야 합니다.')
+        return v
+
+# 백테스트 요약 통계 모델
+class BacktestStats(BaseModel):
+    """
+    백테스트 요약 통계 스키마
+
+    수익률, 위험 지표와 거래 횟수를 정의합니다. 비율 값은 소수(0.1 = 10%)입니다.
+    """
+    total_return: float
+    cagr: float
+    sharpe: float
+    max_drawdown: float
+    num_trades: int
+    win_rate: float
+    exposure: float
+    final_equity: float
+
+# 백테스트 거래 내역 모델
+class BacktestTrade(BaseModel):
+    """
+    백테스트 거래 내역 스키마
+
+    모의 투자 거래 내역(SimulationTransaction)과 같은 필드 구성을 사용합니다.
+    """
+    symbol: str
+    transaction_type: str
+    quantity: int
+    price: float
+    commission: float
+    total_amount: float
+    transaction_date: date
+
+# 백테스트 실행 결과 모델
+class BacktestResult(BaseModel):
+    """
+    백테스트 실행 결과 스키마
+
+    거래 내역, 일별 자산 곡선과 요약 통계를 포함합니다.
+    save_as_account를 지정한 경우 생성된 모의 투자 계좌 ID가 포함됩니다.
+    """
+    symbol: str
+    strategy: str
+    params: Dict[str, float]
+    stats: BacktestStats
+    trades: List[BacktestTrade]
+    equity_curve: List[Dict[str, Any]]
+    final_cash: float
+    account_id: Optional[int] = None
+
+# 파라미터 조합별 결과 모델
+class BacktestSweepEntry(BaseModel):
+    """
+    파라미터 탐색 결과 항목 스키마
+    """
+    params: Dict[str, float]
+    stats: BacktestStats
+
+# 파라미터 탐색 결과 모델
+class BacktestSweepResult(BaseModel):
+    """
+    파라미터 탐색 결과 스키마
+
+    실행한 전체 조합 수와 정렬된 상위 결과를 포함합니다.
+    """
+    symbol: str
+    strategy: str
+    combinations: int
+    sort_by: str
+    results: List[BacktestSweepEntry]
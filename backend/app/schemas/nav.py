@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+from typing import Optional, Dict
+from datetime import date
+
+# 일별 NAV 스냅샷 응답 모델
+class NavSnapshot(BaseModel):
+    """
+    일별 순자산(NAV) 스냅샷 스키마
+    
+    장 마감 후 저장된 현금, 투자 원금, 평가 금액, NAV와 손익을 정의합니다.
+    포트폴리오는 현금 계좌가 없으므로 cash에 실현 손익 누적을 기록하고
+    NAV는 실현 손익 + 평가 금액, 손익은 미실현 손익 + 실현 손익입니다.
+    """
+    snapshot_date: date
+    cash: float
+    invested: float
+    market_value: float
+    nav: float
+    pnl: float
+    
+    class Config:
+        orm_mode = True
+
+# 기간 수익률 응답 모델
+class PeriodReturns(BaseModel):
+    """
+    기간 수익률 스키마
+    
+    최근 스냅샷(as_of) 기준 1D/1W/1M/YTD 수익률(%)을 정의합니다.
+    기준이 되는 과거 스냅샷이 없는 기간은 null입니다.
+    """
+    as_of: date
+    nav: float
+    pnl: float
+    returns: Dict[str, Optional[float]]
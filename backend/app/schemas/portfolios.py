@@ -87,4 +87,38 @@ class PortfolioDetail(BaseModel):
     name: str
     description: Optional[str]
     created_at: datetime
-    performance: PortfolioPerformance
\ No newline at end of file
+    performance: PortfolioPerformance
+
+# 포트폴리오 가치 예측 백분위 밴드
+class ProjectionBand(BaseModel):
+    """
+    몬테카를로 예측 백분위 밴드 스키마
+    
+    step(거래일) 시점의 포트폴리오 가치 분포를 5/25/50/75/95 백분위로 정의합니다.
+    """
+    step: int
+    p5: float
+    p25: float
+    p50: float
+    p75: float
+    p95: float
+
+# 포트폴리오 가치 예측 결과
+class PortfolioProjection(BaseModel):
+    """
+    포트폴리오 몬테카를로 예측 스키마
+    
+    보유 종목의 과거 수익률로 시뮬레이션한 기간별 가치 밴드와 만기 요약 통계를 포함합니다.
+    """
+    portfolio_id: int
+    method: str
+    horizon_days: int
+    paths: int
+    seed: int
+    initial_value: float
+    history_days: int
+    holdings: List[Dict[str, Any]]
+    bands: List[ProjectionBand]
+    expected_value: float
+    probability_of_loss: float
+    value_at_risk_95: float
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, validator, root_validator
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, date
+
+# 과거 재현 계좌 생성 시 시세를 미리 저장할 수 있는 최대 종목 수
+MAX_REPLAY_SYMBOLS = 50
 
 # 모의 투자 계좌 기본 모델
 class SimulationAccountBase(BaseModel):
@@ -18,8 +21,27 @@ class SimulationAccountCreate(SimulationAccountBase):
     모의 투자 계좌 생성 요청 스키마
     
     모의 투자 계좌를 생성할 때 필요한 정보를 정의합니다.
+    replay_start_date를 지정하면 해당 날짜부터 저장된 과거 시세로 거래하는
+    과거 재현(REPLAY) 계좌가 생성됩니다. 과거 재현 계좌는 외부 API를 호출하지
+    않으므로 거래할 종목(replay_symbols)의 일별 시세를 계좌 생성 시 미리 저장합니다.
     """
-    pass
+    replay_start_date: Optional[date] = None
+    replay_symbols: List[str] = []
+    
+    @validator('replay_start_date')
+    def check_replay_start_date(cls, v):
+        if v is not None and v >= date.today():
+            raise ValueError('과거 재현 시작일은 오늘 이전이어야 합니다.')
+        return v
+    
+    @validator('replay_symbols')
+    def check_replay_symbols(cls, v, values):
+        symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in v if symbol.strip()))
+        if symbols and values.get('replay_start_date') is None:
+            raise ValueError('replay_symbols는 과거 재현 계좌에서만 지정할 수 있습니다.')
+        if len(symbols) > MAX_REPLAY_SYMBOLS:
+            raise ValueError(f'과거 재현 종목은 최대 {MAX_REPLAY_SYMBOLS}개까지 지정할 수 있습니다.')
+        return symbols
 
 # 모의 투자 계좌 응답 모델
 class SimulationAccount(SimulationAccountBase):
@@ -31,6 +53,8 @@ class SimulationAccount(SimulationAccountBase):
     id: int
     user_id: int
     current_balance: float
+    mode: str = "LIVE"  # "LIVE", "REPLAY" or "BACKTEST"
+    replay_date: Optional[date] = None  # 과거 재현 계좌의 가상 날짜
     created_at: datetime
     
     class Config:
@@ -61,7 +85,7 @@ class SimulationTransactionBase(BaseModel):
 
     @validator('price')
     def check_price(cls, v):
-        if v <= 0:
+        if v is not None and v <= 0:
             raise ValueError('가격은 0보다 커야 합니다.')
         return v
 
@@ -71,9 +95,18 @@ class SimulationTransactionCreate(SimulationTransactionBase):
     모의 투자 거래 내역 생성 요청 스키마
     
     모의 투자 거래 내역을 생성할 때 필요한 정보를 정의합니다.
+    시장가(MARKET) 주문은 서버가 캐시된 시세로 체결하므로 price는 무시됩니다.
     """
     account_id: int
     symbol: str  # 주식 심볼
+    order_type: str = "MARKET"
+    price: Optional[float] = None  # 하위 호환용 (시장가 주문에서는 사용하지 않음)
+    
+    @validator('order_type')
+    def check_order_type(cls, v):
+        if v != "MARKET":
+            raise ValueError('즉시 체결 주문 유형은 "MARKET"이어야 합니다.')
+        return v
 
 # 모의 투자 거래 내역 응답 모델
 class SimulationTransaction(SimulationTransactionBase):
@@ -85,6 +118,7 @@ class SimulationTransaction(SimulationTransactionBase):
     id: int
     account_id: int
     stock_id: int
+    commission: float = 0
     total_amount: float
     transaction_date: datetime
     
@@ -116,4 +150,199 @@ class SimulationHolding(BaseModel):
     total_cost: float
     current_value: float
     profit_loss: float
-    profit_loss_percent: float
\ No newline at end of file
+    profit_loss_percent: float
+
+# 바스켓 주문의 개별 주문 모델
+class BasketOrderLeg(BaseModel):
+    """
+    바스켓 주문 항목 스키마
+    
+    바스켓에 포함된 종목 하나의 시장가 주문을 정의합니다.
+    """
+    symbol: str
+    transaction_type: str  # "BUY" or "SELL"
+    quantity: int
+    
+    @validator('transaction_type')
+    def check_transaction_type(cls, v):
+        if v not in ["BUY", "SELL"]:
+            raise ValueError('거래 유형은 "BUY" 또는 "SELL"이어야 합니다.')
+        return v
+
+    @validator('quantity')
+    def check_quantity(cls, v):
+        if v <= 0:
+            raise ValueError('수량은 0보다 커야 합니다.')
+        return v
+
+# 바스켓 주문 생성 요청 모델
+class BasketOrderCreate(BaseModel):
+    """
+    바스켓 주문 생성 요청 스키마
+    
+    여러 종목의 시장가 주문을 하나의 트랜잭션으로 실행할 때 사용합니다.
+    모든 주문이 체결되거나, 하나라도 실패하면 전체가 취소됩니다.
+    """
+    account_id: int
+    orders: List[BasketOrderLeg]
+    
+    @validator('orders')
+    def check_orders(cls, v):
+        if not v:
+            raise ValueError('주문이 하나 이상 있어야 합니다.')
+        return v
+
+
+# 대기 주문 생성 요청 모델
+class SimulationOrderCreate(BaseModel):
+    """
+    모의 투자 대기 주문 생성 요청 스키마
+    
+    지정가(LIMIT), 손절(STOP), 손절 지정가(STOP_LIMIT) 주문을 정의합니다.
+    LIMIT은 limit_price, STOP은 stop_price, STOP_LIMIT은 두 가격이 모두 필요합니다.
+    """
+    account_id: int
+    symbol: str
+    order_type: str
+    transaction_type: str  # "BUY" or "SELL"
+    quantity: int
+    limit_price: Optional[float] = None
+    stop_price: Optional[float] = None
+    
+    @validator('order_type')
+    def check_order_type(cls, v):
+        if v not in ["LIMIT", "STOP", "STOP_LIMIT"]:
+            raise ValueError('주문 유형은 "LIMIT", "STOP" 또는 "STOP_LIMIT"이어야 합니다.')
+        return v
+
+    @validator('transaction_type')
+    def check_transaction_type(cls, v):
+        if v not in ["BUY", "SELL"]:
+            raise ValueError('거래 유형은 "BUY" 또는 "SELL"이어야 합니다.')
+        return v
+
+    @validator('quantity')
+    def check_quantity(cls, v):
+        if v <= 0:
+            raise ValueError('수량은 0보다 커야 합니다.')
+        return v
+
+    @root_validator(skip_on_failure=True)
+    def check_prices(cls, values):
+        order_type = values.get('order_type')
+        limit_price = values.get('limit_price')
+        stop_price = values.get('stop_price')
+        
+        if order_type in ("LIMIT", "STOP_LIMIT") and (limit_price is None or limit_price <= 0):
+            raise ValueError('지정가 주문에는 0보다 큰 limit_price가 필요합니다.')
+        if order_type in ("STOP", "STOP_LIMIT") and (stop_price is None or stop_price <= 0):
+            raise ValueError('손절 주문에는 0보다 큰 stop_price가 필요합니다.')
+        return values
+
+# 대기 주문 응답 모델
+class SimulationOrder(BaseModel):
+    """
+    모의 투자 대기 주문 응답 스키마
+    
+    주문 상태(OPEN, TRIGGERED, FILLED, CANCELLED, REJECTED)와 체결된 거래 ID를 포함합니다.
+    """
+    id: int
+    account_id: int
+    stock_id: int
+    order_type: str
+    transaction_type: str
+    quantity: int
+    limit_price: Optional[float] = None
+    stop_price: Optional[float] = None
+    status: str
+    reject_reason: Optional[str] = None
+    transaction_id: Optional[int] = None
+    created_at: datetime
+    
+    class Config:
+        orm_mode = True
+
+# 수익률 순위표 항목 모델
+class LeaderboardEntry(BaseModel):
+    """
+    모의 투자 수익률 순위 스키마
+    
+    계좌의 순위, 총 평가 금액(현금 + 보유 주식)과 초기 자금 대비 수익률(%)을 정의합니다.
+    """
+    rank: int
+    account_id: int
+    user_id: int
+    account_name: str
+    username: str
+    initial_balance: float
+    total_value: float
+    return_percent: float
+
+# 과거 재현 가상 시계 진행 요청 모델
+class ReplayAdvance(BaseModel):
+    """
+    과거 재현 가상 날짜 진행 요청 스키마
+    
+    가상 날짜를 영업일 기준 days만큼 앞으로 이동합니다.
+    """
+    days: int = 1
+    
+    @validator('days')
+    def check_days(cls, v):
+        if v <= 0:
+            raise ValueError('이동 일수는 0보다 커야 합니다.')
+        return v
+
+# 과거 재현 가상 시계 자동 진행 요청 모델
+class ReplayClockStart(BaseModel):
+    """
+    과거 재현 가상 시계 시작 요청 스키마
+    
+    interval_seconds마다 가상 날짜를 하루(영업일)씩 진행하며,
+    until(생략 시 오늘)에 도달하면 멈춥니다.
+    """
+    interval_seconds: float = 1.0
+    until: Optional[date] = None
+    
+    @validator('interval_seconds')
+    def check_interval(cls, v):
+        if v < 0.1:
+            raise ValueError('진행 간격은 0.1초 이상이어야 합니다.')
+        return v
+
+# 과거 재현 계좌 상태 모델
+class ReplayStatus(BaseModel):
+    """
+    과거 재현 계좌 상태 스키마
+    
+    현재 가상 날짜와 가상 시계 자동 진행 여부를 정의합니다.
+    """
+    account_id: int
+    replay_date: date
+    running: bool
+
+# 모의 투자 거래 통계 모델
+class SimulationTradeStats(BaseModel):
+    """
+    모의 투자 계좌 거래 통계 스키마
+    
+    라운드트립(종목 보유 수량이 0에서 시작해 다시 0이 될 때까지)은 청산된 것만 집계합니다.
+    win_rate는 백분율(%), turnover는 총 거래 대금 / 초기 자금입니다.
+    청산된 라운드트립이 없으면 평균/최대 항목은 null입니다.
+    """
+    account_id: int
+    trades: int
+    round_trips: int
+    wins: int
+    losses: int
+    win_rate: float
+    avg_holding_days: Optional[float] = None
+    avg_gain: Optional[float] = None
+    avg_loss: Optional[float] = None
+    realized_pnl: float
+    traded_value: float
+    turnover: float
+    largest_win: Optional[float] = None
+    largest_win_symbol: Optional[str] = None
+    largest_loss: Optional[float] = None
+    largest_loss_symbol: Optional[str] = None
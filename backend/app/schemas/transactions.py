@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
 # 기본 거래 내역 모델
@@ -47,4 +47,26 @@ class TransactionDetail(Transaction):
     """
     stock_symbol: str
     stock_name: str
-    total_amount: float
\ No newline at end of file
+    total_amount: float
+# CSV 일괄 등록 시 행별 오류 정보
+class TransactionImportError(BaseModel):
+    """
+    거래 내역 일괄 등록 오류 스키마
+    
+    CSV 파일에서 등록에 실패한 행과 그 사유를 정의합니다.
+    """
+    row: int  # CSV 파일 상의 행 번호 (헤더 = 1)
+    symbol: Optional[str] = None
+    message: str
+
+# CSV 일괄 등록 결과
+class TransactionImportResult(BaseModel):
+    """
+    거래 내역 일괄 등록 결과 스키마
+    
+    전체 처리 행 수, 등록된 행 수와 행별 오류 목록을 포함합니다.
+    """
+    total_rows: int
+    imported: int
+    dry_run: bool
+    errors: List[TransactionImportError]
@@ -0,0 +1,570 @@
+import asyncio
+import itertools
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.executors import compute_pool_size, get_compute_pool
+from app.db.models import SimulationAccount, SimulationTransaction
+from app.services.replay import BACKTEST
+from app.services.simulation_trading import notify_account_changed
+
+# 연 환산에 사용하는 연간 거래일 수
+TRADING_DAYS = 252
+
+# 파라미터 탐색 시 허용하는 최대 조합 수
+MAX_SWEEP_COMBINATIONS = 2000
+
+# 파라미터 탐색 시 워커 하나에 보내는 조합 묶음 수 (워커 수 x 이 값, 묶음마다 공유 메모리를 한 번 연결)
+SWEEP_CHUNKS_PER_WORKER = 4
+
+
+class StrategySpecError(ValueError):
+    """전략 이름, 파라미터 또는 선언형 전략 정의가 올바르지 않은 경우"""
+
+
+# ---------------------------------------------------------------------------
+# 지표 (모두 길이 n의 배열을 반환하며, 계산할 수 없는 앞부분은 NaN)
+# ---------------------------------------------------------------------------
+
+def _window(value) -> int:
+    window = int(value)
+    if window <= 0:
+        raise StrategySpecError(f"기간은 1 이상이어야 합니다: {value}")
+    return window
+
+
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """누적합을 이용한 단순 이동 평균"""
+    out = np.full(len(values), np.nan)
+    if window > len(values):
+        return out
+    csum = np.cumsum(np.insert(values, 0, 0.0))
+    out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """누적합/제곱 누적합을 이용한 이동 표준편차 (모집단 기준)"""
+    out = np.full(len(values), np.nan)
+    if window > len(values):
+        return out
+    csum = np.cumsum(np.insert(values, 0, 0.0))
+    csum_sq = np.cumsum(np.insert(values * values, 0, 0.0))
+    mean = (csum[window:] - csum[:-window]) / window
+    variance = (csum_sq[window:] - csum_sq[:-window]) / window - mean * mean
+    out[window - 1:] = np.sqrt(np.clip(variance, 0.0, None))
+    return out
+
+
+def zscore(values: np.ndarray, window: int) -> np.ndarray:
+    """이동 평균 대비 표준화 점수"""
+    std = rolling_std(values, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0, (values - sma(values, window)) / std, np.nan)
+
+
+def momentum(values: np.ndarray, lookback: int) -> np.ndarray:
+    """lookback 거래일 전 대비 수익률"""
+    out = np.full(len(values), np.nan)
+    if lookback < len(values):
+        out[lookback:] = values[lookback:] / values[:-lookback] - 1.0
+    return out
+
+
+def hold_positions(entry: np.ndarray, exit: np.ndarray) -> np.ndarray:
+    """
+    진입/청산 신호를 보유 상태(0 또는 1) 배열로 변환합니다.
+
+    마지막 신호를 앞으로 채우는(forward fill) 방식으로 반복문 없이 계산합니다.
+    같은 날 두 신호가 모두 있으면 진입이 우선합니다.
+    """
+    n = len(entry)
+    signal = np.full(n, np.nan)
+    signal[exit] = 0.0
+    signal[entry] = 1.0
+
+    last_index = np.where(~np.isnan(signal), np.arange(n), 0)
+    np.maximum.accumulate(last_index, out=last_index)
+
+    positions = signal[last_index]
+    return np.nan_to_num(positions, nan=0.0)
+
+
+# ---------------------------------------------------------------------------
+# 내장 전략 (close 배열과 파라미터 -> 보유 상태 배열)
+# ---------------------------------------------------------------------------
+
+def ma_crossover(bars: Dict[str, np.ndarray], fast: float = 20, slow: float = 50) -> np.ndarray:
+    """단기 이동 평균이 장기 이동 평균 위에 있는 동안 보유"""
+    close = bars["close"]
+    fast_ma = sma(close, _window(fast))
+    slow_ma = sma(close, _window(slow))
+    with np.errstate(invalid="ignore"):
+        return (fast_ma > slow_ma).astype(np.float64)
+
+
+def momentum_strategy(bars: Dict[str, np.ndarray], lookback: float = 20, threshold: float = 0.0) -> np.ndarray:
+    """lookback 기간 수익률이 threshold를 넘는 동안 보유"""
+    mom = momentum(bars["close"], _window(lookback))
+    with np.errstate(invalid="ignore"):
+        return (mom > threshold).astype(np.float64)
+
+
+def mean_reversion(bars: Dict[str, np.ndarray], window: float = 20, entry_z: float = -1.0, exit_z: float = 0.0) -> np.ndarray:
+    """z-score가 entry_z 아래로 내려가면 진입, exit_z 위로 올라가면 청산"""
+    z = zscore(bars["close"], _window(window))
+    with np.errstate(invalid="ignore"):
+        return hold_positions(z < entry_z, z > exit_z)
+
+
+BUILTIN_STRATEGIES = {
+    "ma_crossover": ma_crossover,
+    "momentum": momentum_strategy,
+    "mean_reversion": mean_reversion,
+}
+
+
+# ---------------------------------------------------------------------------
+# 선언형 전략
+#
+# {
+#   "entry": {"left": {"indicator": "sma", "window": "$fast"}, "op": ">",
+#             "right": {"indicator": "sma", "window": "$slow"}},
+#   "exit":  {"any": [{"left": {"indicator": "zscore", "window": 20}, "op": ">", "right": {"value": 2}}]}
+# }
+#
+# 조건은 비교식 또는 {"all": [...]}, {"any": [...]} 조합이며, "$이름" 값은
+# 실행 파라미터로 치환됩니다. exit이 없으면 entry 조건이 거짓이 될 때 청산합니다.
+# ---------------------------------------------------------------------------
+
+COMPARATORS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+}
+
+
+def _resolve(value, params: Dict[str, float]):
+    if isinstance(value, str) and value.startswith("$"):
+        name = value[1:]
+        if name not in params:
+            raise StrategySpecError(f"정의되지 않은 파라미터입니다: {value}")
+        return params[name]
+    return value
+
+
+def _operand(bars: Dict[str, np.ndarray], operand: Dict[str, Any], params: Dict[str, float]) -> np.ndarray:
+    if "value" in operand:
+        return np.full(len(bars["close"]), float(_resolve(operand["value"], params)))
+
+    indicator = operand.get("indicator")
+    source = bars.get(operand.get("source", "close"))
+    if source is None:
+        raise StrategySpecError(f"알 수 없는 가격 컬럼입니다: {operand.get('source')}")
+
+    if indicator in ("close", "open", "high", "low"):
+        return bars[indicator]
+
+    window = _window(_resolve(operand.get("window", 20), params))
+    if indicator == "sma":
+        return sma(source, window)
+    if indicator == "std":
+        return rolling_std(source, window)
+    if indicator == "zscore":
+        return zscore(source, window)
+    if indicator == "momentum":
+        return momentum(source, window)
+
+    raise StrategySpecError(f"지원하지 않는 지표입니다: {indicator}")
+
+
+def _condition(bars: Dict[str, np.ndarray], condition: Dict[str, Any], params: Dict[str, float]) -> np.ndarray:
+    if "all" in condition:
+        parts = [_condition(bars, c, params) for c in condition["all"]]
+        return np.logical_and.reduce(parts) if parts else np.zeros(len(bars["close"]), dtype=bool)
+    if "any" in condition:
+        parts = [_condition(bars, c, params) for c in condition["any"]]
+        return np.logical_or.reduce(parts) if parts else np.zeros(len(bars["close"]), dtype=bool)
+
+    comparator = COMPARATORS.get(condition.get("op"))
+    if comparator is None or "left" not in condition or "right" not in condition:
+        raise StrategySpecError(f"조건식이 올바르지 않습니다: {condition}")
+
+    left = _operand(bars, condition["left"], params)
+    right = _operand(bars, condition["right"], params)
+    with np.errstate(invalid="ignore"):
+        return comparator(left, right)
+
+
+def spec_strategy(bars: Dict[str, np.ndarray], spec: Dict[str, Any], params: Dict[str, float]) -> np.ndarray:
+    """선언형 전략 정의로 보유 상태 배열 계산"""
+    if "entry" not in spec:
+        raise StrategySpecError("전략 정의에 entry 조건이 필요합니다.")
+
+    entry = _condition(bars, spec["entry"], params)
+    if "exit" in spec:
+        return hold_positions(entry, _condition(bars, spec["exit"], params))
+    return entry.astype(np.float64)
+
+
+def compute_positions(bars, strategy: str, params: Dict[str, float], spec: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """
+    전략 이름(또는 "custom" + spec)으로 날짜별 목표 보유 상태(0/1)를 계산합니다.
+
+    Raises:
+        StrategySpecError: 알 수 없는 전략이거나 파라미터가 올바르지 않은 경우
+    """
+    if strategy == "custom":
+        if not spec:
+            raise StrategySpecError("custom 전략에는 spec이 필요합니다.")
+        return spec_strategy(bars, spec, params)
+
+    func = BUILTIN_STRATEGIES.get(strategy)
+    if func is None:
+        raise StrategySpecError(f"알 수 없는 전략입니다: {strategy}")
+
+    try:
+        return func(bars, **params)
+    except TypeError as e:
+        raise StrategySpecError(f"전략 파라미터가 올바르지 않습니다: {e}")
+
+
+# ---------------------------------------------------------------------------
+# 체결 시뮬레이션 및 성과 지표
+# ---------------------------------------------------------------------------
+
+def simulate(bars: Dict[str, np.ndarray], positions: np.ndarray, initial_cash: float, commission_rate: float):
+    """
+    보유 상태 배열을 거래 내역과 자산 곡선으로 변환합니다.
+
+    t일 종가 기준 신호는 t+1일 시가에 체결됩니다 (미래 데이터 사용 방지).
+    매수 시 현금 전액으로 살 수 있는 만큼 정수 주식을 사고, 청산 시 전량 매도합니다.
+    상태가 바뀌는 날만 순회하므로 반복 횟수는 거래 횟수에 비례하고,
+    날짜별 현금/보유 수량은 구간 인덱스로 한 번에 펼칩니다.
+
+    Returns:
+        tuple: (거래 목록, 날짜별 자산 배열, 날짜별 보유 수량 배열, 최종 현금)
+    """
+    n = len(bars["close"])
+    opens, closes = bars["open"], bars["close"]
+
+    target = np.zeros(n)
+    target[1:] = positions[:-1]
+    change_days = np.flatnonzero(np.diff(np.concatenate(([0.0], target))))
+
+    cash = float(initial_cash)
+    shares = 0
+    segment_cash, segment_shares, trades = [], [], []
+
+    for day in change_days:
+        price = float(opens[day])
+        if target[day] > 0 and shares == 0 and price > 0:
+            quantity = int(cash // (price * (1.0 + commission_rate)))
+            if quantity > 0:
+                commission = quantity * price * commission_rate
+                cash -= quantity * price + commission
+                shares = quantity
+                trades.append((int(day), "BUY", quantity, price, commission))
+        elif target[day] == 0 and shares > 0:
+            commission = shares * price * commission_rate
+            cash += shares * price - commission
+            trades.append((int(day), "SELL", shares, price, commission))
+            shares = 0
+        segment_cash.append(cash)
+        segment_shares.append(shares)
+
+    # 날짜별로 직전 상태 변경 구간의 현금/보유 수량 적용
+    segment = np.searchsorted(change_days, np.arange(n), side="right") - 1
+    cash_by_day = np.append(np.array(segment_cash, dtype=np.float64), float(initial_cash))[segment]
+    shares_by_day = np.append(np.array(segment_shares, dtype=np.float64), 0.0)[segment]
+
+    equity = cash_by_day + shares_by_day * closes
+    return trades, equity, shares_by_day, cash
+
+
+def summarize(equity: np.ndarray, shares_by_day: np.ndarray, trades: List[tuple], initial_cash: float) -> Dict[str, float]:
+    """자산 곡선과 거래 목록으로 요약 통계 계산"""
+    if len(equity) == 0:
+        return {"total_return": 0.0, "cagr": 0.0, "sharpe": 0.0, "max_drawdown": 0.0,
+                "num_trades": 0, "win_rate": 0.0, "exposure": 0.0, "final_equity": float(initial_cash)}
+
+    final_equity = float(equity[-1])
+    total_return = final_equity / initial_cash - 1.0
+
+    years = len(equity) / TRADING_DAYS
+    cagr = (final_equity / initial_cash) ** (1.0 / years) - 1.0 if years > 0 and final_equity > 0 else 0.0
+
+    daily_returns = equity[1:] / equity[:-1] - 1.0 if len(equity) > 1 else np.array([0.0])
+    std = float(np.std(daily_returns))
+    sharpe = float(np.mean(daily_returns)) / std * np.sqrt(TRADING_DAYS) if std > 0 else 0.0
+
+    running_max = np.maximum.accumulate(equity)
+    max_drawdown = float(np.min(equity / running_max - 1.0))
+
+    # 매수-매도 왕복 거래 손익
+    round_trips = []
+    for buy, sell in zip(trades[0::2], trades[1::2]):
+        cost = buy[2] * buy[3] + buy[4]
+        proceeds = sell[2] * sell[3] - sell[4]
+        round_trips.append(proceeds - cost)
+    win_rate = sum(1 for pnl in round_trips if pnl > 0) / len(round_trips) if round_trips else 0.0
+
+    return {
+        "total_return": total_return,
+        "cagr": cagr,
+        "sharpe": float(sharpe),
+        "max_drawdown": max_drawdown,
+        "num_trades": len(trades),
+        "win_rate": win_rate,
+        "exposure": float(np.mean(shares_by_day > 0)),
+        "final_equity": final_equity
+    }
+
+
+def run_backtest(
+    bars: Dict[str, np.ndarray],
+    symbol: str,
+    strategy: str,
+    params: Dict[str, float],
+    spec: Optional[Dict[str, Any]] = None,
+    initial_cash: float = 100000.0,
+    commission_rate: float = 0.0,
+    include_details: bool = True
+) -> Dict[str, Any]:
+    """
+    전략 하나를 일별 시세에 대해 실행합니다.
+
+    프로세스 풀에서 실행할 수 있도록 DB나 전역 상태에 의존하지 않는 순수 함수입니다.
+
+    Args:
+        bars: load_daily_bars 형식의 컬럼별 배열
+        symbol (str): 종목 심볼 (거래 내역 표시용)
+        strategy (str): 내장 전략 이름 또는 "custom"
+        params (Dict[str, float]): 전략 파라미터
+        spec (Optional[Dict]): custom 전략 정의
+        initial_cash (float): 초기 자금
+        commission_rate (float): 거래 금액 대비 수수료율
+        include_details (bool): False이면 통계만 반환 (파라미터 탐색용)
+
+    Returns:
+        dict: params, stats, (include_details=True일 때) trades, equity_curve, final_cash
+
+    Raises:
+        StrategySpecError: 전략 정의가 올바르지 않은 경우
+    """
+    positions = compute_positions(bars, strategy, params, spec)
+    trades, equity, shares_by_day, final_cash = simulate(bars, positions, initial_cash, commission_rate)
+
+    result = {
+        "params": params,
+        "stats": summarize(equity, shares_by_day, trades, initial_cash)
+    }
+
+    if include_details:
+        dates = bars["dates"].astype(str).tolist()
+        result["trades"] = [
+            {
+                "symbol": symbol,
+                "transaction_type": side,
+                "quantity": quantity,
+                "price": round(price, 2),
+                "commission": round(commission, 2),
+                "total_amount": round(quantity * price + commission if side == "BUY" else quantity * price - commission, 2),
+                "transaction_date": dates[day]
+            }
+            for day, side, quantity, price, commission in trades
+        ]
+        result["equity_curve"] = [
+            {"date": date, "equity": round(float(value), 2)}
+            for date, value in zip(dates, equity)
+        ]
+        result["final_cash"] = round(final_cash, 2)
+
+    return result
+
+
+def expand_grid(grid: Dict[str, List[float]]) -> List[Dict[str, float]]:
+    """
+    파라미터 격자를 조합 목록으로 펼칩니다.
+
+    Raises:
+        StrategySpecError: 조합 수가 MAX_SWEEP_COMBINATIONS를 넘는 경우
+    """
+    names = sorted(grid)
+    total = 1
+    for name in names:
+        total *= max(len(grid[name]), 1)
+    if total > MAX_SWEEP_COMBINATIONS:
+        raise StrategySpecError(f"파라미터 조합이 너무 많습니다: {total}개 (최대 {MAX_SWEEP_COMBINATIONS}개)")
+
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+# 공유 메모리 안의 배열 위치: 이름 -> (오프셋, dtype 문자열, shape)
+BarsLayout = Dict[str, Tuple[int, str, Tuple[int, ...]]]
+
+
+def share_bars(bars: Dict[str, np.ndarray]) -> Tuple[SharedMemory, BarsLayout]:
+    """
+    일봉 배열을 공유 메모리 블록 하나에 복사합니다.
+
+    호출한 쪽에서 사용이 끝나면 close()와 unlink()로 해제해야 합니다.
+
+    Returns:
+        tuple: (공유 메모리, 배열 위치 정보)
+    """
+    layout: BarsLayout = {}
+    offset = 0
+    for name, values in bars.items():
+        layout[name] = (offset, values.dtype.str, values.shape)
+        # 다음 배열이 8바이트 경계에서 시작하도록 정렬
+        offset += (values.nbytes + 7) // 8 * 8
+
+    shm = SharedMemory(create=True, size=max(offset, 1))
+    for name, values in bars.items():
+        offset, dtype, shape = layout[name]
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)[...] = values
+    return shm, layout
+
+
+def _run_shared_backtests(
+    shm_name: str,
+    layout: BarsLayout,
+    symbol: str,
+    strategy: str,
+    combinations: List[Dict[str, float]],
+    spec: Optional[Dict[str, Any]],
+    initial_cash: float,
+    commission_rate: float
+) -> List[Dict[str, Any]]:
+    """계산 풀 워커: 공유 메모리의 일봉을 복사 없이 읽어 조합 묶음을 차례로 실행"""
+    shm = SharedMemory(name=shm_name)
+    try:
+        bars = {
+            name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            for name, (offset, dtype, shape) in layout.items()
+        }
+        results = [
+            run_backtest(
+                bars, symbol, strategy, params,
+                spec=spec, initial_cash=initial_cash, commission_rate=commission_rate, include_details=False
+            )
+            for params in combinations
+        ]
+        del bars
+        return results
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            # 예외 traceback이 배열을 참조하는 경우 - 참조가 사라질 때 매핑 해제
+            pass
+
+
+async def run_sweep(
+    bars: Dict[str, np.ndarray],
+    symbol: str,
+    strategy: str,
+    grid: Dict[str, List[float]],
+    spec: Optional[Dict[str, Any]] = None,
+    initial_cash: float = 100000.0,
+    commission_rate: float = 0.0
+) -> List[Dict[str, Any]]:
+    """
+    파라미터 격자의 모든 조합을 계산용 프로세스 풀에 분산해 실행합니다.
+
+    일봉은 공유 메모리에 한 번만 복사하고 워커에는 블록 이름과 조합 묶음만
+    보내므로, 조합 수만큼 일봉을 직렬화하지 않습니다.
+
+    Returns:
+        List[dict]: 조합별 params, stats (요청 순서)
+
+    Raises:
+        StrategySpecError: 격자가 너무 크거나 전략 정의가 올바르지 않은 경우
+    """
+    combinations = expand_grid(grid)
+    if not combinations:
+        return []
+
+    # 첫 조합으로 전략 정의를 미리 검증 (잘못된 정의로 풀 전체를 돌리지 않도록)
+    compute_positions(bars, strategy, combinations[0], spec)
+
+    loop = asyncio.get_running_loop()
+    pool = get_compute_pool()
+    chunk_count = compute_pool_size() * SWEEP_CHUNKS_PER_WORKER
+    chunk_size = -(-len(combinations) // chunk_count)
+    chunks = [combinations[i:i + chunk_size] for i in range(0, len(combinations), chunk_size)]
+
+    shm, layout = share_bars(bars)
+    try:
+        task = partial(
+            _run_shared_backtests,
+            shm.name,
+            layout,
+            symbol,
+            strategy,
+            spec=spec,
+            initial_cash=initial_cash,
+            commission_rate=commission_rate
+        )
+        results = await asyncio.gather(*(loop.run_in_executor(pool, task, chunk) for chunk in chunks))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return [result for chunk_results in results for result in chunk_results]
+
+
+def save_backtest_account(db: Session, user_id: int, name: str, stock_id: int, result: Dict[str, Any], initial_cash: float) -> SimulationAccount:
+    """
+    백테스트 결과를 모의 투자 계좌와 거래 내역으로 저장합니다.
+
+    기존 모의 투자 화면에서 백테스트 결과를 그대로 조회할 수 있습니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        user_id (int): 계좌 소유자 ID
+        name (str): 생성할 계좌 이름
+        stock_id (int): 백테스트 종목 ID
+        result (dict): run_backtest 결과 (include_details=True)
+        initial_cash (float): 초기 자금
+
+    Returns:
+        SimulationAccount: 생성된 계좌
+    """
+    account = SimulationAccount(
+        user_id=user_id,
+        name=name,
+        initial_balance=initial_cash,
+        current_balance=result["final_cash"],
+        mode=BACKTEST  # 순위표/NAV 스냅샷 대상이 아님
+    )
+    db.add(account)
+    db.flush()
+
+    rows = [
+        {
+            "account_id": account.id,
+            "stock_id": stock_id,
+            "transaction_type": trade["transaction_type"],
+            "quantity": trade["quantity"],
+            "price": trade["price"],
+            "commission": trade["commission"],
+            "total_amount": trade["total_amount"],
+            "transaction_date": trade["transaction_date"]
+        }
+        for trade in result["trades"]
+    ]
+    if rows:
+        db.execute(insert(SimulationTransaction), rows)
+
+    db.commit()
+    db.refresh(account)
+    notify_account_changed(db, account.id)
+    return account
@@ -0,0 +1,122 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+from fastapi import HTTPException, status
+
+from app.config import (
+    MARKET_QUOTE_MAX_AGE,
+    SIMULATION_SLIPPAGE_MODEL,
+    SIMULATION_SLIPPAGE_BPS,
+    SIMULATION_COMMISSION_MODEL,
+    SIMULATION_COMMISSION_RATE,
+    SIMULATION_COMMISSION_MIN
+)
+from app.db.models import Stock
+from app.services.stock_data import get_cached_quote
+
+CENT = Decimal("0.01")
+
+
+def _no_slippage(side: str, price: Decimal) -> Decimal:
+    return price
+
+
+def _fixed_bps_slippage(side: str, price: Decimal) -> Decimal:
+    """매수는 시세보다 비싸게, 매도는 싸게 고정 bp만큼 불리하게 체결"""
+    adjustment = price * Decimal(str(SIMULATION_SLIPPAGE_BPS)) / Decimal("10000")
+    return price + adjustment if side == "BUY" else price - adjustment
+
+
+def _no_commission(quantity: int, price: Decimal) -> Decimal:
+    return Decimal("0")
+
+
+def _per_share_commission(quantity: int, price: Decimal) -> Decimal:
+    """주당 고정 수수료 (최소 수수료 적용)"""
+    fee = Decimal(str(SIMULATION_COMMISSION_RATE)) * quantity
+    return max(fee, Decimal(str(SIMULATION_COMMISSION_MIN)))
+
+
+def _percent_commission(quantity: int, price: Decimal) -> Decimal:
+    """거래 금액 대비 비율 수수료 (SIMULATION_COMMISSION_RATE=0.001 이면 0.1%)"""
+    fee = Decimal(str(SIMULATION_COMMISSION_RATE)) * quantity * price
+    return max(fee, Decimal(str(SIMULATION_COMMISSION_MIN)))
+
+
+# 설정값(SIMULATION_SLIPPAGE_MODEL, SIMULATION_COMMISSION_MODEL)으로 선택되는 모델
+SLIPPAGE_MODELS = {
+    "none": _no_slippage,
+    "fixed_bps": _fixed_bps_slippage,
+}
+
+COMMISSION_MODELS = {
+    "none": _no_commission,
+    "per_share": _per_share_commission,
+    "percent": _percent_commission,
+}
+
+
+def get_market_price(stock: Stock) -> Decimal:
+    """
+    시장가 주문의 기준 시세를 외부 API 호출 없이 결정합니다.
+
+    메모리 시세 캐시(get_stock_quote가 채움)를 우선 사용하고, 캐시가 없거나
+    MARKET_QUOTE_MAX_AGE보다 오래되었으면 DB에 저장된 last_price를 사용합니다.
+
+    Args:
+        stock (Stock): 주식 객체
+
+    Returns:
+        Decimal: 기준 시세
+
+    Raises:
+        HTTPException: 사용할 수 있는 시세가 없는 경우
+    """
+    quote = get_cached_quote(stock.symbol, MARKET_QUOTE_MAX_AGE)
+    if quote and quote.get("price"):
+        return Decimal(str(quote["price"]))
+
+    if stock.last_price:
+        return Decimal(str(stock.last_price))
+
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"주식 {stock.symbol}의 시세 정보가 없어 시장가 주문을 체결할 수 없습니다. 시세를 먼저 조회해 주세요."
+    )
+
+
+def price_fill(side: str, quantity: int, reference_price: Decimal):
+    """
+    기준 시세에 슬리피지와 수수료 모델을 적용해 체결가와 수수료를 계산합니다.
+
+    Args:
+        side (str): "BUY" 또는 "SELL"
+        quantity (int): 주문 수량
+        reference_price (Decimal): 기준 시세
+
+    Returns:
+        tuple: (체결가, 수수료) - 모두 센트 단위로 반올림된 Decimal
+    """
+    slippage = SLIPPAGE_MODELS.get(SIMULATION_SLIPPAGE_MODEL, _no_slippage)
+    commission = COMMISSION_MODELS.get(SIMULATION_COMMISSION_MODEL, _no_commission)
+
+    fill_price = slippage(side, reference_price).quantize(CENT, rounding=ROUND_HALF_UP)
+    fee = commission(quantity, fill_price).quantize(CENT, rounding=ROUND_HALF_UP)
+    return fill_price, fee
+
+
+def price_market_order(stock: Stock, side: str, quantity: int):
+    """
+    시장가 주문의 체결가와 수수료를 계산합니다.
+
+    Args:
+        stock (Stock): 주식 객체
+        side (str): "BUY" 또는 "SELL"
+        quantity (int): 주문 수량
+
+    Returns:
+        tuple: (체결가, 수수료)
+
+    Raises:
+        HTTPException: 사용할 수 있는 시세가 없는 경우
+    """
+    return price_fill(side, quantity, get_market_price(stock))
@@ -0,0 +1,112 @@
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def replay_holdings(
+    transactions: Iterable,
+    cost_of: Callable[[Any], float],
+    price_of: Callable[[Any], float]
+) -> Dict[str, dict]:
+    """
+    거래 내역을 순서대로 재생해 종목별 보유 수량과 평균 단가를 계산합니다.
+
+    매수는 원가를 더해 평균 단가를 다시 계산하고, 매도는 수량과 (평균 단가 기준)
+    원가를 줄입니다 (FIFO 방식 단순화).
+
+    Args:
+        transactions (Iterable): stock, transaction_type, quantity 속성이 있는 거래 내역
+        cost_of (Callable): 매수 거래의 원가 (포트폴리오: 수량 * 가격, 모의 투자: 수수료 포함 total_amount)
+        price_of (Callable): 주식의 현재가
+
+    Returns:
+        Dict[str, dict]: 심볼 -> 보유 정보 (매수한 적 있는 모든 종목, 전량 매도 포함)
+    """
+    holdings = {}
+
+    for transaction in transactions:
+        symbol = transaction.stock.symbol
+
+        # 매수/매도에 따라 계산
+        if transaction.transaction_type == "BUY":
+            if symbol not in holdings:
+                holdings[symbol] = {
+                    "symbol": symbol,
+                    "name": transaction.stock.name,
+                    "quantity": 0,
+                    "avg_price": 0,
+                    "current_price": price_of(transaction.stock),
+                    "total_cost": 0,
+                    "current_value": 0,
+                    "profit_loss": 0,
+                    "profit_loss_percent": 0
+                }
+
+            # 평균 단가 계산
+            total_quantity = holdings[symbol]["quantity"] + transaction.quantity
+            total_cost = holdings[symbol]["total_cost"] + cost_of(transaction)
+
+            holdings[symbol]["quantity"] = total_quantity
+            holdings[symbol]["total_cost"] = total_cost
+
+            if total_quantity > 0:
+                holdings[symbol]["avg_price"] = total_cost / total_quantity
+
+        elif transaction.transaction_type == "SELL":
+            if symbol in holdings:
+                # 매도 시 수량 감소
+                holdings[symbol]["quantity"] -= transaction.quantity
+
+                # 매도한 수량만큼 평균 단가 기준 원가 차감
+                holdings[symbol]["total_cost"] -= transaction.quantity * holdings[symbol]["avg_price"]
+
+    return holdings
+
+
+def summarize_holdings(holdings: Dict[str, dict]) -> Tuple[List[dict], float, float]:
+    """
+    보유 중인 종목의 현재 가치와 수익/손실을 계산합니다.
+
+    Returns:
+        tuple: (보유 종목 목록, 총 투자 원가, 총 현재 가치)
+    """
+    holdings_list = []
+    total_investment = 0
+    current_value = 0
+
+    for holding in holdings.values():
+        if holding["quantity"] > 0:
+            holding["current_value"] = holding["quantity"] * holding["current_price"]
+            holding["profit_loss"] = holding["current_value"] - holding["total_cost"]
+
+            if holding["total_cost"] > 0:
+                holding["profit_loss_percent"] = (holding["profit_loss"] / holding["total_cost"]) * 100
+
+            total_investment += holding["total_cost"]
+            current_value += holding["current_value"]
+
+            holdings_list.append(holding)
+
+    return holdings_list, total_investment, current_value
+
+
+def compute_holdings(
+    transactions: Iterable,
+    cost_of: Callable[[Any], float],
+    price_of: Callable[[Any], float]
+) -> Tuple[List[dict], float, float]:
+    """거래 내역 재생 + 보유 종목 요약 (get_portfolio, get_simulation_account 공용)"""
+    return summarize_holdings(replay_holdings(transactions, cost_of, price_of))
+
+
+def last_price(stock) -> float:
+    """DB에 저장된 최근 시세 (없으면 0)"""
+    return float(stock.last_price) if stock.last_price else 0
+
+
+def portfolio_cost(transaction) -> float:
+    """포트폴리오 거래의 원가 (수량 * 가격)"""
+    return transaction.quantity * float(transaction.price)
+
+
+def simulation_cost(transaction) -> float:
+    """모의 투자 거래의 원가 (수수료 포함 현금 변동액)"""
+    return float(transaction.total_amount)
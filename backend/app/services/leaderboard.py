@@ -0,0 +1,392 @@
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Collection, Dict, List, Optional, Set, Tuple
+
+from sortedcontainers import SortedList
+from sqlalchemy import case, delete, func, insert, or_
+from sqlalchemy.orm import Session
+
+from app.config import LEADERBOARD_CHANGE_WINDOW
+from app.db.database import SessionLocal
+from app.db.models import (
+    SimulationAccount,
+    SimulationAccountChange,
+    SimulationLeaderboard,
+    SimulationTransaction,
+    Stock,
+    User
+)
+from app.services.simulation_trading import prune_account_changes
+
+
+@dataclass
+class AccountScore:
+    """순위 계산에 필요한 계좌 상태 (현금, 보유 수량, 평가 금액)"""
+    account_id: int
+    user_id: int
+    name: str
+    username: str
+    initial_balance: float
+    cash: float
+    holdings: Dict[str, int] = field(default_factory=dict)
+    market_value: float = 0.0
+
+    @property
+    def total_value(self) -> float:
+        return self.cash + self.market_value
+
+    @property
+    def return_percent(self) -> float:
+        if self.initial_balance <= 0:
+            return 0.0
+        return (self.total_value - self.initial_balance) / self.initial_balance * 100
+
+    def to_dict(self, rank: int) -> dict:
+        return {
+            "rank": rank,
+            "account_id": self.account_id,
+            "user_id": self.user_id,
+            "account_name": self.name,
+            "username": self.username,
+            "initial_balance": self.initial_balance,
+            "total_value": round(self.total_value, 2),
+            "return_percent": round(self.return_percent, 4)
+        }
+
+
+class Leaderboard:
+    """
+    모의 투자 계좌 수익률 순위표
+
+    계좌별 상태와 (-수익률, 계좌 ID) 키의 정렬 리스트를 메모리에 유지합니다.
+    거래가 커밋되면 해당 계좌만 DB 집계로 다시 읽고, 시세 틱은 그 종목을 보유한
+    계좌의 평가 금액만 차액으로 갱신하므로 갱신 한 번은 O(log n)입니다.
+    상위 N개 조회는 O(log n + N), 특정 계좌 순위 조회는 O(log n)입니다.
+
+    전체 구성은 서버 시작 시 한 번만 하고, 이후 다른 워커에서 바뀐 계좌는
+    simulation_account_changes 기록으로 찾아 그 계좌만 다시 읽습니다 (sync).
+    """
+
+    def __init__(self):
+        self.accounts: Dict[int, AccountScore] = {}
+        self.keys: Dict[int, Tuple[float, int]] = {}
+        self.ranking = SortedList()
+        # 종목 심볼 -> 보유 계좌 ID 집합 (틱 처리 대상 계좌 탐색용)
+        self.holders: Dict[str, Set[int]] = defaultdict(set)
+        self.prices: Dict[str, float] = {}
+        # 반영한 계좌 변경 기록의 마지막 ID와, 그보다 작지만 아직 보이지 않은 ID -> 발견 시각
+        # (먼저 ID를 받은 트랜잭션이 나중에 커밋될 수 있으므로 LEADERBOARD_CHANGE_WINDOW 동안 다시 확인)
+        self.last_change_id = 0
+        self.pending_change_ids: Dict[int, float] = {}
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def _unindex(self, account_id: int):
+        key = self.keys.pop(account_id, None)
+        if key is not None:
+            self.ranking.remove(key)
+
+    def _index(self, score: AccountScore):
+        key = (-score.return_percent, score.account_id)
+        self.keys[score.account_id] = key
+        self.ranking.add(key)
+
+    def _put(self, score: AccountScore):
+        """계좌 상태 교체 (잠금을 잡은 상태에서 호출)"""
+        previous = self.accounts.get(score.account_id)
+        if previous is not None:
+            for symbol in previous.holdings:
+                self.holders[symbol].discard(score.account_id)
+        self._unindex(score.account_id)
+
+        score.market_value = sum(quantity * self.prices.get(symbol, 0.0) for symbol, quantity in score.holdings.items())
+        for symbol in score.holdings:
+            self.holders[symbol].add(score.account_id)
+
+        self.accounts[score.account_id] = score
+        self._index(score)
+
+    def _drop(self, account_id: int):
+        """계좌 제거 (잠금을 잡은 상태에서 호출)"""
+        previous = self.accounts.pop(account_id, None)
+        if previous is not None:
+            for symbol in previous.holdings:
+                self.holders[symbol].discard(account_id)
+        self._unindex(account_id)
+
+    def _apply_price(self, symbol: str, price: float):
+        """새 시세로 종목 보유 계좌의 평가 금액을 차액으로 갱신 (잠금을 잡은 상태에서 호출)"""
+        previous = self.prices.get(symbol, 0.0)
+        self.prices[symbol] = price
+        if price == previous:
+            return
+
+        for account_id in self.holders.get(symbol, ()):
+            score = self.accounts[account_id]
+            self._unindex(account_id)
+            score.market_value += score.holdings[symbol] * (price - previous)
+            self._index(score)
+
+    @staticmethod
+    def _load(db: Session, account_ids: Optional[Collection[int]] = None):
+        """
+        계좌 정보와 종목별 보유 수량을 집계 쿼리 두 번으로 읽습니다.
+
+        Args:
+            db (Session): 데이터베이스 세션
+            account_ids: 읽을 계좌 ID 목록 (None이면 전체)
+
+        Returns:
+            tuple: (AccountScore 목록, 심볼 -> DB last_price)
+        """
+        accounts = db.query(
+            SimulationAccount.id,
+            SimulationAccount.user_id,
+            SimulationAccount.name,
+            User.username,
+            SimulationAccount.initial_balance,
+            SimulationAccount.current_balance
+        ).join(
+            User, User.id == SimulationAccount.user_id
+        ).filter(
+            # 과거 재현 계좌는 실시간 시세로 평가할 수 없으므로 순위에서 제외
+            SimulationAccount.mode == "LIVE"
+        )
+
+        signed_quantity = case(
+            (SimulationTransaction.transaction_type == "BUY", SimulationTransaction.quantity),
+            else_=-SimulationTransaction.quantity
+        )
+        positions = db.query(
+            SimulationTransaction.account_id,
+            Stock.symbol,
+            Stock.last_price,
+            func.sum(signed_quantity)
+        ).join(
+            Stock, Stock.id == SimulationTransaction.stock_id
+        ).group_by(
+            SimulationTransaction.account_id, Stock.symbol, Stock.last_price
+        ).having(func.sum(signed_quantity) > 0)
+
+        if account_ids is not None:
+            accounts = accounts.filter(SimulationAccount.id.in_(account_ids))
+            positions = positions.filter(SimulationTransaction.account_id.in_(account_ids))
+
+        scores = {
+            row.id: AccountScore(
+                account_id=row.id,
+                user_id=row.user_id,
+                name=row.name,
+                username=row.username,
+                initial_balance=float(row.initial_balance),
+                cash=float(row.current_balance)
+            )
+            for row in accounts.all()
+        }
+
+        last_prices = {}
+        for holder_id, symbol, last_price, quantity in positions.all():
+            if holder_id in scores:
+                scores[holder_id].holdings[symbol] = int(quantity)
+                last_prices[symbol] = float(last_price) if last_price else 0.0
+
+        return list(scores.values()), last_prices
+
+    def rebuild(self, db: Session) -> int:
+        """
+        DB에서 전체 순위표를 다시 구성합니다 (서버 시작 시 호출).
+
+        새 색인은 잠금 밖에서 만들고 잠금 안에서는 구성하는 동안 바뀐 시세만
+        반영한 뒤 교체하므로, 이벤트 루프의 시세 리스너가 구성 시간 동안 기다리지
+        않습니다.
+
+        Returns:
+            int: 등록된 계좌 수
+        """
+        # 커밋 지연 기간보다 오래된 변경은 모두 아래 조회에 반영되어 있으므로 그 이후 기록부터 sync에서 다시 확인
+        last_change_id = db.query(func.max(SimulationAccountChange.id)).filter(
+            SimulationAccountChange.changed_at <= func.now() - timedelta(seconds=LEADERBOARD_CHANGE_WINDOW)
+        ).scalar()
+        if last_change_id is None:
+            last_change_id = (db.query(func.min(SimulationAccountChange.id)).scalar() or 1) - 1
+        scores, last_prices = self._load(db)
+
+        fresh = Leaderboard()
+        with self._lock:
+            fresh.prices = dict(self.prices)
+        for symbol, price in last_prices.items():
+            fresh.prices.setdefault(symbol, price)
+        for score in scores:
+            fresh._put(score)
+
+        with self._lock:
+            for symbol, price in self.prices.items():
+                if fresh.prices.get(symbol) != price:
+                    fresh._apply_price(symbol, price)
+            self.accounts = fresh.accounts
+            self.keys = fresh.keys
+            self.ranking = fresh.ranking
+            self.holders = fresh.holders
+            self.prices = fresh.prices
+            self.last_change_id = last_change_id
+            self.pending_change_ids = {}
+            self.loaded = True
+
+        return len(scores)
+
+    def refresh_accounts(self, db: Session, account_ids: Collection[int]):
+        """계좌 여러 개를 다시 읽어 순위 갱신 (없어졌거나 순위 대상이 아닌 계좌는 제거)"""
+        scores, last_prices = self._load(db, account_ids)
+        loaded = {score.account_id for score in scores}
+
+        with self._lock:
+            for symbol, price in last_prices.items():
+                self.prices.setdefault(symbol, price)
+            for score in scores:
+                self._put(score)
+            for account_id in account_ids:
+                if account_id not in loaded:
+                    self._drop(account_id)
+
+    def refresh_account(self, db: Session, account_id: int):
+        """simulation_trading 계좌 리스너: 거래가 커밋된 계좌 하나만 다시 읽어 순위 갱신"""
+        self.refresh_accounts(db, [account_id])
+
+    def sync(self, db: Session) -> int:
+        """
+        다른 워커에서 바뀐 계좌만 다시 읽습니다 (주기적으로 호출).
+
+        마지막으로 반영한 ID 이후의 계좌 변경 기록과, 그 사이에서 아직 커밋되지
+        않아 비어 있던 ID를 다시 조회합니다. 빈 ID는 LEADERBOARD_CHANGE_WINDOW가
+        지나면 롤백된 것으로 보고 더 확인하지 않습니다.
+
+        서버 시작 시 전체 구성이 실패했다면 전체 구성부터 다시 시도합니다.
+
+        Returns:
+            int: 다시 읽은 계좌 수
+        """
+        if not self.loaded:
+            return self.rebuild(db)
+
+        now = time.monotonic()
+        self.pending_change_ids = {
+            change_id: seen_at for change_id, seen_at in self.pending_change_ids.items()
+            if now - seen_at < LEADERBOARD_CHANGE_WINDOW
+        }
+
+        condition = SimulationAccountChange.id > self.last_change_id
+        if self.pending_change_ids:
+            condition = or_(condition, SimulationAccountChange.id.in_(list(self.pending_change_ids)))
+        rows = db.query(SimulationAccountChange.id, SimulationAccountChange.account_id).filter(condition).all()
+        if not rows:
+            return 0
+
+        found = {change_id for change_id, _ in rows}
+        newest = max(found)
+        for change_id in found:
+            self.pending_change_ids.pop(change_id, None)
+        for change_id in range(self.last_change_id + 1, newest):
+            if change_id not in found:
+                self.pending_change_ids[change_id] = now
+        self.last_change_id = max(self.last_change_id, newest)
+
+        account_ids = {account_id for _, account_id in rows}
+        self.refresh_accounts(db, account_ids)
+        return len(account_ids)
+
+    def on_quote(self, symbol: str, price: float):
+        """stock_data 시세 리스너: 종목 보유 계좌의 평가 금액을 차액으로 갱신"""
+        with self._lock:
+            self._apply_price(symbol, price)
+
+    def top(self, limit: int) -> List[dict]:
+        """수익률 상위 limit개 계좌"""
+        with self._lock:
+            return [
+                self.accounts[account_id].to_dict(index + 1)
+                for index, (_, account_id) in enumerate(self.ranking.islice(0, limit))
+            ]
+
+    def get_rank(self, account_id: int) -> Optional[dict]:
+        """계좌의 현재 순위 (순위표에 없으면 None)"""
+        with self._lock:
+            key = self.keys.get(account_id)
+            if key is None:
+                return None
+            return self.accounts[account_id].to_dict(self.ranking.index(key) + 1)
+
+    def __len__(self):
+        return len(self.ranking)
+
+    def checkpoint(self, db: Session) -> int:
+        """
+        현재 순위표를 simulation_leaderboard 테이블에 통째로 저장합니다.
+
+        Returns:
+            int: 저장된 행 수
+        """
+        with self._lock:
+            rows = [
+                {
+                    "account_id": account_id,
+                    "rank": index + 1,
+                    "return_percent": round(self.accounts[account_id].return_percent, 4),
+                    "total_value": round(self.accounts[account_id].total_value, 2)
+                }
+                for index, (_, account_id) in enumerate(self.ranking)
+            ]
+
+        try:
+            db.execute(delete(SimulationLeaderboard))
+            if rows:
+                db.execute(insert(SimulationLeaderboard), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(rows)
+
+
+def rebuild_leaderboard():
+    """서버 시작 시: 순위표를 DB에서 구성"""
+    db = SessionLocal()
+    try:
+        LEADERBOARD.rebuild(db)
+    finally:
+        db.close()
+
+
+def sync_leaderboard():
+    """
+    주기 작업 (모든 워커): 다른 워커에서 바뀐 계좌를 순위표에 반영
+
+    refresh_account는 거래를 처리한 워커에서만 호출되므로, 다른 워커에서 체결된
+    거래나 새로 만든/삭제한 계좌는 이 작업으로 반영됩니다 (워커 간 차이는 주기 이내로 제한).
+    """
+    db = SessionLocal()
+    try:
+        LEADERBOARD.sync(db)
+    finally:
+        db.close()
+
+
+def checkpoint_leaderboard():
+    """
+    주기 작업 (리더): 메모리 순위표를 그대로 체크포인트로 저장하고 오래된 계좌 변경 기록 삭제
+
+    리더의 순위표도 sync_leaderboard로 다른 워커의 변경을 주기마다 반영하므로
+    체크포인트 전에 다시 구성하지 않습니다.
+    """
+    db = SessionLocal()
+    try:
+        LEADERBOARD.checkpoint(db)
+        prune_account_changes(db, LEADERBOARD_CHANGE_WINDOW * 2)
+    finally:
+        db.close()
+
+
+# 프로세스 전역 순위표
+LEADERBOARD = Leaderboard()
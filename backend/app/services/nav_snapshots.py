@@ -0,0 +1,327 @@
+import logging
+from calendar import monthrange
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import Float, and_, case, cast, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.db.models import (
+    NavSnapshot,
+    Portfolio,
+    SimulationAccount,
+    SimulationTransaction,
+    Stock,
+    Transaction
+)
+from app.services.replay import LIVE
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 소유자 유형
+SIMULATION = "SIMULATION"
+PORTFOLIO = "PORTFOLIO"
+
+SNAPSHOT_COLUMNS = ["owner_type", "owner_id", "snapshot_date", "cash", "invested", "market_value", "nav", "pnl"]
+
+
+def _position_values(owner_column, model, cost_expression, owner_filter=None):
+    """
+    소유자별 투자 원금, 평가 금액, 실현 손익을 계산하는 서브쿼리
+
+    holdings.replay_holdings와 같은 평균 단가 방식을 윈도 함수로 계산합니다.
+    (소유자, 종목)별로 거래를 (거래일, ID) 순으로 정렬해 누적 수량을 구하고, 수량이
+    0 이하가 될 때마다 새 구간을 시작합니다 (전량 매도 후 재매수는 원가를 새로 계산).
+    구간 안에서 매수는 원가를 더하고, 매도는 남은 원가에 (매도 후 수량 / 매도 전
+    수량)을 곱합니다. 이 곱의 누적을 로그 합(L)으로 두면 남은 원가는
+
+        exp(L_n) * sum(매수 원가_k * exp(-L_k))
+
+    이므로 누적 합 윈도 함수로 계산됩니다. 매수한 적 없는 종목의 매도는
+    replay_holdings와 같이 무시합니다.
+
+    실현 손익은 매도 금액 합 - (매수 원가 합 - 남은 원가)입니다.
+
+    Args:
+        owner_column: 거래 내역의 소유자 ID 컬럼
+        model: 거래 내역 모델
+        cost_expression: 거래 금액 식 (매수 원가이자 매도 금액)
+        owner_filter: 대상 소유자 조건 (없으면 전체)
+
+    Returns:
+        Subquery: owner_id, invested, market_value, realized
+    """
+    is_buy = model.transaction_type == "BUY"
+    trades = select(
+        owner_column.label("owner_id"),
+        model.stock_id,
+        model.transaction_date,
+        model.id,
+        is_buy.label("is_buy"),
+        case((is_buy, model.quantity), else_=-model.quantity).label("signed_quantity"),
+        cast(cost_expression, Float).label("cost"),
+        func.sum(case((is_buy, 1), else_=0)).over(
+            partition_by=(owner_column, model.stock_id),
+            order_by=(model.transaction_date, model.id)
+        ).label("buys")
+    )
+    if owner_filter is not None:
+        trades = trades.where(owner_filter)
+    trades = trades.subquery()
+
+    # 누적 수량 (매수한 적 없는 종목의 매도 제외)
+    running = select(
+        trades,
+        func.sum(trades.c.signed_quantity).over(
+            partition_by=(trades.c.owner_id, trades.c.stock_id),
+            order_by=(trades.c.transaction_date, trades.c.id)
+        ).label("quantity")
+    ).where(or_(trades.c.is_buy, trades.c.buys > 0)).subquery()
+
+    # 구간 번호 (이전 행까지 수량이 0 이하가 된 횟수)와 매도로 남은 비율의 로그
+    episodes = select(
+        running,
+        func.coalesce(func.sum(case((running.c.quantity <= 0, 1), else_=0)).over(
+            partition_by=(running.c.owner_id, running.c.stock_id),
+            order_by=(running.c.transaction_date, running.c.id),
+            rows=(None, -1)
+        ), 0).label("episode"),
+        case(
+            (and_(~running.c.is_buy, running.c.quantity > 0),
+             func.ln(cast(running.c.quantity, Float) / (running.c.quantity - running.c.signed_quantity))),
+            else_=0.0
+        ).label("log_factor")
+    ).subquery()
+
+    scaled = select(
+        episodes,
+        func.sum(episodes.c.log_factor).over(
+            partition_by=(episodes.c.owner_id, episodes.c.stock_id, episodes.c.episode),
+            order_by=(episodes.c.transaction_date, episodes.c.id)
+        ).label("log_scale")
+    ).subquery()
+
+    position = (scaled.c.owner_id, scaled.c.stock_id)
+    remaining_cost = case(
+        (scaled.c.quantity > 0, func.exp(scaled.c.log_scale) * func.sum(
+            case((scaled.c.is_buy, scaled.c.cost * func.exp(-scaled.c.log_scale)), else_=0.0)
+        ).over(
+            partition_by=(scaled.c.owner_id, scaled.c.stock_id, scaled.c.episode),
+            order_by=(scaled.c.transaction_date, scaled.c.id)
+        )),
+        else_=0.0
+    )
+    positions = select(
+        scaled.c.owner_id,
+        scaled.c.stock_id,
+        scaled.c.quantity,
+        remaining_cost.label("remaining_cost"),
+        func.sum(case((scaled.c.is_buy, scaled.c.cost), else_=0.0)).over(partition_by=position).label("bought"),
+        func.sum(case((scaled.c.is_buy, 0.0), else_=scaled.c.cost)).over(partition_by=position).label("sold"),
+        func.row_number().over(
+            partition_by=position,
+            order_by=(scaled.c.transaction_date.desc(), scaled.c.id.desc())
+        ).label("position_row")
+    ).subquery()
+
+    # 종목별 마지막 행 = 현재 보유 수량과 남은 원가
+    holding = positions.c.quantity > 0
+    return select(
+        positions.c.owner_id,
+        func.sum(case((holding, positions.c.remaining_cost), else_=0.0)).label("invested"),
+        func.sum(case((holding, positions.c.quantity * func.coalesce(Stock.last_price, 0)), else_=0)).label("market_value"),
+        func.sum(positions.c.sold - positions.c.bought + positions.c.remaining_cost).label("realized")
+    ).join(
+        Stock, Stock.id == positions.c.stock_id
+    ).where(
+        positions.c.position_row == 1
+    ).group_by(positions.c.owner_id).subquery()
+
+
+def _upsert(db: Session, rows_select) -> int:
+    """INSERT ... SELECT로 스냅샷을 쓰고 같은 날짜의 기존 스냅샷은 덮어씀"""
+    statement = insert(NavSnapshot).from_select(SNAPSHOT_COLUMNS, rows_select)
+    statement = statement.on_conflict_do_update(
+        constraint="uq_nav_snapshots_owner_date",
+        set_={
+            column: statement.excluded[column]
+            for column in ("cash", "invested", "market_value", "nav", "pnl")
+        }
+    )
+    return db.execute(statement).rowcount
+
+
+def take_nav_snapshots(db: Session, snapshot_date: date) -> Dict[str, int]:
+    """
+    모든 모의 투자 계좌와 포트폴리오의 NAV 스냅샷을 한 번에 저장합니다.
+
+    소유자 유형별로 INSERT ... SELECT 한 번씩 실행하므로 계좌 수와 관계없이
+    쿼리는 두 번이며, 거래 내역은 DB 밖으로 읽어 오지 않습니다. 거래가 없는
+    계좌/포트폴리오도 스냅샷을 남기며, 같은 날짜로 다시 실행하면 기존 스냅샷을
+    갱신합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        snapshot_date (date): 스냅샷 기준일
+
+    Returns:
+        Dict[str, int]: 소유자 유형별 저장된 행 수
+    """
+    # 모의 투자 계좌: 현금 + 평가 금액, 손익은 초기 자금 대비 (실현 손익은 현금에 반영됨)
+    # 과거 재현/백테스트 계좌의 평가 금액은 가상 날짜 기준이므로 일별 스냅샷 대상이 아님
+    live_accounts = select(SimulationAccount.id).where(SimulationAccount.mode == LIVE)
+    simulation_values = _position_values(
+        SimulationTransaction.account_id,
+        SimulationTransaction,
+        SimulationTransaction.total_amount,
+        SimulationTransaction.account_id.in_(live_accounts)
+    )
+    market_value = func.coalesce(simulation_values.c.market_value, 0)
+    simulation_rows = select(
+        literal(SIMULATION),
+        SimulationAccount.id,
+        literal(snapshot_date),
+        SimulationAccount.current_balance,
+        func.coalesce(simulation_values.c.invested, 0),
+        market_value,
+        SimulationAccount.current_balance + market_value,
+        SimulationAccount.current_balance + market_value - SimulationAccount.initial_balance
+    ).outerjoin(
+        simulation_values, simulation_values.c.owner_id == SimulationAccount.id
+    ).where(
+        SimulationAccount.mode == LIVE
+    )
+
+    # 포트폴리오: 현금 계좌가 없으므로 실현 손익 누적을 현금으로 보고 NAV = 실현 손익 + 평가 금액,
+    # 손익 = 미실현 손익 + 실현 손익 (수익 종목을 매도해도 기간 수익률이 음수가 되지 않도록)
+    portfolio_values = _position_values(
+        Transaction.portfolio_id,
+        Transaction,
+        Transaction.quantity * Transaction.price
+    )
+    invested = func.coalesce(portfolio_values.c.invested, 0)
+    market_value = func.coalesce(portfolio_values.c.market_value, 0)
+    realized = func.coalesce(portfolio_values.c.realized, 0)
+    portfolio_rows = select(
+        literal(PORTFOLIO),
+        Portfolio.id,
+        literal(snapshot_date),
+        realized,
+        invested,
+        market_value,
+        realized + market_value,
+        market_value - invested + realized
+    ).outerjoin(portfolio_values, portfolio_values.c.owner_id == Portfolio.id)
+
+    try:
+        counts = {
+            SIMULATION: _upsert(db, simulation_rows),
+            PORTFOLIO: _upsert(db, portfolio_rows)
+        }
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return counts
+
+
+def run_nav_snapshot_job():
+    """일별 작업: 오늘(UTC) 날짜로 전체 NAV 스냅샷 저장"""
+    db = SessionLocal()
+    try:
+        counts = take_nav_snapshots(db, datetime.now(timezone.utc).date())
+        logger.info("NAV 스냅샷 저장 완료: %s", counts)
+    finally:
+        db.close()
+
+
+def delete_nav_snapshots(db: Session, owner_type: str, owner_id: int):
+    """계좌/포트폴리오 삭제 시 스냅샷 정리 (커밋하지 않음)"""
+    db.query(NavSnapshot).filter(
+        NavSnapshot.owner_type == owner_type,
+        NavSnapshot.owner_id == owner_id
+    ).delete(synchronize_session=False)
+
+
+def get_nav_history(db: Session, owner_type: str, owner_id: int, start: Optional[date] = None, end: Optional[date] = None) -> List[NavSnapshot]:
+    """
+    기간 내 NAV 스냅샷을 날짜 오름차순으로 조회합니다 (유니크 인덱스 범위 조회).
+
+    Args:
+        db (Session): 데이터베이스 세션
+        owner_type (str): "SIMULATION" 또는 "PORTFOLIO"
+        owner_id (int): 계좌 또는 포트폴리오 ID
+        start (Optional[date]): 시작일 (포함)
+        end (Optional[date]): 종료일 (포함)
+
+    Returns:
+        List[NavSnapshot]: 스냅샷 목록
+    """
+    query = db.query(NavSnapshot).filter(
+        NavSnapshot.owner_type == owner_type,
+        NavSnapshot.owner_id == owner_id
+    )
+    if start:
+        query = query.filter(NavSnapshot.snapshot_date >= start)
+    if end:
+        query = query.filter(NavSnapshot.snapshot_date <= end)
+    return query.order_by(NavSnapshot.snapshot_date).all()
+
+
+def _one_month_before(day: date) -> date:
+    """한 달 전 같은 날 (말일이 짧으면 그 달의 말일)"""
+    year, month = (day.year - 1, 12) if day.month == 1 else (day.year, day.month - 1)
+    return date(year, month, min(day.day, monthrange(year, month)[1]))
+
+
+def get_period_returns(db: Session, owner_type: str, owner_id: int) -> Optional[dict]:
+    """
+    최근 스냅샷 기준 1D/1W/1M/YTD 수익률을 계산합니다.
+
+    기간 수익률은 (기말 손익 - 기초 손익) / 기초 NAV로 계산하므로 포트폴리오의
+    추가 매수/매도(자금 유출입)는 수익으로 잡히지 않습니다. 기준일 이전 스냅샷이
+    없으면 해당 기간은 None이며, YTD는 올해 첫 스냅샷을 기초로 사용할 수 있습니다.
+
+    Returns:
+        Optional[dict]: as_of, nav, pnl, returns(기간 -> 수익률 %) - 스냅샷이 없으면 None
+    """
+    base = db.query(NavSnapshot).filter(
+        NavSnapshot.owner_type == owner_type,
+        NavSnapshot.owner_id == owner_id
+    )
+
+    latest = base.order_by(NavSnapshot.snapshot_date.desc()).first()
+    if latest is None:
+        return None
+
+    def anchor_on_or_before(day: date, inclusive: bool = True):
+        condition = NavSnapshot.snapshot_date <= day if inclusive else NavSnapshot.snapshot_date < day
+        return base.filter(condition).order_by(NavSnapshot.snapshot_date.desc()).first()
+
+    as_of = latest.snapshot_date
+    year_start = date(as_of.year, 1, 1)
+    anchors = {
+        "1D": anchor_on_or_before(as_of, inclusive=False),
+        "1W": anchor_on_or_before(as_of - timedelta(days=7)),
+        "1M": anchor_on_or_before(_one_month_before(as_of)),
+        "YTD": anchor_on_or_before(year_start - timedelta(days=1)) or base.filter(
+            NavSnapshot.snapshot_date >= year_start,
+            NavSnapshot.snapshot_date < as_of
+        ).order_by(NavSnapshot.snapshot_date).first()
+    }
+
+    returns = {}
+    for period, anchor in anchors.items():
+        if anchor is None or float(anchor.nav) <= 0:
+            returns[period] = None
+        else:
+            returns[period] = (float(latest.pnl) - float(anchor.pnl)) / float(anchor.nav) * 100
+
+    return {
+        "as_of": as_of,
+        "nav": float(latest.nav),
+        "pnl": float(latest.pnl),
+        "returns": returns
+    }
@@ -0,0 +1,263 @@
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.db.models import NewsArticle, NewsArticleFeed, NewsSentimentDaily
+
+# 한 번에 점수를 계산하는 기사 수
+SCORE_CHUNK_SIZE = 500
+
+# 이 값보다 크거나 작은 기사를 긍정/부정 기사로 집계
+POLARITY_THRESHOLD = 0.1
+
+# 부정어 뒤 이 토큰 수 안의 감성어는 극성을 뒤집음 ("not profitable", "no longer growing")
+NEGATION_SCOPE = 3
+
+# 금융 뉴스용 감성 사전 (Loughran-McDonald 금융 감성 사전의 빈출 어휘를 바탕으로 축약)
+POSITIVE_WORDS = {
+    "achieve", "achieved", "advance", "advanced", "advances", "beat", "beats", "benefit", "benefits",
+    "boom", "boost", "boosted", "boosts", "breakthrough", "bullish", "buyback", "climb", "climbed",
+    "climbs", "confident", "efficient", "exceed", "exceeded", "exceeds", "expand", "expanded",
+    "expansion", "favorable", "gain", "gained", "gains", "good", "great", "grew", "grow", "growing",
+    "growth", "high", "higher", "improve", "improved", "improvement", "improves", "innovative",
+    "jump", "jumped", "jumps", "leading", "momentum", "optimism", "optimistic", "outperform",
+    "outperformed", "outperforms", "positive", "profit", "profitable", "profits", "rally", "rallied",
+    "rallies", "rebound", "rebounded", "record", "recover", "recovered", "recovery", "rise", "rises",
+    "rising", "robust", "rose", "soar", "soared", "soars", "solid", "strong", "stronger", "strength",
+    "success", "successful", "surge", "surged", "surges", "surpass", "surpassed", "tailwind",
+    "tailwinds", "top", "topped", "up", "upbeat", "upgrade", "upgraded", "upgrades", "upside", "win",
+    "wins", "winning"
+}
+NEGATIVE_WORDS = {
+    "bankrupt", "bankruptcy", "bearish", "collapse", "collapsed", "concern", "concerns", "crash",
+    "crashed", "cut", "cuts", "decline", "declined", "declines", "declining", "default", "deficit",
+    "delay", "delayed", "disappoint", "disappointed", "disappointing", "down", "downgrade",
+    "downgraded", "downgrades", "downturn", "drop", "dropped", "drops", "fail", "failed", "failure",
+    "fall", "fallen", "falling", "falls", "fear", "fears", "fell", "fined", "fraud", "headwind",
+    "headwinds", "investigation", "lawsuit", "layoff", "layoffs", "loss", "losses", "lost", "low",
+    "lower", "miss", "missed", "misses", "negative", "plunge", "plunged", "plunges", "probe",
+    "recall", "recalls", "recession", "risk", "risks", "selloff", "shortfall", "slide", "slump",
+    "slumped", "slowdown", "sink", "sank", "tumble", "tumbled", "tumbles", "underperform",
+    "underperformed", "volatile", "volatility", "warn", "warned", "warning", "warns", "weak",
+    "weaker", "weakness", "worse", "worst", "worry", "worries"
+}
+NEGATORS = {"not", "no", "never", "without", "n't", "neither", "nor", "cannot"}
+
+TOKEN_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?|n't")
+
+# 어휘 -> 인덱스, 인덱스별 가중치(+1 긍정, -1 부정, 0 부정어 및 기타)
+VOCABULARY: Dict[str, int] = {}
+for _word in sorted(POSITIVE_WORDS | NEGATIVE_WORDS | NEGATORS):
+    VOCABULARY[_word] = len(VOCABULARY)
+WEIGHTS = np.array([
+    1.0 if word in POSITIVE_WORDS else -1.0 if word in NEGATIVE_WORDS else 0.0
+    for word in VOCABULARY
+])
+IS_NEGATOR = np.array([word in NEGATORS for word in VOCABULARY])
+
+
+def _token_ids(text: str) -> List[int]:
+    """사전에 있는 토큰의 인덱스 (사전 밖 토큰은 -1로 남겨 부정어 범위 계산에 사용)"""
+    return [VOCABULARY.get(token, -1) for token in TOKEN_PATTERN.findall(text.lower().replace("n't", " n't"))]
+
+
+def score_texts(texts: List[str]) -> np.ndarray:
+    """
+    기사 묶음의 감성 점수를 한 번에 계산합니다.
+
+    모든 기사의 토큰을 하나의 배열로 이어 붙이고 사전 가중치 조회, 부정어 범위
+    판정, 기사별 합산(np.add.reduceat)을 배열 연산으로 처리합니다.
+    점수는 (긍정어 수 - 부정어 수) / (감성어 수)로 -1 ~ 1 범위이며,
+    감성어가 없는 기사는 0입니다.
+
+    Args:
+        texts (List[str]): 기사 텍스트 목록
+
+    Returns:
+        np.ndarray: 기사별 감성 점수
+    """
+    token_lists = [_token_ids(text) for text in texts]
+    lengths = np.array([len(tokens) for tokens in token_lists])
+    scores = np.zeros(len(texts))
+    if not lengths.sum():
+        return scores
+
+    ids = np.fromiter((token for tokens in token_lists for token in tokens), dtype=np.int64, count=int(lengths.sum()))
+    doc_ids = np.repeat(np.arange(len(texts)), lengths)
+    known = ids >= 0
+
+    weights = np.where(known, WEIGHTS[np.where(known, ids, 0)], 0.0)
+    negator = known & IS_NEGATOR[np.where(known, ids, 0)]
+
+    # 같은 기사 안에서 앞선 NEGATION_SCOPE개 토큰 중 부정어가 있으면 극성 반전
+    negated = np.zeros(len(ids), dtype=bool)
+    for shift in range(1, NEGATION_SCOPE + 1):
+        negated[shift:] |= negator[:-shift] & (doc_ids[shift:] == doc_ids[:-shift])
+    weights = np.where(negated, -weights, weights)
+
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    nonempty = lengths > 0
+    totals = np.add.reduceat(weights, starts[nonempty])
+    counts = np.add.reduceat(np.abs(weights), starts[nonempty])
+    scores[nonempty] = np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
+    return scores
+
+
+def _article_text(title: Optional[str], description: Optional[str], content: Optional[str]) -> str:
+    return "\n".join(part or "" for part in (title, description, content))
+
+
+def score_pending_articles(db: Session) -> Optional[datetime]:
+    """
+    아직 점수가 없는 기사를 SCORE_CHUNK_SIZE개씩 묶어 점수를 저장합니다.
+
+    Returns:
+        Optional[datetime]: 점수를 계산한 기사 중 가장 이른 게시 시각 (없으면 None)
+    """
+    earliest = None
+    while True:
+        rows = db.query(
+            NewsArticle.id, NewsArticle.title, NewsArticle.description, NewsArticle.content, NewsArticle.published_at
+        ).filter(NewsArticle.sentiment.is_(None)).order_by(NewsArticle.id).limit(SCORE_CHUNK_SIZE).all()
+        if not rows:
+            return earliest
+
+        scores = score_texts([_article_text(row.title, row.description, row.content) for row in rows])
+        db.bulk_update_mappings(NewsArticle, [
+            {"id": row.id, "sentiment": round(float(score), 4)}
+            for row, score in zip(rows, scores)
+        ])
+        db.commit()
+
+        chunk_earliest = min(row.published_at for row in rows)
+        earliest = chunk_earliest if earliest is None else min(earliest, chunk_earliest)
+
+
+def _utc_day(column):
+    return cast(func.timezone("UTC", column), Date)
+
+
+def update_daily_sentiment(db: Session, since: date) -> int:
+    """
+    since 이후 날짜의 피드(종목/시장)별 일별 감성 집계를 다시 계산해 저장합니다.
+
+    INSERT ... SELECT 한 번으로 처리하며 기존 집계는 덮어씁니다.
+
+    Returns:
+        int: 저장된 (피드, 날짜) 행 수
+    """
+    day = _utc_day(NewsArticleFeed.published_at)
+    sentiment = NewsArticle.sentiment
+    rows = select(
+        NewsArticleFeed.feed,
+        day,
+        func.count(),
+        func.sum(sentiment),
+        func.count().filter(sentiment > POLARITY_THRESHOLD),
+        func.count().filter(sentiment < -POLARITY_THRESHOLD)
+    ).join(
+        NewsArticle, NewsArticle.id == NewsArticleFeed.article_id
+    ).where(
+        NewsArticleFeed.published_at >= datetime.combine(since, datetime.min.time(), tzinfo=timezone.utc),
+        sentiment.isnot(None)
+    ).group_by(NewsArticleFeed.feed, day)
+
+    statement = insert(NewsSentimentDaily).from_select(
+        ["symbol", "day", "article_count", "sentiment_sum", "positive_count", "negative_count"], rows
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[NewsSentimentDaily.symbol, NewsSentimentDaily.day],
+        set_={
+            column: statement.excluded[column]
+            for column in ("article_count", "sentiment_sum", "positive_count", "negative_count")
+        }
+    )
+    try:
+        count = db.execute(statement).rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return count
+
+
+def run_sentiment_stage(db: Session) -> int:
+    """
+    뉴스 수집 후 배치 단계: 새 기사 점수 계산 후 해당 날짜부터의 일별 집계 갱신
+
+    새로 연결된 종목 피드(기존 기사의 태깅)도 반영되도록 최근 이틀은 항상 다시 집계합니다.
+
+    Returns:
+        int: 갱신된 일별 집계 행 수
+    """
+    earliest = score_pending_articles(db)
+    since = datetime.now(timezone.utc).date() - timedelta(days=1)
+    if earliest is not None:
+        since = min(since, earliest.astimezone(timezone.utc).date())
+    return update_daily_sentiment(db, since)
+
+
+def get_sentiment_series(db: Session, symbol: str, days: int, window: int) -> dict:
+    """
+    종목의 일별 감성과 window일 이동 감성 지수를 계산합니다.
+
+    이동 지수는 window일 동안의 감성 합 / 기사 수(기사 수 가중 평균)이며,
+    기사가 없는 날도 달력 기준으로 포함합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        symbol (str): 주식 심볼 (시장 뉴스는 "MARKET")
+        days (int): 조회 기간 (일)
+        window (int): 이동 평균 기간 (일)
+
+    Returns:
+        dict: symbol, window, series(date, articles, positive, negative, sentiment, index)
+    """
+    end = datetime.now(timezone.utc).date()
+    start = end - timedelta(days=days - 1)
+    # 첫 날의 이동 지수 계산에 필요한 이전 기간까지 조회
+    fetch_start = start - timedelta(days=window - 1)
+
+    rows = db.query(NewsSentimentDaily).filter(
+        NewsSentimentDaily.symbol == symbol,
+        NewsSentimentDaily.day >= fetch_start,
+        NewsSentimentDaily.day <= end
+    ).order_by(NewsSentimentDaily.day).all()
+
+    span = (end - fetch_start).days + 1
+    counts = np.zeros(span)
+    sums = np.zeros(span)
+    positives = np.zeros(span, dtype=np.int64)
+    negatives = np.zeros(span, dtype=np.int64)
+    for row in rows:
+        offset = (row.day - fetch_start).days
+        counts[offset] = row.article_count
+        sums[offset] = row.sentiment_sum
+        positives[offset] = row.positive_count
+        negatives[offset] = row.negative_count
+
+    # 길이 window의 1 벡터와의 합성곱으로 window일 이동 합계 계산
+    rolling_counts = np.convolve(counts, np.ones(window))[:span]
+    rolling_sums = np.convolve(sums, np.ones(window))[:span]
+
+    series = []
+    for offset in range(window - 1, span):
+        series.append({
+            "date": fetch_start + timedelta(days=offset),
+            "articles": int(counts[offset]),
+            "positive": int(positives[offset]),
+            "negative": int(negatives[offset]),
+            "sentiment": round(float(sums[offset] / counts[offset]), 4) if counts[offset] else None,
+            "index": round(float(rolling_sums[offset] / rolling_counts[offset]), 4) if rolling_counts[offset] else None
+        })
+
+    return {
+        "symbol": symbol,
+        "window": window,
+        "series": series
+    }
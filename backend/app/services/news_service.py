@@ -1,183 +1,574 @@
+import asyncio
+import hashlib
+import logging
 import httpx
 from fastapi import HTTPException
-from datetime import datetime, timedelta
-from app.config import NEWS_API_KEY
+from fastapi.concurrency import run_in_threadpool
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import case, func, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.config import NEWS_API_BASE_URL, NEWS_API_KEY, NEWS_INGEST_INTERVAL, NEWS_INGEST_MAX_SYMBOLS, NEWS_WATCH_TTL
+from app.core.metrics import CacheMetrics, UpstreamMetrics
+from app.db.database import SessionLocal
+from app.db.models import NewsArticle, NewsArticleFeed, NewsFetchSlot, NewsWatchSymbol, SimulationTransaction, Stock, Transaction
+from app.db.pagination import InvalidCursorError, decode_cursor, encode_cursor, keyset_page
+from app.services.news_sentiment import run_sentiment_stage
+from app.services.news_tagger import SYMBOL_TAGGER
 
-# News API 기본 URL
-NEWS_API_BASE_URL = "https://newsapi.org/v2"
+logger = logging.getLogger(__name__)
 
-# 캐시 설정 (메모리 캐시 - 실제 프로덕션에서는 Redis 등 사용 권장)
-CACHE = {}
-CACHE_TTL = 900  # 캐시 유효 시간(초) - 15분
+# 시장 뉴스 피드 이름과 검색어
+MARKET_FEED = "MARKET"
+MARKET_QUERY = "stock market OR finance OR economy"
 
-async def get_market_news(page: int = 1, page_size: int = 10):
+# 외부 API 한 번에 가져오는 기사 수 (News API pageSize 최대값)
+FETCH_PAGE_SIZE = 100
+
+# 피드별 최신 기사 창 캐시: feed -> (저장 시각, 창) - 페이지/페이지 크기와 무관하게 창을 잘라서 응답
+FEED_WINDOW_CACHE = {}
+FEED_WINDOW_SIZE = 200  # 창에 담는 최신 기사 수
+FEED_WINDOW_TTL = 120  # 캐시 유효 시간(초) - 다른 워커가 저장한 기사 반영 주기
+FEED_WINDOW_CACHE_SIZE = 256  # 캐시하는 피드 수
+
+# 캐시/외부 API 지표
+FEED_WINDOW_METRICS = CacheMetrics("news_feed_window")
+UPSTREAM_METRICS = UpstreamMetrics("newsapi", "everything")
+
+# 피드별 마지막 외부 API 수집 시각
+FEED_FETCHED_AT: Dict[str, datetime] = {}
+# 조회된 종목은 news_watch_symbols에 기록 (NEWS_WATCH_TTL 동안 수집 대상에 포함)
+# 워커별 마지막 기록 시각 - 같은 종목은 WATCH_RECORD_INTERVAL(초)에 한 번만 DB에 기록
+WATCH_RECORD_INTERVAL = 300
+WATCH_RECORD_CACHE_SIZE = 4096
+_watch_recorded: Dict[str, datetime] = {}
+# 저장된 기사가 없는 피드를 요청 시 바로 수집한 횟수는 news_fetch_slots에 기록
+# (NEWS_INGEST_INTERVAL 구간마다 모든 워커를 합쳐 NEWS_INGEST_MAX_SYMBOLS회로 제한)
+# 같은 피드를 동시에 수집하지 않도록 하는 피드별 잠금
+_feed_locks: Dict[str, asyncio.Lock] = {}
+
+
+def url_hash(url: str) -> str:
+    """기사 중복 제거 키 (URL의 sha256)"""
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def _parse_published_at(value: str) -> datetime:
+    """News API의 publishedAt (예: 2025-04-14T12:00:00Z)을 UTC datetime으로 변환"""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return datetime.now(timezone.utc)
+
+
+async def fetch_articles(query: str, since: Optional[datetime] = None) -> List[dict]:
     """
-    시장 전반에 관한 뉴스를 가져옵니다.
-    
+    News API에서 검색어의 최신 기사를 한 번의 요청으로 가져옵니다.
+
     Args:
-        page (int): 페이지 번호 (기본값: 1)
-        page_size (int): 페이지 당 뉴스 항목 수 (기본값: 10)
-        
+        query (str): 검색어
+        since (Optional[datetime]): 이 시각 이후 기사만 요청 (증분 수집)
+
     Returns:
-        dict: 뉴스 데이터 (articles, totalResults 포함)
-        
+        List[dict]: 정제된 기사 목록 (최신순)
+
     Raises:
         HTTPException: API 요청 실패 시
     """
-    # 캐시 확인
-    cache_key = f"market_news_{page}_{page_size}"
-    now = datetime.now()
-    
-    if cache_key in CACHE:
-        cache_time, cache_data = CACHE[cache_key]
-        # 캐시가 유효하면 캐시된 데이터 반환
-        if now - cache_time < timedelta(seconds=CACHE_TTL):
-            return cache_data
-    
+    params = {
+        "q": query,
+        "language": "en",
+        "sortBy": "publishedAt",
+        "pageSize": FETCH_PAGE_SIZE,
+        "page": 1,
+        "apiKey": NEWS_API_KEY
+    }
+    if since:
+        params["from"] = since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
     try:
-        # API 요청 매개변수
-        params = {
-            "q": "stock market OR finance OR economy",  # 시장 관련 키워드 검색
-            "language": "en",  # 영어 뉴스만 (언어 옵션은 필요에 따라 변경)
-            "sortBy": "publishedAt",  # 최신순 정렬
-            "pageSize": page_size,
-            "page": page,
-            "apiKey": NEWS_API_KEY
-        }
-        
-        # API 요청
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{NEWS_API_BASE_URL}/everything", params=params)
-            response.raise_for_status()  # HTTP 오류 확인
-            data = response.json()
-        
-        # 응답 데이터 확인
-        if data["status"] != "ok":
-            raise HTTPException(status_code=500, detail=f"뉴스 API 오류: {data.get('message', '알 수 없는 오류')}")
-        
-        # 뉴스 데이터 정제
-        articles = data.get("articles", [])
-        processed_articles = []
-        
-        for article in articles:
-            # 필요한 정보만 추출하고 불필요한 필드 제거
-            processed_articles.append({
-                "title": article.get("title", ""),
-                "description": article.get("description", ""),
-                "url": article.get("url", ""),
-                "urlToImage": article.get("urlToImage", ""),
-                "source": article.get("source", {}).get("name", ""),
-                "publishedAt": article.get("publishedAt", ""),
-                "content": article.get("content", "")
-            })
-        
-        result = {
-            "articles": processed_articles,
-            "totalResults": data.get("totalResults", 0)
-        }
-        
-        # 결과 캐싱
-        CACHE[cache_key] = (now, result)
-        
-        return result
-        
+        with UPSTREAM_METRICS.track():
+            async with httpx.AsyncClient() as client:
+                response = await client.get(f"{NEWS_API_BASE_URL}/everything", params=params)
+                response.raise_for_status()
+                data = response.json()
     except httpx.HTTPError as e:
-        # HTTP 요청 오류 처리
         raise HTTPException(status_code=503, detail=f"뉴스 API 요청 실패: {str(e)}")
-    except Exception as e:
-        # 기타 오류 처리
-        raise HTTPException(status_code=500, detail=f"뉴스 데이터 가져오기 실패: {str(e)}")
 
-async def get_stock_news(symbol: str, page: int = 1, page_size: int = 10):
+    if data.get("status") != "ok":
+        raise HTTPException(status_code=500, detail=f"뉴스 API 오류: {data.get('message', '알 수 없는 오류')}")
+
+    articles = []
+    for article in data.get("articles", []):
+        # URL이 없거나 삭제된 기사는 저장하지 않음
+        if not article.get("url") or article.get("title") == "[Removed]":
+            continue
+        articles.append({
+            "url_hash": url_hash(article["url"]),
+            "url": article["url"],
+            "title": article.get("title") or "",
+            "description": article.get("description"),
+            "url_to_image": article.get("urlToImage"),
+            "source": (article.get("source") or {}).get("name"),
+            "content": article.get("content"),
+            "published_at": _parse_published_at(article.get("publishedAt"))
+        })
+    return articles
+
+
+def _article_text(article: dict) -> str:
+    """종목 태깅 대상 텍스트 (제목, 요약, 본문)"""
+    return "\n".join(article[key] or "" for key in ("title", "description", "content"))
+
+
+def store_articles(db: Session, feed: str, articles: List[dict]) -> int:
+    """
+    기사를 news_articles에 URL 해시 기준으로 한 번만 저장하고 피드에 연결합니다.
+
+    수집한 피드 외에, 종목 태거가 본문에서 찾은 모든 종목의 피드에도 연결하므로
+    종목별 뉴스는 외부 API 검색 없이 news_article_feeds 인덱스 조회로 제공됩니다.
+
+    Returns:
+        int: 새로 저장된 기사 수
+    """
+    rows = {article["url_hash"]: article for article in articles}
+    if not rows:
+        return 0
+
+    try:
+        inserted = db.execute(
+            insert(NewsArticle).values(list(rows.values())).on_conflict_do_nothing(
+                index_elements=[NewsArticle.url_hash]
+            ).returning(NewsArticle.id)
+        ).all()
+        stored = db.query(
+            NewsArticle.id, NewsArticle.url_hash, NewsArticle.published_at
+        ).filter(NewsArticle.url_hash.in_(list(rows))).all()
+
+        feed_rows = []
+        for article_id, article_hash, published_at in stored:
+            for article_feed in {feed} | SYMBOL_TAGGER.tag(_article_text(rows[article_hash])):
+                feed_rows.append({"feed": article_feed, "article_id": article_id, "published_at": published_at})
+
+        db.execute(insert(NewsArticleFeed).values(feed_rows).on_conflict_do_nothing())
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    # 기사가 추가되었을 수 있는 피드의 창 캐시 무효화
+    for feed_row in feed_rows:
+        FEED_WINDOW_CACHE.pop(feed_row["feed"], None)
+    return len(inserted)
+
+
+def latest_published_at(db: Session, feed: str) -> Optional[datetime]:
+    """피드에 저장된 가장 최근 기사 시각 (인덱스 첫 행)"""
+    return db.query(func.max(NewsArticleFeed.published_at)).filter(NewsArticleFeed.feed == feed).scalar()
+
+
+async def ingest_feed(db: Session, feed: str, query: str) -> int:
+    """
+    피드 하나를 수집합니다. 저장된 마지막 기사 이후의 기사만 요청합니다.
+
+    Returns:
+        int: 새로 추가된 기사 수
+    """
+    since = await run_in_threadpool(latest_published_at, db, feed)
+    articles = await fetch_articles(query, since)
+    added = await run_in_threadpool(store_articles, db, feed, articles)
+    FEED_FETCHED_AT[feed] = datetime.now()
+    return added
+
+
+def _holding_stock_ids(owner_column, stock_column, type_column, quantity_column):
+    """보유 수량이 0보다 큰 (소유자, 종목) 쌍"""
+    signed_quantity = case((type_column == "BUY", quantity_column), else_=-quantity_column)
+    return select(
+        owner_column.label("owner_id"),
+        stock_column.label("stock_id")
+    ).group_by(owner_column, stock_column).having(func.sum(signed_quantity) > 0)
+
+
+def _company_name(symbol: str, name: Optional[str] = None) -> str:
+    return name or symbol
+
+
+def _stock_name(db: Session, symbol: str) -> Optional[str]:
+    """등록된 종목의 회사명 (없으면 None)"""
+    return db.query(Stock.name).filter(Stock.symbol == symbol).scalar()
+
+
+def _stock_query(symbol: str, company_name: str) -> str:
+    return f"{symbol} OR {company_name} stock"
+
+
+def record_watch(db: Session, symbol: str):
+    """
+    뉴스가 조회된 종목을 news_watch_symbols에 기록 (모든 워커가 공유하는 수집 대상)
+
+    같은 종목은 워커마다 WATCH_RECORD_INTERVAL에 한 번만 기록하며,
+    기록 실패는 뉴스 조회 결과에 영향을 주지 않습니다.
+    """
+    now = datetime.now(timezone.utc)
+    recorded_at = _watch_recorded.get(symbol)
+    if recorded_at and now - recorded_at < timedelta(seconds=WATCH_RECORD_INTERVAL):
+        return
+
+    statement = insert(NewsWatchSymbol).values(symbol=symbol, last_requested_at=now)
+    statement = statement.on_conflict_do_update(
+        index_elements=[NewsWatchSymbol.symbol],
+        set_={"last_requested_at": statement.excluded.last_requested_at}
+    )
+    try:
+        db.execute(statement)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning("뉴스 관심 종목 기록 실패 (%s): %s", symbol, e)
+        return
+
+    if len(_watch_recorded) >= WATCH_RECORD_CACHE_SIZE:
+        _watch_recorded.clear()
+    _watch_recorded[symbol] = now
+
+
+def watched_symbols(db: Session, limit: int) -> List[Tuple[str, str]]:
+    """
+    뉴스를 수집할 종목 목록
+
+    포트폴리오/모의 투자 계좌에서 보유 중인 종목을 보유자 수 순으로 고르고,
+    남는 자리는 NEWS_WATCH_TTL 안에 (어느 워커에서든) 조회된 종목으로 채웁니다.
+    기한이 지난 조회 기록은 이때 삭제합니다.
+
+    Returns:
+        List[Tuple[str, str]]: (심볼, 회사명) - 최대 limit개
+    """
+    holdings = union_all(
+        _holding_stock_ids(Transaction.portfolio_id, Transaction.stock_id, Transaction.transaction_type, Transaction.quantity),
+        _holding_stock_ids(
+            SimulationTransaction.account_id, SimulationTransaction.stock_id,
+            SimulationTransaction.transaction_type, SimulationTransaction.quantity
+        )
+    ).subquery()
+
+    held = db.query(Stock.symbol, Stock.name).join(
+        holdings, holdings.c.stock_id == Stock.id
+    ).group_by(Stock.symbol, Stock.name).order_by(func.count().desc(), Stock.symbol).limit(limit).all()
+
+    symbols = {symbol: _company_name(symbol, name) for symbol, name in held}
+
+    expired = datetime.now(timezone.utc) - timedelta(seconds=NEWS_WATCH_TTL)
+    db.query(NewsWatchSymbol).filter(
+        NewsWatchSymbol.last_requested_at < expired
+    ).delete(synchronize_session=False)
+    db.commit()
+
+    remaining = limit - len(symbols)
+    if remaining > 0:
+        requested = db.query(NewsWatchSymbol.symbol, Stock.name).outerjoin(
+            Stock, Stock.symbol == NewsWatchSymbol.symbol
+        ).filter(
+            NewsWatchSymbol.symbol.notin_(list(symbols))
+        ).order_by(NewsWatchSymbol.last_requested_at.desc()).limit(remaining).all()
+        for symbol, name in requested:
+            symbols[symbol] = _company_name(symbol, name)
+
+    return list(symbols.items())
+
+
+async def run_news_ingestion():
+    """
+    주기 작업: 시장 뉴스와 관심 종목 뉴스를 수집하고 감성 점수를 계산합니다.
+
+    주기당 외부 API 호출은 1 + NEWS_INGEST_MAX_SYMBOLS회 이하이며 API 트래픽과 무관합니다.
+    """
+    db = SessionLocal()
+    try:
+        await run_in_threadpool(SYMBOL_TAGGER.refresh, db)
+        symbols = await run_in_threadpool(watched_symbols, db, NEWS_INGEST_MAX_SYMBOLS)
+        await run_in_threadpool(prune_fetch_slots, db)
+        feeds = [(MARKET_FEED, MARKET_QUERY)] + [
+            (symbol, _stock_query(symbol, company_name)) for symbol, company_name in symbols
+        ]
+
+        added, failed = 0, 0
+        for feed, query in feeds:
+            try:
+                added += await ingest_feed(db, feed, query)
+            except HTTPException as e:
+                failed += 1
+                logger.warning("뉴스 수집 실패 (%s): %s", feed, e.detail)
+
+        # 배치 단계: 새 기사 감성 점수 계산 및 종목별 일별 집계 갱신
+        aggregates = await run_in_threadpool(run_sentiment_stage, db)
+
+        logger.info("뉴스 수집 완료: 피드 %d개, 새 기사 %d건, 실패 %d건, 감성 집계 %d건", len(feeds), added, failed, aggregates)
+    finally:
+        db.close()
+
+
+def _fetch_window_start(now: datetime) -> datetime:
+    """now가 속한 NEWS_INGEST_INTERVAL 구간의 시작 시각 (모든 워커가 같은 구간을 사용)"""
+    seconds = int(now.timestamp()) // NEWS_INGEST_INTERVAL * NEWS_INGEST_INTERVAL
+    return datetime.fromtimestamp(seconds, timezone.utc)
+
+
+def take_fetch_slot(db: Session) -> bool:
     """
-    특정 주식에 관한 뉴스를 가져옵니다.
-    
+    요청 시 수집 허용 여부 (NEWS_INGEST_INTERVAL 구간마다 모든 워커를 합쳐 NEWS_INGEST_MAX_SYMBOLS회)
+
+    구간 행의 count를 한도 미만일 때만 올리는 upsert 한 번으로 확인하므로 여러 워커가
+    동시에 요청해도 한도를 넘지 않습니다. 기록에 실패하면 수집하지 않습니다.
+    """
+    statement = insert(NewsFetchSlot).values(window_start=_fetch_window_start(datetime.now(timezone.utc)), count=1)
+    statement = statement.on_conflict_do_update(
+        index_elements=[NewsFetchSlot.window_start],
+        set_={"count": NewsFetchSlot.count + 1},
+        where=NewsFetchSlot.count < NEWS_INGEST_MAX_SYMBOLS
+    ).returning(NewsFetchSlot.count)
+    try:
+        taken = db.execute(statement).first() is not None
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning("뉴스 수집 횟수 기록 실패: %s", e)
+        return False
+    return taken
+
+
+def prune_fetch_slots(db: Session):
+    """지난 구간의 수집 횟수 삭제"""
+    db.query(NewsFetchSlot).filter(
+        NewsFetchSlot.window_start < _fetch_window_start(datetime.now(timezone.utc))
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+async def _ensure_feed(db: Session, feed: str, query: str):
+    """
+    아직 저장된 기사가 없는 피드(수집 대상이 아니었던 종목, 서버 첫 시작)를 바로 수집합니다.
+
+    이미 수집한 피드는 외부 API를 호출하지 않고 다음 수집 주기를 기다립니다.
+    """
+    if feed in FEED_FETCHED_AT:
+        return
+
+    lock = _feed_locks.setdefault(feed, asyncio.Lock())
+    async with lock:
+        if feed in FEED_FETCHED_AT:
+            return
+        has_articles = await run_in_threadpool(latest_published_at, db, feed)
+        if has_articles:
+            return
+        if not await run_in_threadpool(take_fetch_slot, db):
+            return
+        await run_in_threadpool(SYMBOL_TAGGER.refresh, db)
+        await ingest_feed(db, feed, query)
+
+
+def _article_dict(article: NewsArticle) -> dict:
+    """기존 News API 응답과 같은 형식의 기사"""
+    return {
+        "title": article.title,
+        "description": article.description or "",
+        "url": article.url,
+        "urlToImage": article.url_to_image or "",
+        "source": article.source or "",
+        "publishedAt": article.published_at.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "content": article.content or ""
+    }
+
+
+def _load_feed_window(db: Session, feed: str) -> dict:
+    """
+    피드의 최신 FEED_WINDOW_SIZE개 기사를 한 번에 읽어 캐시합니다.
+
+    Returns:
+        dict: entries((published_at, article_id, 기사) 목록, 최신순), total, complete(창에 피드 전체가 들어있는지)
+    """
+    now = datetime.now()
+    cached = FEED_WINDOW_CACHE.get(feed)
+    if cached and now - cached[0] < timedelta(seconds=FEED_WINDOW_TTL):
+        FEED_WINDOW_METRICS.hit()
+        return cached[1]
+    FEED_WINDOW_METRICS.miss()
+
+    rows = db.query(NewsArticleFeed).filter(NewsArticleFeed.feed == feed).order_by(
+        NewsArticleFeed.published_at.desc(), NewsArticleFeed.article_id.desc()
+    ).limit(FEED_WINDOW_SIZE).all()
+    total = db.query(func.count(NewsArticleFeed.article_id)).filter(NewsArticleFeed.feed == feed).scalar()
+
+    window = {
+        "entries": [(row.published_at, row.article_id, _article_dict(row.article)) for row in rows],
+        "total": total,
+        "complete": len(rows) >= total
+    }
+    if len(FEED_WINDOW_CACHE) >= FEED_WINDOW_CACHE_SIZE:
+        # 가장 오래된 항목 제거 (dict는 삽입 순서 유지)
+        FEED_WINDOW_CACHE.pop(next(iter(FEED_WINDOW_CACHE)))
+        FEED_WINDOW_METRICS.evict()
+    FEED_WINDOW_CACHE[feed] = (now, window)
+    return window
+
+
+def _window_start(entries: list, cursor: Optional[str], page: int, page_size: int) -> int:
+    """요청의 창 내 시작 위치 (커서는 (published_at, article_id)보다 뒤의 첫 항목)"""
+    if not cursor:
+        return (page - 1) * page_size
+
+    last_key = decode_cursor(cursor)
+    try:
+        for index, (published_at, article_id, _) in enumerate(entries):
+            if (published_at, article_id) < last_key:
+                return index
+    except TypeError as e:
+        # 시간대 정보가 없는 커서
+        raise InvalidCursorError(f"유효하지 않은 커서입니다: {cursor}") from e
+    return len(entries)
+
+
+def get_feed_page(db: Session, feed: str, page_size: int, cursor: Optional[str] = None, page: int = 1) -> dict:
+    """
+    저장된 피드 기사를 (published_at, article_id) 역순으로 조회합니다.
+
+    피드의 최신 기사 창(FEED_WINDOW_SIZE개)을 한 번 읽어 두고 어떤 (page, page_size)나
+    커서 요청이든 창을 잘라서 응답합니다. 창 밖으로 넘어가는 요청만 DB에서
+    키셋(cursor) 또는 OFFSET(page, 기존 클라이언트 호환용)으로 조회합니다.
+
+    Returns:
+        dict: articles, totalResults, nextCursor
+
+    Raises:
+        InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    window = _load_feed_window(db, feed)
+    entries = window["entries"]
+    start = _window_start(entries, cursor, page, page_size)
+
+    # 요청한 범위가 창 안에 있으면 창을 잘라서 응답 (창 뒤에 기사가 더 있으면 다음 커서 전달)
+    if start + page_size <= len(entries) or window["complete"]:
+        sliced = entries[start:start + page_size]
+        has_more = start + page_size < len(entries) or not window["complete"]
+        return {
+            "articles": [article for _, _, article in sliced],
+            "totalResults": window["total"],
+            "nextCursor": encode_cursor(sliced[-1][0], sliced[-1][1]) if has_more and sliced else None
+        }
+
+    query = db.query(NewsArticleFeed).filter(NewsArticleFeed.feed == feed)
+
+    if cursor:
+        rows, next_cursor = keyset_page(query, NewsArticleFeed.published_at, NewsArticleFeed.article_id, page_size, cursor)
+    else:
+        rows = query.order_by(
+            NewsArticleFeed.published_at.desc(), NewsArticleFeed.article_id.desc()
+        ).offset((page - 1) * page_size).limit(page_size + 1).all()
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = encode_cursor(rows[-1].published_at, rows[-1].article_id)
+
+    return {
+        "articles": [_article_dict(row.article) for row in rows],
+        "totalResults": window["total"],
+        "nextCursor": next_cursor
+    }
+
+
+async def get_market_news(db: Session, page_size: int = 10, cursor: Optional[str] = None, page: int = 1):
+    """
+    시장 전반에 관한 뉴스를 로컬 저장소에서 가져옵니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        page_size (int): 페이지 당 뉴스 항목 수 (기본값: 10)
+        cursor (Optional[str]): 이전 응답의 nextCursor
+        page (int): 페이지 번호 (cursor가 없을 때만 사용)
+
+    Returns:
+        dict: 뉴스 데이터 (articles, totalResults, nextCursor 포함)
+
+    Raises:
+        HTTPException: 저장된 기사가 없어 수집하다 API 요청이 실패한 경우
+        InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    await _ensure_feed(db, MARKET_FEED, MARKET_QUERY)
+    return await run_in_threadpool(get_feed_page, db, MARKET_FEED, page_size, cursor, page)
+
+
+async def get_stock_news(db: Session, symbol: str, page_size: int = 10, cursor: Optional[str] = None, page: int = 1):
+    """
+    특정 주식에 관한 뉴스를 로컬 저장소에서 가져옵니다.
+
+    조회된 종목은 NEWS_WATCH_TTL 동안 수집 대상에 포함됩니다.
+
     Args:
+        db (Session): 데이터베이스 세션
         symbol (str): 주식 심볼 (예: AAPL, MSFT)
-        page (int): 페이지 번호 (기본값: 1)
         page_size (int): 페이지 당 뉴스 항목 수 (기본값: 10)
-        
+        cursor (Optional[str]): 이전 응답의 nextCursor
+        page (int): 페이지 번호 (cursor가 없을 때만 사용)
+
     Returns:
-        dict: 뉴스 데이터 (articles, totalResults 포함)
-        
+        dict: 뉴스 데이터 (symbol, companyName, articles, totalResults, nextCursor 포함)
+
     Raises:
-        HTTPException: API 요청 실패 시
+        HTTPException: 저장된 기사가 없어 수집하다 API 요청이 실패한 경우
+        InvalidCursorError: 커서 형식이 올바르지 않은 경우
     """
-    # 캐시 확인
-    cache_key = f"stock_news_{symbol}_{page}_{page_size}"
-    now = datetime.now()
-    
-    if cache_key in CACHE:
-        cache_time, cache_data = CACHE[cache_key]
-        # 캐시가 유효하면 캐시된 데이터 반환
-        if now - cache_time < timedelta(seconds=CACHE_TTL):
-            return cache_data
-    
-    try:
-        # 회사 정보 확인 (확장 가능)
-        # 실제 구현에서는 데이터베이스나 외부 API를 통해 회사명을 가져올 수 있음
-        company_info = {
-            "AAPL": "Apple",
-            "MSFT": "Microsoft",
-            "GOOGL": "Google",
-            "AMZN": "Amazon",
-            "META": "Meta",
-            "TSLA": "Tesla",
-            "NVDA": "NVIDIA"
-        }
-        
-        # 검색 키워드 설정
-        company_name = company_info.get(symbol, symbol)
-        search_query = f"{symbol} OR {company_name} stock"
-        
-        # API 요청 매개변수
-        params = {
-            "q": search_query,
-            "language": "en",
-            "sortBy": "publishedAt",
-            "pageSize": page_size,
-            "page": page,
-            "apiKey": NEWS_API_KEY
-        }
-        
-        # API 요청
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{NEWS_API_BASE_URL}/everything", params=params)
-            response.raise_for_status()
-            data = response.json()
-        
-        # 응답 데이터 확인
-        if data["status"] != "ok":
-            raise HTTPException(status_code=500, detail=f"뉴스 API 오류: {data.get('message', '알 수 없는 오류')}")
-        
-        # 뉴스 데이터 정제
-        articles = data.get("articles", [])
-        processed_articles = []
-        
-        for article in articles:
-            processed_articles.append({
-                "title": article.get("title", ""),
-                "description": article.get("description", ""),
-                "url": article.get("url", ""),
-                "urlToImage": article.get("urlToImage", ""),
-                "source": article.get("source", {}).get("name", ""),
-                "publishedAt": article.get("publishedAt", ""),
-                "content": article.get("content", "")
-            })
-        
-        result = {
-            "symbol": symbol,
-            "companyName": company_name,
-            "articles": processed_articles,
-            "totalResults": data.get("totalResults", 0)
-        }
-        
-        # 결과 캐싱
-        CACHE[cache_key] = (now, result)
-        
-        return result
-        
-    except httpx.HTTPError as e:
-        raise HTTPException(status_code=503, detail=f"뉴스 API 요청 실패: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"뉴스 데이터 가져오기 실패: {str(e)}")
\ No newline at end of file
+    await run_in_threadpool(record_watch, db, symbol)
+
+    company_name = _company_name(symbol, await run_in_threadpool(_stock_name, db, symbol))
+
+    await _ensure_feed(db, symbol, _stock_query(symbol, company_name))
+    result = await run_in_threadpool(get_feed_page, db, symbol, page_size, cursor, page)
+
+    return {
+        "symbol": symbol,
+        "companyName": company_name,
+        **result
+    }
+
+
+def search_articles(db: Session, query: str, page_size: int = 10, page: int = 1, symbol: Optional[str] = None) -> dict:
+    """
+    저장된 기사를 전문 검색합니다 (news_articles.search_vector GIN 인덱스).
+
+    검색어는 websearch_to_tsquery 문법(따옴표 구문, OR, -제외어)을 따르며,
+    결과는 ts_rank_cd 관련도(제목 > 요약 > 본문 가중치) 순, 같으면 최신순입니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        query (str): 검색어 (예: earnings guidance NVDA)
+        page_size (int): 페이지 당 기사 수
+        page (int): 페이지 번호
+        symbol (Optional[str]): 지정하면 해당 종목 피드의 기사로 제한
+
+    Returns:
+        dict: query, articles(rank 포함), page, hasMore
+    """
+    ts_query = func.websearch_to_tsquery("english", query)
+    rank = func.ts_rank_cd(NewsArticle.search_vector, ts_query).label("rank")
+
+    search = db.query(NewsArticle, rank).filter(NewsArticle.search_vector.op("@@")(ts_query))
+    if symbol:
+        search = search.join(
+            NewsArticleFeed, NewsArticleFeed.article_id == NewsArticle.id
+        ).filter(NewsArticleFeed.feed == symbol)
+
+    rows = search.order_by(
+        rank.desc(), NewsArticle.published_at.desc(), NewsArticle.id.desc()
+    ).offset((page - 1) * page_size).limit(page_size + 1).all()
+
+    return {
+        "query": query,
+        "articles": [
+            {**_article_dict(article), "rank": round(float(score), 6)}
+            for article, score in rows[:page_size]
+        ],
+        "page": page,
+        "hasMore": len(rows) > page_size
+    }
@@ -0,0 +1,206 @@
+import logging
+import re
+import threading
+from collections import deque
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from app.db.models import Stock
+
+logger = logging.getLogger(__name__)
+
+# 회사명 끝에서 제거하는 법인 형태/주식 종류 표기 (Apple Inc -> apple)
+NAME_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "companies", "ltd", "limited",
+    "plc", "llc", "lp", "sa", "ag", "nv", "se", "holdings", "holding", "group", "the", "class",
+    "a", "b", "c", "adr", "ads", "common", "stock", "shares", "ordinary"
+}
+
+# 이보다 짧은 심볼은 본문 오탐이 많으므로 캐시태그($F, $GM)로만 매칭
+MIN_BARE_SYMBOL_LENGTH = 3
+# 이보다 짧은 회사명 별칭은 사용하지 않음
+MIN_NAME_LENGTH = 3
+
+
+def name_aliases(name: str) -> Set[str]:
+    """
+    회사명에서 기사 매칭용 별칭(소문자)을 만듭니다.
+
+    "Alphabet Inc - Class A" -> {"alphabet inc", "alphabet"}
+
+    Returns:
+        Set[str]: 별칭 집합 (MIN_NAME_LENGTH 미만은 제외)
+    """
+    base = name.split(" - ")[0].lower()
+    base = re.sub(r"[,()]", " ", base)
+    words = base.split()
+
+    aliases = {" ".join(words)}
+    while words and words[-1].rstrip(".") in NAME_SUFFIXES:
+        words.pop()
+    aliases.add(" ".join(words))
+
+    return {alias for alias in aliases if len(alias) >= MIN_NAME_LENGTH}
+
+
+class SymbolTagger:
+    """
+    stocks 테이블의 심볼/회사명으로 만든 Aho-Corasick 오토마톤 기반 종목 태거
+
+    모든 패턴(소문자)을 하나의 오토마톤에 넣어 기사 본문을 한 번만 훑으면서
+    등장하는 종목을 모두 찾습니다. 태깅 비용은 패턴 수와 무관하게 본문 길이에
+    비례합니다.
+
+    - 심볼: 원문에서 대문자로 쓰인 경우만 인정 (AAPL은 매칭, "apple"의 일부는 아님)
+    - 짧은 심볼: 캐시태그($F)로 쓰인 경우만 인정
+    - 회사명: 대소문자 무시, 법인 형태 표기를 뗀 별칭도 함께 등록
+    - 한 단어 회사명 별칭: 대문자로 시작하는 경우만 인정 ("Gap"은 매칭, "the gap widened"는 아님)
+    - 모든 패턴은 단어 경계(앞뒤가 영숫자가 아님)에서만 인정
+    """
+
+    def __init__(self):
+        # (goto, fail, output, patterns) - 교체는 튜플 한 번 대입으로 처리
+        self._automaton = ([{}], [0], [[]], [])
+        self.signature = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _compile(patterns: List[Tuple[str, str, Optional[str], bool]]):
+        """
+        (키워드, 심볼, 대소문자 일치 필요 원문, 대문자 시작 필요 여부) 목록으로 오토마톤을 만듭니다.
+
+        Returns:
+            tuple: (goto, fail, output, patterns)
+        """
+        goto = [{}]
+        output: List[List[int]] = [[]]
+
+        for index, (keyword, _, _, _) in enumerate(patterns):
+            node = 0
+            for char in keyword:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    output.append([])
+                node = next_node
+            output[node].append(index)
+
+        # 너비 우선으로 실패 링크를 만들고, 실패 노드의 출력을 합쳐 둠
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                output[child] = output[child] + output[fail[child]]
+
+        return goto, fail, output, patterns
+
+    def build(self, stocks: Iterable[Tuple[str, str]]) -> int:
+        """
+        (심볼, 회사명) 목록으로 오토마톤을 다시 만듭니다.
+
+        Returns:
+            int: 등록된 패턴 수
+        """
+        patterns: List[Tuple[str, str, Optional[str], bool]] = []
+        seen = set()
+
+        def add(keyword: str, symbol: str, exact: Optional[str] = None, capitalized: bool = False):
+            if (keyword, symbol) not in seen:
+                seen.add((keyword, symbol))
+                patterns.append((keyword, symbol, exact, capitalized))
+
+        for symbol, name in stocks:
+            add(f"${symbol.lower()}", symbol)
+            if len(symbol) >= MIN_BARE_SYMBOL_LENGTH:
+                add(symbol.lower(), symbol, exact=symbol)
+            for alias in name_aliases(name or ""):
+                # 한 단어 별칭(target, block, gap)은 일반 단어와 겹치므로 고유명사로 쓰인 경우만 인정
+                add(alias, symbol, capitalized=" " not in alias)
+
+        automaton = self._compile(patterns)
+        self._automaton = automaton
+        return len(patterns)
+
+    def tag(self, text: str) -> Set[str]:
+        """
+        본문에 등장하는 종목 심볼을 한 번의 선형 탐색으로 찾습니다.
+
+        Returns:
+            Set[str]: 심볼 집합
+        """
+        if not text:
+            return set()
+
+        goto, fail, output, patterns = self._automaton
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # 소문자 변환으로 길이가 바뀌는 문자(예: İ)가 있으면 위치가 어긋나지 않도록 문자 단위 변환
+            lowered = "".join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+        found = set()
+        length = len(text)
+        node = 0
+        for position, char in enumerate(lowered):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            for index in output[node]:
+                keyword, symbol, exact, capitalized = patterns[index]
+                if symbol in found:
+                    continue
+                start = position - len(keyword) + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if position + 1 < length and text[position + 1].isalnum():
+                    continue
+                if exact is not None and text[start:position + 1] != exact:
+                    continue
+                if capitalized and not text[start].isupper():
+                    continue
+                found.add(symbol)
+
+        return found
+
+    @staticmethod
+    def stocks_signature(db: Session):
+        """stocks 테이블의 심볼/회사명 변경 감지용 서명 (종목 수, 심볼|회사명 md5)"""
+        return db.query(
+            func.count(Stock.id),
+            func.md5(func.string_agg(Stock.symbol + "|" + Stock.name, aggregate_order_by(",", Stock.id)))
+        ).one()
+
+    def refresh(self, db: Session) -> bool:
+        """
+        stocks 테이블이 바뀌었으면 오토마톤을 다시 만듭니다.
+
+        Returns:
+            bool: 다시 만들었으면 True
+        """
+        signature = tuple(self.stocks_signature(db))
+        if signature == self.signature:
+            return False
+
+        with self._lock:
+            if signature == self.signature:
+                return False
+            stocks = db.query(Stock.symbol, Stock.name).all()
+            patterns = self.build(stocks)
+            self.signature = signature
+        logger.info("뉴스 종목 태거 갱신: 종목 %d개, 패턴 %d개", len(stocks), patterns)
+        return True
+
+
+# 프로세스 전역 종목 태거
+SYMBOL_TAGGER = SymbolTagger()
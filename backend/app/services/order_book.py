@@ -0,0 +1,366 @@
+import asyncio
+import heapq
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Tuple
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.db.models import SimulationOrder, Stock
+from app.services.execution import price_fill
+from app.services.simulation_trading import lock_account, apply_trade, notify_account_changed
+
+logger = logging.getLogger(__name__)
+
+# 매칭 엔진이 관리하는 미체결 상태
+ACTIVE_STATUSES = ("OPEN", "TRIGGERED")
+
+
+@dataclass
+class RestingOrder:
+    """매칭 엔진 메모리에 보관하는 미체결 주문 (DB 행의 필요한 필드만 복사)"""
+    id: int
+    account_id: int
+    stock_id: int
+    symbol: str
+    order_type: str
+    transaction_type: str
+    quantity: int
+    limit_price: Optional[Decimal]
+    stop_price: Optional[Decimal]
+    status: str = "OPEN"
+
+    @classmethod
+    def from_model(cls, order: SimulationOrder, symbol: str):
+        return cls(
+            id=order.id,
+            account_id=order.account_id,
+            stock_id=order.stock_id,
+            symbol=symbol,
+            order_type=order.order_type,
+            transaction_type=order.transaction_type,
+            quantity=order.quantity,
+            limit_price=order.limit_price,
+            stop_price=order.stop_price,
+            status=order.status
+        )
+
+
+class SymbolBook:
+    """
+    한 종목의 발동 가격별 힙 4개
+
+    - buy_limits : 시세 <= 지정가일 때 체결, 최대 힙 (-지정가, id)
+    - sell_limits: 시세 >= 지정가일 때 체결, 최소 힙 (지정가, id)
+    - buy_stops  : 시세 >= 손절가일 때 발동, 최소 힙 (손절가, id)
+    - sell_stops : 시세 <= 손절가일 때 발동, 최대 힙 (-손절가, id)
+
+    각 힙의 top만 비교하면 되므로 틱 하나는 교차된 주문 k개에 대해 O(log n + k)로
+    처리됩니다. 취소된 주문은 힙에서 바로 빼지 않고 꺼낼 때 건너뜁니다 (지연 삭제).
+    """
+
+    def __init__(self):
+        self.buy_limits: List[Tuple[Decimal, int]] = []
+        self.sell_limits: List[Tuple[Decimal, int]] = []
+        self.buy_stops: List[Tuple[Decimal, int]] = []
+        self.sell_stops: List[Tuple[Decimal, int]] = []
+
+    def push_limit(self, order: RestingOrder):
+        if order.transaction_type == "BUY":
+            heapq.heappush(self.buy_limits, (-order.limit_price, order.id))
+        else:
+            heapq.heappush(self.sell_limits, (order.limit_price, order.id))
+
+    def push_stop(self, order: RestingOrder):
+        if order.transaction_type == "BUY":
+            heapq.heappush(self.buy_stops, (order.stop_price, order.id))
+        else:
+            heapq.heappush(self.sell_stops, (-order.stop_price, order.id))
+
+
+class OrderBook:
+    """
+    모의 투자 대기 주문 매칭 엔진
+
+    종목별 SymbolBook과 주문 ID -> RestingOrder 맵을 메모리에 유지합니다.
+    체결은 simulation_trading의 일반 거래 경로(apply_trade)로 저장되며,
+    주문 행을 FOR UPDATE로 잠그고 상태를 확인하므로 여러 워커가 같은 주문을
+    동시에 매칭해도 한 번만 체결됩니다.
+
+    엔진은 워커마다 따로 있으므로 sync를 주기적으로 실행해 다른 워커에서 접수,
+    취소, 체결된 주문을 DB 기준으로 맞춥니다.
+    """
+
+    def __init__(self):
+        self.books: Dict[str, SymbolBook] = defaultdict(SymbolBook)
+        self.orders: Dict[int, RestingOrder] = {}
+        # 매칭된 뒤 체결 저장을 기다리는 주문 ID (DB에는 아직 미체결로 보임)
+        self.pending: Set[int] = set()
+        # 이 워커에서 종료(체결/취소)된 주문 ID -> 종료 시점의 sync 세대
+        self.retired: Dict[int, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        # 실행 중인 체결 태스크 (가비지 컬렉션 방지)
+        self._tasks = set()
+
+    def add(self, order: RestingOrder):
+        """미체결 주문을 엔진에 등록"""
+        with self._lock:
+            self._push(order)
+
+    def _push(self, order: RestingOrder):
+        """주문을 종목 힙에 넣음 (잠금을 잡은 상태에서 호출)"""
+        self.orders[order.id] = order
+        book = self.books[order.symbol]
+        if order.order_type == "LIMIT" or (order.order_type == "STOP_LIMIT" and order.status == "TRIGGERED"):
+            book.push_limit(order)
+        else:
+            book.push_stop(order)
+
+    def remove(self, order_id: int):
+        """주문 제거 (힙에서는 지연 삭제, 주문 종료가 커밋된 뒤 호출)"""
+        with self._lock:
+            self.orders.pop(order_id, None)
+            self.retired[order_id] = self._generation
+
+    def remove_account(self, account_id: int):
+        """계좌의 미체결 주문을 모두 제거 (계좌 삭제가 커밋된 뒤 호출)"""
+        with self._lock:
+            for order_id in [order.id for order in self.orders.values() if order.account_id == account_id]:
+                del self.orders[order_id]
+                self.retired[order_id] = self._generation
+
+    def restore(self, order: RestingOrder):
+        """체결 저장에 실패한 주문을 엔진에 되돌림"""
+        with self._lock:
+            self.pending.discard(order.id)
+            self._push(order)
+
+    def finish(self, order_id: int):
+        """체결 저장이 끝난 주문을 저장 대기 목록에서 종료 목록으로 옮김"""
+        with self._lock:
+            self.pending.discard(order_id)
+            self.retired[order_id] = self._generation
+
+    def _pop_crossed(self, heap, crossed) -> List[RestingOrder]:
+        """heap top이 crossed(key)를 만족하는 동안 꺼내 살아있는 주문만 반환"""
+        result = []
+        while heap and crossed(heap[0][0]):
+            _, order_id = heapq.heappop(heap)
+            order = self.orders.get(order_id)
+            if order is not None:
+                result.append(order)
+        return result
+
+    def match(self, symbol: str, price: Decimal):
+        """
+        틱 하나로 교차된 주문을 찾습니다.
+
+        Args:
+            symbol (str): 종목 심볼
+            price (Decimal): 새 시세
+
+        Returns:
+            tuple: (체결할 주문 목록, 손절 지정가에서 지정가로 전환된 주문 목록)
+        """
+        fills, triggered = [], []
+
+        with self._lock:
+            book = self.books.get(symbol)
+            if book is None:
+                return fills, triggered
+
+            # 손절 주문 발동
+            stops = self._pop_crossed(book.buy_stops, lambda stop: stop <= price)
+            stops += self._pop_crossed(book.sell_stops, lambda neg_stop: -neg_stop >= price)
+            for order in stops:
+                if order.order_type == "STOP":
+                    fills.append(order)
+                elif order.status != "TRIGGERED":
+                    # 손절 지정가: 발동 후 지정가 주문으로 전환
+                    order.status = "TRIGGERED"
+                    book.push_limit(order)
+                    triggered.append(order)
+
+            # 지정가 주문 체결 (방금 전환된 주문 포함)
+            fills += self._pop_crossed(book.buy_limits, lambda neg_limit: -neg_limit >= price)
+            fills += self._pop_crossed(book.sell_limits, lambda limit: limit <= price)
+
+            for order in fills:
+                self.orders.pop(order.id, None)
+                self.pending.add(order.id)
+
+        return fills, triggered
+
+    def sync(self, db: Session) -> int:
+        """
+        DB의 미체결 주문과 엔진을 맞춥니다 (서버 시작 시, 이후 주기적으로 호출).
+
+        다른 워커에서 접수된 주문은 추가하고, 취소/체결된 주문은 제거하며, 다른
+        워커에서 발동된 손절 지정가 주문은 지정가 주문으로 전환합니다. 조회하는
+        동안 이 워커에서 바뀐 주문은 건드리지 않습니다.
+
+        - 조회 시작 뒤 API가 등록한 주문은 조회 결과에 없어도 제거하지 않음
+        - 매칭되어 체결 저장을 기다리는 주문과 조회 시작 뒤 종료된 주문은 DB에
+          아직 미체결로 보이더라도 다시 넣지 않음 (같은 주문의 중복 매칭 방지)
+
+        Args:
+            db (Session): 데이터베이스 세션
+
+        Returns:
+            int: 동기화 후 엔진에 등록된 주문 수
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            known = set(self.orders)
+
+        rows = db.query(SimulationOrder, Stock.symbol).join(
+            Stock, Stock.id == SimulationOrder.stock_id
+        ).filter(SimulationOrder.status.in_(ACTIVE_STATUSES)).all()
+        active = {order.id: (order, symbol) for order, symbol in rows}
+
+        with self._lock:
+            for order_id in known:
+                if order_id not in active:
+                    self.orders.pop(order_id, None)
+
+            for order_id, (order, symbol) in active.items():
+                if order_id in self.pending or order_id in self.retired:
+                    continue
+                resting = self.orders.get(order_id)
+                if resting is None:
+                    self._push(RestingOrder.from_model(order, symbol))
+                elif order.status == "TRIGGERED" and resting.status != "TRIGGERED":
+                    resting.status = "TRIGGERED"
+                    self.books[symbol].push_limit(resting)
+
+            # 조회 시작 전에 종료된 주문은 커밋된 상태가 이번 조회에 반영되어 있음
+            self.retired = {
+                order_id: retired_at for order_id, retired_at in self.retired.items() if retired_at >= generation
+            }
+            return len(self.orders)
+
+    async def process_tick(self, symbol: str, price: float):
+        """
+        새 시세로 주문을 매칭하고 체결 결과를 DB에 저장합니다.
+
+        매칭은 메모리에서 바로 처리하고, DB 저장은 스레드풀에서 실행해
+        이벤트 루프를 막지 않습니다.
+        """
+        tick = Decimal(str(price))
+        fills, triggered = self.match(symbol, tick)
+        if fills or triggered:
+            await run_in_threadpool(persist_matches, fills, triggered, tick)
+
+    def on_quote(self, symbol: str, price: float):
+        """stock_data 시세 리스너: 매칭 태스크를 예약하고 바로 반환"""
+        if symbol not in self.books:
+            return
+        task = asyncio.get_running_loop().create_task(self.process_tick(symbol, price))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _fill_reference_price(order: RestingOrder, tick: Decimal):
+    """
+    주문 유형별 체결가와 수수료 계산
+
+    손절(STOP) 주문은 발동 후 시장가로 체결되어 슬리피지가 적용되고,
+    지정가 주문은 지정가보다 불리하게 체결되지 않습니다.
+    """
+    fill_price, commission = price_fill(order.transaction_type, order.quantity, tick)
+    if order.order_type != "STOP":
+        if order.transaction_type == "BUY":
+            fill_price = min(fill_price, order.limit_price)
+        else:
+            fill_price = max(fill_price, order.limit_price)
+    return fill_price, commission
+
+
+def fill_order(db: Session, order: RestingOrder, tick: Decimal) -> str:
+    """
+    매칭된 주문 하나를 일반 거래 경로로 체결합니다.
+
+    주문 행 잠금 -> 상태 확인 -> 계좌 잠금 및 거래 반영 -> 주문 상태 FILLED
+    순서로 하나의 트랜잭션에서 처리합니다. 잔액 또는 보유 수량이 부족하면
+    주문은 REJECTED로 종료됩니다.
+
+    Returns:
+        str: 최종 주문 상태
+    """
+    try:
+        db_order = db.query(SimulationOrder).filter(
+            SimulationOrder.id == order.id
+        ).with_for_update().first()
+
+        # 다른 워커가 이미 체결했거나 사용자가 취소한 경우
+        if db_order is None or db_order.status not in ACTIVE_STATUSES:
+            db.rollback()
+            return db_order.status if db_order else "CANCELLED"
+
+        fill_price, commission = _fill_reference_price(order, tick)
+        account = lock_account(db, order.account_id)
+        db_transaction = apply_trade(
+            db, account, order.stock_id, order.transaction_type, order.quantity, fill_price, commission
+        )
+
+        db_order.status = "FILLED"
+        db_order.transaction_id = db_transaction.id
+        db.commit()
+        notify_account_changed(db, order.account_id)
+        return "FILLED"
+    except HTTPException as e:
+        db.rollback()
+        db.query(SimulationOrder).filter(
+            SimulationOrder.id == order.id,
+            SimulationOrder.status.in_(ACTIVE_STATUSES)
+        ).update({"status": "REJECTED", "reject_reason": str(e.detail)}, synchronize_session=False)
+        db.commit()
+        return "REJECTED"
+    except Exception:
+        db.rollback()
+        raise
+
+
+def persist_matches(fills: List[RestingOrder], triggered: List[RestingOrder], tick: Decimal):
+    """매칭 결과 저장: 전환된 손절 지정가 주문의 상태 갱신 및 체결 처리"""
+    db = SessionLocal()
+    try:
+        if triggered:
+            db.query(SimulationOrder).filter(
+                SimulationOrder.id.in_([order.id for order in triggered]),
+                SimulationOrder.status == "OPEN"
+            ).update({"status": "TRIGGERED"}, synchronize_session=False)
+            db.commit()
+
+        for order in fills:
+            try:
+                fill_order(db, order, tick)
+            except Exception:
+                # 저장 실패 시 다음 틱에서 다시 매칭되도록 엔진에 되돌림
+                logger.exception("주문 체결 실패 (order %s)", order.id)
+                ORDER_BOOK.restore(order)
+            else:
+                ORDER_BOOK.finish(order.id)
+    finally:
+        db.close()
+
+
+def sync_order_book():
+    """주기 작업 (모든 워커): 매칭 엔진을 DB의 미체결 주문과 동기화"""
+    db = SessionLocal()
+    try:
+        ORDER_BOOK.sync(db)
+    finally:
+        db.close()
+
+
+# 프로세스 전역 매칭 엔진
+ORDER_BOOK = OrderBook()
@@ -0,0 +1,192 @@
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.db.models import Stock, StockPrice
+from app.services.stock_data import get_historical_data
+
+logger = logging.getLogger(__name__)
+
+# 당일 일봉이 확정되는 시각 (UTC) - 미국 장 마감(16:00 ET) 이후
+DAILY_BAR_CLOSE_UTC = time(21, 0)
+
+# 외부 API의 compact 응답에 들어 있는 최근 일봉 수
+COMPACT_BARS = 100
+
+# 빠진 일봉을 다시 확인하기까지의 간격 (휴장일에 요청마다 외부 API를 호출하지 않도록)
+HISTORY_REFRESH_INTERVAL = timedelta(hours=1)
+
+# 종목 ID -> 마지막으로 외부 API에서 빠진 일봉을 확인한 시각
+_history_checked: Dict[int, datetime] = {}
+
+
+def store_daily_bars(db: Session, stock_id: int, bars: List[dict]) -> int:
+    """
+    일별 시세를 stock_prices 테이블에 upsert합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        stock_id (int): 주식 ID
+        bars (List[dict]): get_historical_data 형식의 시세 목록 (date, open, high, low, close, volume)
+
+    Returns:
+        int: 저장된 행 수
+    """
+    if not bars:
+        return 0
+
+    rows = [
+        {
+            "stock_id": stock_id,
+            "price_date": date.fromisoformat(bar["date"]),
+            "open": bar["open"],
+            "high": bar["high"],
+            "low": bar["low"],
+            "close": bar["close"],
+            "volume": bar["volume"]
+        }
+        for bar in bars
+    ]
+
+    statement = insert(StockPrice)
+    statement = statement.on_conflict_do_update(
+        index_elements=[StockPrice.stock_id, StockPrice.price_date],
+        set_={
+            "open": statement.excluded.open,
+            "high": statement.excluded.high,
+            "low": statement.excluded.low,
+            "close": statement.excluded.close,
+            "volume": statement.excluded.volume
+        }
+    )
+    db.execute(statement, rows)
+    db.commit()
+    return len(rows)
+
+
+def load_daily_bars(db: Session, stock_id: int, start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, np.ndarray]:
+    """
+    저장된 일별 시세를 컬럼별 NumPy 배열로 읽어옵니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        stock_id (int): 주식 ID
+        start (Optional[date]): 시작일 (포함)
+        end (Optional[date]): 종료일 (포함)
+
+    Returns:
+        Dict[str, np.ndarray]: dates(datetime64[D]), open, high, low, close, volume - 날짜 오름차순
+    """
+    query = db.query(
+        StockPrice.price_date,
+        StockPrice.open,
+        StockPrice.high,
+        StockPrice.low,
+        StockPrice.close,
+        StockPrice.volume
+    ).filter(StockPrice.stock_id == stock_id)
+
+    if start:
+        query = query.filter(StockPrice.price_date >= start)
+    if end:
+        query = query.filter(StockPrice.price_date <= end)
+
+    rows = query.order_by(StockPrice.price_date).all()
+
+    if not rows:
+        return {
+            "dates": np.array([], dtype="datetime64[D]"),
+            "open": np.array([], dtype=np.float64),
+            "high": np.array([], dtype=np.float64),
+            "low": np.array([], dtype=np.float64),
+            "close": np.array([], dtype=np.float64),
+            "volume": np.array([], dtype=np.int64)
+        }
+
+    dates, opens, highs, lows, closes, volumes = zip(*rows)
+    return {
+        "dates": np.array(dates, dtype="datetime64[D]"),
+        "open": np.array(opens, dtype=np.float64),
+        "high": np.array(highs, dtype=np.float64),
+        "low": np.array(lows, dtype=np.float64),
+        "close": np.array(closes, dtype=np.float64),
+        "volume": np.array(volumes, dtype=np.int64)
+    }
+
+
+def last_trading_day(now: Optional[datetime] = None) -> date:
+    """
+    일봉이 확정된 가장 최근 거래일 (주말 제외, 휴장일은 고려하지 않음)
+
+    Args:
+        now (Optional[datetime]): 기준 시각 (UTC, 기본값 현재)
+    """
+    now = now or datetime.now(timezone.utc)
+    day = now.date() if now.time() >= DAILY_BAR_CLOSE_UTC else now.date() - timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+def _stored_history(db: Session, symbol: str):
+    """종목과 저장된 마지막 일봉 날짜 조회 (등록되지 않은 심볼이면 404)"""
+    stock = db.query(Stock).filter(Stock.symbol == symbol).first()
+    if not stock:
+        raise HTTPException(status_code=404, detail=f"등록되지 않은 주식 심볼입니다: {symbol}")
+
+    latest = db.query(func.max(StockPrice.price_date)).filter(StockPrice.stock_id == stock.id).scalar()
+    return stock, latest
+
+
+async def ensure_daily_history(db: Session, symbol: str) -> Stock:
+    """
+    종목의 일별 시세를 최근 거래일까지 DB에 채워 둡니다.
+
+    저장된 시세가 없으면 외부 API에서 전체 기간을 가져오고, 있으면 마지막 저장일
+    이후의 빠진 일봉만 저장합니다 (빠진 기간이 COMPACT_BARS 이내면 compact 응답 사용).
+    휴장일처럼 새 일봉이 없을 수 있으므로 같은 종목은 HISTORY_REFRESH_INTERVAL에
+    한 번만 다시 확인하며, 이미 저장된 시세가 있으면 외부 API 실패 시 저장된 시세를 그대로 사용합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        symbol (str): 주식 심볼
+
+    Returns:
+        Stock: 주식 객체
+
+    Raises:
+        HTTPException: 등록되지 않은 심볼이거나, 저장된 시세가 없는데 외부 API 요청이 실패한 경우
+    """
+    stock, latest = await run_in_threadpool(_stored_history, db, symbol)
+    target = last_trading_day()
+    if latest is not None and latest >= target:
+        return stock
+
+    now = datetime.now(timezone.utc)
+    checked_at = _history_checked.get(stock.id)
+    if latest is not None and checked_at and now - checked_at < HISTORY_REFRESH_INTERVAL:
+        return stock
+
+    if latest is None:
+        history = await get_historical_data(symbol, "daily", outputsize="full")
+        await run_in_threadpool(store_daily_bars, db, stock.id, history["data"])
+    else:
+        outputsize = "compact" if np.busday_count(latest, target) < COMPACT_BARS else "full"
+        try:
+            history = await get_historical_data(symbol, "daily", outputsize=outputsize)
+        except HTTPException as e:
+            logger.warning("일별 시세 갱신 실패 (%s), 저장된 시세 사용: %s", symbol, e.detail)
+            _history_checked[stock.id] = now
+            return stock
+        new_bars = [bar for bar in history["data"] if date.fromisoformat(bar["date"]) > latest]
+        await run_in_threadpool(store_daily_bars, db, stock.id, new_bars)
+
+    _history_checked[stock.id] = now
+    return stock
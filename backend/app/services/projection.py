@@ -0,0 +1,291 @@
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timedelta
+from functools import reduce
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.core.executors import get_compute_pool
+from app.core.metrics import CacheMetrics
+from app.db.models import Stock, Transaction
+from app.services.price_history import ensure_daily_history, load_daily_bars
+
+# 경로 x 기간 x 종목 배열 한 덩어리의 최대 크기 (바이트)
+CHUNK_BYTES = 32 * 1024 * 1024
+
+# 이 원소 수(경로 x 기간 x 종목)를 넘는 계산은 프로세스 풀에서 실행
+POOL_THRESHOLD = 2_000_000
+
+# 결과 캐시 (메모리 캐시 - stock_data.CACHE와 같은 (저장 시각, 데이터) 형식)
+PROJECTION_CACHE = {}
+PROJECTION_CACHE_TTL = 3600  # 캐시 유효 시간(초)
+PROJECTION_CACHE_SIZE = 256
+PROJECTION_CACHE_METRICS = CacheMetrics("projection")
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+# 응답에 포함하는 밴드 지점 수 (약 주 단위)
+MAX_BAND_POINTS = 52
+
+
+def get_portfolio_positions(db: Session, portfolio_id: int) -> List[dict]:
+    """
+    포트폴리오의 종목별 보유 수량과 현재가를 집계 쿼리 한 번으로 조회합니다.
+
+    Returns:
+        List[dict]: symbol, quantity, price, value (보유 수량이 0보다 큰 종목만)
+    """
+    signed_quantity = case(
+        (Transaction.transaction_type == "BUY", Transaction.quantity),
+        else_=-Transaction.quantity
+    )
+    rows = db.query(
+        Stock.symbol,
+        Stock.last_price,
+        func.sum(signed_quantity).label("quantity")
+    ).join(
+        Stock, Stock.id == Transaction.stock_id
+    ).filter(
+        Transaction.portfolio_id == portfolio_id
+    ).group_by(
+        Stock.symbol, Stock.last_price
+    ).having(func.sum(signed_quantity) > 0).order_by(Stock.symbol).all()
+
+    return [
+        {
+            "symbol": symbol,
+            "quantity": int(quantity),
+            "price": float(last_price or 0),
+            "value": int(quantity) * float(last_price or 0)
+        }
+        for symbol, last_price, quantity in rows
+    ]
+
+
+def align_log_returns(closes: Dict[str, tuple], lookback_days: int) -> np.ndarray:
+    """
+    종목별 종가를 공통 거래일로 맞춘 뒤 일간 로그 수익률 행렬을 만듭니다.
+
+    Args:
+        closes: 심볼 -> (dates, close) 배열 쌍 (입력 순서가 종목 열 순서)
+        lookback_days (int): 사용할 최근 거래일 수
+
+    Returns:
+        np.ndarray: (거래일 수 - 1, 종목 수) 로그 수익률
+    """
+    common = reduce(np.intersect1d, (dates for dates, _ in closes.values()))[-(lookback_days + 1):]
+
+    columns = []
+    for dates, close in closes.values():
+        index = np.searchsorted(dates, common)
+        columns.append(close[index])
+
+    prices = np.column_stack(columns)
+    return np.diff(np.log(prices), axis=0)
+
+
+def _chunk_size(steps: int, assets: int) -> int:
+    """CHUNK_BYTES를 넘지 않는 한 번의 경로 수"""
+    return max(1, CHUNK_BYTES // (steps * assets * 8))
+
+
+def band_steps(horizon: int) -> np.ndarray:
+    """응답에 포함하는 밴드 지점 (1부터 시작하는 거래일, 최대 MAX_BAND_POINTS개, 마지막은 항상 만기)"""
+    every = max(1, -(-horizon // MAX_BAND_POINTS))
+    return np.unique(np.append(np.arange(every, horizon + 1, every), horizon))
+
+
+def simulate_paths(
+    log_returns: np.ndarray,
+    weights: np.ndarray,
+    horizon: int,
+    paths: int,
+    method: str,
+    seed: int,
+    steps: np.ndarray
+) -> np.ndarray:
+    """
+    포트폴리오 가치 경로를 시뮬레이션합니다.
+
+    - gbm: 과거 로그 수익률의 평균과 공분산(Cholesky 분해)으로 상관된 정규 수익률 생성
+    - bootstrap: 과거 거래일을 복원 추출해 종목 간 상관을 그대로 유지
+
+    경로 x 기간 x 종목 배열은 CHUNK_BYTES 단위로 나눠 계산하고, 덩어리마다 밴드 지점의
+    포트폴리오 가치만 남기므로 결과 배열은 경로 x 밴드 지점 수(최대 MAX_BAND_POINTS)
+    크기입니다. 프로세스 풀에서 실행할 수 있도록 DB나 전역 상태에 의존하지 않습니다.
+
+    Args:
+        log_returns (np.ndarray): (거래일, 종목) 일간 로그 수익률
+        weights (np.ndarray): 종목별 현재 평가 금액
+        horizon (int): 시뮬레이션 거래일 수
+        paths (int): 경로 수
+        method (str): "gbm" 또는 "bootstrap"
+        seed (int): 난수 시드
+        steps (np.ndarray): 가치를 남길 거래일 (band_steps, 마지막은 만기)
+
+    Returns:
+        np.ndarray: (paths, len(steps)) 밴드 지점별 포트폴리오 가치
+    """
+    rng = np.random.default_rng(seed)
+    assets = log_returns.shape[1]
+    values = np.empty((paths, len(steps)))
+
+    if method == "gbm":
+        mean = log_returns.mean(axis=0)
+        covariance = np.atleast_2d(np.cov(log_returns, rowvar=False))
+        # 수치 오차로 양의 정부호가 아닐 때를 대비한 작은 대각 보정
+        jitter = 1e-12 * np.eye(assets)
+        cholesky = np.linalg.cholesky(covariance + jitter)
+
+    chunk = _chunk_size(horizon, assets)
+    for start in range(0, paths, chunk):
+        size = min(chunk, paths - start)
+
+        if method == "gbm":
+            shocks = rng.standard_normal((size, horizon, assets)) @ cholesky.T
+            shocks += mean
+        else:
+            shocks = log_returns[rng.integers(0, len(log_returns), size=(size, horizon))]
+
+        np.cumsum(shocks, axis=1, out=shocks)
+        np.exp(shocks, out=shocks)
+        values[start:start + size] = shocks[:, steps - 1] @ weights
+
+    return values
+
+
+def summarize_paths(values: np.ndarray, steps: np.ndarray, initial_value: float) -> Dict[str, Any]:
+    """밴드 지점별 가치(simulate_paths 결과)에서 백분위 밴드와 만기 요약 통계 계산"""
+    bands = np.percentile(values, PERCENTILES, axis=0)
+    final = values[:, -1]
+
+    return {
+        "bands": [
+            {"step": int(step), **{f"p{p}": round(float(bands[i, j]), 2) for i, p in enumerate(PERCENTILES)}}
+            for j, step in enumerate(steps)
+        ],
+        "expected_value": round(float(final.mean()), 2),
+        "probability_of_loss": float(np.mean(final < initial_value)),
+        "value_at_risk_95": round(initial_value - float(np.percentile(final, 5)), 2)
+    }
+
+
+def run_projection(log_returns, weights, horizon, paths, method, seed) -> Dict[str, Any]:
+    """시뮬레이션 + 요약 (프로세스 풀 실행 단위)"""
+    steps = band_steps(horizon)
+    values = simulate_paths(log_returns, weights, horizon, paths, method, seed, steps)
+    return summarize_paths(values, steps, float(weights.sum()))
+
+
+def _cache_key(positions: List[dict], method: str, horizon: int, paths: int, seed: int, lookback_days: int, last_date) -> str:
+    payload = json.dumps(
+        {
+            "holdings": [(p["symbol"], p["quantity"], round(p["price"], 4)) for p in positions],
+            "method": method,
+            "horizon": horizon,
+            "paths": paths,
+            "seed": seed,
+            "lookback": lookback_days,
+            "last_date": str(last_date)
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _default_seed(positions: List[dict]) -> int:
+    """시드를 지정하지 않으면 보유 종목에서 결정해 같은 포트폴리오는 같은 결과(캐시 적중)를 얻음"""
+    digest = hashlib.sha256(json.dumps([(p["symbol"], p["quantity"]) for p in positions]).encode()).digest()
+    return int.from_bytes(digest[:4], "big")
+
+
+async def project_portfolio(
+    db: Session,
+    portfolio_id: int,
+    horizon: int,
+    paths: int,
+    method: str,
+    seed: Optional[int],
+    lookback_days: int
+) -> Dict[str, Any]:
+    """
+    포트폴리오 가치의 몬테카를로 예측을 계산합니다.
+
+    보유 종목의 일별 시세가 없으면 먼저 가져와 저장하고, 같은 입력(보유 종목,
+    시세 마지막 날짜, 시드, 파라미터)의 결과는 PROJECTION_CACHE에서 반환합니다.
+
+    Raises:
+        HTTPException: 보유 종목이 없거나 과거 시세가 부족한 경우
+    """
+    # 세션 조회는 동기 I/O이므로 이벤트 루프를 막지 않도록 스레드 풀에서 실행
+    positions = await run_in_threadpool(get_portfolio_positions, db, portfolio_id)
+    if not positions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="보유 중인 주식이 없어 예측할 수 없습니다."
+        )
+
+    closes = {}
+    for position in positions:
+        stock = await ensure_daily_history(db, position["symbol"])
+        bars = await run_in_threadpool(load_daily_bars, db, stock.id)
+        closes[position["symbol"]] = (bars["dates"], bars["close"])
+
+    log_returns = align_log_returns(closes, lookback_days)
+    if len(log_returns) < 2:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="보유 종목의 공통 과거 시세가 부족해 예측할 수 없습니다."
+        )
+
+    # last_price가 없는 종목은 마지막 종가로 평가
+    for position in positions:
+        if position["price"] <= 0:
+            position["price"] = float(closes[position["symbol"]][1][-1])
+            position["value"] = position["quantity"] * position["price"]
+
+    if seed is None:
+        seed = _default_seed(positions)
+
+    last_date = min(dates[-1] for dates, _ in closes.values())
+    cache_key = _cache_key(positions, method, horizon, paths, seed, lookback_days, last_date)
+    now = datetime.now()
+    cached = PROJECTION_CACHE.get(cache_key)
+    if cached and now - cached[0] < timedelta(seconds=PROJECTION_CACHE_TTL):
+        PROJECTION_CACHE_METRICS.hit()
+        return cached[1]
+    PROJECTION_CACHE_METRICS.miss()
+
+    weights = np.array([position["value"] for position in positions])
+    args = (log_returns, weights, horizon, paths, method, seed)
+
+    if paths * horizon * len(positions) > POOL_THRESHOLD:
+        loop = asyncio.get_running_loop()
+        summary = await loop.run_in_executor(get_compute_pool(), run_projection, *args)
+    else:
+        summary = await run_in_threadpool(run_projection, *args)
+
+    result = {
+        "portfolio_id": portfolio_id,
+        "method": method,
+        "horizon_days": horizon,
+        "paths": paths,
+        "seed": seed,
+        "initial_value": round(float(weights.sum()), 2),
+        "history_days": len(log_returns),
+        "holdings": positions,
+        **summary
+    }
+
+    if len(PROJECTION_CACHE) >= PROJECTION_CACHE_SIZE:
+        # 가장 오래된 항목 제거 (dict는 삽입 순서 유지)
+        PROJECTION_CACHE.pop(next(iter(PROJECTION_CACHE)))
+        PROJECTION_CACHE_METRICS.evict()
+    PROJECTION_CACHE[cache_key] = (now, result)
+    return result
@@ -0,0 +1,225 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+import numpy as np
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.db.models import SimulationAccount, Stock
+from app.services.execution import price_fill
+from app.services.price_history import ensure_daily_history, load_daily_bars
+
+# 모의 투자 계좌 모드 (실시간, 과거 재현, 백테스트 결과 - 순위표/NAV 스냅샷은 LIVE만)
+LIVE = "LIVE"
+REPLAY = "REPLAY"
+BACKTEST = "BACKTEST"
+
+# 메모리에 보관하는 종목 수 (가장 오래 사용하지 않은 종목부터 제거)
+HISTORY_STORE_SIZE = 512
+
+
+class HistoryStore:
+    """
+    종목별 일별 시세를 컬럼 배열(dates, open, high, low, close, volume)로 보관하는 저장소
+
+    한 번 읽은 종목은 메모리에 두고, 특정 날짜의 시세는 날짜 배열에 대한
+    이진 탐색(np.searchsorted)으로 찾습니다. 외부 API는 호출하지 않습니다.
+    """
+
+    def __init__(self, max_symbols: int = HISTORY_STORE_SIZE):
+        self.max_symbols = max_symbols
+        self._bars: "OrderedDict[int, Dict[str, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_bars(self, db: Session, stock_id: int) -> Dict[str, np.ndarray]:
+        with self._lock:
+            bars = self._bars.get(stock_id)
+            if bars is not None:
+                self._bars.move_to_end(stock_id)
+                return bars
+
+        bars = load_daily_bars(db, stock_id)
+        # 아직 저장된 시세가 없는 종목은 보관하지 않음 (나중에 저장되면 다시 읽음)
+        if len(bars["dates"]):
+            with self._lock:
+                self._bars[stock_id] = bars
+                if len(self._bars) > self.max_symbols:
+                    self._bars.popitem(last=False)
+        return bars
+
+    def quote(self, db: Session, stock_id: int, as_of: date) -> Optional[dict]:
+        """
+        as_of 날짜 이전(포함) 마지막 거래일의 시세
+
+        Returns:
+            Optional[dict]: date, open, high, low, close, volume (해당 날짜 이전 시세가 없으면 None)
+        """
+        bars = self.get_bars(db, stock_id)
+        index = int(np.searchsorted(bars["dates"], np.datetime64(as_of, "D"), side="right")) - 1
+        if index < 0:
+            return None
+
+        return {
+            "date": bars["dates"][index].astype(date),
+            "open": float(bars["open"][index]),
+            "high": float(bars["high"][index]),
+            "low": float(bars["low"][index]),
+            "close": float(bars["close"][index]),
+            "volume": int(bars["volume"][index])
+        }
+
+
+# 프로세스 전역 시세 저장소
+HISTORY_STORE = HistoryStore()
+
+
+def replay_timestamp(replay_date: date) -> datetime:
+    """가상 날짜의 거래 시각 (해당 날짜 장 마감 기준으로 기록)"""
+    return datetime.combine(replay_date, time(21, 0), tzinfo=timezone.utc)
+
+
+async def preload_replay_history(db: Session, symbols: List[str]):
+    """
+    과거 재현 계좌 생성 시 거래할 종목의 일별 시세를 저장합니다.
+
+    과거 재현 계좌의 체결/시세 조회는 저장된 stock_prices만 읽으므로
+    외부 API 호출은 계좌 생성 시 이 함수에서만 일어납니다.
+
+    Raises:
+        HTTPException: 등록되지 않은 심볼이거나 시세를 가져오지 못한 경우
+    """
+    for symbol in symbols:
+        await ensure_daily_history(db, symbol)
+
+
+def price_replay_order(db: Session, account: SimulationAccount, stock: Stock, side: str, quantity: int):
+    """
+    과거 재현 계좌의 시장가 주문을 가상 날짜의 일봉 종가로 체결합니다.
+
+    저장된 일별 시세만 사용하며 외부 API는 호출하지 않습니다.
+    슬리피지/수수료 모델은 실시간 계좌와 같게 적용됩니다.
+
+    Returns:
+        tuple: (체결가, 수수료)
+
+    Raises:
+        HTTPException: 가상 날짜 이전의 저장된 시세가 없는 경우 (409)
+    """
+    bar = HISTORY_STORE.quote(db, stock.id, account.replay_date)
+    if bar is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"{account.replay_date} 이전의 {stock.symbol} 시세가 저장되어 있지 않아 주문을 체결할 수 없습니다. "
+                   f"계좌 생성 시 replay_symbols에 종목을 지정하세요."
+        )
+    return price_fill(side, quantity, Decimal(str(bar["close"])))
+
+
+def next_replay_date(current: date, days: int) -> date:
+    """가상 날짜를 영업일(월~금) 기준으로 days만큼 이동 (오늘 이후로는 이동하지 않음)"""
+    moved = np.busday_offset(np.datetime64(current, "D"), days, roll="forward").astype(date)
+    return min(moved, datetime.now(timezone.utc).date())
+
+
+def advance_replay_date(db: Session, account_id: int, days: int = 1) -> date:
+    """
+    계좌의 가상 날짜를 앞으로 이동합니다.
+
+    UPDATE 한 번으로 처리되어 같은 계좌의 거래(행 잠금)와 순서가 보장됩니다.
+
+    Returns:
+        date: 이동 후 가상 날짜
+
+    Raises:
+        HTTPException: 계좌가 없거나 과거 재현 계좌가 아닌 경우
+    """
+    account = db.query(SimulationAccount).filter(SimulationAccount.id == account_id).first()
+    if not account or account.mode != REPLAY:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="과거 재현 모의 투자 계좌를 찾을 수 없습니다."
+        )
+
+    new_date = next_replay_date(account.replay_date, days)
+    db.query(SimulationAccount).filter(
+        SimulationAccount.id == account_id
+    ).update({"replay_date": new_date}, synchronize_session=False)
+    db.commit()
+    return new_date
+
+
+def _advance_in_new_session(account_id: int, days: int) -> date:
+    db = SessionLocal()
+    try:
+        return advance_replay_date(db, account_id, days)
+    finally:
+        db.close()
+
+
+class ReplayClocks:
+    """
+    과거 재현 계좌별 가상 시계
+
+    계좌마다 asyncio 태스크 하나가 interval초마다 가상 날짜를 하루(영업일)씩
+    진행합니다. 태스크는 대부분 sleep 상태이고 DB 갱신만 스레드풀에서 실행하므로
+    한 워커에서 많은 계좌가 서로를 막지 않고 동시에 진행됩니다.
+    시계는 이를 시작한 워커의 메모리에만 있습니다.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def is_running(self, account_id: int) -> bool:
+        task = self._tasks.get(account_id)
+        return task is not None and not task.done()
+
+    def start(self, account_id: int, interval: float, until: Optional[date] = None):
+        """가상 시계 시작 (이벤트 루프에서 호출, 이미 실행 중이면 새 설정으로 다시 시작)"""
+        self.stop(account_id)
+
+        async def run():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    current = await run_in_threadpool(_advance_in_new_session, account_id, 1)
+                except HTTPException:
+                    # 계좌가 삭제된 경우
+                    return
+                if current >= (until or datetime.now(timezone.utc).date()):
+                    return
+
+        self._loop = asyncio.get_running_loop()
+        task = self._loop.create_task(run(), name=f"replay_clock_{account_id}")
+        self._tasks[account_id] = task
+
+        def forget(_):
+            if self._tasks.get(account_id) is task:
+                del self._tasks[account_id]
+
+        task.add_done_callback(forget)
+
+    def stop(self, account_id: int) -> bool:
+        """가상 시계 정지 (스레드풀에서도 호출 가능, 실행 중이었으면 True)"""
+        task = self._tasks.pop(account_id, None)
+        if task is None or task.done():
+            return False
+        self._loop.call_soon_threadsafe(task.cancel)
+        return True
+
+    async def stop_all(self):
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# 프로세스 전역 가상 시계
+REPLAY_CLOCKS = ReplayClocks()
@@ -0,0 +1,283 @@
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, delete, func
+from sqlalchemy.orm import Session
+
+from app.db.models import SimulationAccount, SimulationAccountChange, SimulationTransaction
+
+logger = logging.getLogger(__name__)
+
+# 계좌 잔액/보유 종목이 바뀐 뒤(커밋 후) 호출할 리스너 목록 (db, account_id) -> None
+ACCOUNT_LISTENERS = []
+
+
+def register_account_listener(listener):
+    """
+    모의 투자 계좌의 거래가 커밋되거나 계좌가 생성/삭제될 때 호출될 리스너를 등록합니다.
+
+    리스너는 거래를 실행한 스레드에서 같은 세션으로 호출됩니다.
+
+    Args:
+        listener: (db: Session, account_id: int)를 인자로 받는 함수
+    """
+    ACCOUNT_LISTENERS.append(listener)
+
+
+def notify_account_changed(db: Session, account_id: int):
+    """등록된 리스너에 계좌 변경 전달 (리스너 오류는 거래 결과에 영향을 주지 않음)"""
+    for listener in ACCOUNT_LISTENERS:
+        try:
+            listener(db, account_id)
+        except Exception:
+            logger.exception("계좌 리스너 오류 (account %s)", account_id)
+
+
+def record_account_change(db: Session, account_id: int):
+    """
+    계좌 변경을 simulation_account_changes에 기록합니다 (커밋하지 않음).
+
+    변경과 같은 트랜잭션에서 호출하므로 커밋된 변경만 기록되고, 다른 워커는
+    이 기록으로 자기가 처리하지 않은 계좌 변경을 알 수 있습니다.
+    """
+    db.add(SimulationAccountChange(account_id=account_id))
+
+
+def prune_account_changes(db: Session, older_than: int) -> int:
+    """
+    older_than초보다 오래된 계좌 변경 기록 삭제
+
+    Returns:
+        int: 삭제된 행 수
+    """
+    result = db.execute(
+        delete(SimulationAccountChange).where(
+            SimulationAccountChange.changed_at < func.now() - timedelta(seconds=older_than)
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+def get_position_quantity(db: Session, account_id: int, stock_id: int) -> int:
+    """
+    계좌의 특정 주식 보유 수량을 집계 쿼리 한 번으로 계산합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        account_id (int): 모의 투자 계좌 ID
+        stock_id (int): 주식 ID
+
+    Returns:
+        int: 현재 보유 수량
+    """
+    signed_quantity = case(
+        (SimulationTransaction.transaction_type == "BUY", SimulationTransaction.quantity),
+        else_=-SimulationTransaction.quantity
+    )
+    quantity = db.query(func.coalesce(func.sum(signed_quantity), 0)).filter(
+        SimulationTransaction.account_id == account_id,
+        SimulationTransaction.stock_id == stock_id
+    ).scalar()
+    return int(quantity)
+
+
+def lock_account(db: Session, account_id: int) -> SimulationAccount:
+    """
+    계좌 행을 SELECT ... FOR UPDATE로 잠그고 최신 상태로 가져옵니다.
+
+    같은 계좌에 대한 모든 거래는 이 잠금을 거치므로 잔액 확인과 보유 수량
+    확인이 트랜잭션이 끝날 때까지 다른 거래와 겹치지 않습니다.
+
+    Raises:
+        HTTPException: 계좌가 없는 경우
+    """
+    account = db.query(SimulationAccount).filter(
+        SimulationAccount.id == account_id
+    ).populate_existing().with_for_update().first()
+
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="모의 투자 계좌를 찾을 수 없습니다."
+        )
+    return account
+
+
+def apply_trade(
+    db: Session,
+    account: SimulationAccount,
+    stock_id: int,
+    transaction_type: str,
+    quantity: int,
+    price: Decimal,
+    commission: Decimal = Decimal("0"),
+    transaction_date: Optional[datetime] = None
+) -> SimulationTransaction:
+    """
+    잠긴 계좌에 거래 하나를 반영하고 계좌 변경을 기록합니다 (커밋하지 않음).
+
+    total_amount는 현금 변동액입니다. 매수는 거래 금액에 수수료를 더하고,
+    매도는 거래 금액에서 수수료를 뺍니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        account (SimulationAccount): lock_account로 잠근 계좌
+        stock_id (int): 주식 ID
+        transaction_type (str): "BUY" 또는 "SELL"
+        quantity (int): 거래 수량
+        price (Decimal): 체결 가격
+        commission (Decimal): 거래 수수료
+        transaction_date (Optional[datetime]): 거래 시각 (생략 시 DB 현재 시각, 과거 재현 계좌는 가상 날짜)
+
+    Returns:
+        SimulationTransaction: 세션에 추가된 거래 내역
+
+    Raises:
+        HTTPException: 잔액 또는 보유 수량이 부족한 경우
+    """
+    # 총 거래 금액 계산 (수수료 반영)
+    gross_amount = Decimal(str(quantity)) * Decimal(str(price))
+    total_amount = gross_amount + commission if transaction_type == "BUY" else gross_amount - commission
+
+    # 매수 거래인 경우 잔액 확인
+    if transaction_type == "BUY":
+        if account.current_balance < total_amount:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"잔액이 부족합니다. 현재 잔액: ${float(account.current_balance)}, 필요 금액: ${float(total_amount)}"
+            )
+
+        # 잔액 감소
+        account.current_balance -= total_amount
+
+    # 매도 거래인 경우 보유 수량 확인
+    elif transaction_type == "SELL":
+        current_quantity = get_position_quantity(db, account.id, stock_id)
+
+        # 판매하려는 수량이 보유 수량보다 많으면 에러
+        if quantity > current_quantity:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"보유한 수량({current_quantity}주)보다 많은 수량({quantity}주)을 판매할 수 없습니다."
+            )
+
+        # 잔액 증가
+        account.current_balance += total_amount
+
+    db_transaction = SimulationTransaction(
+        account_id=account.id,
+        stock_id=stock_id,
+        transaction_type=transaction_type,
+        quantity=quantity,
+        price=price,
+        commission=commission,
+        total_amount=total_amount
+    )
+    if transaction_date is not None:
+        db_transaction.transaction_date = transaction_date
+    db.add(db_transaction)
+    record_account_change(db, account.id)
+    # 같은 트랜잭션 안의 다음 거래가 보유 수량 집계에 포함하도록 flush
+    db.flush()
+
+    return db_transaction
+
+
+def execute_simulation_trade(
+    db: Session,
+    account_id: int,
+    stock_id: int,
+    transaction_type: str,
+    quantity: int,
+    price: Decimal,
+    commission: Decimal = Decimal("0"),
+    transaction_date: Optional[datetime] = None
+) -> SimulationTransaction:
+    """
+    모의 투자 거래를 원자적으로 실행합니다.
+
+    계좌 행 잠금 -> 잔액/보유 수량 검증 -> 잔액 갱신 및 거래 내역 저장 -> 커밋
+    순서로 하나의 DB 트랜잭션에서 처리하므로, 동시에 들어온 매수가 잔액을 초과
+    사용하거나 같은 주식을 두 번 매도할 수 없습니다. 실패 시 롤백되어 잠금이
+    해제됩니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        account_id (int): 모의 투자 계좌 ID
+        stock_id (int): 주식 ID
+        transaction_type (str): "BUY" 또는 "SELL"
+        quantity (int): 거래 수량
+        price (Decimal): 체결 가격
+        commission (Decimal): 거래 수수료
+        transaction_date (Optional[datetime]): 거래 시각 (생략 시 DB 현재 시각)
+
+    Returns:
+        SimulationTransaction: 저장된 거래 내역
+
+    Raises:
+        HTTPException: 계좌가 없거나 잔액/보유 수량이 부족한 경우
+    """
+    try:
+        account = lock_account(db, account_id)
+        db_transaction = apply_trade(
+            db, account, stock_id, transaction_type, quantity, price, commission, transaction_date
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    db.refresh(db_transaction)
+    notify_account_changed(db, account_id)
+    return db_transaction
+
+
+def execute_basket(
+    db: Session,
+    account_id: int,
+    legs: List[Tuple[int, str, int, Decimal, Decimal]],
+    transaction_date: Optional[datetime] = None
+) -> List[SimulationTransaction]:
+    """
+    여러 종목의 주문을 하나의 DB 트랜잭션으로 실행합니다.
+
+    계좌를 한 번만 잠그고 주문을 입력 순서대로 반영합니다. 하나라도 실패하면
+    전체가 롤백되며, 오류 메시지에 실패한 주문의 순번이 포함됩니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        account_id (int): 모의 투자 계좌 ID
+        legs: (stock_id, transaction_type, quantity, price, commission) 목록
+        transaction_date (Optional[datetime]): 거래 시각 (생략 시 DB 현재 시각)
+
+    Returns:
+        List[SimulationTransaction]: 저장된 거래 내역 목록
+
+    Raises:
+        HTTPException: 계좌가 없거나 어느 주문이든 잔액/보유 수량이 부족한 경우
+    """
+    transactions = []
+    try:
+        account = lock_account(db, account_id)
+
+        for index, (stock_id, transaction_type, quantity, price, commission) in enumerate(legs):
+            try:
+                transactions.append(
+                    apply_trade(db, account, stock_id, transaction_type, quantity, price, commission, transaction_date)
+                )
+            except HTTPException as e:
+                raise HTTPException(status_code=e.status_code, detail=f"{index + 1}번째 주문 실패: {e.detail}")
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    for db_transaction in transactions:
+        db.refresh(db_transaction)
+    notify_account_changed(db, account_id)
+    return transactions
@@ -1,18 +1,51 @@
+import logging
 import httpx
 import asyncio
 from fastapi import HTTPException
 from datetime import datetime, timedelta
-from app.config import STOCK_API_KEY
+from app.config import ALPHA_VANTAGE_BASE_URL, STOCK_API_KEY
+from app.core.metrics import CacheMetrics, UpstreamMetrics
 from app.db.models import Stock
 from sqlalchemy.orm import Session
 
-# Alpha Vantage API 기본 URL
-ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
+logger = logging.getLogger(__name__)
 
 # 캐시 설정 (메모리 캐시 - 실제 프로덕션에서는 Redis 등 사용 권장)
 CACHE = {}
 CACHE_TTL = 60  # 캐시 유효 시간(초)
 
+# 캐시/외부 API 지표 (요청마다 라벨을 만들지 않도록 미리 생성)
+QUOTE_CACHE_METRICS = CacheMetrics("stock_quote")
+SEARCH_CACHE_METRICS = CacheMetrics("stock_search")
+HISTORY_CACHE_METRICS = CacheMetrics("stock_history")
+UPSTREAM_METRICS = {
+    function: UpstreamMetrics("alpha_vantage", function)
+    for function in ("GLOBAL_QUOTE", "SYMBOL_SEARCH", "TIME_SERIES_DAILY", "TIME_SERIES_WEEKLY", "TIME_SERIES_MONTHLY")
+}
+
+# 새 시세 수신 시 호출할 리스너 목록 (symbol, price) -> None
+QUOTE_LISTENERS = []
+
+def register_quote_listener(listener):
+    """
+    새 시세(틱)를 받을 때마다 호출될 리스너를 등록합니다.
+    
+    리스너는 이벤트 루프 안에서 동기적으로 호출되므로 빠르게 반환해야 하며,
+    DB 작업 등 오래 걸리는 일은 별도 태스크로 넘겨야 합니다.
+    
+    Args:
+        listener: (symbol: str, price: float)를 인자로 받는 함수
+    """
+    QUOTE_LISTENERS.append(listener)
+
+def _publish_quote(symbol: str, price: float):
+    """등록된 리스너에 새 시세 전달 (리스너 오류는 시세 조회에 영향을 주지 않음)"""
+    for listener in QUOTE_LISTENERS:
+        try:
+            listener(symbol, price)
+        except Exception:
+            logger.exception("시세 리스너 오류 (%s)", symbol)
+
 async def get_stock_quote(symbol: str):
     """
     특정 주식의 실시간 시세 데이터를 가져옵니다.
@@ -34,7 +67,9 @@ async def get_stock_quote(symbol: str):
         cache_time, cache_data = CACHE[cache_key]
         # 캐시가 유효하면 캐시된 데이터 반환
         if now - cache_time < timedelta(seconds=CACHE_TTL):
+            QUOTE_CACHE_METRICS.hit()
             return cache_data
+    QUOTE_CACHE_METRICS.miss()
     
     try:
         # API 요청 매개변수
@@ -45,11 +80,11 @@ async def get_stock_quote(symbol: str):
         }
         
         # 비동기 HTTP 클라이언트로 API 요청
-        async with httpx.AsyncClient() as client:
-            response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
-            response.raise_for_status()  # HTTP 오류 확인
-            data = response.json()
-        print(data)
+        with UPSTREAM_METRICS["GLOBAL_QUOTE"].track():
+            async with httpx.AsyncClient() as client:
+                response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
+                response.raise_for_status()  # HTTP 오류 확인
+                data = response.json()
         # API 응답 확인
         if "Global Quote" not in data or not data["Global Quote"]:
             raise HTTPException(status_code=404, detail=f"주식 {symbol}에 대한 데이터를 찾을 수 없습니다.")
@@ -70,6 +105,9 @@ async def get_stock_quote(symbol: str):
         # 결과 캐싱
         CACHE[cache_key] = (now, result)
         
+        # 새 시세를 리스너(주문 매칭 엔진 등)에 전달
+        _publish_quote(symbol, result["price"])
+        
         return result
         
     except httpx.HTTPError as e:
@@ -79,6 +117,26 @@ async def get_stock_quote(symbol: str):
         # 데이터 파싱 오류 처리
         raise HTTPException(status_code=500, detail=f"데이터 파싱 오류: {str(e)}")
 
+def get_cached_quote(symbol: str, max_age: int):
+    """
+    메모리 캐시에 있는 최근 시세를 외부 API 호출 없이 반환합니다.
+    
+    Args:
+        symbol (str): 주식 심볼
+        max_age (int): 허용할 최대 캐시 경과 시간(초)
+        
+    Returns:
+        dict 또는 None: 캐시된 시세 데이터 (없거나 오래된 경우 None)
+    """
+    cached = CACHE.get(f"quote_{symbol}")
+    if not cached:
+        return None
+    
+    cache_time, cache_data = cached
+    if datetime.now() - cache_time > timedelta(seconds=max_age):
+        return None
+    return cache_data
+
 async def search_stocks(query: str):
     """
     주식 심볼 또는 회사명으로 주식 검색
@@ -96,7 +154,9 @@ async def search_stocks(query: str):
     if cache_key in CACHE:
         cache_time, cache_data = CACHE[cache_key]
         if now - cache_time < timedelta(seconds=CACHE_TTL):
+            SEARCH_CACHE_METRICS.hit()
             return cache_data
+    SEARCH_CACHE_METRICS.miss()
     
     try:
         # API 요청 매개변수
@@ -107,10 +167,11 @@ async def search_stocks(query: str):
         }
         
         # API 요청
-        async with httpx.AsyncClient() as client:
-            response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
+        with UPSTREAM_METRICS["SYMBOL_SEARCH"].track():
+            async with httpx.AsyncClient() as client:
+                response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
+                response.raise_for_status()
+                data = response.json()
         
         # 결과 확인
         if "bestMatches" not in data:
@@ -137,25 +198,28 @@ async def search_stocks(query: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"검색 중 오류 발생: {str(e)}")
 
-async def get_historical_data(symbol: str, interval: str = "daily"):
+async def get_historical_data(symbol: str, interval: str = "daily", outputsize: str = "compact"):
     """
     특정 주식의 과거 데이터를 가져옵니다.
     
     Args:
         symbol (str): 주식 심볼
         interval (str): 데이터 간격 ('daily', 'weekly', 'monthly')
+        outputsize (str): 'compact' (최근 100개) 또는 'full' (전체 기간)
         
     Returns:
         dict: 과거 주가 데이터
     """
     # 캐시 확인
-    cache_key = f"history_{symbol}_{interval}"
+    cache_key = f"history_{symbol}_{interval}_{outputsize}"
     now = datetime.now()
     
     if cache_key in CACHE:
         cache_time, cache_data = CACHE[cache_key]
         if now - cache_time < timedelta(seconds=CACHE_TTL):
+            HISTORY_CACHE_METRICS.hit()
             return cache_data
+    HISTORY_CACHE_METRICS.miss()
     
     # API 함수 매핑
     function_map = {
@@ -173,14 +237,15 @@ async def get_historical_data(symbol: str, interval: str = "daily"):
             "function": function_map[interval],
             "symbol": symbol,
             "apikey": STOCK_API_KEY,
-            "outputsize": "compact"  # 최근 100개 데이터만
+            "outputsize": outputsize  # compact: 최근 100개 데이터만
         }
         
         # API 요청
-        async with httpx.AsyncClient() as client:
-            response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
+        with UPSTREAM_METRICS[function_map[interval]].track():
+            async with httpx.AsyncClient() as client:
+                response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
+                response.raise_for_status()
+                data = response.json()
         
         # 응답 확인
         time_series_key = f"Time Series ({interval.capitalize()})"
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from sqlalchemy import case, func, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
+from sqlalchemy.orm import Session
+
+from app.core.metrics import CacheMetrics
+from app.db.models import SimulationAccount, SimulationTransaction, Stock
+
+# 계좌별 거래 통계 캐시 (다음 거래 시 무효화, 다른 워커의 거래에 대비해 TTL도 적용)
+TRADE_STATS_CACHE = {}
+TRADE_STATS_CACHE_TTL = 300  # 캐시 유효 시간(초)
+TRADE_STATS_CACHE_METRICS = CacheMetrics("trade_stats")
+
+
+def _stats_query(account_id: int):
+    """
+    거래 통계를 계산하는 단일 SELECT 문
+
+    1. ledger  : 종목별 누적 보유 수량 (SUM ... OVER, CTE로 한 번만 계산)
+    2. marked  : 보유 수량 0에서 시작하는 거래마다 증가하는 라운드트립 번호 (SUM ... OVER)
+    3. episodes: 라운드트립(진입 ~ 전량 청산)별 매수 원가, 매도 금액, 보유 기간
+    4. 최종 집계: 청산된 라운드트립 기준 승률, 평균 이익/손실, 최대 이익/손실 종목
+    """
+    t = SimulationTransaction
+    signed_quantity = case((t.transaction_type == "BUY", t.quantity), else_=-t.quantity)
+
+    ledger = select(
+        t.id,
+        Stock.symbol,
+        t.transaction_type,
+        t.quantity,
+        t.price,
+        t.total_amount,
+        t.transaction_date,
+        signed_quantity.label("signed_quantity"),
+        func.sum(signed_quantity).over(
+            partition_by=t.stock_id,
+            order_by=(t.transaction_date, t.id)
+        ).label("position")
+    ).join(
+        Stock, Stock.id == t.stock_id
+    ).where(t.account_id == account_id).cte("ledger")
+
+    opens_episode = case((ledger.c.position - ledger.c.signed_quantity == 0, 1), else_=0)
+    marked = select(
+        ledger,
+        func.sum(opens_episode).over(
+            partition_by=ledger.c.symbol,
+            order_by=(ledger.c.transaction_date, ledger.c.id)
+        ).label("episode")
+    ).subquery("marked")
+
+    is_buy = marked.c.transaction_type == "BUY"
+    episodes = select(
+        marked.c.symbol,
+        func.min(marked.c.transaction_date).label("opened_at"),
+        func.max(case((marked.c.position == 0, marked.c.transaction_date))).label("closed_at"),
+        (
+            func.sum(case((is_buy, 0), else_=marked.c.total_amount))
+            - func.sum(case((is_buy, marked.c.total_amount), else_=0))
+        ).label("pnl")
+    ).group_by(marked.c.symbol, marked.c.episode).subquery("episodes")
+
+    closed = episodes.c.closed_at.isnot(None)
+    pnl = episodes.c.pnl
+    holding_days = func.extract("epoch", episodes.c.closed_at - episodes.c.opened_at) / 86400
+
+    # 거래 횟수/거래 대금은 ledger 전체에서, 라운드트립 통계는 episodes에서 계산해 한 행으로 결합
+    trade_totals = select(
+        func.count().label("trades"),
+        func.coalesce(func.sum(ledger.c.quantity * ledger.c.price), 0).label("traded_value")
+    ).subquery("totals")
+
+    return select(
+        trade_totals.c.trades,
+        trade_totals.c.traded_value,
+        select(SimulationAccount.initial_balance).where(SimulationAccount.id == account_id).scalar_subquery().label("initial_balance"),
+        func.count().filter(closed).label("round_trips"),
+        func.count().filter(closed & (pnl > 0)).label("wins"),
+        func.count().filter(closed & (pnl < 0)).label("losses"),
+        func.avg(holding_days).filter(closed).label("avg_holding_days"),
+        func.avg(pnl).filter(closed & (pnl > 0)).label("avg_gain"),
+        func.avg(pnl).filter(closed & (pnl < 0)).label("avg_loss"),
+        func.sum(pnl).filter(closed).label("realized_pnl"),
+        func.max(pnl).filter(closed).label("largest_win"),
+        func.min(pnl).filter(closed).label("largest_loss"),
+        array_agg(aggregate_order_by(episodes.c.symbol, pnl.desc())).filter(closed)[1].label("largest_win_symbol"),
+        array_agg(aggregate_order_by(episodes.c.symbol, pnl.asc())).filter(closed)[1].label("largest_loss_symbol")
+    ).select_from(trade_totals).outerjoin(episodes, true()).group_by(
+        trade_totals.c.trades, trade_totals.c.traded_value
+    )
+
+
+def _as_float(value):
+    return float(value) if value is not None else None
+
+
+def compute_trade_stats(db: Session, account_id: int) -> Dict[str, Any]:
+    """
+    모의 투자 계좌의 거래 통계를 DB에서 한 번의 쿼리로 계산합니다.
+
+    라운드트립은 종목 보유 수량이 0에서 시작해 다시 0이 될 때까지의 거래 묶음이며,
+    손익은 매도 금액 합 - 매수 원가 합(수수료 포함)입니다. 승률, 보유 기간, 평균
+    이익/손실은 청산된 라운드트립만으로 계산합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        account_id (int): 모의 투자 계좌 ID
+
+    Returns:
+        dict: 거래 통계
+    """
+    row = db.execute(_stats_query(account_id)).one()
+
+    initial_balance = float(row.initial_balance or 0)
+    traded_value = float(row.traded_value)
+    round_trips = row.round_trips
+
+    return {
+        "account_id": account_id,
+        "trades": row.trades,
+        "round_trips": round_trips,
+        "wins": row.wins,
+        "losses": row.losses,
+        "win_rate": row.wins / round_trips * 100 if round_trips else 0.0,
+        "avg_holding_days": _as_float(row.avg_holding_days),
+        "avg_gain": _as_float(row.avg_gain),
+        "avg_loss": _as_float(row.avg_loss),
+        "realized_pnl": _as_float(row.realized_pnl) or 0.0,
+        "traded_value": traded_value,
+        "turnover": traded_value / initial_balance if initial_balance > 0 else 0.0,
+        "largest_win": _as_float(row.largest_win),
+        "largest_win_symbol": row.largest_win_symbol,
+        "largest_loss": _as_float(row.largest_loss),
+        "largest_loss_symbol": row.largest_loss_symbol
+    }
+
+
+def get_trade_stats(db: Session, account_id: int) -> Dict[str, Any]:
+    """캐시된 거래 통계를 반환하고, 없거나 만료되었으면 다시 계산"""
+    now = datetime.now()
+    cached = TRADE_STATS_CACHE.get(account_id)
+    if cached and now - cached[0] < timedelta(seconds=TRADE_STATS_CACHE_TTL):
+        TRADE_STATS_CACHE_METRICS.hit()
+        return cached[1]
+    TRADE_STATS_CACHE_METRICS.miss()
+
+    stats = compute_trade_stats(db, account_id)
+    TRADE_STATS_CACHE[account_id] = (now, stats)
+    return stats
+
+
+def invalidate_trade_stats(db: Session, account_id: int):
+    """simulation_trading 계좌 리스너: 거래가 커밋된 계좌의 통계 캐시 제거"""
+    TRADE_STATS_CACHE.pop(account_id, None)
@@ -0,0 +1,308 @@
+import csv
+import io
+from bisect import bisect_right
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, insert
+from sqlalchemy.orm import Session
+
+from app.db.models import Stock, Transaction
+
+# 한 번의 multi-row INSERT로 저장할 최대 행 수
+IMPORT_BATCH_SIZE = 1000
+
+# transactions 컬럼 범위 (quantity: Integer, price: Numeric(10, 2))
+MAX_QUANTITY = 2 ** 31 - 1
+MAX_PRICE = Decimal("99999999.99")
+
+# 증권사 거래 내역서마다 다른 컬럼명을 표준 필드명으로 매핑
+COLUMN_ALIASES = {
+    "symbol": ("symbol", "ticker", "code"),
+    "transaction_type": ("transaction_type", "type", "side", "action"),
+    "quantity": ("quantity", "qty", "shares"),
+    "price": ("price", "unit_price"),
+    "transaction_date": ("transaction_date", "date", "trade_date"),
+}
+
+REQUIRED_COLUMNS = ("symbol", "transaction_type", "quantity", "price")
+
+
+class ImportFormatError(ValueError):
+    """CSV 헤더가 올바르지 않아 가져오기를 시작할 수 없는 경우"""
+
+
+def _resolve_columns(header: List[str]) -> Dict[str, int]:
+    """
+    CSV 헤더에서 표준 필드별 컬럼 위치를 찾습니다.
+
+    Args:
+        header (List[str]): CSV 첫 행
+
+    Returns:
+        Dict[str, int]: 표준 필드명 -> 컬럼 인덱스
+
+    Raises:
+        ImportFormatError: 필수 컬럼이 없는 경우
+    """
+    normalized = [h.strip().lower() for h in header]
+    columns = {}
+
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in normalized:
+                columns[field] = normalized.index(alias)
+                break
+
+    missing = [field for field in REQUIRED_COLUMNS if field not in columns]
+    if missing:
+        raise ImportFormatError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+    return columns
+
+
+def _cell(row: List[str], columns: Dict[str, int], field: str) -> str:
+    index = columns.get(field)
+    if index is None or index >= len(row):
+        return ""
+    return row[index].strip()
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """ISO 형식(YYYY-MM-DD 또는 YYYY-MM-DDTHH:MM:SS) 날짜 파싱"""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class PositionTimeline:
+    """
+    포트폴리오에 이미 저장된 한 종목 거래의 시점별 보유 수량
+
+    거래일 순 누적 수량과 각 시점 이후의 최솟값을 보관해, 어떤 날짜의 매도가
+    그 날짜 이후 어느 시점의 보유 수량도 음수로 만들지 않는지 O(log n)으로 확인합니다.
+    """
+
+    def __init__(self):
+        self.dates: List[datetime] = []
+        self.positions: List[int] = []
+        self.later_min: List[int] = []
+
+    def append(self, transaction_date: datetime, signed_quantity: int):
+        """거래일 순으로 기존 거래 추가"""
+        previous = self.positions[-1] if self.positions else 0
+        self.dates.append(transaction_date)
+        self.positions.append(previous + signed_quantity)
+
+    def finish(self):
+        """모든 거래를 추가한 뒤 시점별 이후 최솟값 계산"""
+        self.later_min = list(self.positions)
+        for index in range(len(self.later_min) - 2, -1, -1):
+            self.later_min[index] = min(self.later_min[index], self.later_min[index + 1])
+
+    def sellable(self, transaction_date: datetime) -> int:
+        """기존 거래만 기준으로 transaction_date에 팔 수 있는 최대 수량 (같은 시각의 기존 거래는 먼저 반영)"""
+        index = bisect_right(self.dates, transaction_date)
+        available = self.positions[index - 1] if index else 0
+        if index < len(self.dates):
+            available = min(available, self.later_min[index])
+        return available
+
+
+def _load_timelines(db: Session, portfolio_id: int, stock_ids: Iterable[int]) -> Dict[int, PositionTimeline]:
+    """파일에 나온 종목의 기존 거래를 거래일 순으로 읽어 종목별 PositionTimeline 생성"""
+    timelines: Dict[int, PositionTimeline] = {}
+    stock_ids = list(stock_ids)
+    if not stock_ids:
+        return timelines
+
+    signed_quantity = case(
+        (Transaction.transaction_type == "BUY", Transaction.quantity),
+        else_=-Transaction.quantity
+    )
+    rows = db.query(Transaction.stock_id, Transaction.transaction_date, signed_quantity).filter(
+        Transaction.portfolio_id == portfolio_id,
+        Transaction.stock_id.in_(stock_ids)
+    ).order_by(Transaction.stock_id, Transaction.transaction_date, Transaction.id).yield_per(IMPORT_BATCH_SIZE)
+
+    for stock_id, transaction_date, quantity in rows:
+        timelines.setdefault(stock_id, PositionTimeline()).append(transaction_date, quantity)
+    for timeline in timelines.values():
+        timeline.finish()
+    return timelines
+
+
+def import_transactions_csv(db: Session, portfolio_id: int, upload: BinaryIO, dry_run: bool = False):
+    """
+    증권사 CSV 거래 내역을 포트폴리오에 일괄 등록합니다.
+
+    업로드 파일을 두 번 순차적으로 읽습니다. 첫 번째 읽기에서는 심볼만 모아
+    한 번의 쿼리로 주식 ID를 조회하고, 두 번째 읽기에서 행 단위로 검증하며
+    IMPORT_BATCH_SIZE 단위의 multi-row INSERT로 하나의 트랜잭션 안에서 저장합니다.
+    파일 전체를 메모리에 올리지 않으므로 사용 메모리는 파일 크기와 무관합니다
+    (기존 거래 내역과 오류 목록에 비례).
+
+    파일은 거래일 오름차순이어야 하며 (같은 날짜는 파일 순서), 이전 행보다 빠른
+    날짜의 행은 오류로 처리합니다. 매도는 그 행의 거래일 기준 보유 수량으로
+    확인합니다. 기존 거래 중 그보다 늦은 거래가 있으면 이후 모든 시점의 보유
+    수량이 음수가 되지 않아야 합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        portfolio_id (int): 거래 내역을 등록할 포트폴리오 ID
+        upload (BinaryIO): 업로드된 CSV 파일 (seek 가능해야 함)
+        dry_run (bool): True이면 검증만 하고 저장하지 않음
+
+    Returns:
+        dict: 전체 행 수, 등록된 행 수, 행별 오류 목록
+
+    Raises:
+        ImportFormatError: CSV 헤더나 인코딩이 올바르지 않은 경우
+    """
+    text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+
+    try:
+        # 1차 읽기: 심볼 수집
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if not header:
+            raise ImportFormatError("빈 CSV 파일입니다.")
+        columns = _resolve_columns(header)
+
+        symbols = set()
+        for row in reader:
+            symbol = _cell(row, columns, "symbol").upper()
+            if symbol:
+                symbols.add(symbol)
+
+        # 모든 심볼을 한 번의 쿼리로 조회
+        stock_ids = {}
+        if symbols:
+            stock_ids = dict(
+                db.query(Stock.symbol, Stock.id).filter(Stock.symbol.in_(symbols)).all()
+            )
+
+        # 기존 거래의 시점별 보유 수량과, 이번 파일에서 등록한 종목별 순매수 수량
+        timelines = _load_timelines(db, portfolio_id, stock_ids.values())
+        imported_quantity: Dict[int, int] = {}
+
+        # 2차 읽기: 행 단위 검증 및 배치 저장
+        text.seek(0)
+        reader = csv.reader(text)
+        next(reader)
+
+        errors = []
+        batch = []
+        imported = 0
+        total_rows = 0
+        default_date = datetime.now(timezone.utc)
+        last_date = None
+
+        for line_number, row in enumerate(reader, start=2):
+            if not any(cell.strip() for cell in row):
+                continue
+            total_rows += 1
+
+            symbol = _cell(row, columns, "symbol").upper()
+            transaction_type = _cell(row, columns, "transaction_type").upper()
+
+            try:
+                quantity = int(_cell(row, columns, "quantity"))
+                price = Decimal(_cell(row, columns, "price"))
+                transaction_date = _parse_date(_cell(row, columns, "transaction_date")) or default_date
+            except (ValueError, InvalidOperation):
+                errors.append({"row": line_number, "symbol": symbol, "message": "수량, 가격 또는 날짜 형식이 올바르지 않습니다."})
+                continue
+
+            if transaction_type not in ("BUY", "SELL"):
+                errors.append({"row": line_number, "symbol": symbol, "message": '거래 유형은 "BUY" 또는 "SELL"이어야 합니다.'})
+                continue
+
+            # NaN/Infinity는 비교 연산에서 예외가 나므로 먼저 거름
+            if not price.is_finite():
+                errors.append({"row": line_number, "symbol": symbol, "message": "가격 형식이 올바르지 않습니다."})
+                continue
+
+            if quantity <= 0 or price <= 0:
+                errors.append({"row": line_number, "symbol": symbol, "message": "수량과 가격은 0보다 커야 합니다."})
+                continue
+
+            if quantity > MAX_QUANTITY or price > MAX_PRICE:
+                errors.append({
+                    "row": line_number,
+                    "symbol": symbol,
+                    "message": f"수량은 {MAX_QUANTITY}주, 가격은 {MAX_PRICE} 이하여야 합니다."
+                })
+                continue
+
+            stock_id = stock_ids.get(symbol)
+            if stock_id is None:
+                errors.append({"row": line_number, "symbol": symbol, "message": f"등록되지 않은 주식 심볼입니다: {symbol}"})
+                continue
+
+            if last_date is not None and transaction_date < last_date:
+                errors.append({
+                    "row": line_number,
+                    "symbol": symbol,
+                    "message": "거래일이 이전 행보다 빠릅니다. 거래일 오름차순으로 정렬된 파일만 등록할 수 있습니다."
+                })
+                continue
+
+            # 지금까지 등록한 행은 모두 이 행보다 이르므로 이 날짜 이후의 모든 시점에 반영됨
+            if transaction_type == "SELL":
+                timeline = timelines.get(stock_id)
+                available = (timeline.sellable(transaction_date) if timeline else 0) + imported_quantity.get(stock_id, 0)
+                if quantity > available:
+                    errors.append({
+                        "row": line_number,
+                        "symbol": symbol,
+                        "message": f"{transaction_date.date()} 기준 매도 가능 수량({available}주)보다 많은 수량({quantity}주)을 판매할 수 없습니다."
+                    })
+                    continue
+
+            last_date = transaction_date
+            imported_quantity[stock_id] = imported_quantity.get(stock_id, 0) + (quantity if transaction_type == "BUY" else -quantity)
+            batch.append({
+                "portfolio_id": portfolio_id,
+                "stock_id": stock_id,
+                "transaction_type": transaction_type,
+                "quantity": quantity,
+                "price": price,
+                "transaction_date": transaction_date
+            })
+
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                if not dry_run:
+                    db.execute(insert(Transaction), batch)
+                imported += len(batch)
+                batch = []
+
+        if batch:
+            if not dry_run:
+                db.execute(insert(Transaction), batch)
+            imported += len(batch)
+
+        if dry_run:
+            db.rollback()
+        else:
+            db.commit()
+    except (csv.Error, UnicodeDecodeError) as e:
+        db.rollback()
+        raise ImportFormatError(str(e))
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        # 업로드 파일 객체는 호출자가 닫도록 분리
+        text.detach()
+
+    return {
+        "total_rows": total_rows,
+        "imported": imported,
+        "dry_run": dry_run,
+        "errors": errors
+    }
@@ -0,0 +1,179 @@
+"""
+부하 테스트용 로컬 외부 API 대역 서버 (Alpha Vantage, NewsAPI)
+
+실제 API 대신 결정적인 가짜 데이터를 응답하며, 응답 지연(고정 + 무작위 지터)과
+오류 비율(HTTP 503)을 설정할 수 있습니다. 앱은 ALPHA_VANTAGE_BASE_URL,
+NEWS_API_BASE_URL 환경 변수로 이 서버를 가리키게 합니다.
+
+- Alpha Vantage: GET /query (GLOBAL_QUOTE, SYMBOL_SEARCH, TIME_SERIES_DAILY/WEEKLY/MONTHLY)
+- NewsAPI: GET /v2/everything
+
+실행 (backend 디렉터리):
+    python -m benchmarks.fake_upstreams --port 9100 --latency-ms 80 --jitter-ms 40 --error-rate 0.01
+    ALPHA_VANTAGE_BASE_URL=http://127.0.0.1:9100/query NEWS_API_BASE_URL=http://127.0.0.1:9100/v2 uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+
+# 검색 결과로 돌려주는 종목 (부하 테스트의 기본 종목과 같음)
+KNOWN_SYMBOLS = {
+    "AAPL": "Apple Inc", "MSFT": "Microsoft Corporation", "NVDA": "NVIDIA Corporation",
+    "AMZN": "Amazon.com Inc", "GOOGL": "Alphabet Inc - Class A", "META": "Meta Platforms Inc",
+    "TSLA": "Tesla Inc", "JPM": "JPMorgan Chase & Co", "V": "Visa Inc - Class A", "XOM": "Exxon Mobil Corp"
+}
+
+HEADLINE_TEMPLATES = [
+    "{name} shares rise after strong quarterly earnings",
+    "{name} stock falls as analysts warn of slowdown",
+    "{name} announces record revenue and buyback",
+    "Investors weigh {name} guidance amid market volatility",
+    "{name} faces probe over supply chain concerns",
+    "{name} upgraded on robust demand outlook"
+]
+
+
+def _base_price(symbol: str) -> float:
+    """심볼별로 항상 같은 기준 가격 (20 ~ 520)"""
+    digest = hashlib.md5(symbol.encode()).digest()
+    return 20 + int.from_bytes(digest[:2], "big") % 500
+
+
+def create_app(latency_ms: float = 50, jitter_ms: float = 0, error_rate: float = 0, seed: int = 0) -> FastAPI:
+    """
+    대역 서버 앱 생성
+
+    Args:
+        latency_ms (float): 모든 응답에 더하는 고정 지연 (밀리초)
+        jitter_ms (float): 0 ~ jitter_ms 사이의 무작위 추가 지연 (밀리초)
+        error_rate (float): HTTP 503으로 실패시킬 요청 비율 (0 ~ 1)
+        seed (int): 지연/오류/시세 변동 난수 시드
+    """
+    app = FastAPI(title="StockDashX fake upstreams")
+    rng = random.Random(seed)
+    stats = {"requests": 0, "errors": 0}
+
+    async def simulate():
+        """설정한 지연만큼 대기하고, 오류로 응답할 요청이면 응답 객체 반환"""
+        stats["requests"] += 1
+        delay = latency_ms + (rng.uniform(0, jitter_ms) if jitter_ms else 0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if error_rate and rng.random() < error_rate:
+            stats["errors"] += 1
+            return JSONResponse(status_code=503, content={"message": "fake upstream error"})
+        return None
+
+    @app.get("/query")
+    async def alpha_vantage(
+        function: str,
+        symbol: str = "",
+        keywords: str = "",
+        outputsize: str = "compact"
+    ):
+        error = await simulate()
+        if error is not None:
+            return error
+
+        if function == "GLOBAL_QUOTE":
+            base = _base_price(symbol)
+            change = round(base * rng.uniform(-0.03, 0.03), 4)
+            return {"Global Quote": {
+                "01. symbol": symbol,
+                "05. price": f"{base + change:.4f}",
+                "06. volume": str(rng.randint(100_000, 50_000_000)),
+                "07. latest trading day": date.today().isoformat(),
+                "08. previous close": f"{base:.4f}",
+                "09. change": f"{change:.4f}",
+                "10. change percent": f"{change / base * 100:.4f}%"
+            }}
+
+        if function == "SYMBOL_SEARCH":
+            keyword = keywords.lower()
+            return {"bestMatches": [
+                {"1. symbol": known, "2. name": name, "3. type": "Equity", "4. region": "United States", "8. currency": "USD"}
+                for known, name in KNOWN_SYMBOLS.items()
+                if keyword in known.lower() or keyword in name.lower()
+            ]}
+
+        if function.startswith("TIME_SERIES_"):
+            interval = function.rsplit("_", 1)[1].capitalize()
+            step = {"Daily": 1, "Weekly": 7, "Monthly": 30}.get(interval, 1)
+            count = 100 if outputsize == "compact" else 1000
+            price = _base_price(symbol)
+            series = {}
+            day = date.today()
+            # 심볼별로 같은 시세가 나오도록 심볼 시드의 난수 사용
+            walk = random.Random(symbol)
+            for _ in range(count):
+                while step == 1 and day.weekday() >= 5:
+                    day -= timedelta(days=1)
+                close = price
+                series[day.isoformat()] = {
+                    "1. open": f"{close * 0.995:.4f}", "2. high": f"{close * 1.01:.4f}",
+                    "3. low": f"{close * 0.99:.4f}", "4. close": f"{close:.4f}",
+                    "5. volume": str(walk.randint(100_000, 50_000_000))
+                }
+                price = max(1.0, price * (1 + walk.gauss(0, 0.015)))
+                day -= timedelta(days=step)
+            return {"Meta Data": {"2. Symbol": symbol}, f"Time Series ({interval})": series}
+
+        return {"Error Message": f"Unknown function {function}"}
+
+    @app.get("/v2/everything")
+    async def news_everything(q: str = "", pageSize: int = Query(20, le=100)):
+        error = await simulate()
+        if error is not None:
+            return error
+
+        # 검색어에 대문자 심볼이 있으면 그 종목 이름으로 기사 생성
+        symbol = next((word for word in q.replace('"', " ").split() if word in KNOWN_SYMBOLS), None)
+        name = KNOWN_SYMBOLS.get(symbol, "Wall Street")
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        # 수집할 때마다 일부 새 기사가 생기도록 분 단위로 URL을 바꿈
+        minute = now.strftime("%Y%m%d%H%M")
+        articles = []
+        for index in range(min(pageSize, 20)):
+            published = now - timedelta(minutes=index * 7)
+            title = HEADLINE_TEMPLATES[index % len(HEADLINE_TEMPLATES)].format(name=name)
+            articles.append({
+                "source": {"id": None, "name": "Fake Wire"},
+                "title": title,
+                "description": f"{title}. {symbol or 'Markets'} coverage from the fake upstream.",
+                "url": f"https://fake.example.com/{symbol or 'market'}/{minute}/{index}",
+                "urlToImage": None,
+                "publishedAt": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "content": f"{title}. Analysts expect growth while some investors fear volatility."
+            })
+        return {"status": "ok", "totalResults": len(articles), "articles": articles}
+
+    @app.get("/stats")
+    async def upstream_stats():
+        """대역 서버가 받은 요청 수와 오류로 응답한 수"""
+        return stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alpha Vantage / NewsAPI 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=50, help="고정 응답 지연 (밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="무작위 추가 지연 최대값 (밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0, help="503으로 실패시킬 요청 비율 (0 ~ 1)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import uvicorn
+    app = create_app(args.latency_ms, args.jitter_ms, args.error_rate, args.seed)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+보유 종목 / 손익 계산 규모별 마이크로벤치마크
+
+거래 10^2 ~ 10^6건의 합성 포트폴리오/모의 투자 계좌를 DB에 만들고,
+get_portfolio / get_simulation_account가 사용하는 계산 단계를 규모별로 측정합니다.
+이후 최적화의 기준선으로 쓰도록 결과를 JSON으로 저장할 수 있습니다.
+
+측정 항목:
+- load           : 계좌의 거래 내역 ORM 조회 (엔드포인트와 같은 쿼리)
+- replay         : 조회한 거래 내역으로 보유 종목/평균 단가 재생 + 요약 (순수 계산)
+- simulation     : get_simulation_account의 보유 종목 계산 전체 (load + replay)
+- portfolio      : get_portfolio의 보유 종목 계산 전체
+- sell_validation: 매도 주문의 보유 수량 검증 (get_position_quantity)
+- trade_stats    : 거래 성과 집계 (compute_trade_stats)
+
+시간은 --repeat 회 반복 중 최소/중앙값이며, 메모리 최대치는 별도 1회 실행에서
+tracemalloc으로 측정한 파이썬 할당량입니다 (DB 서버 메모리 제외, 측정 자체가
+느려지므로 시간 측정과 분리). 합성 거래는 종목마다 매수, 매수, 매도(1주)를
+반복하므로 보유 수량이 음수가 되지 않습니다.
+
+벤치마크용 사용자/계좌/주식은 실행 후 삭제됩니다.
+
+실행 (backend 디렉터리, 로컬 DB 필요):
+    python -m benchmarks.holdings_bench --sizes 100,1000,10000,100000,1000000 --symbols 50 --output holdings.json
+"""
+import argparse
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import case, create_engine, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.orm import sessionmaker
+
+from app.config import DATABASE_URL
+from app.db.models import Portfolio, SimulationAccount, SimulationTransaction, Stock, Transaction, User
+from app.services.holdings import compute_holdings, last_price, portfolio_cost, simulation_cost
+from app.services.simulation_trading import get_position_quantity
+from app.services.trade_stats import compute_trade_stats
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def setup(symbols: int):
+    """벤치마크용 사용자와 주식 생성"""
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        user = User(email=f"holdbench_{tag}@example.com", username=f"holdbench_{tag}", hashed_password="x")
+        db.add(user)
+        stocks = [
+            Stock(symbol=f"HB{tag[:4]}{i}".upper(), name=f"Holdings Bench {i}", last_price=Decimal("100.00"))
+            for i in range(symbols)
+        ]
+        db.add_all(stocks)
+        db.commit()
+        return user.id, [stock.id for stock in stocks]
+    finally:
+        db.close()
+
+
+def teardown(user_id: int, stock_ids):
+    db = SessionLocal()
+    try:
+        # 사용자 삭제 시 포트폴리오/계좌/거래 내역도 cascade로 삭제
+        db.query(User).filter(User.id == user_id).delete()
+        db.commit()
+        db.query(Stock).filter(Stock.id.in_(stock_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _synthetic_rows(size: int, stock_ids):
+    """
+    거래 size건을 DB에서 generate_series로 생성하는 SELECT
+
+    i번째 거래는 stock_ids[i % 종목 수] 종목이며, 종목별로 세 번째 거래마다 1주 매도
+    """
+    i = func.generate_series(0, size - 1).table_valued("value").alias("i")
+    symbols = len(stock_ids)
+    is_sell = (i.c.value // symbols) % 3 == 2
+    quantity = case((is_sell, 1), else_=1 + i.c.value % 7)
+    price = 50 + i.c.value % 100
+    return i, {
+        "stock_id": array(stock_ids)[1 + i.c.value % symbols],
+        "transaction_type": case((is_sell, "SELL"), else_="BUY"),
+        "quantity": quantity,
+        "price": price,
+        "transaction_date": func.now() - func.make_interval(0, 0, 0, 0, 0, 0, size - i.c.value)
+    }, quantity * price
+
+
+def create_accounts(user_id: int, stock_ids, size: int):
+    """거래 size건의 포트폴리오와 모의 투자 계좌 생성 (INSERT ... SELECT 한 번씩)"""
+    db = SessionLocal()
+    try:
+        portfolio = Portfolio(user_id=user_id, name=f"bench {size}")
+        account = SimulationAccount(
+            user_id=user_id,
+            name=f"bench {size}",
+            initial_balance=Decimal("1000000000.00"),
+            current_balance=Decimal("1000000000.00")
+        )
+        db.add_all([portfolio, account])
+        db.flush()
+
+        i, columns, amount = _synthetic_rows(size, stock_ids)
+        db.execute(insert(Transaction).from_select(
+            ["portfolio_id", *columns],
+            select(literal(portfolio.id), *columns.values()).select_from(i)
+        ))
+        db.execute(insert(SimulationTransaction).from_select(
+            ["account_id", *columns, "commission", "total_amount"],
+            select(literal(account.id), *columns.values(), literal(0), amount).select_from(i)
+        ))
+        db.commit()
+        return portfolio.id, account.id
+    finally:
+        db.close()
+
+
+def build_cases(portfolio_id: int, account_id: int, stock_id: int):
+    """측정 항목 -> (db)를 받아 한 번 실행하는 함수"""
+
+    def load_simulation(db):
+        return db.query(SimulationTransaction).filter(SimulationTransaction.account_id == account_id).all()
+
+    def load_portfolio(db):
+        return db.query(Transaction).filter(Transaction.portfolio_id == portfolio_id).all()
+
+    loaded = {}
+
+    def replay(db):
+        if "transactions" not in loaded:
+            # 순수 계산만 재도록 거래 내역과 주식은 미리 읽어 둠
+            loaded["transactions"] = load_simulation(db)
+            for transaction in loaded["transactions"]:
+                transaction.stock
+        return compute_holdings(loaded["transactions"], simulation_cost, last_price)
+
+    return {
+        "load": load_simulation,
+        "replay": replay,
+        "simulation": lambda db: compute_holdings(load_simulation(db), simulation_cost, last_price),
+        "portfolio": lambda db: compute_holdings(load_portfolio(db), portfolio_cost, last_price),
+        "sell_validation": lambda db: get_position_quantity(db, account_id, stock_id),
+        "trade_stats": lambda db: compute_trade_stats(db, account_id)
+    }
+
+
+def measure(case, repeat: int) -> dict:
+    """반복 실행 시간(밀리초)과 1회 실행의 tracemalloc 최대치(MiB)"""
+    db = SessionLocal()
+    try:
+        # 워밍업 1회 (DB 버퍼 캐시, replay의 거래 내역 미리 읽기)
+        case(db)
+        timings = []
+        for _ in range(repeat):
+            # ORM 조회 비용이 매번 포함되도록 identity map 비움 (replay의 미리 읽은 객체는 유지)
+            db.expunge_all()
+            gc.collect()
+            start = time.perf_counter()
+            case(db)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        db.expunge_all()
+        gc.collect()
+        tracemalloc.start()
+        case(db)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        db.close()
+
+    return {
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "peak_mib": round(peak / 2 ** 20, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보유 종목 / 손익 계산 규모별 벤치마크")
+    parser.add_argument("--sizes", default="100,1000,10000,100000,1000000", help="계좌별 거래 수 (쉼표 구분)")
+    parser.add_argument("--symbols", type=int, default=50, help="거래 종목 수")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 횟수")
+    parser.add_argument("--cases", default=None, help="측정할 항목만 (쉼표 구분, 기본 전체)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    SessionLocal.configure(bind=create_engine(DATABASE_URL))
+
+    user_id, stock_ids = setup(args.symbols)
+    results = []
+    try:
+        print(f"{'size':>9}  {'case':<16}{'min ms':>12}{'median ms':>12}{'peak MiB':>10}")
+        for size in sizes:
+            started = time.perf_counter()
+            portfolio_id, account_id = create_accounts(user_id, stock_ids, size)
+            print(f"{size:>9}  (생성 {time.perf_counter() - started:.1f}s)")
+
+            cases = build_cases(portfolio_id, account_id, stock_ids[0])
+            selected = args.cases.split(",") if args.cases else list(cases)
+            for name in selected:
+                result = {"size": size, "case": name, **measure(cases[name], args.repeat)}
+                results.append(result)
+                print(f"{size:>9}  {name:<16}{result['min_ms']:>12.2f}{result['median_ms']:>12.2f}{result['peak_mib']:>10.2f}")
+    finally:
+        teardown(user_id, stock_ids)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "symbols": args.symbols,
+                "repeat": args.repeat,
+                "results": results
+            }, f, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,495 @@
+"""
+엔드 투 엔드 부하 테스트
+
+로컬 외부 API 대역 서버(benchmarks/fake_upstreams.py)와 앱(uvicorn)을 띄우고,
+API로 사용자/포트폴리오/모의 투자 계좌를 만든 뒤 실제 사용 패턴을 섞은
+트래픽을 보내 라우트별 처리량과 p50/p95/p99 지연 시간을 측정합니다.
+결과는 JSON으로 저장하며, 두 결과를 비교해 성능 저하를 찾을 수 있습니다.
+
+트래픽 구성 (--mix로 비율 변경):
+- dashboard: 포트폴리오 목록/상세, 모의 투자 계좌, 시장 뉴스를 동시에 조회 (화면 첫 로드)
+- quote    : 종목 시세 조회 (시세 폴링)
+- trade    : 모의 투자 시장가 매수/매도
+- news     : 종목 뉴스 조회, 일부는 뉴스 검색
+
+앱은 backend/.env의 DB를 사용하므로 부하 테스트 전용 DB에서 실행하세요.
+(`alembic upgrade head`로 스키마 준비) 만든 포트폴리오/계좌는 끝나면 삭제되지만
+사용자는 남습니다.
+
+실행 (backend 디렉터리):
+    python -m benchmarks.loadtest run --users 20 --duration 60 --output before.json
+    python -m benchmarks.loadtest run --upstream-latency-ms 150 --upstream-error-rate 0.02 --output after.json
+    python -m benchmarks.loadtest compare before.json after.json --threshold 0.10
+
+이미 실행 중인 앱에 보내려면 --app-url http://127.0.0.1:8080 (대역 서버 설정은 앱 쪽에서)
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Dict, List, Optional, Set
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API = "/api/v1"
+
+RESULT_VERSION = 1
+DEFAULT_SYMBOLS = ["AAPL", "MSFT", "NVDA", "AMZN", "GOOGL", "META", "TSLA", "JPM", "V", "XOM"]
+DEFAULT_MIX = "dashboard=35,quote=30,trade=15,news=20"
+PASSWORD = "loadtest-password"
+
+
+@dataclass
+class VirtualUser:
+    """부하 테스트 사용자 하나 (API로 만든 데이터의 ID)"""
+    username: str
+    token: str
+    portfolio_id: int
+    account_id: int
+    holdings: Set[str] = field(default_factory=set)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+class Recorder:
+    """라우트(메서드 + 경로 템플릿)별 응답 시간과 상태 코드 기록"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.active = False
+
+    async def request(self, client: httpx.AsyncClient, method: str, route: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        """요청을 보내고 측정 구간이면 기록 (연결 오류는 상태 코드 0)"""
+        start = perf_counter()
+        response = None
+        try:
+            response = await client.request(method, url, **kwargs)
+            status_code = response.status_code
+        except httpx.HTTPError:
+            status_code = 0
+        if self.active:
+            key = f"{method} {route}"
+            self.samples[key].append((perf_counter() - start) * 1000)
+            self.statuses[key][status_code] += 1
+        return response
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """정렬된 값의 p 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: List[float], statuses: Dict[int, int], duration: float) -> dict:
+    values = sorted(samples)
+    errors = sum(count for code, count in statuses.items() if code == 0 or code >= 500)
+    client_errors = sum(count for code, count in statuses.items() if 400 <= code < 500)
+    return {
+        "requests": len(values),
+        "throughput_rps": round(len(values) / duration, 2) if duration else 0.0,
+        "errors": errors,
+        "client_errors": client_errors,
+        "error_rate": round(errors / len(values), 4) if values else 0.0,
+        "mean_ms": round(sum(values) / len(values), 2) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 2),
+        "p95_ms": round(percentile(values, 95), 2),
+        "p99_ms": round(percentile(values, 99), 2),
+        "max_ms": round(values[-1], 2) if values else 0.0,
+        "statuses": {str(code): count for code, count in sorted(statuses.items())}
+    }
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 시나리오: {name} (가능: {', '.join(SCENARIOS)})")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+# ---------------------------------------------------------------------------
+# 서버 실행
+# ---------------------------------------------------------------------------
+
+def start_process(args: List[str], env: Optional[dict] = None) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, *args], cwd=BACKEND_DIR, env={**os.environ, **(env or {})})
+
+
+def stop_process(process: subprocess.Popen):
+    """SIGINT로 정상 종료(앱 shutdown 핸들러 실행)를 기다리고, 안 되면 강제 종료"""
+    if process.poll() is not None:
+        return
+    process.send_signal(signal.SIGINT)
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+async def wait_ready(url: str, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url)).status_code < 500:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"{url} 응답 대기 시간 초과")
+
+
+# ---------------------------------------------------------------------------
+# 데이터 준비
+# ---------------------------------------------------------------------------
+
+async def _post_with_retry(client: httpx.AsyncClient, url: str, attempts: int = 20, **kwargs) -> httpx.Response:
+    """비밀번호 해시 대기열이 가득 차 503(Retry-After)이면 잠시 후 재시도"""
+    for _ in range(attempts):
+        response = await client.post(url, **kwargs)
+        if response.status_code != 503:
+            return response
+        await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+    return response
+
+
+async def create_user(client: httpx.AsyncClient, run_id: str, index: int, symbols: List[str], rng: random.Random) -> VirtualUser:
+    """사용자 가입/로그인 후 거래 내역이 있는 포트폴리오와 보유 종목이 있는 모의 투자 계좌 생성"""
+    username = f"lt_{run_id}_{index}"
+    response = await _post_with_retry(client, f"{API}/auth/register", json={
+        "email": f"{username}@example.com", "username": username, "password": PASSWORD
+    })
+    response.raise_for_status()
+    response = await _post_with_retry(client, f"{API}/auth/token", data={"username": username, "password": PASSWORD})
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = await client.post(f"{API}/portfolios/", headers=headers, json={"name": f"{username} portfolio"})
+    response.raise_for_status()
+    portfolio_id = response.json()["id"]
+    for symbol in rng.sample(symbols, k=min(4, len(symbols))):
+        response = await client.post(f"{API}/transactions/", headers=headers, json={
+            "portfolio_id": portfolio_id, "symbol": symbol, "transaction_type": "BUY",
+            "quantity": rng.randint(1, 50), "price": round(rng.uniform(50, 500), 2)
+        })
+        response.raise_for_status()
+
+    response = await client.post(f"{API}/simulation/accounts", headers=headers, json={"name": f"{username} account"})
+    response.raise_for_status()
+    account_id = response.json()["id"]
+
+    user = VirtualUser(username, headers["Authorization"].split()[1], portfolio_id, account_id)
+    for symbol in rng.sample(symbols, k=min(3, len(symbols))):
+        response = await client.post(f"{API}/simulation/transactions", headers=headers, json={
+            "account_id": account_id, "symbol": symbol, "transaction_type": "BUY", "quantity": 10
+        })
+        if response.status_code == 200:
+            user.holdings.add(symbol)
+    return user
+
+
+async def seed(client: httpx.AsyncClient, users: int, symbols: List[str], rng: random.Random) -> List[VirtualUser]:
+    run_id = uuid.uuid4().hex[:6]
+    # 가입 시 비밀번호 해시가 몰리지 않도록 동시 생성 수 제한
+    semaphore = asyncio.Semaphore(8)
+
+    async def create(index: int):
+        async with semaphore:
+            return await create_user(client, run_id, index, symbols, random.Random(rng.random()))
+
+    return await asyncio.gather(*(create(index) for index in range(users)))
+
+
+async def cleanup(client: httpx.AsyncClient, users: List[VirtualUser]):
+    for user in users:
+        await client.delete(f"{API}/portfolios/{user.portfolio_id}", headers=user.headers)
+        await client.delete(f"{API}/simulation/accounts/{user.account_id}", headers=user.headers)
+
+
+# ---------------------------------------------------------------------------
+# 시나리오
+# ---------------------------------------------------------------------------
+
+async def dashboard(client, recorder: Recorder, user: VirtualUser, symbols, rng):
+    """화면 첫 로드: 브라우저처럼 여러 API를 동시에 요청"""
+    await asyncio.gather(
+        recorder.request(client, "GET", f"{API}/portfolios/", f"{API}/portfolios/", headers=user.headers),
+        recorder.request(client, "GET", f"{API}/portfolios/{{portfolio_id}}",
+                         f"{API}/portfolios/{user.portfolio_id}", headers=user.headers),
+        recorder.request(client, "GET", f"{API}/simulation/accounts/{{account_id}}",
+                         f"{API}/simulation/accounts/{user.account_id}", headers=user.headers),
+        recorder.request(client, "GET", f"{API}/news/market", f"{API}/news/market",
+                         params={"page_size": 10}, headers=user.headers)
+    )
+
+
+async def quote(client, recorder: Recorder, user: VirtualUser, symbols, rng):
+    symbol = rng.choice(symbols)
+    await recorder.request(client, "GET", f"{API}/stocks/quote/{{symbol}}",
+                           f"{API}/stocks/quote/{symbol}", headers=user.headers)
+
+
+async def trade(client, recorder: Recorder, user: VirtualUser, symbols, rng):
+    """보유 종목이 있으면 40% 확률로 1주 매도, 아니면 소량 매수"""
+    if user.holdings and rng.random() < 0.4:
+        symbol, transaction_type, quantity = rng.choice(sorted(user.holdings)), "SELL", 1
+    else:
+        symbol, transaction_type, quantity = rng.choice(symbols), "BUY", rng.randint(1, 5)
+    response = await recorder.request(client, "POST", f"{API}/simulation/transactions",
+                                      f"{API}/simulation/transactions", headers=user.headers, json={
+                                          "account_id": user.account_id, "symbol": symbol,
+                                          "transaction_type": transaction_type, "quantity": quantity
+                                      })
+    if response is not None and response.status_code == 200 and transaction_type == "BUY":
+        user.holdings.add(symbol)
+
+
+async def news(client, recorder: Recorder, user: VirtualUser, symbols, rng):
+    if rng.random() < 0.3:
+        await recorder.request(client, "GET", f"{API}/news/search", f"{API}/news/search",
+                               params={"q": rng.choice(["earnings", "buyback", "guidance", "volatility"])},
+                               headers=user.headers)
+    else:
+        symbol = rng.choice(symbols)
+        await recorder.request(client, "GET", f"{API}/news/stock/{{symbol}}",
+                               f"{API}/news/stock/{symbol}", headers=user.headers)
+
+
+SCENARIOS = {"dashboard": dashboard, "quote": quote, "trade": trade, "news": news}
+
+
+async def virtual_user_loop(client, recorder: Recorder, user: VirtualUser, symbols, mix, think_ms: float,
+                            deadline: float, rng: random.Random):
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    while time.monotonic() < deadline:
+        await SCENARIOS[rng.choices(names, weights)[0]](client, recorder, user, symbols, rng)
+        if think_ms:
+            # 사용자 생각 시간 (지수 분포)
+            await asyncio.sleep(rng.expovariate(1000 / think_ms))
+
+
+# ---------------------------------------------------------------------------
+# 실행 / 비교
+# ---------------------------------------------------------------------------
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_load(args) -> dict:
+    rng = random.Random(args.seed)
+    symbols = args.symbols.split(",")
+    mix = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.users * 4, max_keepalive_connections=args.users * 4)
+
+    async with httpx.AsyncClient(base_url=args.app_url, timeout=args.timeout, limits=limits) as client:
+        print(f"데이터 준비: 사용자 {args.users}명")
+        users = await seed(client, args.users, symbols, rng)
+
+        recorder = Recorder()
+        try:
+            deadline = time.monotonic() + args.warmup + args.duration
+            loops = [
+                asyncio.create_task(virtual_user_loop(
+                    client, recorder, user, symbols, mix, args.think_ms, deadline, random.Random(rng.random())
+                ))
+                for user in users
+            ]
+            print(f"워밍업 {args.warmup}s 후 {args.duration}s 측정")
+            await asyncio.sleep(args.warmup)
+            recorder.active = True
+            started = time.monotonic()
+            await asyncio.gather(*loops)
+            elapsed = time.monotonic() - started
+            recorder.active = False
+        finally:
+            if not args.keep_data:
+                await cleanup(client, users)
+
+        upstream = None
+        if args.upstream_url:
+            try:
+                upstream = (await client.get(f"{args.upstream_url}/stats")).json()
+            except httpx.HTTPError:
+                pass
+
+    all_samples = [value for values in recorder.samples.values() for value in values]
+    all_statuses = defaultdict(int)
+    for statuses in recorder.statuses.values():
+        for code, count in statuses.items():
+            all_statuses[code] += count
+
+    return {
+        "version": RESULT_VERSION,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "config": {key: value for key, value in vars(args).items() if key != "func"},
+        "duration_s": round(elapsed, 2),
+        "total": summarize(all_samples, all_statuses, elapsed),
+        "routes": {
+            route: summarize(recorder.samples[route], recorder.statuses[route], elapsed)
+            for route in sorted(recorder.samples)
+        },
+        "upstream": upstream
+    }
+
+
+def print_report(result: dict):
+    print(f"\n{'route':<58}{'req':>7}{'rps':>9}{'err':>6}{'4xx':>6}{'p50':>9}{'p95':>9}{'p99':>9}")
+    rows = list(result["routes"].items()) + [("TOTAL", result["total"])]
+    for route, stats in rows:
+        print(f"{route:<58}{stats['requests']:>7}{stats['throughput_rps']:>9.1f}{stats['errors']:>6}"
+              f"{stats['client_errors']:>6}{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}")
+    if result.get("upstream"):
+        print(f"\n대역 서버: 요청 {result['upstream']['requests']}건, 오류 응답 {result['upstream']['errors']}건")
+
+
+def command_run(args):
+    processes = []
+    try:
+        if args.app_url is None:
+            upstream_port, app_port = args.upstream_port, args.app_port
+            args.upstream_url = f"http://127.0.0.1:{upstream_port}"
+            processes.append(start_process([
+                "-m", "benchmarks.fake_upstreams", "--port", str(upstream_port),
+                "--latency-ms", str(args.upstream_latency_ms), "--jitter-ms", str(args.upstream_jitter_ms),
+                "--error-rate", str(args.upstream_error_rate), "--seed", str(args.seed)
+            ]))
+            asyncio.run(wait_ready(f"{args.upstream_url}/stats"))
+
+            args.app_url = f"http://127.0.0.1:{app_port}"
+            processes.append(start_process([
+                "-m", "uvicorn", "app.main:app", "--port", str(app_port),
+                "--workers", str(args.app_workers), "--log-level", "warning"
+            ], env={
+                "ALPHA_VANTAGE_BASE_URL": f"{args.upstream_url}/query",
+                "NEWS_API_BASE_URL": f"{args.upstream_url}/v2",
+                "STOCK_API_KEY": os.environ.get("STOCK_API_KEY", "loadtest"),
+                "NEWS_API_KEY": os.environ.get("NEWS_API_KEY", "loadtest")
+            }))
+            asyncio.run(wait_ready(f"{args.app_url}/"))
+
+        result = asyncio.run(run_load(args))
+    finally:
+        for process in reversed(processes):
+            stop_process(process)
+
+    print_report(result)
+    output = args.output or f"loadtest-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"\n결과 저장: {output}")
+
+
+def compare_results(baseline: dict, current: dict, threshold: float, min_delta_ms: float) -> List[str]:
+    """
+    기준 결과 대비 성능 저하 목록
+
+    - p95/p99 지연이 threshold 비율 이상, min_delta_ms 이상 늘어난 경우
+    - 처리량이 threshold 비율 이상 줄어든 경우
+    - 오류율이 1%p 이상 늘어난 경우
+    """
+    regressions = []
+    routes = [("TOTAL", baseline["total"], current["total"])] + [
+        (route, baseline["routes"][route], current["routes"][route])
+        for route in sorted(set(baseline["routes"]) & set(current["routes"]))
+    ]
+
+    print(f"\n{'route':<58}{'p95 base':>10}{'p95 now':>10}{'change':>9}{'rps base':>10}{'rps now':>9}")
+    for route, before, after in routes:
+        change = (after["p95_ms"] - before["p95_ms"]) / before["p95_ms"] if before["p95_ms"] else 0.0
+        print(f"{route:<58}{before['p95_ms']:>10.1f}{after['p95_ms']:>10.1f}{change:>+9.1%}"
+              f"{before['throughput_rps']:>10.1f}{after['throughput_rps']:>9.1f}")
+
+        for metric in ("p95_ms", "p99_ms"):
+            delta = after[metric] - before[metric]
+            if before[metric] and delta >= min_delta_ms and delta / before[metric] > threshold:
+                regressions.append(f"{route}: {metric} {before[metric]:.1f} -> {after[metric]:.1f}")
+        if before["throughput_rps"] and (before["throughput_rps"] - after["throughput_rps"]) / before["throughput_rps"] > threshold:
+            regressions.append(f"{route}: throughput {before['throughput_rps']:.1f} -> {after['throughput_rps']:.1f} rps")
+        if after["error_rate"] - before["error_rate"] >= 0.01:
+            regressions.append(f"{route}: error rate {before['error_rate']:.2%} -> {after['error_rate']:.2%}")
+
+    missing = sorted(set(baseline["routes"]) - set(current["routes"]))
+    if missing:
+        print(f"\n현재 결과에 없는 라우트: {', '.join(missing)}")
+    return regressions
+
+
+def command_compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = compare_results(baseline, current, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"\n성능 저하 {len(regressions)}건:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print("\n성능 저하 없음")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StockDashX 엔드 투 엔드 부하 테스트")
+    subparsers = parser.add_subparsers(required=True)
+
+    run = subparsers.add_parser("run", help="부하 테스트 실행")
+    run.add_argument("--users", type=int, default=20, help="동시 가상 사용자 수")
+    run.add_argument("--duration", type=float, default=60, help="측정 시간 (초)")
+    run.add_argument("--warmup", type=float, default=10, help="측정 전 워밍업 시간 (초)")
+    run.add_argument("--think-ms", type=float, default=200, help="요청 사이 평균 대기 시간 (밀리초, 0이면 대기 없음)")
+    run.add_argument("--mix", default=DEFAULT_MIX, help="시나리오 비율 (예: dashboard=35,quote=30,trade=15,news=20)")
+    run.add_argument("--symbols", default=",".join(DEFAULT_SYMBOLS), help="사용할 종목 (쉼표 구분)")
+    run.add_argument("--timeout", type=float, default=30, help="요청 타임아웃 (초)")
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--app-url", default=None, help="실행 중인 앱 주소 (지정하지 않으면 대역 서버와 앱을 직접 실행)")
+    run.add_argument("--app-port", type=int, default=8090)
+    run.add_argument("--app-workers", type=int, default=1)
+    run.add_argument("--upstream-url", default=None, help="대역 서버 주소 (--app-url과 함께 쓸 때 통계 수집용)")
+    run.add_argument("--upstream-port", type=int, default=9100)
+    run.add_argument("--upstream-latency-ms", type=float, default=80)
+    run.add_argument("--upstream-jitter-ms", type=float, default=40)
+    run.add_argument("--upstream-error-rate", type=float, default=0.0)
+    run.add_argument("--keep-data", action="store_true", help="만든 포트폴리오/계좌를 삭제하지 않음")
+    run.add_argument("--output", default=None, help="결과 JSON 경로 (기본: loadtest-<시각>.json)")
+    run.set_defaults(func=command_run)
+
+    compare = subparsers.add_parser("compare", help="두 결과 비교 (성능 저하가 있으면 종료 코드 1)")
+    compare.add_argument("baseline", help="기준 결과 JSON")
+    compare.add_argument("current", help="비교할 결과 JSON")
+    compare.add_argument("--threshold", type=float, default=0.10, help="허용 변화율 (기본 10%%)")
+    compare.add_argument("--min-delta-ms", type=float, default=2.0, help="이보다 작은 지연 증가는 무시 (밀리초)")
+    compare.set_defaults(func=command_compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
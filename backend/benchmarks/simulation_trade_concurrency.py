@@ -0,0 +1,184 @@
+"""
+모의 투자 동시 주문 처리량 / 정합성 벤치마크
+
+하나의 모의 투자 계좌에 수천 건의 매수/매도 주문을 여러 스레드에서 동시에
+실행한 뒤 처리량(orders/sec)과 불변 조건 위반 건수를 출력합니다.
+불변 조건 위반은 항상 0이어야 하며, 하나라도 있으면 종료 코드 1로 끝납니다.
+
+검사하는 불변 조건:
+- 현금 잔액 >= 0
+- 현금 잔액 == 초기 잔액 - 매수 총액 + 매도 총액
+- 모든 주식의 보유 수량 >= 0 (거래 순서대로 누적해도 음수가 되는 시점이 없음)
+
+벤치마크용 사용자/계좌/주식은 실행 후 삭제됩니다.
+
+실행 (backend 디렉터리, 로컬 DB 필요):
+    python -m benchmarks.simulation_trade_concurrency --orders 5000 --workers 32
+"""
+import argparse
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import DATABASE_URL
+from app.db.models import SimulationAccount, SimulationTransaction, Stock, User
+from app.services.simulation_trading import execute_simulation_trade
+
+BENCH_PRICE = Decimal("100.00")
+
+# 동시 실행 스레드 수에 맞춰 main()에서 커넥션 풀 크기를 설정
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def setup(initial_balance: Decimal, symbols: int):
+    """벤치마크용 사용자, 계좌, 주식 생성"""
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        user = User(email=f"bench_{tag}@example.com", username=f"bench_{tag}", hashed_password="x")
+        db.add(user)
+        db.flush()
+
+        account = SimulationAccount(
+            user_id=user.id,
+            name=f"bench_{tag}",
+            initial_balance=initial_balance,
+            current_balance=initial_balance
+        )
+        db.add(account)
+
+        stocks = [Stock(symbol=f"BN{tag[:4]}{i}".upper(), name=f"Bench {i}", last_price=BENCH_PRICE) for i in range(symbols)]
+        db.add_all(stocks)
+        db.commit()
+
+        return user.id, account.id, [stock.id for stock in stocks]
+    finally:
+        db.close()
+
+
+def teardown(user_id: int, stock_ids):
+    db = SessionLocal()
+    try:
+        db.query(User).filter(User.id == user_id).delete()
+        db.commit()
+        db.query(Stock).filter(Stock.id.in_(stock_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def place_order(account_id: int, stock_id: int, transaction_type: str, quantity: int):
+    """주문 하나를 독립된 세션에서 실행 (요청 하나에 해당)"""
+    db = SessionLocal()
+    try:
+        execute_simulation_trade(db, account_id, stock_id, transaction_type, quantity, BENCH_PRICE)
+        return "filled"
+    except HTTPException:
+        return "rejected"
+    finally:
+        db.close()
+
+
+def check_invariants(account_id: int):
+    """저장된 결과로 불변 조건을 검사하고 위반 목록을 반환"""
+    db = SessionLocal()
+    try:
+        account = db.query(SimulationAccount).filter(SimulationAccount.id == account_id).one()
+        rows = db.query(
+            SimulationTransaction.stock_id,
+            SimulationTransaction.transaction_type,
+            SimulationTransaction.quantity,
+            SimulationTransaction.total_amount
+        ).filter(
+            SimulationTransaction.account_id == account_id
+        ).order_by(SimulationTransaction.id).all()
+    finally:
+        db.close()
+
+    violations = []
+    expected_balance = account.initial_balance
+    positions = defaultdict(int)
+
+    for stock_id, transaction_type, quantity, total_amount in rows:
+        if transaction_type == "BUY":
+            expected_balance -= total_amount
+            positions[stock_id] += quantity
+        else:
+            expected_balance += total_amount
+            positions[stock_id] -= quantity
+            if positions[stock_id] < 0:
+                violations.append(f"stock {stock_id}: 보유 수량 음수 ({positions[stock_id]})")
+
+        if expected_balance < 0:
+            violations.append(f"잔액 음수 발생 ({expected_balance})")
+
+    if account.current_balance < 0:
+        violations.append(f"최종 잔액 음수 ({account.current_balance})")
+    if account.current_balance != expected_balance:
+        violations.append(f"잔액 불일치: 저장 {account.current_balance} != 재계산 {expected_balance}")
+
+    return violations, len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 투자 동시 주문 벤치마크")
+    parser.add_argument("--orders", type=int, default=5000, help="총 주문 수")
+    parser.add_argument("--workers", type=int, default=32, help="동시 실행 스레드 수")
+    parser.add_argument("--symbols", type=int, default=3, help="거래할 주식 수")
+    parser.add_argument("--initial-balance", type=Decimal, default=Decimal("50000.00"),
+                        help="초기 잔액 (작을수록 잔액 부족 경합이 많아짐)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # 커넥션 풀이 동시 실행 스레드 수보다 작으면 풀 대기 시간이 측정에 섞임
+    SessionLocal.configure(bind=create_engine(DATABASE_URL, pool_size=args.workers, max_overflow=0))
+
+    rng = random.Random(args.seed)
+    user_id, account_id, stock_ids = setup(args.initial_balance, args.symbols)
+
+    orders = [
+        (
+            account_id,
+            rng.choice(stock_ids),
+            "BUY" if rng.random() < 0.55 else "SELL",
+            rng.randint(1, 20)
+        )
+        for _ in range(args.orders)
+    ]
+
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            outcomes = list(executor.map(lambda order: place_order(*order), orders))
+        elapsed = time.perf_counter() - started
+
+        violations, stored = check_invariants(account_id)
+    finally:
+        teardown(user_id, stock_ids)
+
+    filled = outcomes.count("filled")
+    rejected = outcomes.count("rejected")
+
+    print(f"orders            : {args.orders} ({args.workers} workers)")
+    print(f"filled / rejected : {filled} / {rejected}")
+    print(f"stored rows       : {stored}")
+    print(f"elapsed           : {elapsed:.2f}s")
+    print(f"throughput        : {args.orders / elapsed:.1f} orders/sec")
+    print(f"violations        : {len(violations)}")
+    for violation in violations[:20]:
+        print(f"  - {violation}")
+
+    if violations or stored != filled:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+서버 콜드 스타트 임포트 시간 검사
+
+새 파이썬 프로세스에서 `python -X importtime -c "import app.main"`을 실행해
+모듈별 임포트 시간을 집계하고, 다음 경우 실패(종료 코드 1)합니다.
+
+- 전체 임포트 시간이 예산(--budget-ms)을 넘는 경우
+- 처음 사용할 때 임포트하도록 미룬 모듈(DEFERRED_MODULES)이 시작 시 임포트되는 경우
+
+측정값은 디스크 캐시/.pyc 생성 영향을 빼기 위해 워밍업 1회 후 --runs 회 중 최소값을
+사용합니다. 앱 임포트는 DB에 연결하지 않으므로 DB 없이 실행할 수 있습니다.
+
+실행 (backend 디렉터리):
+    python -m scripts.check_import_time
+    python -m scripts.check_import_time --budget-ms 1500 --runs 5 --top 30
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 측정 대상 (uvicorn이 임포트하는 모듈)
+TARGET_MODULE = "app.main"
+
+# 처음 사용할 때 임포트하도록 미룬 모듈 (서버 시작 시 임포트되면 실패)
+DEFERRED_MODULES = ("jose", "passlib", "alembic")
+
+# 기본 예산 (밀리초)
+DEFAULT_BUDGET_MS = 2000
+
+
+def measure_once() -> Dict[str, Tuple[int, int]]:
+    """
+    새 프로세스에서 앱을 임포트하고 -X importtime 출력을 파싱
+
+    Returns:
+        Dict[str, Tuple[int, int]]: 모듈 이름 -> (자체 시간, 누적 시간) 마이크로초
+    """
+    # 측정에 필요 없는 DB 설정이 비어 있어도 임포트되도록 기본값 지정
+    env = {"DB_HOST": "localhost", "DB_PORT": "5432", "DB_NAME": "x", "DB_USER": "x", "DB_PASSWORD": "x", **os.environ}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET_MODULE}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{TARGET_MODULE} 임포트 실패:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 콜드 스타트 임포트 시간 검사")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_TIME_BUDGET_MS", DEFAULT_BUDGET_MS)),
+                        help="전체 임포트 시간 예산 (밀리초)")
+    parser.add_argument("--runs", type=int, default=3, help="측정 횟수 (최소값 사용)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 느린 모듈 수")
+    args = parser.parse_args()
+
+    # 워밍업 (.pyc 생성, 디스크 캐시)
+    measure_once()
+    runs = [measure_once() for _ in range(max(1, args.runs))]
+    totals = [sum(self_us for self_us, _ in modules.values()) for modules in runs]
+    best = runs[totals.index(min(totals))]
+    total_ms = min(totals) / 1000
+
+    print(f"{'self ms':>9}{'cumul ms':>10}  module")
+    slowest = sorted(best.items(), key=lambda item: item[1][1], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{self_us / 1000:>9.1f}{cumulative_us / 1000:>10.1f}  {name}")
+
+    failures = []
+    deferred = sorted(name for name in best if name in DEFERRED_MODULES)
+    if deferred:
+        failures.append(f"시작 시 임포트하지 않아야 하는 모듈이 임포트됨: {', '.join(deferred)}")
+    if total_ms > args.budget_ms:
+        failures.append(f"임포트 시간 {total_ms:.0f}ms가 예산 {args.budget_ms:.0f}ms를 초과")
+
+    print(f"\n전체 임포트 시간: {total_ms:.0f}ms (예산 {args.budget_ms:.0f}ms, {len(runs)}회 중 최소)")
+    if failures:
+        print("\n실패:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("통과")
+
+
+if __name__ == "__main__":
+    main()
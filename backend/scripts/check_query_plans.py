@@ -0,0 +1,244 @@
+"""
+주요 조회 쿼리의 실행 계획 회귀 검사
+
+로컬 DB(`alembic upgrade head` 적용 완료)에 대량의 샘플 데이터를 임시로 넣고
+핫 쿼리마다 EXPLAIN (FORMAT JSON)을 실행합니다. 다음 경우 실패(종료 코드 1)합니다.
+
+- 대상 테이블에 Seq Scan이 나타나는 경우
+- 총 비용(Total Cost)이 기준값 대비 허용 범위를 넘어 증가한 경우
+
+샘플 데이터와 통계는 하나의 트랜잭션 안에서 만들고 마지막에 롤백하므로
+DB에 흔적이 남지 않습니다. 기준값(query_plan_baseline.json)은 기본 설정의
+PostgreSQL 16에서 만든 값이며, 버전이나 비용 설정이 다르면 다시 만들어야 합니다.
+
+실행 (backend 디렉터리):
+    python -m scripts.check_query_plans
+    python -m scripts.check_query_plans --update-baseline   # 기준값 갱신
+"""
+import argparse
+import json
+import os
+import sys
+
+from sqlalchemy import text
+
+from app.db.database import engine
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "query_plan_baseline.json")
+
+# 비용 증가 허용 비율 (기준 대비 25%)
+COST_TOLERANCE = 0.25
+
+# 샘플 데이터 규모
+SEED_USERS = 20_000
+SEED_STOCKS = 500
+SEED_TRANSACTIONS = 200_000
+
+# 이름: (쿼리, 바인드 파라미터, Seq Scan을 허용하지 않는 테이블)
+HOT_QUERIES = {
+    "portfolio_sell_position": (
+        """
+        SELECT transaction_type, quantity FROM stockdashx.transactions
+        WHERE portfolio_id = :portfolio_id AND stock_id = :stock_id
+        """,
+        {"portfolio_id": 1, "stock_id": 1},
+        {"transactions"},
+    ),
+    "portfolio_holdings": (
+        "SELECT * FROM stockdashx.transactions WHERE portfolio_id = :portfolio_id",
+        {"portfolio_id": 1},
+        {"transactions"},
+    ),
+    "portfolio_history_page": (
+        """
+        SELECT * FROM stockdashx.transactions
+        WHERE portfolio_id = :portfolio_id
+        ORDER BY transaction_date DESC, id DESC LIMIT 101
+        """,
+        {"portfolio_id": 1},
+        {"transactions"},
+    ),
+    # simulation_trading.get_position_quantity와 같은 집계 쿼리
+    "simulation_sell_position": (
+        """
+        SELECT coalesce(sum(CASE WHEN transaction_type = 'BUY' THEN quantity ELSE -quantity END), 0)
+        FROM stockdashx.simulation_transactions
+        WHERE account_id = :account_id AND stock_id = :stock_id
+        """,
+        {"account_id": 1, "stock_id": 1},
+        {"simulation_transactions"},
+    ),
+    "simulation_history_page": (
+        """
+        SELECT * FROM stockdashx.simulation_transactions
+        WHERE account_id = :account_id
+        ORDER BY transaction_date DESC, id DESC LIMIT 101
+        """,
+        {"account_id": 1},
+        {"simulation_transactions"},
+    ),
+    "simulation_accounts_by_user": (
+        "SELECT * FROM stockdashx.simulation_accounts WHERE user_id = :user_id",
+        {"user_id": 1},
+        {"simulation_accounts"},
+    ),
+    "user_by_username": (
+        "SELECT * FROM stockdashx.users WHERE username = :username",
+        {"username": "plan_user_1"},
+        {"users"},
+    ),
+    "stock_by_symbol": (
+        "SELECT * FROM stockdashx.stocks WHERE symbol = :symbol",
+        {"symbol": "PLAN1"},
+        {"stocks"},
+    ),
+}
+
+
+def seed(conn):
+    """실행 계획 검사용 샘플 데이터 생성 (현재 트랜잭션 안에서만 유효)"""
+    conn.execute(text("""
+        INSERT INTO stockdashx.users (email, username, hashed_password)
+        SELECT 'plan_user_' || g || '@example.com', 'plan_user_' || g, 'x'
+        FROM generate_series(1, :n) AS g
+    """), {"n": SEED_USERS})
+    conn.execute(text("""
+        INSERT INTO stockdashx.stocks (symbol, name, last_price, change_percent)
+        SELECT 'PLAN' || g, 'Plan Stock ' || g, 100, 0
+        FROM generate_series(1, :n) AS g
+    """), {"n": SEED_STOCKS})
+    conn.execute(text("""
+        INSERT INTO stockdashx.portfolios (user_id, name)
+        SELECT id, 'plan portfolio' FROM stockdashx.users WHERE username LIKE 'plan_user_%'
+    """))
+    conn.execute(text("""
+        INSERT INTO stockdashx.simulation_accounts (user_id, name, initial_balance, current_balance)
+        SELECT id, 'plan account', 100000, 100000 FROM stockdashx.users WHERE username LIKE 'plan_user_%'
+    """))
+    conn.execute(text("""
+        WITH p AS (
+            SELECT array_agg(id ORDER BY id) AS ids FROM stockdashx.portfolios WHERE name = 'plan portfolio'
+        ), s AS (
+            SELECT array_agg(id ORDER BY id) AS ids FROM stockdashx.stocks WHERE symbol LIKE 'PLAN%'
+        )
+        INSERT INTO stockdashx.transactions (portfolio_id, stock_id, transaction_type, quantity, price, transaction_date)
+        SELECT p.ids[1 + g % cardinality(p.ids)], s.ids[1 + g % cardinality(s.ids)],
+               CASE WHEN g % 3 = 0 THEN 'SELL' ELSE 'BUY' END, 1 + g % 50, 100,
+               now() - (g || ' minutes')::interval
+        FROM generate_series(1, :n) AS g, p, s
+    """), {"n": SEED_TRANSACTIONS})
+    conn.execute(text("""
+        INSERT INTO stockdashx.simulation_transactions
+            (account_id, stock_id, transaction_type, quantity, price, total_amount, transaction_date)
+        SELECT a.id, t.stock_id, t.transaction_type, t.quantity, t.price, t.quantity * t.price, t.transaction_date
+        FROM stockdashx.transactions t
+        JOIN stockdashx.portfolios p ON p.id = t.portfolio_id AND p.name = 'plan portfolio'
+        JOIN stockdashx.simulation_accounts a ON a.user_id = p.user_id AND a.name = 'plan account'
+    """))
+    # 표본이 테이블 전체를 덮도록 통계 대상을 늘려 실행마다 같은 통계(같은 실행 계획)가 나오게 함
+    conn.execute(text("SET LOCAL default_statistics_target = 1000"))
+    conn.execute(text("ANALYZE stockdashx.users, stockdashx.stocks, stockdashx.portfolios, stockdashx.transactions, "
+                      "stockdashx.simulation_accounts, stockdashx.simulation_transactions"))
+
+
+def resolve_params(conn, params):
+    """샘플 데이터 기준으로 실제 존재하는 ID를 바인드 파라미터에 채움"""
+    resolved = dict(params)
+    if "portfolio_id" in resolved:
+        resolved["portfolio_id"] = conn.execute(text(
+            "SELECT min(id) FROM stockdashx.portfolios WHERE name = 'plan portfolio'")).scalar()
+    if "account_id" in resolved:
+        resolved["account_id"] = conn.execute(text(
+            "SELECT min(id) FROM stockdashx.simulation_accounts WHERE name = 'plan account'")).scalar()
+    if "user_id" in resolved:
+        resolved["user_id"] = conn.execute(text(
+            "SELECT min(id) FROM stockdashx.users WHERE username LIKE 'plan_user_%'")).scalar()
+    if "stock_id" in resolved:
+        resolved["stock_id"] = conn.execute(text(
+            "SELECT min(id) FROM stockdashx.stocks WHERE symbol LIKE 'PLAN%'")).scalar()
+    return resolved
+
+
+def walk(plan):
+    """실행 계획 트리의 모든 노드 순회"""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+def check_plans(conn, baseline, compare=True):
+    """
+    샘플 데이터를 넣고 핫 쿼리의 실행 계획을 검사합니다 (호출한 쪽에서 트랜잭션을 롤백).
+
+    Args:
+        conn: 트랜잭션을 시작한 DB 연결
+        baseline (dict): 쿼리 이름 -> 기준 비용
+        compare (bool): 기준 비용과 비교할지 여부 (기준값 갱신 시 False)
+
+    Returns:
+        tuple: (쿼리 이름 -> 총 비용, 실패 메시지 목록)
+    """
+    results = {}
+    failures = []
+
+    seed(conn)
+
+    for name, (sql, params, guarded_tables) in HOT_QUERIES.items():
+        explain = conn.execute(
+            text(f"EXPLAIN (FORMAT JSON) {sql}"), resolve_params(conn, params)
+        ).scalar()
+        plan = (explain if isinstance(explain, list) else json.loads(explain))[0]["Plan"]
+
+        total_cost = plan["Total Cost"]
+        results[name] = total_cost
+        node_types = sorted({node["Node Type"] for node in walk(plan)})
+        print(f"{name:32s} cost={total_cost:10.2f}  nodes={', '.join(node_types)}")
+
+        for node in walk(plan):
+            if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in guarded_tables:
+                failures.append(f"{name}: {node['Relation Name']} 테이블 Seq Scan 발생")
+
+        expected = baseline.get(name)
+        if expected is not None and compare and total_cost > expected * (1 + COST_TOLERANCE):
+            failures.append(f"{name}: 비용 회귀 {expected:.2f} -> {total_cost:.2f}")
+
+    return results, failures
+
+
+def load_baseline():
+    """기준 비용 읽기 (파일이 없으면 빈 dict)"""
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 쿼리 실행 계획 회귀 검사")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 비용을 기준값으로 저장")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            # 기준값을 갱신할 때는 이전 기준값과 비교하지 않음
+            results, failures = check_plans(conn, load_baseline(), compare=not args.update_baseline)
+        finally:
+            trans.rollback()
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"기준값 저장: {BASELINE_PATH}")
+
+    if failures:
+        print("\n실행 계획 검사 실패:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+    print("\n실행 계획 검사 통과")
+
+
+if __name__ == "__main__":
+    main()
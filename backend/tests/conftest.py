@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pytest
+
+# app.db.database는 임포트 시 엔진을 만들므로 DB 설정이 없으면 기본값 사용
+# (DB가 필요한 테스트는 db_engine 픽스처를 쓰며, 연결할 수 없으면 건너뜀)
+for _name, _value in {"DB_HOST": "localhost", "DB_PORT": "5432", "DB_NAME": "x", "DB_USER": "x", "DB_PASSWORD": "x"}.items():
+    os.environ.setdefault(_name, _value)
+
+# backend 디렉터리에서 `python -m pytest`로 실행하지 않아도 app 패키지를 찾도록 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """마이그레이션이 적용된 DB 엔진 (DB에 연결할 수 없거나 스키마가 없으면 테스트 건너뜀)"""
+    from sqlalchemy import text
+
+    from app.db.database import engine
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1 FROM stockdashx.alembic_version"))
+    except Exception as e:
+        pytest.skip(f"테스트 DB를 사용할 수 없음: {e.__class__.__name__}")
+    return engine
+
+
+@pytest.fixture
+def db_session(db_engine):
+    """
+    테스트 하나가 끝나면 모두 롤백되는 세션
+
+    바깥 트랜잭션 안에서 실행하고, 코드 안의 commit/rollback은 세이브포인트에만
+    적용되므로 DB에 흔적이 남지 않습니다.
+    """
+    from sqlalchemy.orm import Session
+
+    connection = db_engine.connect()
+    trans = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        trans.rollback()
+        connection.close()
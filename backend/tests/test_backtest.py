@@ -0,0 +1,65 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.core.executors import shutdown_executors
+from app.services import backtest
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(7)
+    n = 400
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return {
+        "dates": np.datetime64("2020-01-01") + np.arange(n),
+        "open": close,
+        "high": close * 1.01,
+        "low": close * 0.99,
+        "close": close,
+        "volume": np.full(n, 1000, dtype=np.int64)
+    }
+
+
+def test_sma_and_rolling_std_match_naive_windows():
+    values = np.array([1.0, 2.0, 4.0, 8.0, 16.0])
+
+    np.testing.assert_allclose(backtest.sma(values, 2)[1:], [1.5, 3.0, 6.0, 12.0])
+    np.testing.assert_allclose(backtest.rolling_std(values, 3)[2:], [np.std(values[i - 2:i + 1]) for i in range(2, 5)])
+    assert np.isnan(backtest.sma(values, 2)[0])
+
+
+def test_expand_grid_rejects_too_many_combinations(monkeypatch):
+    monkeypatch.setattr(backtest, "MAX_SWEEP_COMBINATIONS", 3)
+
+    assert len(backtest.expand_grid({"fast": [5, 10], "slow": [20]})) == 2
+    with pytest.raises(backtest.StrategySpecError):
+        backtest.expand_grid({"fast": [5, 10], "slow": [20, 30]})
+
+
+def test_shared_bars_round_trip(bars):
+    shm, layout = backtest.share_bars(bars)
+    try:
+        for name, (offset, dtype, shape) in layout.items():
+            shared = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            np.testing.assert_array_equal(shared, bars[name])
+            del shared
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_sweep_matches_sequential_backtests_in_order(bars):
+    grid = {"fast": [5, 10, 15], "slow": [30, 60]}
+
+    try:
+        results = asyncio.run(backtest.run_sweep(bars, "TEST", "ma_crossover", grid))
+    finally:
+        shutdown_executors()
+
+    expected = [
+        backtest.run_backtest(bars, "TEST", "ma_crossover", params, include_details=False)
+        for params in backtest.expand_grid(grid)
+    ]
+    assert results == expected
@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+import pytest
+
+from app.services import execution
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    def apply(**values):
+        for name, value in values.items():
+            monkeypatch.setattr(execution, name, value)
+    return apply
+
+
+def test_fixed_bps_slippage_is_always_adverse(settings):
+    settings(SIMULATION_SLIPPAGE_BPS=10)
+    assert execution._fixed_bps_slippage("BUY", Decimal("100")) == Decimal("100.1")
+    assert execution._fixed_bps_slippage("SELL", Decimal("100")) == Decimal("99.9")
+
+
+def test_per_share_commission_applies_minimum(settings):
+    settings(SIMULATION_COMMISSION_RATE=0.005, SIMULATION_COMMISSION_MIN=1.0)
+    assert execution._per_share_commission(100, Decimal("50")) == Decimal("1.0")
+    assert execution._per_share_commission(1000, Decimal("50")) == Decimal("5.000")
+
+
+def test_percent_commission_applies_minimum(settings):
+    settings(SIMULATION_COMMISSION_RATE=0.001, SIMULATION_COMMISSION_MIN=1.0)
+    assert execution._percent_commission(10, Decimal("50")) == Decimal("1.0")
+    assert execution._percent_commission(100, Decimal("50")) == Decimal("5")
+
+
+def test_price_fill_rounds_to_cents(settings):
+    settings(
+        SIMULATION_SLIPPAGE_MODEL="fixed_bps", SIMULATION_SLIPPAGE_BPS=10,
+        SIMULATION_COMMISSION_MODEL="percent", SIMULATION_COMMISSION_RATE=0.001, SIMULATION_COMMISSION_MIN=0
+    )
+    fill_price, fee = execution.price_fill("BUY", 300, Decimal("33.333"))
+    assert fill_price == Decimal("33.37")
+    assert fee == Decimal("10.01")
+
+
+def test_price_fill_without_models(settings):
+    settings(SIMULATION_SLIPPAGE_MODEL="none", SIMULATION_COMMISSION_MODEL="none")
+    assert execution.price_fill("SELL", 10, Decimal("12.345")) == (Decimal("12.35"), Decimal("0.00"))
+
+
+def test_unknown_models_fall_back_to_none(settings):
+    settings(SIMULATION_SLIPPAGE_MODEL="bogus", SIMULATION_COMMISSION_MODEL="bogus")
+    assert execution.price_fill("BUY", 10, Decimal("10")) == (Decimal("10.00"), Decimal("0.00"))
+
+
+def test_market_order_for_unregistered_symbol_is_rejected_without_upstream_call(db_session, monkeypatch):
+    from fastapi import HTTPException
+
+    from app.api.v1.endpoints.simulation import create_simulation_transaction
+    from app.db.models import SimulationAccount, User
+    from app.schemas.simulation import SimulationTransactionCreate
+    from app.services import stock_data
+
+    async def fail(symbol):
+        raise AssertionError("주문 경로에서 외부 시세 API를 호출함")
+    monkeypatch.setattr(stock_data, "get_stock_quote", fail)
+
+    user = User(email="execution-test@example.com", username="execution-test", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    account = SimulationAccount(user_id=user.id, name="execution test", initial_balance=1000, current_balance=1000)
+    db_session.add(account)
+    db_session.flush()
+
+    request = SimulationTransactionCreate(
+        account_id=account.id, symbol="NOSUCHSYM", transaction_type="BUY", quantity=1, price=1
+    )
+    with pytest.raises(HTTPException) as error:
+        create_simulation_transaction(request, current_user=user, db=db_session)
+    assert error.value.status_code == 404
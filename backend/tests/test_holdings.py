@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+from app.services.holdings import compute_holdings, portfolio_cost, replay_holdings, summarize_holdings
+
+
+def stock(symbol, last_price=None):
+    return SimpleNamespace(symbol=symbol, name=f"{symbol} Inc", last_price=last_price)
+
+
+def trade(stock_, side, quantity, price):
+    return SimpleNamespace(stock=stock_, transaction_type=side, quantity=quantity, price=price)
+
+
+def replay(transactions):
+    return replay_holdings(transactions, portfolio_cost, lambda s: float(s.last_price or 0))
+
+
+def test_buys_average_the_cost():
+    aapl = stock("AAPL", 130)
+    holdings = replay([trade(aapl, "BUY", 10, 100), trade(aapl, "BUY", 10, 120)])
+
+    assert holdings["AAPL"]["quantity"] == 20
+    assert holdings["AAPL"]["avg_price"] == 110
+    assert holdings["AAPL"]["total_cost"] == 2200
+
+
+def test_partial_sell_keeps_average_price():
+    aapl = stock("AAPL", 130)
+    holdings = replay([trade(aapl, "BUY", 10, 100), trade(aapl, "BUY", 10, 120), trade(aapl, "SELL", 5, 150)])
+
+    assert holdings["AAPL"]["quantity"] == 15
+    assert holdings["AAPL"]["avg_price"] == 110
+    assert holdings["AAPL"]["total_cost"] == 1650
+
+
+def test_rebuy_after_selling_out_starts_a_new_average():
+    aapl = stock("AAPL", 210)
+    holdings = replay([trade(aapl, "BUY", 10, 100), trade(aapl, "SELL", 10, 150), trade(aapl, "BUY", 10, 200)])
+
+    assert holdings["AAPL"]["avg_price"] == 200
+    assert holdings["AAPL"]["total_cost"] == 2000
+
+
+def test_sell_without_buy_is_ignored():
+    holdings = replay([trade(stock("AAPL"), "SELL", 10, 100)])
+    assert holdings == {}
+
+
+def test_summary_excludes_sold_out_positions():
+    aapl, msft = stock("AAPL", 120), stock("MSFT", 50)
+    transactions = [
+        trade(aapl, "BUY", 10, 100),
+        trade(msft, "BUY", 4, 40),
+        trade(msft, "SELL", 4, 45)
+    ]
+    holdings_list, total_investment, current_value = summarize_holdings(replay(transactions))
+
+    assert [holding["symbol"] for holding in holdings_list] == ["AAPL"]
+    assert total_investment == 1000
+    assert current_value == 1200
+    assert holdings_list[0]["profit_loss"] == 200
+    assert holdings_list[0]["profit_loss_percent"] == 20
+
+
+def test_compute_holdings_matches_replay_and_summary():
+    aapl = stock("AAPL", 120)
+    transactions = [trade(aapl, "BUY", 10, 100)]
+    _, total_investment, current_value = compute_holdings(transactions, portfolio_cost, lambda s: float(s.last_price))
+
+    assert (total_investment, current_value) == (1000, 1200)
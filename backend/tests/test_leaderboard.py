@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from app.db.models import SimulationAccount, Stock, User
+from app.services.leaderboard import AccountScore, Leaderboard
+from app.services.simulation_trading import execute_simulation_trade, record_account_change
+
+
+def score(account_id, cash, holdings=None, initial_balance=1000.0):
+    return AccountScore(
+        account_id=account_id,
+        user_id=1,
+        name=f"account {account_id}",
+        username="user",
+        initial_balance=initial_balance,
+        cash=cash,
+        holdings=holdings or {}
+    )
+
+
+def ranked_ids(board, limit=10):
+    return [entry["account_id"] for entry in board.top(limit)]
+
+
+def test_quotes_update_holders_by_delta_and_reorder():
+    board = Leaderboard()
+    board.prices["AAA"] = 50.0
+    with board._lock:
+        board._put(score(1, cash=500.0, holdings={"AAA": 10}))
+        board._put(score(2, cash=1100.0))
+
+    assert ranked_ids(board) == [2, 1]
+    assert board.top(1)[0]["return_percent"] == 10.0
+
+    board.on_quote("AAA", 70.0)
+    assert ranked_ids(board) == [1, 2]
+    assert board.get_rank(1)["total_value"] == 1200.0
+    assert board.get_rank(2)["rank"] == 2
+
+    # 보유하지 않은 종목 시세는 순위에 영향 없음
+    board.on_quote("BBB", 1.0)
+    assert ranked_ids(board) == [1, 2]
+
+
+def test_top_returns_only_the_requested_prefix():
+    board = Leaderboard()
+    with board._lock:
+        for account_id in range(1, 6):
+            board._put(score(account_id, cash=1000.0 + account_id))
+
+    assert ranked_ids(board, 3) == [5, 4, 3]
+    assert [entry["rank"] for entry in board.top(3)] == [1, 2, 3]
+    assert board.get_rank(1)["rank"] == 5
+
+
+def test_sync_reads_only_accounts_changed_elsewhere(db_session):
+    user = User(email="leaderboard-test@example.com", username="leaderboard-test", hashed_password="x")
+    stock = Stock(symbol="RANKTEST", name="Rank Test", last_price=Decimal("10"))
+    db_session.add_all([user, stock])
+    db_session.flush()
+    first = SimulationAccount(user_id=user.id, name="first", initial_balance=1000, current_balance=1000)
+    second = SimulationAccount(user_id=user.id, name="second", initial_balance=1000, current_balance=1000)
+    db_session.add_all([first, second])
+    db_session.flush()
+    record_account_change(db_session, first.id)
+    record_account_change(db_session, second.id)
+    db_session.commit()
+
+    board = Leaderboard()
+    board.rebuild(db_session)
+    # 커밋 지연 기간 안의 기록은 rebuild 뒤 첫 sync에서 다시 읽고, 이후에는 새 기록만 읽음
+    assert board.sync(db_session) >= 2
+    assert board.sync(db_session) == 0
+
+    # 다른 워커에서 체결된 거래 (이 순위표의 리스너는 호출되지 않음)
+    execute_simulation_trade(db_session, first.id, stock.id, "BUY", 10, Decimal("10"))
+    board.on_quote("RANKTEST", 20.0)
+    assert board.sync(db_session) == 1
+    assert board.get_rank(first.id)["total_value"] == 1100.0
+    assert board.get_rank(second.id)["total_value"] == 1000.0
+
+    # 다른 워커에서 삭제된 계좌
+    db_session.delete(second)
+    record_account_change(db_session, second.id)
+    db_session.commit()
+    assert board.sync(db_session) == 1
+    assert board.get_rank(second.id) is None
@@ -0,0 +1,108 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.db.models import NavSnapshot, Portfolio, SimulationAccount, SimulationTransaction, Stock, Transaction, User
+from app.services.holdings import compute_holdings, last_price, portfolio_cost
+from app.services.nav_snapshots import PORTFOLIO, SIMULATION, take_nav_snapshots
+
+SNAPSHOT_DATE = date(2024, 12, 31)
+
+
+def day(value):
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def owner(db_session):
+    user = User(email="nav-test@example.com", username="nav-test", hashed_password="x")
+    stock = Stock(symbol="NAVTEST", name="NAV Test", last_price=Decimal("150"))
+    db_session.add_all([user, stock])
+    db_session.flush()
+    return user, stock
+
+
+def add_portfolio(db_session, owner, trades):
+    """trades: (날짜, 유형, 수량, 가격) 목록 - 같은 날짜는 입력 순서(ID)대로 처리됨"""
+    user, stock = owner
+    portfolio = Portfolio(user_id=user.id, name="nav test")
+    db_session.add(portfolio)
+    db_session.flush()
+    for when, transaction_type, quantity, price in trades:
+        db_session.add(Transaction(
+            portfolio_id=portfolio.id, stock_id=stock.id, transaction_type=transaction_type,
+            quantity=quantity, price=Decimal(price), transaction_date=day(when)
+        ))
+        db_session.flush()
+    return portfolio
+
+
+def snapshot(db_session, owner_type, owner_id):
+    return db_session.query(NavSnapshot).filter_by(
+        owner_type=owner_type, owner_id=owner_id, snapshot_date=SNAPSHOT_DATE
+    ).one()
+
+
+@pytest.mark.parametrize("trades, invested, realized", [
+    # 부분 매도 후 추가 매수: 남은 5주(원가 500) + 10주(1300)
+    ([("2024-01-01", "BUY", 10, "100"), ("2024-02-01", "SELL", 5, "120"), ("2024-03-01", "BUY", 10, "130")], 1800, 100),
+    # 전량 매도 후 재매수: 이전 원가는 남지 않음
+    ([("2024-01-01", "BUY", 10, "100"), ("2024-02-01", "SELL", 10, "150"), ("2024-03-01", "BUY", 4, "200")], 800, 500),
+    # 같은 날 거래는 ID 순서로 처리
+    ([("2024-01-01", "BUY", 10, "100"), ("2024-01-01", "SELL", 10, "90"), ("2024-01-01", "BUY", 2, "110")], 220, -100),
+    # 매수 전 매도는 무시
+    ([("2024-01-01", "SELL", 3, "100"), ("2024-02-01", "BUY", 2, "100")], 200, 0),
+])
+def test_portfolio_snapshot_matches_replay(db_session, owner, trades, invested, realized):
+    portfolio = add_portfolio(db_session, owner, trades)
+
+    take_nav_snapshots(db_session, SNAPSHOT_DATE)
+
+    row = snapshot(db_session, PORTFOLIO, portfolio.id)
+    transactions = db_session.query(Transaction).filter_by(portfolio_id=portfolio.id).order_by(
+        Transaction.transaction_date, Transaction.id
+    ).all()
+    _, expected_invested, expected_value = compute_holdings(transactions, portfolio_cost, last_price)
+    assert float(row.invested) == pytest.approx(expected_invested) == pytest.approx(invested)
+    assert float(row.market_value) == pytest.approx(expected_value)
+    assert float(row.cash) == pytest.approx(realized)
+    assert float(row.nav) == pytest.approx(realized + expected_value)
+    assert float(row.pnl) == pytest.approx(expected_value - invested + realized)
+
+
+def test_empty_owners_get_zero_snapshots(db_session, owner):
+    user, _ = owner
+    portfolio = add_portfolio(db_session, owner, [])
+    account = SimulationAccount(user_id=user.id, name="nav test", initial_balance=1000, current_balance=1000)
+    db_session.add(account)
+    db_session.flush()
+
+    counts = take_nav_snapshots(db_session, SNAPSHOT_DATE)
+
+    assert counts[PORTFOLIO] >= 1 and counts[SIMULATION] >= 1
+    assert float(snapshot(db_session, PORTFOLIO, portfolio.id).nav) == 0
+    assert float(snapshot(db_session, SIMULATION, account.id).nav) == 1000
+
+
+def test_simulation_snapshot_uses_cash_and_commission_cost(db_session, owner):
+    user, stock = owner
+    account = SimulationAccount(user_id=user.id, name="nav test", initial_balance=10000, current_balance=8490)
+    db_session.add(account)
+    db_session.flush()
+    db_session.add(SimulationTransaction(
+        account_id=account.id, stock_id=stock.id, transaction_type="BUY", quantity=10,
+        price=Decimal("150"), commission=Decimal("10"), total_amount=Decimal("1510"), transaction_date=day("2024-01-01")
+    ))
+    db_session.flush()
+
+    take_nav_snapshots(db_session, SNAPSHOT_DATE)
+    # 같은 날짜로 다시 실행하면 기존 스냅샷을 갱신
+    take_nav_snapshots(db_session, SNAPSHOT_DATE)
+
+    row = snapshot(db_session, SIMULATION, account.id)
+    assert float(row.cash) == 8490
+    assert float(row.invested) == pytest.approx(1510)
+    assert float(row.market_value) == 1500
+    assert float(row.nav) == 9990
+    assert float(row.pnl) == -10
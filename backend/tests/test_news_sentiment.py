@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from app.services.news_sentiment import score_texts
+
+
+def test_positive_and_negative_articles():
+    scores = score_texts([
+        "Shares surged after earnings beat estimates",
+        "Shares plunged after the company missed estimates",
+    ])
+    assert scores[0] == pytest.approx(1.0)
+    assert scores[1] == pytest.approx(-1.0)
+
+
+def test_mixed_article_scores_between_extremes():
+    # 긍정 2, 부정 1 -> (2 - 1) / 3
+    score, = score_texts(["Revenue grew and margins improved despite lawsuit"])
+    assert score == pytest.approx(1 / 3)
+
+
+def test_negation_flips_polarity_within_scope():
+    scores = score_texts([
+        "The unit is not profitable",
+        "The company didn't beat estimates",
+        "Not that anyone expected the results to be profitable",
+    ])
+    assert scores[0] == pytest.approx(-1.0)
+    assert scores[1] == pytest.approx(-1.0)
+    # 부정어에서 NEGATION_SCOPE 토큰보다 멀리 있으면 뒤집지 않음
+    assert scores[2] == pytest.approx(1.0)
+
+
+def test_negation_does_not_cross_articles():
+    scores = score_texts(["Results were not", "good"])
+    assert scores[1] == pytest.approx(1.0)
+
+
+def test_articles_without_sentiment_words_score_zero():
+    scores = score_texts(["", "The meeting is on Tuesday", "Profits rose"])
+    assert scores[0] == 0
+    assert scores[1] == 0
+    assert scores[2] == pytest.approx(1.0)
+
+
+def test_empty_batch_and_range():
+    assert len(score_texts([])) == 0
+    scores = score_texts(["gain loss gain", "crash fraud probe", "up up down"])
+    assert np.all((scores >= -1) & (scores <= 1))
@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+
+from app.db.models import NewsFetchSlot
+from app.services import news_service
+
+
+def test_fetch_slots_are_capped_per_window(db_session, monkeypatch):
+    monkeypatch.setattr(news_service, "NEWS_INGEST_MAX_SYMBOLS", 2)
+    db_session.query(NewsFetchSlot).delete()
+
+    taken = [news_service.take_fetch_slot(db_session) for _ in range(3)]
+
+    assert taken == [True, True, False]
+    assert db_session.query(NewsFetchSlot.count).scalar() == 2
+
+
+def test_prune_keeps_current_window(db_session):
+    db_session.query(NewsFetchSlot).delete()
+    news_service.take_fetch_slot(db_session)
+    db_session.add(NewsFetchSlot(window_start=news_service._fetch_window_start(
+        datetime(2020, 1, 1, tzinfo=timezone.utc)), count=5))
+    db_session.commit()
+
+    news_service.prune_fetch_slots(db_session)
+
+    assert db_session.query(NewsFetchSlot.count).all() == [(1,)]
@@ -0,0 +1,62 @@
+from app.services.news_tagger import SymbolTagger, name_aliases
+
+STOCKS = [
+    ("AAPL", "Apple Inc"),
+    ("GOOGL", "Alphabet Inc - Class A"),
+    ("BAC", "Bank of America Corp"),
+    ("TGT", "Target Corp"),
+    ("SQ", "Block Inc"),
+    ("GPS", "Gap Inc"),
+    ("NVDA", "NVIDIA Corp"),
+    ("F", "Ford Motor Co"),
+]
+
+
+def make_tagger():
+    tagger = SymbolTagger()
+    tagger.build(STOCKS)
+    return tagger
+
+
+def test_name_aliases_strip_legal_suffixes():
+    assert name_aliases("Alphabet Inc - Class A") == {"alphabet inc", "alphabet"}
+    assert name_aliases("Bank of America Corp") == {"bank of america corp", "bank of america"}
+    assert name_aliases("") == set()
+
+
+def test_symbols_match_only_in_upper_case():
+    tagger = make_tagger()
+    assert tagger.tag("AAPL rose 2% today") == {"AAPL"}
+    assert tagger.tag("aapl rose 2% today") == set()
+
+
+def test_short_symbols_need_cashtag():
+    tagger = make_tagger()
+    assert tagger.tag("F shares fell") == set()
+    assert tagger.tag("$F shares fell") == {"F"}
+
+
+def test_patterns_respect_word_boundaries():
+    tagger = make_tagger()
+    assert tagger.tag("Pineapple Inc reported") == set()
+    assert tagger.tag("XAAPL and AAPLX are not symbols") == set()
+
+
+def test_company_names_match_case_insensitively_for_multi_word_aliases():
+    tagger = make_tagger()
+    assert tagger.tag("bank of america raised its dividend") == {"BAC"}
+    assert tagger.tag("Alphabet and Apple announced a deal") == {"GOOGL", "AAPL"}
+
+
+def test_single_word_aliases_need_capitalization():
+    tagger = make_tagger()
+    text = "Analysts raised the price target on NVIDIA after a block trade; the gap widened"
+    assert tagger.tag(text) == {"NVDA"}
+    assert tagger.tag("Target, Block and Gap reported earnings") == {"TGT", "SQ", "GPS"}
+
+
+def test_empty_text_and_rebuild():
+    tagger = make_tagger()
+    assert tagger.tag("") == set()
+    tagger.build([("MSFT", "Microsoft Corp")])
+    assert tagger.tag("AAPL and Microsoft") == {"MSFT"}
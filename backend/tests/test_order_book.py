@@ -0,0 +1,188 @@
+from decimal import Decimal
+
+from app.services.order_book import OrderBook, RestingOrder
+
+
+def make_order(order_id, order_type, side, limit=None, stop=None, symbol="AAPL", status="OPEN"):
+    return RestingOrder(
+        id=order_id,
+        account_id=1,
+        stock_id=1,
+        symbol=symbol,
+        order_type=order_type,
+        transaction_type=side,
+        quantity=10,
+        limit_price=Decimal(str(limit)) if limit is not None else None,
+        stop_price=Decimal(str(stop)) if stop is not None else None,
+        status=status
+    )
+
+
+def ids(orders):
+    return sorted(order.id for order in orders)
+
+
+def test_limit_orders_fill_only_when_crossed():
+    book = OrderBook()
+    book.add(make_order(1, "LIMIT", "BUY", limit=100))
+    book.add(make_order(2, "LIMIT", "BUY", limit=99))
+    book.add(make_order(3, "LIMIT", "SELL", limit=101))
+
+    fills, triggered = book.match("AAPL", Decimal("99.5"))
+    assert ids(fills) == [1]
+    assert triggered == []
+
+    fills, _ = book.match("AAPL", Decimal("101"))
+    assert ids(fills) == [3]
+
+    fills, _ = book.match("AAPL", Decimal("99"))
+    assert ids(fills) == [2]
+    assert book.orders == {}
+
+
+def test_filled_orders_are_not_matched_again():
+    book = OrderBook()
+    book.add(make_order(1, "LIMIT", "BUY", limit=100))
+
+    fills, _ = book.match("AAPL", Decimal("100"))
+    assert ids(fills) == [1]
+    fills, _ = book.match("AAPL", Decimal("90"))
+    assert fills == []
+
+
+def test_stop_orders_trigger_at_stop_price():
+    book = OrderBook()
+    book.add(make_order(1, "STOP", "BUY", stop=105))
+    book.add(make_order(2, "STOP", "SELL", stop=95))
+
+    assert book.match("AAPL", Decimal("104"))[0] == []
+    assert ids(book.match("AAPL", Decimal("105"))[0]) == [1]
+    assert ids(book.match("AAPL", Decimal("95"))[0]) == [2]
+
+
+def test_stop_limit_becomes_limit_after_trigger():
+    book = OrderBook()
+    book.add(make_order(1, "STOP_LIMIT", "SELL", stop=95, limit=96))
+
+    fills, triggered = book.match("AAPL", Decimal("95"))
+    assert fills == []
+    assert ids(triggered) == [1]
+    assert book.orders[1].status == "TRIGGERED"
+
+    fills, triggered = book.match("AAPL", Decimal("96"))
+    assert ids(fills) == [1]
+    assert triggered == []
+
+
+def test_stop_limit_fills_in_same_tick_when_limit_already_crossed():
+    book = OrderBook()
+    book.add(make_order(1, "STOP_LIMIT", "BUY", stop=105, limit=106))
+
+    fills, triggered = book.match("AAPL", Decimal("105"))
+    assert ids(fills) == [1]
+    assert ids(triggered) == [1]
+
+
+def test_removed_orders_are_skipped_and_dropped_from_heap():
+    book = OrderBook()
+    book.add(make_order(1, "LIMIT", "BUY", limit=100))
+    book.add(make_order(2, "LIMIT", "BUY", limit=100))
+    book.remove(1)
+
+    # 취소된 주문은 힙에 남아 있다가 꺼낼 때 건너뜀
+    assert len(book.books["AAPL"].buy_limits) == 2
+    fills, _ = book.match("AAPL", Decimal("100"))
+    assert ids(fills) == [2]
+    assert book.books["AAPL"].buy_limits == []
+
+
+def test_other_symbols_are_not_matched():
+    book = OrderBook()
+    book.add(make_order(1, "LIMIT", "BUY", limit=100, symbol="MSFT"))
+
+    assert book.match("AAPL", Decimal("1")) == ([], [])
+    assert ids(book.match("MSFT", Decimal("100"))[0]) == [1]
+
+
+class FakeQuery:
+    """sync가 쓰는 db.query(...).join(...).filter(...).all() 체인만 흉내냄"""
+
+    def __init__(self, rows, on_all=None):
+        self.rows = rows
+        self.on_all = on_all
+
+    def join(self, *args):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def all(self):
+        if self.on_all:
+            self.on_all()
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, orders, on_all=None):
+        self.orders = orders
+        self.on_all = on_all
+
+    def query(self, *args):
+        return FakeQuery([(order, order.symbol) for order in self.orders], self.on_all)
+
+
+def test_sync_adds_orders_from_other_workers_and_drops_closed_ones():
+    book = OrderBook()
+    book.add(make_order(1, "LIMIT", "BUY", limit=100))
+    book.add(make_order(2, "LIMIT", "BUY", limit=100))
+
+    # 1번은 다른 워커에서 취소됨, 3번은 다른 워커에서 접수됨
+    assert book.sync(FakeSession([make_order(2, "LIMIT", "BUY", limit=100), make_order(3, "LIMIT", "SELL", limit=101)])) == 2
+    assert sorted(book.orders) == [2, 3]
+    assert ids(book.match("AAPL", Decimal("101"))[0]) == [3]
+    assert ids(book.match("AAPL", Decimal("100"))[0]) == [2]
+
+
+def test_sync_keeps_orders_added_while_querying():
+    book = OrderBook()
+    session = FakeSession([], on_all=lambda: book.add(make_order(1, "LIMIT", "BUY", limit=100)))
+
+    book.sync(session)
+    assert sorted(book.orders) == [1]
+
+
+def test_sync_does_not_re_add_pending_or_finished_orders():
+    book = OrderBook()
+    book.add(make_order(1, "LIMIT", "BUY", limit=100))
+    book.add(make_order(2, "LIMIT", "BUY", limit=100))
+    fills, _ = book.match("AAPL", Decimal("100"))
+    assert ids(fills) == [1, 2]
+    book.finish(2)
+
+    # 체결 저장 전이라 DB에는 아직 미체결로 보임
+    stale = FakeSession([make_order(1, "LIMIT", "BUY", limit=100), make_order(2, "LIMIT", "BUY", limit=100)])
+    book.sync(stale)
+    assert book.orders == {}
+    assert book.match("AAPL", Decimal("100"))[0] == []
+
+
+def test_sync_converts_orders_triggered_elsewhere():
+    book = OrderBook()
+    book.add(make_order(1, "STOP_LIMIT", "SELL", stop=95, limit=96))
+
+    book.sync(FakeSession([make_order(1, "STOP_LIMIT", "SELL", stop=95, limit=96, status="TRIGGERED")]))
+    assert book.orders[1].status == "TRIGGERED"
+    assert ids(book.match("AAPL", Decimal("97"))[0]) == [1]
+
+
+def test_remove_account_drops_its_orders():
+    book = OrderBook()
+    book.add(make_order(1, "LIMIT", "BUY", limit=100))
+    other = make_order(2, "LIMIT", "BUY", limit=100)
+    other.account_id = 2
+    book.add(other)
+
+    book.remove_account(1)
+    assert sorted(book.orders) == [2]
+    assert ids(book.match("AAPL", Decimal("100"))[0]) == [2]
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.db.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.services.news_service import _window_start
+
+NOW = datetime(2025, 4, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(NOW, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (NOW, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "bm9waXBl", encode_cursor(NOW, 1)[:-3] + "!!!"])
+def test_invalid_cursor_raises(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def entries():
+    # (published_at, article_id, 기사) 최신순 - 같은 시각은 id 역순
+    return [
+        (NOW, 5, {}),
+        (NOW, 4, {}),
+        (NOW - timedelta(hours=1), 3, {}),
+        (NOW - timedelta(hours=2), 2, {}),
+    ]
+
+
+def test_window_start_without_cursor_uses_page():
+    assert _window_start(entries(), None, 1, 2) == 0
+    assert _window_start(entries(), None, 3, 2) == 4
+
+
+def test_window_start_resumes_after_cursor():
+    assert _window_start(entries(), encode_cursor(NOW, 5), 1, 2) == 1
+    assert _window_start(entries(), encode_cursor(NOW, 4), 1, 2) == 2
+    assert _window_start(entries(), encode_cursor(NOW - timedelta(hours=2), 2), 1, 2) == 4
+
+
+def test_window_start_with_naive_cursor_is_invalid():
+    with pytest.raises(InvalidCursorError):
+        _window_start(entries(), encode_cursor(NOW.replace(tzinfo=None), 5), 1, 2)
@@ -0,0 +1,37 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.metrics import PASSWORD_HASH_DURATION, PASSWORD_HASH_PENDING, PASSWORD_HASH_REJECTED
+
+
+def test_full_queue_is_rejected_with_503(monkeypatch):
+    monkeypatch.setattr(security, "_password_slots", threading.BoundedSemaphore(0))
+    rejected = PASSWORD_HASH_REJECTED.labels().value
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(security.hash_password_async("secret"))
+
+    assert error.value.status_code == 503
+    assert error.value.headers == {"Retry-After": "1"}
+    assert PASSWORD_HASH_REJECTED.labels().value == rejected + 1
+    assert PASSWORD_HASH_PENDING.labels().value == 0
+
+
+def test_task_releases_slot_and_records_duration(monkeypatch):
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(security, "_password_slots", slots)
+    # 프로세스 풀 대신 기본 스레드 풀에서 실행 (해시 비용과 무관하게 지표/슬롯만 확인)
+    monkeypatch.setattr(security, "get_password_pool", lambda: None)
+    duration = PASSWORD_HASH_DURATION.labels("hash")
+    observed = sum(duration.counts)
+
+    result = asyncio.run(security._run_password_task("hash", str.upper, "secret"))
+
+    assert result == "SECRET"
+    assert sum(duration.counts) == observed + 1
+    assert PASSWORD_HASH_PENDING.labels().value == 0
+    assert slots.acquire(blocking=False)
@@ -0,0 +1,16 @@
+from scripts.check_query_plans import check_plans, load_baseline
+
+
+def test_hot_query_plans_match_baseline(db_engine):
+    baseline = load_baseline()
+
+    with db_engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            results, failures = check_plans(conn, baseline)
+        finally:
+            trans.rollback()
+
+    assert failures == []
+    # 기준값 파일에 없는 새 쿼리는 --update-baseline으로 기준값을 추가해야 함
+    assert sorted(results) == sorted(baseline)
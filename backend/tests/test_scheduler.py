@@ -0,0 +1,84 @@
+import asyncio
+import logging
+
+import pytest
+
+from app.core import tasks
+from app.core.leader import FileLock, LeaderElection
+from app.core.metrics import JOB_LAST_SUCCESS, JOB_RUNS
+
+
+def test_file_lock_fails_over_to_the_next_worker(tmp_path):
+    path = str(tmp_path / "scheduler.lock")
+    first = LeaderElection(FileLock(path))
+    second = LeaderElection(FileLock(path))
+
+    assert first.renew() is True
+    assert second.renew() is False
+    # 리더는 renew()로 잠금을 유지하고, 나머지 워커는 계속 실패
+    assert first.renew() is True
+    assert second.renew() is False
+
+    first.release()
+
+    assert second.renew() is True
+    assert first.renew() is False
+    second.release()
+
+
+class Leader:
+    def __init__(self, is_leader):
+        self.is_leader = is_leader
+
+    def renew(self):
+        return self.is_leader
+
+
+def run_job(name, func, leader_only=True):
+    asyncio.run(tasks._run_scheduled_job(name, func, leader_only))
+
+
+def test_leader_only_jobs_are_skipped_on_other_workers(monkeypatch):
+    monkeypatch.setattr(tasks, "LEADER", Leader(False))
+    calls = []
+    skipped = JOB_RUNS.labels("test_skip", "skipped").value
+
+    run_job("test_skip", lambda: calls.append(1))
+    run_job("test_skip", lambda: calls.append(2), leader_only=False)
+
+    assert calls == [2]
+    assert JOB_RUNS.labels("test_skip", "skipped").value == skipped + 1
+    assert JOB_LAST_SUCCESS.labels("test_skip").value > 0
+
+
+def _sleep_once():
+    """첫 sleep은 바로 반환하고 두 번째 sleep에서 작업을 취소하는 가짜 asyncio.sleep"""
+    calls = []
+
+    async def sleep(delay):
+        calls.append(delay)
+        if len(calls) > 1:
+            raise asyncio.CancelledError
+    return sleep
+
+
+def test_failed_job_is_counted_and_logged(monkeypatch, caplog):
+    monkeypatch.setattr(tasks, "LEADER", Leader(True))
+    monkeypatch.setattr(tasks.asyncio, "sleep", _sleep_once())
+    failures = JOB_RUNS.labels("test_failure", "failure").value
+
+    def fail():
+        raise RuntimeError("boom")
+
+    async def run():
+        tasks.start_periodic_task("test_failure", 60, fail, run_at_start=True)
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.gather(*tasks._periodic_tasks)
+
+    with caplog.at_level(logging.ERROR, logger="app.core.tasks"):
+        asyncio.run(run())
+
+    assert JOB_RUNS.labels("test_failure", "failure").value == failures + 1
+    assert "주기 작업 실패 (test_failure)" in caplog.text
+    assert "RuntimeError: boom" in caplog.text
+
@@ -0,0 +1,97 @@
+import threading
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete
+
+from app.db.database import SessionLocal
+from app.db.models import SimulationAccount, Stock, User
+from app.services.simulation_trading import execute_simulation_trade, get_position_quantity
+
+
+@pytest.fixture
+def account(db_engine):
+    """동시 거래 테스트용 계좌 (다른 연결에서 보이도록 커밋하고 테스트 후 삭제)"""
+    db = SessionLocal()
+    user = User(email="locking-test@example.com", username="locking-test", hashed_password="x")
+    stock = Stock(symbol="LOCKTEST", name="Locking Test", last_price=Decimal("100"))
+    db.add_all([user, stock])
+    db.flush()
+    account = SimulationAccount(user_id=user.id, name="locking test", initial_balance=1000, current_balance=1000)
+    db.add(account)
+    db.commit()
+    ids = (account.id, stock.id)
+    try:
+        yield ids
+    finally:
+        # 계좌와 거래 내역은 사용자 삭제 시 cascade로 함께 삭제됨
+        db.execute(delete(User).where(User.id == user.id))
+        db.execute(delete(Stock).where(Stock.id == stock.id))
+        db.commit()
+        db.close()
+
+
+def run_concurrently(count, trade):
+    """trade(db)를 스레드 count개에서 동시에 실행하고 (성공 수, 실패 상태 코드 목록) 반환"""
+    barrier = threading.Barrier(count)
+    results = []
+
+    def worker():
+        db = SessionLocal()
+        try:
+            barrier.wait()
+            trade(db)
+            results.append(None)
+        except HTTPException as e:
+            results.append(e.status_code)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results.count(None), [code for code in results if code is not None]
+
+
+def test_concurrent_buys_cannot_overspend(account):
+    account_id, stock_id = account
+
+    succeeded, failures = run_concurrently(
+        4, lambda db: execute_simulation_trade(db, account_id, stock_id, "BUY", 6, Decimal("100"))
+    )
+
+    assert succeeded == 1
+    assert failures == [400, 400, 400]
+    db = SessionLocal()
+    try:
+        balance = db.query(SimulationAccount.current_balance).filter(SimulationAccount.id == account_id).scalar()
+        assert balance == Decimal("400")
+        assert get_position_quantity(db, account_id, stock_id) == 6
+    finally:
+        db.close()
+
+
+def test_concurrent_sells_cannot_sell_the_same_shares_twice(account):
+    account_id, stock_id = account
+    db = SessionLocal()
+    try:
+        execute_simulation_trade(db, account_id, stock_id, "BUY", 5, Decimal("100"))
+    finally:
+        db.close()
+
+    succeeded, failures = run_concurrently(
+        4, lambda db: execute_simulation_trade(db, account_id, stock_id, "SELL", 5, Decimal("110"))
+    )
+
+    assert succeeded == 1
+    assert failures == [400, 400, 400]
+    db = SessionLocal()
+    try:
+        balance = db.query(SimulationAccount.current_balance).filter(SimulationAccount.id == account_id).scalar()
+        assert balance == Decimal("1050")
+        assert get_position_quantity(db, account_id, stock_id) == 0
+    finally:
+        db.close()
@@ -0,0 +1,81 @@
+import io
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.db.models import Portfolio, Stock, Transaction, User
+from app.services.transaction_import import PositionTimeline, import_transactions_csv
+
+
+def day(value):
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+def test_timeline_limits_sells_by_later_positions():
+    timeline = PositionTimeline()
+    timeline.append(day("2024-01-01"), 10)
+    timeline.append(day("2024-03-01"), -8)
+    timeline.finish()
+
+    assert timeline.sellable(day("2023-12-31")) == 0
+    # 2월에는 10주를 보유했지만 3월 매도 이후 2주만 남으므로 2주까지만 팔 수 있음
+    assert timeline.sellable(day("2024-02-01")) == 2
+    assert timeline.sellable(day("2024-03-01")) == 2
+    assert timeline.sellable(day("2024-04-01")) == 2
+
+
+@pytest.fixture
+def portfolio(db_session):
+    user = User(email="import-test@example.com", username="import-test", hashed_password="x")
+    stock = Stock(symbol="IMPTEST", name="Import Test", last_price=Decimal("100"))
+    db_session.add_all([user, stock])
+    db_session.flush()
+    portfolio = Portfolio(user_id=user.id, name="import test")
+    db_session.add(portfolio)
+    db_session.flush()
+    db_session.add_all([
+        Transaction(portfolio_id=portfolio.id, stock_id=stock.id, transaction_type="BUY",
+                    quantity=10, price=Decimal("100"), transaction_date=day("2024-01-01")),
+        Transaction(portfolio_id=portfolio.id, stock_id=stock.id, transaction_type="SELL",
+                    quantity=10, price=Decimal("110"), transaction_date=day("2024-03-01")),
+    ])
+    db_session.commit()
+    return portfolio
+
+
+def run_import(db_session, portfolio, rows, dry_run=False):
+    content = "symbol,type,quantity,price,date\n" + "".join(f"{row}\n" for row in rows)
+    return import_transactions_csv(db_session, portfolio.id, io.BytesIO(content.encode()), dry_run=dry_run)
+
+
+def test_sell_is_checked_against_position_on_its_date(db_session, portfolio):
+    result = run_import(db_session, portfolio, [
+        "IMPTEST,SELL,5,105,2023-12-15",  # 첫 매수 이전
+        "IMPTEST,SELL,5,105,2024-02-01",  # 3월에 10주를 모두 팔았으므로 불가
+        "IMPTEST,BUY,5,100,2024-02-10",
+        "IMPTEST,SELL,5,105,2024-02-20",  # 직전 매수분만큼 가능
+    ])
+
+    assert result["imported"] == 2
+    assert [error["row"] for error in result["errors"]] == [2, 3]
+    assert "매도 가능 수량(0주)" in result["errors"][0]["message"]
+
+
+def test_rows_must_be_in_date_order(db_session, portfolio):
+    result = run_import(db_session, portfolio, [
+        "IMPTEST,BUY,5,100,2024-05-02",
+        "IMPTEST,BUY,5,100,2024-05-01",
+        "IMPTEST,SELL,3,100,2024-05-03",
+    ])
+
+    assert result["imported"] == 2
+    assert [error["row"] for error in result["errors"]] == [3]
+    assert "오름차순" in result["errors"][0]["message"]
+
+
+def test_dry_run_does_not_store_rows(db_session, portfolio):
+    result = run_import(db_session, portfolio, ["IMPTEST,BUY,5,100,2024-05-01"], dry_run=True)
+
+    assert result["imported"] == 1
+    assert db_session.query(Transaction).filter(Transaction.portfolio_id == portfolio.id).count() == 2
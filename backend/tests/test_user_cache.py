@@ -0,0 +1,101 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints import auth
+from app.core.security import create_access_token
+from app.core.user_cache import USER_CACHE, UserCache, UserSnapshot
+from app.db.crud.users import update_user
+from app.db.models import User
+from app.schemas.users import UserUpdate
+
+
+def snapshot(username, user_id=1):
+    return UserSnapshot(id=user_id, username=username, email=f"{username}@example.com", is_active=True)
+
+
+def test_entries_expire_after_ttl():
+    cache = UserCache(max_size=10, ttl=60)
+    cache.put(snapshot("alice"))
+    assert cache.get("alice") == snapshot("alice")
+
+    cached_at, entry = cache._entries["alice"]
+    cache._entries["alice"] = (cached_at - timedelta(seconds=61), entry)
+    evictions = cache.metrics.evictions.value
+
+    assert cache.get("alice") is None
+    assert cache.metrics.evictions.value == evictions + 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = UserCache(max_size=2, ttl=60)
+    cache.put(snapshot("alice", 1))
+    cache.put(snapshot("bob", 2))
+    cache.get("alice")
+    cache.put(snapshot("carol", 3))
+
+    assert cache.get("bob") is None
+    assert cache.get("alice") is not None and cache.get("carol") is not None
+
+
+def test_invalidate_removes_every_given_name():
+    cache = UserCache(max_size=10, ttl=60)
+    cache.put(snapshot("alice", 1))
+    cache.put(snapshot("bob", 2))
+
+    cache.invalidate("alice", "bob", "missing")
+
+    assert cache.get("alice") is None and cache.get("bob") is None
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """get_current_user의 DB 조회를 기록하는 가짜 조회 함수"""
+    calls = []
+    users = {"alice": User(id=1, username="alice", email="alice@example.com", is_active=True)}
+
+    def fake_lookup(db, username):
+        calls.append(username)
+        return users.get(username)
+
+    monkeypatch.setattr(auth, "get_user_by_username", fake_lookup)
+    USER_CACHE.clear()
+    yield calls
+    USER_CACHE.clear()
+
+
+def current_user(username):
+    token = create_access_token({"sub": username})
+    return asyncio.run(auth.get_current_user(token=token, db=None))
+
+
+def test_current_user_is_looked_up_once(lookups):
+    first = current_user("alice")
+    second = current_user("alice")
+
+    assert first == second == snapshot("alice")
+    assert lookups == ["alice"]
+
+
+def test_unknown_users_are_not_cached(lookups):
+    for _ in range(2):
+        with pytest.raises(HTTPException) as error:
+            current_user("ghost")
+        assert error.value.status_code == 401
+
+    assert lookups == ["ghost", "ghost"]
+
+
+def test_update_user_invalidates_old_and_new_names(db_session):
+    user = User(email="cache-test@example.com", username="cache-old", hashed_password="x")
+    db_session.add(user)
+    db_session.commit()
+    USER_CACHE.put(UserSnapshot.from_model(user))
+    USER_CACHE.put(snapshot("cache-new", user.id))
+
+    update_user(db_session, user.id, UserUpdate(username="cache-new", is_active=False))
+
+    assert USER_CACHE.get("cache-old") is None
+    assert USER_CACHE.get("cache-new") is None
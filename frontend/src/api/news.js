@@ -41,4 +41,26 @@ export const getStockNews = async (symbol, page = 1, pageSize = 10) => {
   } catch (error) {
     throw new Error(error.response?.data?.detail || '주식 뉴스 조회 중 오류가 발생했습니다.');
   }
-};
\ No newline at end of file
+};
+
+/**
+ * 종목 뉴스 감성 시계열 조회 API 요청 함수
+ * 
+ * 일별 평균 감성과 windowDays일 이동 감성 지수(-1 ~ 1)를 가져옵니다.
+ * 
+ * @param {string} symbol - 주식 심볼 (예: AAPL) 또는 MARKET
+ * @param {number} days - 조회 기간 (일, 기본값: 90)
+ * @param {number} windowDays - 이동 감성 지수 기간 (일, 기본값: 7)
+ * @returns {Promise<Object>} - 감성 데이터 (symbol, window, series 포함)
+ * @throws {Error} - 조회 실패 시 에러
+ */
+export const getStockSentiment = async (symbol, days = 90, windowDays = 7) => {
+  try {
+    const response = await api.get(`/news/sentiment/${symbol}`, {
+      params: { days, window: windowDays }
+    });
+    return response.data;
+  } catch (error) {
+    throw new Error(error.response?.data?.detail || '뉴스 감성 조회 중 오류가 발생했습니다.');
+  }
+};
@@ -82,7 +82,7 @@ export const deleteSimulationAccount = async (accountId) => {
    * @param {string} transaction.symbol - 주식 심볼
    * @param {string} transaction.transaction_type - 거래 유형 ("BUY" 또는 "SELL")
    * @param {number} transaction.quantity - 거래 수량
-   * @param {number} transaction.price - 거래 가격
+   * @param {number} [transaction.price] - 참고 가격 (시장가 주문은 서버의 최근 시세로 체결됨)
    * @returns {Promise<Object>} - 생성된 모의 투자 거래 내역 정보
    * @throws {Error} - 생성 실패 시 에러
    */
@@ -98,16 +98,20 @@ export const deleteSimulationAccount = async (accountId) => {
   /**
    * 모의 투자 계좌의 거래 내역 목록 조회 API 요청 함수
    * 
-   * 특정 모의 투자 계좌의 모든 거래 내역을 가져옵니다.
+   * 특정 모의 투자 계좌의 거래 내역을 최신순으로 가져옵니다.
+   * 다음 페이지 커서는 응답의 X-Next-Cursor 헤더로 전달됩니다.
    * 
    * @param {number} accountId - 모의 투자 계좌 ID
-   * @returns {Promise<Array>} - 거래 내역 목록
+   * @param {Object} [params] - 페이지네이션 옵션
+   * @param {number} [params.limit] - 페이지 당 거래 내역 수 (기본값: 100)
+   * @param {string} [params.cursor] - 다음 페이지 커서
+   * @returns {Promise<{items: Array, nextCursor: (string|null)}>} - 거래 내역 목록과 다음 페이지 커서 (마지막 페이지면 null)
    * @throws {Error} - 조회 실패 시 에러
    */
-  export const getSimulationAccountTransactions = async (accountId) => {
+  export const getSimulationAccountTransactions = async (accountId, params = {}) => {
     try {
-      const response = await api.get(`/simulation/accounts/${accountId}/transactions`);
-      return response.data;
+      const response = await api.get(`/simulation/accounts/${accountId}/transactions`, { params });
+      return { items: response.data, nextCursor: response.headers['x-next-cursor'] || null };
     } catch (error) {
       throw new Error(error.response?.data?.detail || '거래 내역 조회 중 오류가 발생했습니다.');
     }
@@ -26,16 +26,20 @@ export const createTransaction = async (transaction) => {
 /**
  * 포트폴리오 거래 내역 조회 API 요청 함수
  * 
- * 특정 포트폴리오의 모든 거래 내역을 가져옵니다.
+ * 특정 포트폴리오의 거래 내역을 최신순으로 가져옵니다.
+ * 다음 페이지 커서는 응답의 X-Next-Cursor 헤더로 전달됩니다.
  * 
  * @param {number} portfolioId - 포트폴리오 ID
- * @returns {Promise<Array>} - 거래 내역 목록
+ * @param {Object} [params] - 페이지네이션 옵션
+ * @param {number} [params.limit] - 페이지 당 거래 내역 수 (기본값: 100)
+ * @param {string} [params.cursor] - 다음 페이지 커서
+ * @returns {Promise<{items: Array, nextCursor: (string|null)}>} - 거래 내역 목록과 다음 페이지 커서 (마지막 페이지면 null)
  * @throws {Error} - 조회 실패 시 에러
  */
-export const getPortfolioTransactions = async (portfolioId) => {
+export const getPortfolioTransactions = async (portfolioId, params = {}) => {
   try {
-    const response = await api.get(`/transactions/portfolio/${portfolioId}`);
-    return response.data;
+    const response = await api.get(`/transactions/portfolio/${portfolioId}`, { params });
+    return { items: response.data, nextCursor: response.headers['x-next-cursor'] || null };
   } catch (error) {
     throw new Error(error.response?.data?.detail || '거래 내역 조회 중 오류가 발생했습니다.');
   }
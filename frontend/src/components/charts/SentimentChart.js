@@ -0,0 +1,119 @@
+import React, { useState, useEffect } from 'react';
+import { ComposedChart, Bar, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ReferenceLine, ResponsiveContainer } from 'recharts';
+import { getStockSentiment } from '../../api/news';
+
+/**
+ * 뉴스 감성 차트 컴포넌트
+ * 
+ * 종목의 일별 기사 수와 이동 감성 지수를 차트로 표시합니다.
+ * 
+ * @param {Object} props - 컴포넌트 속성
+ * @param {string} props.symbol - 주식 심볼
+ * @param {number} props.days - 조회 기간 (일)
+ * @param {number} props.windowDays - 이동 감성 지수 기간 (일)
+ */
+const SentimentChart = ({ symbol, days = 90, windowDays = 7 }) => {
+  // 차트 데이터 상태
+  const [chartData, setChartData] = useState([]);
+  // 로딩 상태
+  const [loading, setLoading] = useState(true);
+  // 에러 상태
+  const [error, setError] = useState(null);
+
+  // 심볼이나 기간이 변경될 때 데이터 로드
+  useEffect(() => {
+    const fetchSentiment = async () => {
+      if (!symbol) return;
+      
+      try {
+        setLoading(true);
+        setError(null);
+        
+        const data = await getStockSentiment(symbol, days, windowDays);
+        setChartData(data.series);
+      } catch (err) {
+        setError(err.message);
+      } finally {
+        setLoading(false);
+      }
+    };
+
+    fetchSentiment();
+  }, [symbol, days, windowDays]);
+
+  // 로딩 중 표시
+  if (loading) {
+    return (
+      <div className="flex justify-center items-center h-64">
+        <p>감성 데이터 로딩 중...</p>
+      </div>
+    );
+  }
+
+  // 에러 표시
+  if (error) {
+    return (
+      <div className="flex justify-center items-center h-64 text-red-500">
+        <p>데이터를 불러오는 중 오류가 발생했습니다: {error}</p>
+      </div>
+    );
+  }
+
+  // 기사가 하나도 없으면 차트 대신 안내 표시
+  if (!chartData.some(item => item.articles > 0)) {
+    return (
+      <div className="bg-white p-4 rounded-lg shadow">
+        <h2 className="text-lg font-semibold mb-4">{symbol} 뉴스 감성</h2>
+        <p className="text-gray-500">최근 {days}일간 수집된 관련 기사가 없습니다.</p>
+      </div>
+    );
+  }
+
+  const formatDate = (value, options) => new Date(value).toLocaleDateString('ko-KR', options);
+
+  return (
+    <div className="bg-white p-4 rounded-lg shadow">
+      <h2 className="text-lg font-semibold mb-4">{symbol} 뉴스 감성 ({windowDays}일 이동 지수)</h2>
+      
+      {/* 차트 영역 */}
+      <div className="h-64">
+        <ResponsiveContainer width="100%" height="100%">
+          <ComposedChart
+            data={chartData}
+            margin={{ top: 5, right: 30, left: 20, bottom: 5 }}
+          >
+            <CartesianGrid strokeDasharray="3 3" />
+            <XAxis 
+              dataKey="date" 
+              tick={{ fontSize: 12 }}
+              interval="preserveEnd"
+              tickFormatter={(value) => formatDate(value, { month: 'short', day: 'numeric' })}
+            />
+            <YAxis 
+              yAxisId="index"
+              domain={[-1, 1]}
+              tick={{ fontSize: 12 }}
+              tickFormatter={(value) => value.toFixed(1)}
+            />
+            <YAxis 
+              yAxisId="articles"
+              orientation="right"
+              allowDecimals={false}
+              tick={{ fontSize: 12 }}
+            />
+            <Tooltip 
+              formatter={(value, name) => [value === null ? '-' : (name === '기사 수' ? value : value.toFixed(3)), name]}
+              labelFormatter={(label) => formatDate(label, { year: 'numeric', month: 'long', day: 'numeric' })}
+            />
+            <Legend />
+            <ReferenceLine yAxisId="index" y={0} stroke="#9ca3af" />
+            <Bar yAxisId="articles" dataKey="articles" name="기사 수" fill="#d1d5db" />
+            <Line yAxisId="index" type="monotone" dataKey="index" name="감성 지수" stroke="#2563eb" dot={false} connectNulls />
+          </ComposedChart>
+        </ResponsiveContainer>
+      </div>
+    </div>
+  );
+};
+
+export default SentimentChart;
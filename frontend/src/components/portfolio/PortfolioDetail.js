@@ -18,6 +18,10 @@ const PortfolioDetail = () => {
   const [portfolio, setPortfolio] = useState(null);
   // 거래 내역 상태
   const [transactions, setTransactions] = useState([]);
+  // 거래 내역 다음 페이지 커서 (없으면 마지막 페이지)
+  const [nextCursor, setNextCursor] = useState(null);
+  // 거래 내역 추가 로딩 상태
+  const [loadingMore, setLoadingMore] = useState(false);
   // 선택된 탭 상태
   const [activeTab, setActiveTab] = useState('holdings');
   // 로딩 상태
@@ -41,8 +45,9 @@ const PortfolioDetail = () => {
         setPortfolio(portfolioData);
         
         // 거래 내역 조회
-        const transactionsData = await getPortfolioTransactions(portfolioId);
-        setTransactions(transactionsData);
+        const transactionsPage = await getPortfolioTransactions(portfolioId);
+        setTransactions(transactionsPage.items);
+        setNextCursor(transactionsPage.nextCursor);
       } catch (err) {
         setError(err.message);
       } finally {
@@ -53,6 +58,20 @@ const PortfolioDetail = () => {
     fetchData();
   }, [portfolioId]);
 
+  // 거래 내역 다음 페이지 로드
+  const handleLoadMore = async () => {
+    try {
+      setLoadingMore(true);
+      const transactionsPage = await getPortfolioTransactions(portfolioId, { cursor: nextCursor });
+      setTransactions((prev) => [...prev, ...transactionsPage.items]);
+      setNextCursor(transactionsPage.nextCursor);
+    } catch (err) {
+      setError(err.message);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // 로딩 중 표시
   if (loading) {
     return <div className="text-center p-4">포트폴리오 정보를 불러오는 중...</div>;
@@ -298,6 +317,17 @@ const PortfolioDetail = () => {
               </tbody>
             </table>
           )}
+          {nextCursor && (
+            <div className="text-center mt-4">
+              <button
+                onClick={handleLoadMore}
+                disabled={loadingMore}
+                className="px-4 py-2 border border-gray-300 rounded text-gray-700 hover:bg-gray-50 disabled:opacity-50"
+              >
+                {loadingMore ? '불러오는 중...' : '더 보기'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
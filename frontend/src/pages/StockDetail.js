@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom'; // useNavigate 추가
 import { getStockQuote } from '../api/stocks';
 import PriceChart from '../components/charts/PriceChart';
+import SentimentChart from '../components/charts/SentimentChart';
 
 /**
  * 주식 상세 정보 페이지
@@ -129,6 +130,9 @@ const StockDetail = () => {
 
       {/* 주가 차트 */}
       <PriceChart symbol={symbol} />
+
+      {/* 뉴스 감성 차트 */}
+      <SentimentChart symbol={symbol} />
     </div>
   );
 };